@@ -0,0 +1,11 @@
+import argparse
+
+import path_util  # noqa: F401
+
+from hummingbot.client.settings import CONNECTOR_MANIFEST_PATH, AllConnectorSettings
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the connector manifest read by the client at startup")
+    parser.add_argument("--output", type=str, default=str(CONNECTOR_MANIFEST_PATH), help="Path of the manifest file.")
+    args = parser.parse_args()
+    AllConnectorSettings.save_connector_manifest(args.output)
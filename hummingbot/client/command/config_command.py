@@ -23,7 +23,7 @@ from hummingbot.core.utils import map_df_to_str
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.model.inventory_cost import InventoryCost
 from hummingbot.strategy.perpetual_market_making import PerpetualMarketMakingStrategy
-from hummingbot.strategy.pure_market_making import PureMarketMakingStrategy
+from hummingbot.strategy.pure_market_making import MultiMarketPureMarketMakingStrategy, PureMarketMakingStrategy
 from hummingbot.user.user_balances import UserBalances
 
 if TYPE_CHECKING:
@@ -84,6 +84,12 @@ client_configs_to_display = ["autofill_import",
                              "market_data_collection_enabled",
                              "market_data_collection_interval",
                              "market_data_collection_depth",
+                             "markets_recorder",
+                             "write_behind_enabled",
+                             "write_behind_flush_interval",
+                             "write_behind_batch_size",
+                             "trades_csv_max_file_size_mb",
+                             "trades_csv_rotate_daily",
                              ]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
@@ -219,6 +225,16 @@ class ConfigCommand:
             return True
         return False
 
+    @staticmethod
+    def update_running_multi_market_mm(mm_strategy, key: str, new_value: Any):
+        """
+        Updates the strategies of the trading pairs without a market override for the key
+        """
+        updated = False
+        for strategy in mm_strategy.strategies_using_config(key):
+            updated = ConfigCommand.update_running_mm(strategy, key, new_value) or updated
+        return updated
+
     async def _config_single_key(self,  # type: HummingbotApplication
                                  key: str,
                                  input_value):
@@ -314,14 +330,18 @@ class ConfigCommand:
         self.app.app.style = load_style(self.client_config_map)
         for config in missings:
             self.notify(f"{config.key}: {str(config.value)}")
-        if (
+        if isinstance(self.strategy, MultiMarketPureMarketMakingStrategy):
+            updated = ConfigCommand.update_running_multi_market_mm(self.strategy, key, config_var.value)
+        elif (
                 isinstance(self.strategy, PureMarketMakingStrategy) or
                 isinstance(self.strategy, PerpetualMarketMakingStrategy)
         ):
             updated = ConfigCommand.update_running_mm(self.strategy, key, config_var.value)
-            if updated:
-                self.notify(f"\nThe current {self.strategy_name} strategy has been updated "
-                            f"to reflect the new configuration.")
+        else:
+            updated = False
+        if updated:
+            self.notify(f"\nThe current {self.strategy_name} strategy has been updated "
+                        f"to reflect the new configuration.")
 
     async def _prompt_missing_configs(self,  # type: HummingbotApplication
                                       config_map):
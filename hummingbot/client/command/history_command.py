@@ -1,9 +1,10 @@
 import asyncio
 import threading
 import time
+from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -12,6 +13,7 @@ from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllCo
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_summary import TradeFillSummary
 from hummingbot.user.user_balances import UserBalances
 
 s_float_0 = float(0)
@@ -40,17 +42,21 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        if self.markets_recorder is not None:
+            self.markets_recorder.flush_pending_writes()
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            if not trades:
+            # Only the summaries since the session start are stored, other start times are aggregated once
+            summaries: List[TradeFillSummary] = TradeFillSummary.get_summaries(
+                session,
+                config_file_path=self.strategy_file_name,
+                start_timestamp=int(start_time * 1e3),
+                persist=days <= 0)
+            if not summaries:
                 self.notify("\n  No past trades to report.")
                 return
             if verbose:
                 self.list_trades(start_time)
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+            safe_ensure_future(self.history_summary_report(start_time, summaries, precision))
 
     def get_history_trades_json(self,  # type: HummingbotApplication
                                 days: float = 0):
@@ -69,12 +75,56 @@ class HistoryCommand:
                              trades: List[TradeFill],
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        trades_by_market: Dict[Tuple[str, str], List[TradeFill]] = defaultdict(list)
+        for trade in trades:
+            trades_by_market[(trade.market, trade.symbol)].append(trade)
+
+        async def market_performance(market: str, symbol: str, market_trades: List[TradeFill],
+                                     balances: Dict[str, Decimal]) -> PerformanceMetrics:
+            return await PerformanceMetrics.create(symbol, market_trades, balances)
+
+        return await self._markets_performance_report(
+            start_time, trades_by_market, market_performance, precision, display_report)
+
+    async def history_summary_report(self,  # type: HummingbotApplication
+                                     start_time: float,
+                                     summaries: List[TradeFillSummary],
+                                     precision: Optional[int] = None,
+                                     display_report: bool = True) -> Decimal:
+        """
+        Reports the performance of each market from the trade fill summaries. The trades of the markets with
+        derivative positions are loaded to pair the open and close trades.
+        """
+        summaries_by_market: Dict[Tuple[str, str], List[TradeFillSummary]] = defaultdict(list)
+        for summary in summaries:
+            summaries_by_market[(summary.market, summary.symbol)].append(summary)
+
+        async def market_performance(market: str, symbol: str, market_summaries: List[TradeFillSummary],
+                                     balances: Dict[str, Decimal]) -> PerformanceMetrics:
+            if TradeFillSummary.are_derivatives(market_summaries):
+                with self.trade_fill_db.get_new_session() as session:
+                    market_trades: List[TradeFill] = self._get_trades_from_session(
+                        int(start_time * 1e3),
+                        session=session,
+                        config_file_path=self.strategy_file_name,
+                        market=market,
+                        symbol=symbol)
+                return await PerformanceMetrics.create(symbol, market_trades, balances)
+            return await PerformanceMetrics.create_from_summaries(symbol, market_summaries, balances)
+
+        return await self._markets_performance_report(
+            start_time, summaries_by_market, market_performance, precision, display_report)
+
+    async def _markets_performance_report(self,  # type: HummingbotApplication
+                                          start_time: float,
+                                          markets_records: Dict[Tuple[str, str], List[Any]],
+                                          market_performance: Callable[..., Awaitable[PerformanceMetrics]],
+                                          precision: Optional[int],
+                                          display_report: bool) -> Decimal:
         if display_report:
             self.report_header(start_time)
         return_pcts = []
-        for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+        for (market, symbol), records in markets_records.items():
             network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
             try:
                 cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
@@ -83,7 +133,7 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            perf = await market_performance(market, symbol, records, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -202,13 +252,15 @@ class HistoryCommand:
             return s_decimal_0
 
         start_time = self.init_time
+        if self.markets_recorder is not None:
+            self.markets_recorder.flush_pending_writes()
 
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            avg_return = await self.history_report(start_time, trades, display_report=False)
+            summaries: List[TradeFillSummary] = TradeFillSummary.get_summaries(
+                session,
+                config_file_path=self.strategy_file_name,
+                start_timestamp=int(start_time * 1e3))
+        avg_return = await self.history_summary_report(start_time, summaries, display_report=False)
         return avg_return
 
     def list_trades(self,  # type: HummingbotApplication
@@ -138,6 +138,41 @@ class MQTTBridgeConfigMap(BaseClientModel):
             ),
         ),
     )
+    mqtt_events_batching: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable forwarding the events to the MQTT broker in batch messages"
+            ),
+        ),
+    )
+    mqtt_events_batch_interval: float = Field(
+        default=0.5,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum time in seconds an event waits to be sent in a batch message"
+            ),
+        ),
+    )
+    mqtt_events_batch_size: int = Field(
+        default=100,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum number of events of a batch message"
+            ),
+        ),
+    )
+    mqtt_events_queue_size: int = Field(
+        default=10000,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum number of events waiting to be sent in batch messages"
+            ),
+        ),
+    )
     mqtt_autostart: bool = Field(
         default=False,
         client_data=ClientFieldData(
@@ -183,6 +218,58 @@ class MarketDataCollectionConfigMap(BaseClientModel):
         title = "market_data_collection"
 
 
+class MarketsRecorderConfigMap(BaseClientModel):
+    write_behind_enabled: bool = Field(
+        default=False,
+        description="When enabled, orders and trades are queued in memory and written to the database in batches by a"
+                    "\nbackground thread, instead of on every event.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable batched (write-behind) recording of orders and trades"
+            ),
+        ),
+    )
+    write_behind_flush_interval: float = Field(
+        default=1.0,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum time in seconds records are kept in memory before being written (Default=1.0)"
+            ),
+        ),
+    )
+    write_behind_batch_size: int = Field(
+        default=100,
+        ge=1,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum number of records written in a single transaction (Default=100)"
+            ),
+        ),
+    )
+    trades_csv_max_file_size_mb: int = Field(
+        default=0,
+        ge=0,
+        description="The trades CSV file is rotated when it grows over this size in MB (0 disables size rotation).",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the size in MB after which the trades CSV file is rotated (0 to disable)"
+            ),
+        ),
+    )
+    trades_csv_rotate_daily: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Rotate the trades CSV file every day (UTC)?"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "markets_recorder"
+
+
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
         default="#000000",
@@ -593,6 +680,37 @@ class GatewayConfigMap(BaseClientModel):
             prompt=lambda cm: "Please enter your Gateway API port",
         ),
     )
+    gateway_api_unix_socket: Optional[str] = Field(
+        default=None,
+        description="The Unix domain socket of a Gateway running on the same host, used instead of the API host and port.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Please enter the Unix domain socket path of your Gateway (leave empty to connect over TCP)",
+        ),
+    )
+    gateway_trading_connections_limit: int = Field(
+        default=10,
+        gt=0,
+        description="The maximum number of connections to Gateway used to place and cancel orders.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Please enter the maximum number of Gateway connections for placing and canceling orders",
+        ),
+    )
+    gateway_polling_connections_limit: int = Field(
+        default=10,
+        gt=0,
+        description="The maximum number of connections to Gateway used for prices, balances and status updates.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Please enter the maximum number of Gateway connections for prices, balances and status updates",
+        ),
+    )
+    gateway_keepalive_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="The time in seconds an idle connection to Gateway is kept open to be reused.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Please enter the time in seconds an idle Gateway connection is kept open",
+        ),
+    )
 
     class Config:
         title = "gateway"
@@ -1028,6 +1146,7 @@ class ClientConfigMap(BaseClientModel):
         ),
     )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
+    markets_recorder: MarketsRecorderConfigMap = Field(default=MarketsRecorderConfigMap())
 
     class Config:
         title = "client_config_map"
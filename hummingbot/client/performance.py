@@ -10,6 +10,7 @@ from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, Tok
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_summary import TradeFillSummary
 
 s_decimal_0 = Decimal("0")
 s_decimal_nan = Decimal("NaN")
@@ -71,6 +72,20 @@ class PerformanceMetrics:
         await performance._initialize_metrics(trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_summaries(cls,
+                                    trading_pair: str,
+                                    summaries: List[TradeFillSummary],
+                                    current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+        """
+        Creates the performance metrics from the trade fill summaries of the trading pair, instead of the trades.
+        The trade P&L of derivative positions requires pairing the individual trades, so it can't be calculated from
+        summaries (see `TradeFillSummary.are_derivatives`).
+        """
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_summaries(trading_pair, summaries, current_balances)
+        return performance
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -196,6 +211,11 @@ class PerformanceMetrics:
 
             self.s_vol_quote += self._process_deducted_fees_impact_in_quote_vol(trade)
 
+        self._calculate_totals_and_average_prices()
+
+        return buys, sells
+
+    def _calculate_totals_and_average_prices(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -206,8 +226,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     def _process_deducted_fees_impact_in_quote_vol(self, trade):
         fee_percent = None
         fee_type = ""
@@ -248,6 +266,9 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+        await self._calculate_fee_in_quote(quote)
+
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -302,15 +323,72 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        await self._calculate_balances_and_values(trading_pair,
+                                                  current_balances,
+                                                  first_price=Decimal(str(trades[0].price)),
+                                                  last_price=Decimal(str(trades[-1].price)))
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(quote, trades)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _initialize_metrics_from_summaries(self,
+                                                 trading_pair: str,
+                                                 summaries: List[TradeFillSummary],
+                                                 current_balances: Dict[str, Decimal]):
+        """
+        Calculates PnL, fees, Return % and etc... from the trade fill summaries of the trading pair
+        :param trading_pair: the trading market to get performance metrics
+        :param summaries: the buy and sell trade fill summaries of the trading pair
+        :param current_balances: current user account balance
+        """
+        _, quote = split_hb_trading_pair(trading_pair)
+        for summary in summaries:
+            if summary.is_buy:
+                self.num_buys += summary.num_trades
+                self.b_vol_base += summary.base_volume
+                self.b_vol_quote -= summary.quote_volume
+            else:
+                self.num_sells += summary.num_trades
+                self.s_vol_base -= summary.base_volume
+                self.s_vol_quote += summary.quote_volume
+            self.s_vol_quote -= summary.deducted_fees_in_quote
+            self.fees[quote] += summary.percent_fees_in_quote
+            for fee_token, fee_amount in summary.flat_fees.items():
+                self.fees[fee_token] += Decimal(fee_amount)
+        self.num_trades = self.num_buys + self.num_sells
+        self._calculate_totals_and_average_prices()
+
+        first_summary = min(summaries, key=lambda s: s.first_timestamp)
+        last_summary = max(summaries, key=lambda s: s.last_timestamp)
+        await self._calculate_balances_and_values(trading_pair,
+                                                  current_balances,
+                                                  first_price=first_summary.first_price,
+                                                  last_price=last_summary.last_price)
+        self.trade_pnl = self.cur_value - self.hold_value
+
+        await self._calculate_fee_in_quote(quote)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _calculate_balances_and_values(self,
+                                             trading_pair: str,
+                                             current_balances: Dict[str, Decimal],
+                                             first_price: Decimal,
+                                             last_price: Decimal):
+        base, quote = split_hb_trading_pair(trading_pair)
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = first_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -318,9 +396,3 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
-
-        await self._calculate_fees(quote, trades)
-
-        self.total_pnl = self.trade_pnl - self.fee_in_quote
-        self.return_pct = self.divide(self.total_pnl, self.hold_value)
@@ -5,7 +5,7 @@ from enum import Enum
 from os import DirEntry, scandir
 from os.path import exists, join, realpath
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from pydantic import SecretStr
 
@@ -62,6 +62,8 @@ PAPER_TRADE_EXCHANGES = [  # todo: fix after global config map refactor
 ]
 
 CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES = ["test_support", "utilities", "gateway"]
+CONNECTOR_EXCEPTIONS = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+CONNECTOR_MANIFEST_PATH = root_path() / "hummingbot" / "connector" / "connector_manifest.json"
 
 
 class ConnectorType(Enum):
@@ -307,16 +309,19 @@ class ConnectorSetting(NamedTuple):
 
         trading_pairs = trading_pairs or []
         connector_class = getattr(importlib.import_module(self.module_path()), self.class_name())
+        config_keys = self.config_keys
+        if config_keys is None and self.name in AllConnectorSettings.connectors_with_unloaded_config_keys:
+            config_keys = AllConnectorSettings.get_connector_config_keys(self.name)
         kwargs = {}
-        if isinstance(self.config_keys, Dict):
-            kwargs = {key: (config.value or "") for key, config in self.config_keys.items()}  # legacy
-        elif self.config_keys is not None:
+        if isinstance(config_keys, Dict):
+            kwargs = {key: (config.value or "") for key, config in config_keys.items()}  # legacy
+        elif config_keys is not None:
             kwargs = {
                 traverse_item.attr: traverse_item.value.get_secret_value()
                 if isinstance(traverse_item.value, SecretStr)
                 else traverse_item.value or ""
                 for traverse_item
-                in ClientConfigAdapter(self.config_keys).traverse()
+                in ClientConfigAdapter(config_keys).traverse()
                 if traverse_item.attr != "connector"
             }
         kwargs = self.conn_init_parameters(
@@ -356,73 +361,36 @@ class ConnectorSetting(NamedTuple):
 
 class AllConnectorSettings:
     all_connector_settings: Dict[str, ConnectorSetting] = {}
+    # The connectors read from the manifest, whose config keys are loaded from their utils module on first use
+    connectors_with_unloaded_config_keys: Set[str] = set()
 
     @classmethod
-    def create_connector_settings(cls):
+    def create_connector_settings(cls, use_manifest: bool = True):
         """
         Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+
+        The settings of the connectors listed in the connector manifest are read from it, and their utils modules are
+        only imported when their config keys are requested. The utils modules of the other connectors are imported.
         """
         cls.all_connector_settings = {}  # reset
-        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
-
-        type_dirs: List[DirEntry] = [
-            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
-            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
-        ]
-        for type_dir in type_dirs:
-            if type_dir.name == 'gateway':
+        cls.connectors_with_unloaded_config_keys = set()
+        manifest: Dict[str, List[ConnectorSetting]] = cls.read_connector_manifest() if use_manifest else {}
+
+        for type_dir, connector_dir in cls._connector_dirs():
+            if connector_dir.name in cls.all_connector_settings:
+                raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
+            if connector_dir.name in manifest:
+                for connector_setting in manifest[connector_dir.name]:
+                    cls.all_connector_settings[connector_setting.name] = connector_setting
+                    cls.connectors_with_unloaded_config_keys.add(connector_setting.name)
                 continue
-            connector_dirs: List[DirEntry] = [
-                cast(DirEntry, f) for f in scandir(type_dir.path)
-                if f.is_dir() and exists(join(f.path, "__init__.py"))
-            ]
-            for connector_dir in connector_dirs:
-                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
-                    continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
+            try:
+                util_module = importlib.import_module(cls._util_module_path(type_dir.name, connector_dir.name))
+            except ModuleNotFoundError:
+                continue
+            cls.all_connector_settings.update(
+                cls._connector_settings_from_util_module(type_dir.name, connector_dir.name, util_module)
+            )
 
         # add gateway connectors
         gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
@@ -447,6 +415,49 @@ class AllConnectorSettings:
 
         return cls.all_connector_settings
 
+    @classmethod
+    def create_connector_manifest(cls) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Imports the utils module of every connector and returns the manifest of their settings, without config keys,
+        grouped by connector module.
+        """
+        manifest: Dict[str, List[Dict[str, Any]]] = {}
+        for type_dir, connector_dir in cls._connector_dirs():
+            try:
+                util_module = importlib.import_module(cls._util_module_path(type_dir.name, connector_dir.name))
+            except ModuleNotFoundError:
+                continue
+            connector_settings = cls._connector_settings_from_util_module(
+                type_dir.name, connector_dir.name, util_module
+            )
+            manifest[connector_dir.name] = [
+                cls._connector_manifest_entry(connector_setting) for connector_setting in connector_settings.values()
+            ]
+        return manifest
+
+    @classmethod
+    def save_connector_manifest(cls, manifest_path: str = str(CONNECTOR_MANIFEST_PATH)):
+        manifest = cls.create_connector_manifest()
+        with open(manifest_path, "w") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+            manifest_file.write("\n")
+
+    @classmethod
+    def read_connector_manifest(
+            cls, manifest_path: str = str(CONNECTOR_MANIFEST_PATH)) -> Dict[str, List[ConnectorSetting]]:
+        """
+        :return: the connector settings of the manifest, without config keys, grouped by connector module. Empty if
+        there is no manifest.
+        """
+        if not exists(manifest_path):
+            return {}
+        with open(manifest_path) as manifest_file:
+            manifest: Dict[str, List[Dict[str, Any]]] = json.load(manifest_file)
+        return {
+            connector_name: [cls._connector_setting_from_manifest_entry(entry) for entry in entries]
+            for connector_name, entries in manifest.items()
+        }
+
     @classmethod
     def initialize_paper_trade_settings(cls, paper_trade_exchanges: List[str]):
         for e in paper_trade_exchanges:
@@ -466,6 +477,8 @@ class AllConnectorSettings:
                     use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
                 )
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
+                if e in cls.connectors_with_unloaded_config_keys:
+                    cls.connectors_with_unloaded_config_keys.add(f"{e}_paper_trade")
 
     @classmethod
     def get_connector_settings(cls) -> Dict[str, ConnectorSetting]:
@@ -475,12 +488,14 @@ class AllConnectorSettings:
 
     @classmethod
     def get_connector_config_keys(cls, connector: str) -> Optional["BaseConnectorConfigMap"]:
-        return cls.get_connector_settings()[connector].config_keys
+        connector_settings = cls.get_connector_settings()
+        if connector in cls.connectors_with_unloaded_config_keys:
+            cls._load_connector_config_keys(connector)
+        return connector_settings[connector].config_keys
 
     @classmethod
     def reset_connector_config_keys(cls, connector: str):
-        current_settings = cls.get_connector_settings()[connector]
-        current_keys = current_settings.config_keys
+        current_keys = cls.get_connector_config_keys(connector)
         new_keys = (
             current_keys if current_keys is None else current_keys.__class__.construct()
         )
@@ -494,6 +509,7 @@ class AllConnectorSettings:
         cls.get_connector_settings()[new_config_keys.connector] = ConnectorSetting(
             **new_keys_settings_dict
         )
+        cls.connectors_with_unloaded_config_keys.discard(new_config_keys.connector)
 
     @classmethod
     def get_exchange_names(cls) -> Set[str]:
@@ -541,6 +557,111 @@ class AllConnectorSettings:
     def get_example_assets(cls) -> Dict[str, str]:
         return {name: cs.example_pair.split("-")[0] for name, cs in cls.get_connector_settings().items()}
 
+    @classmethod
+    def _load_connector_config_keys(cls, connector: str):
+        connector_setting = cls.all_connector_settings[connector]
+        connector_type = connector_setting.type.name.lower()
+        if connector_setting.is_sub_domain:
+            # The sub domains are defined in the utils module of their parent connector
+            util_module = importlib.import_module(cls._util_module_path(connector_type, connector_setting.parent_name))
+            config_keys = getattr(util_module, "OTHER_DOMAINS_KEYS")[connector]
+        elif connector_setting.parent_name is not None:
+            # The paper trade exchanges use the keys of the connector they are based on, which can be a sub domain
+            config_keys = cls.get_connector_config_keys(connector_setting.parent_name)
+        else:
+            util_module = importlib.import_module(cls._util_module_path(connector_type, connector_setting.name))
+            config_keys = getattr(util_module, "KEYS", None)
+        cls.all_connector_settings[connector] = connector_setting._replace(config_keys=config_keys)
+        cls.connectors_with_unloaded_config_keys.discard(connector)
+
+    @staticmethod
+    def _connector_dirs() -> List[Tuple[DirEntry, DirEntry]]:
+        """
+        :return: the (type directory, connector directory) of the connector modules
+        """
+        type_dirs: List[DirEntry] = [
+            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
+            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
+        ]
+        connector_dirs: List[Tuple[DirEntry, DirEntry]] = []
+        for type_dir in type_dirs:
+            connector_dirs.extend(
+                (type_dir, cast(DirEntry, f)) for f in scandir(type_dir.path)
+                if f.is_dir() and exists(join(f.path, "__init__.py"))
+                and not f.name.startswith("_") and f.name not in CONNECTOR_EXCEPTIONS
+            )
+        return connector_dirs
+
+    @staticmethod
+    def _util_module_path(type_name: str, connector_name: str) -> str:
+        return f"hummingbot.connector.{type_name}.{connector_name}.{connector_name}_utils"
+
+    @classmethod
+    def _connector_settings_from_util_module(
+            cls, type_name: str, connector_name: str, util_module: ModuleType) -> Dict[str, ConnectorSetting]:
+        """
+        :return: the settings of the connector and of its other domains
+        """
+        trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+        trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(connector_name, trade_fee_settings)
+        parent = ConnectorSetting(
+            name=connector_name,
+            type=ConnectorType[type_name.capitalize()],
+            centralised=getattr(util_module, "CENTRALIZED", True),
+            example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
+            use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
+            trade_fee_schema=trade_fee_schema,
+            config_keys=getattr(util_module, "KEYS", None),
+            is_sub_domain=False,
+            parent_name=None,
+            domain_parameter=None,
+            use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+        )
+        connector_settings: Dict[str, ConnectorSetting] = {connector_name: parent}
+        # Adds other domains of connector
+        other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+        for domain in other_domains:
+            trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+            trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
+            connector_settings[domain] = ConnectorSetting(
+                name=domain,
+                type=parent.type,
+                centralised=parent.centralised,
+                example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                use_ethereum_wallet=parent.use_ethereum_wallet,
+                trade_fee_schema=trade_fee_schema,
+                config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
+                is_sub_domain=True,
+                parent_name=parent.name,
+                domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                use_eth_gas_lookup=parent.use_eth_gas_lookup,
+            )
+        return connector_settings
+
+    @staticmethod
+    def _connector_manifest_entry(connector_setting: ConnectorSetting) -> Dict[str, Any]:
+        entry: Dict[str, Any] = connector_setting._asdict()
+        del entry["config_keys"]
+        entry["type"] = connector_setting.type.name
+        entry["trade_fee_schema"] = connector_setting.trade_fee_schema.to_json()
+        return entry
+
+    @staticmethod
+    def _connector_setting_from_manifest_entry(entry: Dict[str, Any]) -> ConnectorSetting:
+        return ConnectorSetting(
+            name=entry["name"],
+            type=ConnectorType[entry["type"]],
+            example_pair=entry["example_pair"],
+            centralised=entry["centralised"],
+            use_ethereum_wallet=entry["use_ethereum_wallet"],
+            trade_fee_schema=TradeFeeSchema.from_json(entry["trade_fee_schema"]),
+            config_keys=None,
+            is_sub_domain=entry["is_sub_domain"],
+            parent_name=entry["parent_name"],
+            domain_parameter=entry["domain_parameter"],
+            use_eth_gas_lookup=entry["use_eth_gas_lookup"],
+        )
+
     @staticmethod
     def _validate_trade_fee_schema(
         exchange_name: str, trade_fee_schema: Optional[Union[TradeFeeSchema, List[float]]]
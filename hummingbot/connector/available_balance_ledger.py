@@ -0,0 +1,125 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from hummingbot.connector.constants import s_decimal_0
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.event.events import OrderFilledEvent
+
+if TYPE_CHECKING:
+    from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+
+# (timestamp, base asset, quote asset, base balance change, quote balance change)
+FillDelta = Tuple[float, str, str, Decimal, Decimal]
+
+
+class AvailableBalanceLedger:
+    """
+    Per asset ledger of the balances locked in orders and of the balance changes caused by fills, used by connectors
+    without real time balance updates to estimate the available balance since the last balance snapshot.
+    - The locked balances of the snapshot orders are calculated once per snapshot.
+    - The locked balances of the in flight orders are calculated once after each order event (creation, fill,
+      cancellation, completion, failure) or change in the set of in flight orders.
+    - The fill balance changes are accumulated as the fill events are received. The fills after the snapshot are
+      kept until the next snapshot, to rebuild the changes since the new snapshot timestamp.
+    With that, each balance lookup in between events is a dictionary access.
+    """
+
+    def __init__(self, locked_balances_calculator: Callable[[Dict[str, "InFlightOrderBase"]], Dict[str, Decimal]]):
+        """
+        :param locked_balances_calculator: function calculating the balances locked by a dictionary of orders
+        """
+        self._locked_balances_calculator = locked_balances_calculator
+        self._snapshot: Optional[Dict[str, "InFlightOrderBase"]] = None
+        self._snapshot_timestamp: float = 0.0
+        self._snapshot_locked_balances: Dict[str, Decimal] = {}
+        self._in_flight_orders: Optional[Dict[str, "InFlightOrderBase"]] = None
+        self._in_flight_orders_count: int = -1
+        self._in_flight_locked_balances: Dict[str, Decimal] = {}
+        self._orders_version: int = 0
+        self._in_flight_locked_balances_version: int = -1
+        self._fills_since_snapshot: List[FillDelta] = []
+        self._filled_balances_since_snapshot: Dict[str, Decimal] = defaultdict(Decimal)
+        self._filled_balances: Dict[str, Decimal] = defaultdict(Decimal)
+        self._trading_pair_assets: Dict[str, Tuple[str, str]] = {}
+
+    def mark_orders_changed(self):
+        """
+        Invalidates the locked balances of the in flight orders. To be called with every order event.
+        """
+        self._orders_version += 1
+
+    def record_fill(self, event: OrderFilledEvent):
+        base, quote = self._assets(event.trading_pair)
+        if event.trade_type is TradeType.BUY:
+            base_delta = event.amount
+            quote_delta = -event.price * event.amount
+        else:
+            base_delta = -event.amount
+            quote_delta = event.price * event.amount
+        fill = (event.timestamp, base, quote, base_delta, quote_delta)
+        self._add_fill(self._filled_balances, fill)
+        if event.timestamp > self._snapshot_timestamp:
+            self._fills_since_snapshot.append(fill)
+            self._add_fill(self._filled_balances_since_snapshot, fill)
+        self.mark_orders_changed()
+
+    def filled_balance(self, currency: str) -> Decimal:
+        """
+        Returns the balance change of the currency caused by all the fills recorded
+        """
+        return self._filled_balances.get(currency, s_decimal_0)
+
+    def filled_balance_since_snapshot(self, currency: str, snapshot_timestamp: float) -> Decimal:
+        """
+        Returns the balance change of the currency caused by the fills after the snapshot timestamp.
+        Snapshot timestamps are expected to only move forward.
+        """
+        if snapshot_timestamp != self._snapshot_timestamp:
+            self._set_snapshot_timestamp(snapshot_timestamp)
+        return self._filled_balances_since_snapshot.get(currency, s_decimal_0)
+
+    def snapshot_locked_balance(self, currency: str, snapshot: Dict[str, "InFlightOrderBase"]) -> Decimal:
+        """
+        Returns the balance of the currency locked in the snapshot orders. The snapshot is expected to be replaced
+        (not modified) each time the balances are updated.
+        """
+        if snapshot is not self._snapshot:
+            self._snapshot = snapshot
+            self._snapshot_locked_balances = self._locked_balances_calculator(snapshot)
+        return self._snapshot_locked_balances.get(currency, s_decimal_0)
+
+    def in_flight_locked_balance(self, currency: str, in_flight_orders: Dict[str, "InFlightOrderBase"]) -> Decimal:
+        """
+        Returns the balance of the currency locked in the in flight orders
+        """
+        if (in_flight_orders is not self._in_flight_orders
+                or in_flight_orders is None
+                or len(in_flight_orders) != self._in_flight_orders_count
+                or self._orders_version != self._in_flight_locked_balances_version):
+            self._in_flight_orders = in_flight_orders
+            self._in_flight_orders_count = len(in_flight_orders) if in_flight_orders is not None else -1
+            self._in_flight_locked_balances_version = self._orders_version
+            self._in_flight_locked_balances = self._locked_balances_calculator(in_flight_orders)
+        return self._in_flight_locked_balances.get(currency, s_decimal_0)
+
+    def _set_snapshot_timestamp(self, snapshot_timestamp: float):
+        self._snapshot_timestamp = snapshot_timestamp
+        self._fills_since_snapshot = [fill for fill in self._fills_since_snapshot if fill[0] > snapshot_timestamp]
+        self._filled_balances_since_snapshot.clear()
+        for fill in self._fills_since_snapshot:
+            self._add_fill(self._filled_balances_since_snapshot, fill)
+
+    def _assets(self, trading_pair: str) -> Tuple[str, str]:
+        assets = self._trading_pair_assets.get(trading_pair)
+        if assets is None:
+            assets = split_hb_trading_pair(trading_pair)
+            self._trading_pair_assets[trading_pair] = assets
+        return assets
+
+    @staticmethod
+    def _add_fill(balances: Dict[str, Decimal], fill: FillDelta):
+        _, base, quote, base_delta, quote_delta = fill
+        balances[base] += base_delta
+        balances[quote] += quote_delta
@@ -4,6 +4,7 @@ from decimal import Decimal
 from typing import Dict, List, Set, Tuple, TYPE_CHECKING, Union
 
 from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
+from hummingbot.connector.available_balance_ledger import AvailableBalanceLedger
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 from hummingbot.connector.utils import split_hb_trading_pair, TradeFillOrderDetails
 from hummingbot.connector.constants import s_decimal_NaN, s_decimal_0
@@ -12,6 +13,7 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.market_order import MarketOrder
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.network_iterator import NetworkIterator
@@ -43,6 +45,16 @@ cdef class ConnectorBase(NetworkIterator):
         MarketEvent.RangePositionUpdateFailure,
         MarketEvent.RangePositionFeeCollected,
     ]
+    BALANCE_LEDGER_EVENTS = [
+        MarketEvent.BuyOrderCreated,
+        MarketEvent.SellOrderCreated,
+        MarketEvent.OrderFilled,
+        MarketEvent.OrderCancelled,
+        MarketEvent.BuyOrderCompleted,
+        MarketEvent.SellOrderCompleted,
+        MarketEvent.OrderFailure,
+        MarketEvent.OrderExpired,
+    ]
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__()
@@ -62,6 +74,11 @@ cdef class ConnectorBase(NetworkIterator):
         # for _in_flight_orders_snapshot and _in_flight_orders_snapshot_timestamp when the update user balances.
         self._in_flight_orders_snapshot = {}  # Dict[order_id:str, InFlightOrderBase]
         self._in_flight_orders_snapshot_timestamp = 0.0
+        # The ledger keeps the locked and filled balances used to estimate the available balance since the snapshot
+        self._balance_ledger = AvailableBalanceLedger(locked_balances_calculator=self.in_flight_asset_balances)
+        self._balance_ledger_forwarder = SourceInfoEventForwarder(self._process_balance_ledger_event)
+        for event_tag in self.BALANCE_LEDGER_EVENTS:
+            self.c_add_listener(event_tag.value, self._balance_ledger_forwarder)
         self._current_trade_fills = set()
         self._exchange_order_ids = dict()
         self._trade_fee_schema = None
@@ -96,6 +113,16 @@ cdef class ConnectorBase(NetworkIterator):
     def in_flight_orders_snapshot_timestamp(self, value: float):
         self._in_flight_orders_snapshot_timestamp = value
 
+    @property
+    def balance_ledger(self) -> AvailableBalanceLedger:
+        return self._balance_ledger
+
+    def _process_balance_ledger_event(self, event_tag: int, market: "ConnectorBase", event: any):
+        if event_tag == MarketEvent.OrderFilled.value:
+            self._balance_ledger.record_fill(event)
+        else:
+            self._balance_ledger.mark_orders_changed()
+
     def estimate_fee_pct(self, is_maker: bool) -> Decimal:
         """
         Estimate the trading fee for maker or taker type of order
@@ -386,10 +413,8 @@ cdef class ConnectorBase(NetworkIterator):
         :param limit: The balance limit for the token
         :returns An available balance after the limit has been applied
         """
-        in_flight_balance = self.in_flight_asset_balances(self.in_flight_orders).get(currency, s_decimal_0)
-        limit -= in_flight_balance
-        filled_balance = self.order_filled_balances().get(currency, s_decimal_0)
-        limit += filled_balance
+        limit -= self._balance_ledger.in_flight_locked_balance(currency, self.in_flight_orders)
+        limit += self._balance_ledger.filled_balance(currency)
         limit = max(limit, s_decimal_0)
         return min(available_balance, limit)
 
@@ -401,10 +426,10 @@ cdef class ConnectorBase(NetworkIterator):
         _update_balances()
         :returns the real available that accounts for changes in flight orders and filled orders
         """
-        snapshot_bal = self.in_flight_asset_balances(self._in_flight_orders_snapshot).get(currency, s_decimal_0)
-        in_flight_bal = self.in_flight_asset_balances(self.in_flight_orders).get(currency, s_decimal_0)
-        orders_filled_bal = self.order_filled_balances(self._in_flight_orders_snapshot_timestamp).get(currency,
-                                                                                                      s_decimal_0)
+        snapshot_bal = self._balance_ledger.snapshot_locked_balance(currency, self._in_flight_orders_snapshot)
+        in_flight_bal = self._balance_ledger.in_flight_locked_balance(currency, self.in_flight_orders)
+        orders_filled_bal = self._balance_ledger.filled_balance_since_snapshot(
+            currency, self._in_flight_orders_snapshot_timestamp)
         actual_available = available_balance + snapshot_bal - in_flight_bal + orders_filled_bal
         return actual_available
 
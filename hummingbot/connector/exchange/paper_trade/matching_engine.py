@@ -0,0 +1,279 @@
+from bisect import bisect_left, insort
+from collections import defaultdict
+from decimal import Decimal
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+s_decimal_0 = Decimal(0)
+
+
+class PaperTradeOrder:
+    """
+    A resting limit order of the paper trade exchange.
+    `queue_ahead` is the order book amount that was resting at the order price (on the same side) when the order was
+    placed. Trades at the order price consume that amount before filling the order.
+    """
+    __slots__ = ("client_order_id", "trading_pair", "is_buy", "base_asset", "quote_asset", "price", "quantity",
+                 "creation_timestamp", "filled_quantity", "queue_ahead", "base_amount_traded", "quote_amount_traded")
+
+    def __init__(self,
+                 client_order_id: str,
+                 trading_pair: str,
+                 is_buy: bool,
+                 base_asset: str,
+                 quote_asset: str,
+                 price: Decimal,
+                 quantity: Decimal,
+                 creation_timestamp: int,
+                 queue_ahead: Decimal = s_decimal_0):
+        self.client_order_id: str = client_order_id
+        self.trading_pair: str = trading_pair
+        self.is_buy: bool = is_buy
+        self.base_asset: str = base_asset
+        self.quote_asset: str = quote_asset
+        self.price: Decimal = price
+        self.quantity: Decimal = quantity
+        self.creation_timestamp: int = creation_timestamp
+        self.filled_quantity: Decimal = s_decimal_0
+        self.queue_ahead: Decimal = queue_ahead
+        # Totals of the balance changes of the fills, used to report the order completion
+        self.base_amount_traded: Decimal = s_decimal_0
+        self.quote_amount_traded: Decimal = s_decimal_0
+
+    @property
+    def remaining_quantity(self) -> Decimal:
+        return self.quantity - self.filled_quantity
+
+    @property
+    def is_done(self) -> bool:
+        return self.filled_quantity >= self.quantity
+
+    @property
+    def on_hold_asset(self) -> str:
+        return self.quote_asset if self.is_buy else self.base_asset
+
+    @property
+    def on_hold_amount(self) -> Decimal:
+        return self.remaining_quantity * self.price if self.is_buy else self.remaining_quantity
+
+    def __repr__(self) -> str:
+        return (f"PaperTradeOrder('{self.client_order_id}', '{self.trading_pair}', {self.is_buy}, {self.price}, "
+                f"{self.quantity}, filled={self.filled_quantity}, queue_ahead={self.queue_ahead})")
+
+
+class PriceLevelQueues:
+    """
+    The resting orders of one side of a trading pair, in one FIFO queue per price level.
+    Prices are kept sorted, so the orders crossed by a price are found walking the levels from the best one.
+    """
+
+    def __init__(self, is_buy: bool):
+        self._is_buy: bool = is_buy
+        # Orders by client order id. Dictionaries keep the insertion order, which is the queue order
+        self._levels: Dict[Decimal, Dict[str, PaperTradeOrder]] = {}
+        # Level prices in ascending order
+        self._prices: List[Decimal] = []
+        self._orders_count: int = 0
+
+    def __len__(self) -> int:
+        return self._orders_count
+
+    def __iter__(self) -> Iterator[PaperTradeOrder]:
+        for price in self._prices_best_first():
+            yield from self._levels[price].values()
+
+    @property
+    def best_price(self) -> Optional[Decimal]:
+        if len(self._prices) == 0:
+            return None
+        return self._prices[-1] if self._is_buy else self._prices[0]
+
+    def add(self, order: PaperTradeOrder):
+        level = self._levels.get(order.price)
+        if level is None:
+            level = {}
+            self._levels[order.price] = level
+            insort(self._prices, order.price)
+        level[order.client_order_id] = order
+        self._orders_count += 1
+
+    def remove(self, order: PaperTradeOrder):
+        level = self._levels.get(order.price)
+        if level is None or level.pop(order.client_order_id, None) is None:
+            return
+        self._orders_count -= 1
+        if len(level) == 0:
+            del self._levels[order.price]
+            del self._prices[bisect_left(self._prices, order.price)]
+
+    def crossed_orders(self, opposite_price: Decimal) -> List[PaperTradeOrder]:
+        """
+        Returns the orders crossed by the best price of the opposite side of the order book (bids priced at or above
+        the best ask, asks priced at or below the best bid), best priced first
+        """
+        crossed = []
+        for price in self._prices_best_first():
+            if (price < opposite_price) if self._is_buy else (price > opposite_price):
+                break
+            crossed.extend(self._levels[price].values())
+        return crossed
+
+    def trade_fills(self,
+                    trade_price: Decimal,
+                    trade_amount: Decimal,
+                    queue_position_fills: bool) -> List[Tuple[PaperTradeOrder, Decimal]]:
+        """
+        Returns the fills (order, amount) caused by a trade against this side of the book.
+        Orders priced better than the trade are completely filled (the trade went through their level). If
+        `queue_position_fills` is enabled, the trade also fills the orders at the trade price, after consuming the
+        amount ahead of each one in the queue.
+        """
+        fills = []
+        for price in self._prices_best_first():
+            if price == trade_price:
+                if queue_position_fills:
+                    fills.extend(self._queue_fills(self._levels[price], trade_amount))
+                break
+            if (price < trade_price) if self._is_buy else (price > trade_price):
+                break
+            fills.extend((order, order.remaining_quantity) for order in self._levels[price].values())
+        return fills
+
+    def _prices_best_first(self) -> Iterator[Decimal]:
+        return reversed(self._prices) if self._is_buy else iter(self._prices)
+
+    @staticmethod
+    def _queue_fills(level: Dict[str, PaperTradeOrder], trade_amount: Decimal) -> List[Tuple[PaperTradeOrder, Decimal]]:
+        fills = []
+        # The trade amount already assigned to orders earlier in the queue
+        filled_in_level = s_decimal_0
+        for order in level.values():
+            consumed_queue = min(order.queue_ahead, trade_amount)
+            order.queue_ahead -= consumed_queue
+            fill_amount = min(order.remaining_quantity, trade_amount - consumed_queue - filled_in_level)
+            if fill_amount > s_decimal_0:
+                fills.append((order, fill_amount))
+                filled_in_level += fill_amount
+        return fills
+
+
+class PaperTradeMatchingEngine:
+    """
+    Limit order matching for the paper trade exchange. Keeps the resting orders in per trading pair price level
+    queues, the balances on hold for them, and the order book top prices seen at the last crossing check of each
+    trading pair, so that only the pairs with new orders or a changed order book top have to be checked each tick.
+    """
+
+    def __init__(self, queue_position_fills: bool = True):
+        self._queue_position_fills: bool = queue_position_fills
+        self._bids: Dict[str, PriceLevelQueues] = {}
+        self._asks: Dict[str, PriceLevelQueues] = {}
+        self._orders: Dict[str, PaperTradeOrder] = {}
+        self._on_hold_balances: Dict[str, Decimal] = defaultdict(Decimal)
+        self._last_checked_tops: Dict[str, Tuple[float, float]] = {}
+        self._woken_trading_pairs: Set[str] = set()
+
+    @property
+    def on_hold_balances(self) -> Dict[str, Decimal]:
+        return self._on_hold_balances
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def get_order(self, client_order_id: str) -> Optional[PaperTradeOrder]:
+        return self._orders.get(client_order_id)
+
+    def orders(self) -> List[PaperTradeOrder]:
+        """
+        Returns the resting orders, the bids (best priced first) and then the asks (best priced first)
+        """
+        orders = []
+        for queues in (self._bids, self._asks):
+            for side_queues in queues.values():
+                orders.extend(side_queues)
+        return orders
+
+    def add_order(self, order: PaperTradeOrder):
+        queues = self._bids if order.is_buy else self._asks
+        side_queues = queues.get(order.trading_pair)
+        if side_queues is None:
+            side_queues = PriceLevelQueues(is_buy=order.is_buy)
+            queues[order.trading_pair] = side_queues
+        side_queues.add(order)
+        self._orders[order.client_order_id] = order
+        self._on_hold_balances[order.on_hold_asset] += order.on_hold_amount
+        self._woken_trading_pairs.add(order.trading_pair)
+
+    def remove_order(self, client_order_id: str) -> Optional[PaperTradeOrder]:
+        order = self._orders.pop(client_order_id, None)
+        if order is None:
+            return None
+        queues = self._bids if order.is_buy else self._asks
+        side_queues = queues[order.trading_pair]
+        side_queues.remove(order)
+        if len(side_queues) == 0:
+            del queues[order.trading_pair]
+            if order.trading_pair not in self._bids and order.trading_pair not in self._asks:
+                self._last_checked_tops.pop(order.trading_pair, None)
+        self._on_hold_balances[order.on_hold_asset] -= order.on_hold_amount
+        return order
+
+    def apply_fill(self, order: PaperTradeOrder, amount: Decimal, base_amount: Decimal, quote_amount: Decimal):
+        """
+        Registers a fill of the order, removing the order if it is completely filled
+        :param order: the filled order
+        :param amount: the filled amount
+        :param base_amount: base asset balance change of the fill (acquired for buys, sold for sells)
+        :param quote_amount: quote asset balance change of the fill (paid for buys, acquired for sells)
+        """
+        self._on_hold_balances[order.on_hold_asset] -= order.on_hold_amount
+        order.filled_quantity += amount
+        order.base_amount_traded += base_amount
+        order.quote_amount_traded += quote_amount
+        self._on_hold_balances[order.on_hold_asset] += order.on_hold_amount
+        if order.is_done:
+            self.remove_order(order.client_order_id)
+
+    def trading_pairs_to_check(self, order_book_top: Callable[[str], Tuple[float, float]]) -> List[str]:
+        """
+        Returns the trading pairs with resting orders that could have been crossed since the last check: the ones with
+        new orders, or with a best bid or ask different from the last check.
+        :param order_book_top: function returning the order book (best bid, best ask) of a trading pair
+        """
+        trading_pairs = []
+        for trading_pair in set(self._bids).union(self._asks):
+            top = order_book_top(trading_pair)
+            if trading_pair in self._woken_trading_pairs or top != self._last_checked_tops.get(trading_pair):
+                self._last_checked_tops[trading_pair] = top
+                trading_pairs.append(trading_pair)
+        self._woken_trading_pairs.clear()
+        return trading_pairs
+
+    def crossed_orders(self, trading_pair: str, best_bid: Decimal, best_ask: Decimal) -> List[PaperTradeOrder]:
+        """
+        Returns the orders of the trading pair crossed by the order book best prices (NaN prices cross nothing)
+        """
+        crossed = []
+        bids = self._bids.get(trading_pair)
+        if bids is not None and not best_ask.is_nan():
+            crossed.extend(bids.crossed_orders(best_ask))
+        asks = self._asks.get(trading_pair)
+        if asks is not None and not best_bid.is_nan():
+            crossed.extend(asks.crossed_orders(best_bid))
+        return crossed
+
+    def trade_fills(self,
+                    trading_pair: str,
+                    is_maker_buy: bool,
+                    trade_price: Decimal,
+                    trade_amount: Decimal) -> List[Tuple[PaperTradeOrder, Decimal]]:
+        """
+        Returns the fills (order, amount) caused by a public trade
+        :param trading_pair: the trading pair of the trade
+        :param is_maker_buy: True if the trade hit the bids (it was a sell), False if it lifted the asks
+        :param trade_price: the trade price
+        :param trade_amount: the trade amount
+        """
+        side_queues = (self._bids if is_maker_buy else self._asks).get(trading_pair)
+        if side_queues is None:
+            return []
+        return side_queues.trade_fills(trade_price, trade_amount, self._queue_position_fills)
@@ -1,20 +1,9 @@
 from libcpp.set cimport set as cpp_set
-from libcpp.string cimport string
-from libcpp.unordered_map cimport unordered_map
-from libcpp.utility cimport pair
-
-from hummingbot.core.data_type.LimitOrder cimport LimitOrder as CPPLimitOrder
 from hummingbot.core.data_type.OrderExpirationEntry cimport OrderExpirationEntry as CPPOrderExpirationEntry
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.connector.exchange_base cimport ExchangeBase
 
 
-ctypedef cpp_set[CPPLimitOrder] SingleTradingPairLimitOrders
-ctypedef unordered_map[string, SingleTradingPairLimitOrders].iterator LimitOrdersIterator
-ctypedef pair[string, SingleTradingPairLimitOrders] LimitOrdersPair
-ctypedef unordered_map[string, SingleTradingPairLimitOrders] LimitOrders
-ctypedef cpp_set[CPPLimitOrder].iterator SingleTradingPairLimitOrdersIterator
-ctypedef cpp_set[CPPLimitOrder].reverse_iterator SingleTradingPairLimitOrdersRIterator
 ctypedef cpp_set[CPPOrderExpirationEntry] LimitOrderExpirationSet
 ctypedef cpp_set[CPPOrderExpirationEntry].iterator LimitOrderExpirationSetIterator
 
@@ -29,8 +18,7 @@ cdef class QuantizationParams:
 
 cdef class PaperTradeExchange(ExchangeBase):
     cdef:
-        LimitOrders _bid_limit_orders
-        LimitOrders _ask_limit_orders
+        object _matching_engine
         bint _paper_trade_market_initialized
         dict _trading_pairs
         object _queued_orders
@@ -53,31 +41,10 @@ cdef class PaperTradeExchange(ExchangeBase):
                           object amount,
                           object price,
                           object is_maker=*)
-    cdef c_delete_limit_order(self,
-                              LimitOrders *limit_orders_map_ptr,
-                              LimitOrdersIterator *map_it_ptr,
-                              const SingleTradingPairLimitOrdersIterator orders_it)
-    cdef c_process_limit_order(self,
-                               bint is_buy,
-                               LimitOrders *limit_orders_map_ptr,
-                               LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it)
-    cdef c_process_limit_bid_order(self,
-                                   LimitOrders *limit_orders_map_ptr,
-                                   LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
-    cdef c_process_limit_ask_order(self,
-                                   LimitOrders *limit_orders_map_ptr,
-                                   LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
-    cdef c_process_crossed_limit_orders_for_trading_pair(self,
-                                                         bint is_buy,
-                                                         LimitOrders *limit_orders_map_ptr,
-                                                         LimitOrdersIterator *map_it_ptr)
+    cdef object c_get_queue_ahead(self, str trading_pair, bint is_buy, object price)
+    cdef tuple c_get_order_book_top(self, str trading_pair)
+    cdef c_settle_limit_order_fill(self, object order, object amount, dict balances, list events)
+    cdef c_settle_limit_order_fills(self, list fills)
     cdef c_process_crossed_limit_orders(self)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
-    cdef object c_cancel_order_from_orders_map(self,
-                                               LimitOrders *orders_map,
-                                               str trading_pair_str,
-                                               bint cancel_all=*,
-                                               str client_order_id=*)
+    cdef bint c_cancel_limit_order(self, str client_order_id)
@@ -7,13 +7,9 @@ from collections import defaultdict, deque
 from decimal import Decimal, ROUND_DOWN
 from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
-from cpython cimport PyObject
-from cython.operator cimport address, dereference as deref, postincrement as inc
-from libcpp cimport bool as cppbool
-from libcpp.vector cimport vector
-
 from hummingbot.connector.budget_checker import BudgetChecker
 from hummingbot.connector.connector_metrics_collector import DummyMetricsCollector
+from hummingbot.connector.exchange.paper_trade.matching_engine import PaperTradeMatchingEngine, PaperTradeOrder
 from hummingbot.connector.exchange.paper_trade.trading_pair import TradingPair
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.clock cimport Clock
@@ -23,7 +19,6 @@ from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
 from hummingbot.core.data_type.composite_order_book cimport CompositeOrderBook
 from hummingbot.core.data_type.limit_order import LimitOrder
-from hummingbot.core.data_type.limit_order cimport c_create_limit_order_from_cpp_limit_order
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_candidate import OrderCandidate
@@ -41,7 +36,6 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.Utils cimport getIteratorFromReverseIterator, reverse_iterator
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.utils.estimate_fee import build_trade_fee
 
@@ -50,6 +44,7 @@ if TYPE_CHECKING:
 
 ptm_logger = None
 s_decimal_0 = Decimal(0)
+s_float_nan = float("nan")
 
 
 cdef class QuantizationParams:
@@ -150,6 +145,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
     MARKET_SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
     MARKET_BUY_ORDER_CREATED_EVENT_TAG = MarketEvent.BuyOrderCreated.value
+    # Fill limit orders with the trades at their price, once the order book amount ahead of them has been traded
+    QUEUE_POSITION_FILLS = True
 
     def __init__(
         self,
@@ -169,6 +166,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._trading_pairs = {}
         self._queued_orders = deque()
         self._quantization_params = {}
+        self._matching_engine = PaperTradeMatchingEngine(queue_position_fills=self.QUEUE_POSITION_FILLS)
         self._order_book_trade_listener = OrderBookTradeListener(self)
         self._target_market = target_market
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
@@ -244,51 +242,27 @@ cdef class PaperTradeExchange(ExchangeBase):
 
     @property
     def limit_orders(self) -> List[LimitOrder]:
-        cdef:
-            LimitOrdersIterator map_it
-            SingleTradingPairLimitOrders *single_trading_pair_collection_ptr
-            SingleTradingPairLimitOrdersIterator collection_it
-            SingleTradingPairLimitOrdersRIterator collection_rit
-            const CPPLimitOrder *cpp_limit_order_ptr
-            list retval = []
-
-        map_it = self._bid_limit_orders.begin()
-        while map_it != self._bid_limit_orders.end():
-            single_trading_pair_collection_ptr = address(deref(map_it).second)
-            collection_rit = single_trading_pair_collection_ptr.rbegin()
-            while collection_rit != single_trading_pair_collection_ptr.rend():
-                cpp_limit_order_ptr = address(deref(collection_rit))
-                retval.append(c_create_limit_order_from_cpp_limit_order(deref(cpp_limit_order_ptr)))
-                inc(collection_rit)
-            inc(map_it)
-
-        map_it = self._ask_limit_orders.begin()
-        while map_it != self._ask_limit_orders.end():
-            single_trading_pair_collection_ptr = address(deref(map_it).second)
-            collection_it = single_trading_pair_collection_ptr.begin()
-            while collection_it != single_trading_pair_collection_ptr.end():
-                cpp_limit_order_ptr = address(deref(collection_it))
-                retval.append(c_create_limit_order_from_cpp_limit_order(deref(cpp_limit_order_ptr)))
-                inc(collection_it)
-            inc(map_it)
-
-        return retval
+        return [LimitOrder(order.client_order_id,
+                           order.trading_pair,
+                           order.is_buy,
+                           order.base_asset,
+                           order.quote_asset,
+                           order.price,
+                           order.quantity,
+                           order.filled_quantity,
+                           order.creation_timestamp)
+                for order in self._matching_engine.orders()]
 
     @property
     def on_hold_balances(self) -> Dict[str, Decimal]:
-        _on_hold_balances = defaultdict(Decimal)
-        for limit_order in self.limit_orders:
-            if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
-            else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
-        return _on_hold_balances
+        return defaultdict(Decimal, self._matching_engine.on_hold_balances)
 
     @property
     def available_balances(self) -> Dict[str, Decimal]:
         _available_balances = self._account_balances.copy()
-        for trading_pair_str, balance in _available_balances.items():
-            _available_balances[trading_pair_str] -= self.on_hold_balances[trading_pair_str]
+        on_hold_balances = self._matching_engine.on_hold_balances
+        for currency in _available_balances:
+            _available_balances[currency] -= on_hold_balances.get(currency, s_decimal_0)
         return _available_balances
 
     # </editor-fold>
@@ -331,14 +305,7 @@ cdef class PaperTradeExchange(ExchangeBase):
 
         cdef:
             str order_id = self.random_order_id("buy", trading_pair_str)
-            str quote_asset = self._trading_pairs[trading_pair_str].quote_asset
-            string cpp_order_id = order_id.encode("utf8")
-            string cpp_trading_pair_str = trading_pair_str.encode("utf8")
-            string cpp_base_asset = self._trading_pairs[trading_pair_str].base_asset.encode("utf8")
-            string cpp_quote_asset = quote_asset.encode("utf8")
-            LimitOrdersIterator map_it
-            SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
-            pair[LimitOrders.iterator, cppbool] insert_result
+            object trading_pair = self._trading_pairs[trading_pair_str]
 
         quantized_price = (self.c_quantize_order_price(trading_pair_str, price)
                            if order_type is OrderType.LIMIT
@@ -348,25 +315,16 @@ cdef class PaperTradeExchange(ExchangeBase):
             self._queued_orders.append(QueuedOrder(self._current_timestamp, order_id, True, trading_pair_str,
                                                    quantized_amount))
         elif order_type is OrderType.LIMIT:
-
-            map_it = self._bid_limit_orders.find(cpp_trading_pair_str)
-
-            if map_it == self._bid_limit_orders.end():
-                insert_result = self._bid_limit_orders.insert(LimitOrdersPair(cpp_trading_pair_str,
-                                                                              SingleTradingPairLimitOrders()))
-                map_it = insert_result.first
-            limit_orders_collection_ptr = address(deref(map_it).second)
-            limit_orders_collection_ptr.insert(CPPLimitOrder(
-                cpp_order_id,
-                cpp_trading_pair_str,
+            self._matching_engine.add_order(PaperTradeOrder(
+                order_id,
+                trading_pair_str,
                 True,
-                cpp_base_asset,
-                cpp_quote_asset,
-                <PyObject *> quantized_price,
-                <PyObject *> quantized_amount,
-                <PyObject *> None,
+                trading_pair.base_asset,
+                trading_pair.quote_asset,
+                quantized_price,
+                quantized_amount,
                 int(self._current_timestamp * 1e6),
-                0
+                self.c_get_queue_ahead(trading_pair_str, True, quantized_price)
             ))
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
@@ -390,14 +348,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             raise ValueError(f"Trading pair '{trading_pair_str}' does not existing in current data set.")
         cdef:
             str order_id = self.random_order_id("sell", trading_pair_str)
-            str base_asset = self._trading_pairs[trading_pair_str].base_asset
-            string cpp_order_id = order_id.encode("utf8")
-            string cpp_trading_pair_str = trading_pair_str.encode("utf8")
-            string cpp_base_asset = base_asset.encode("utf8")
-            string cpp_quote_asset = self._trading_pairs[trading_pair_str].quote_asset.encode("utf8")
-            LimitOrdersIterator map_it
-            SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
-            pair[LimitOrders.iterator, cppbool] insert_result
+            object trading_pair = self._trading_pairs[trading_pair_str]
 
         quantized_price = (self.c_quantize_order_price(trading_pair_str, price)
                            if order_type is OrderType.LIMIT
@@ -407,24 +358,16 @@ cdef class PaperTradeExchange(ExchangeBase):
             self._queued_orders.append(QueuedOrder(self._current_timestamp, order_id, False, trading_pair_str,
                                                    quantized_amount))
         elif order_type is OrderType.LIMIT:
-            map_it = self._ask_limit_orders.find(cpp_trading_pair_str)
-
-            if map_it == self._ask_limit_orders.end():
-                insert_result = self._ask_limit_orders.insert(LimitOrdersPair(cpp_trading_pair_str,
-                                                                              SingleTradingPairLimitOrders()))
-                map_it = insert_result.first
-            limit_orders_collection_ptr = address(deref(map_it).second)
-            limit_orders_collection_ptr.insert(CPPLimitOrder(
-                cpp_order_id,
-                cpp_trading_pair_str,
+            self._matching_engine.add_order(PaperTradeOrder(
+                order_id,
+                trading_pair_str,
                 False,
-                cpp_base_asset,
-                cpp_quote_asset,
-                <PyObject *> quantized_price,
-                <PyObject *> quantized_amount,
-                <PyObject *> None,
+                trading_pair.base_asset,
+                trading_pair.quote_asset,
+                quantized_price,
+                quantized_amount,
                 int(self._current_timestamp * 1e6),
-                0
+                self.c_get_queue_ahead(trading_pair_str, False, quantized_price)
             ))
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
@@ -618,162 +561,91 @@ cdef class PaperTradeExchange(ExchangeBase):
             else:
                 return
 
-    cdef c_delete_limit_order(self,
-                              LimitOrders *limit_orders_map_ptr,
-                              LimitOrdersIterator *map_it_ptr,
-                              const SingleTradingPairLimitOrdersIterator orders_it):
+    cdef object c_get_queue_ahead(self, str trading_pair, bint is_buy, object price):
+        """
+        Returns the order book amount resting at the price, on the bid side for buy orders and on the ask side for
+        sell orders. That amount has to be traded before a new limit order at that price can be filled by trades.
+        """
         cdef:
-            SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
-        try:
-            orders_collection_ptr.erase(orders_it)
-            if orders_collection_ptr.empty():
-                map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
-            return True
-        except Exception as err:
-            self.logger().error("Error deleting limit order.", exc_info=True)
-            return False
-
-    cdef c_process_limit_bid_order(self,
-                                   LimitOrders *limit_orders_map_ptr,
-                                   LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+            double float_price = float(price)
+            double amount = 0
+
+        for row in (order_book.bid_entries() if is_buy else order_book.ask_entries()):
+            if (row.price < float_price) if is_buy else (row.price > float_price):
+                break
+            if row.price == float_price:
+                amount += row.amount
+        return Decimal(str(amount))
+
+    cdef tuple c_get_order_book_top(self, str trading_pair):
         cdef:
-            const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
-            str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
-            str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
-            str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
-            str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
-            object amount = <object> cpp_limit_order_ptr.getQuantity()
-            object price = <object> cpp_limit_order_ptr.getPrice()
-            object quote_balance = self.c_get_balance(quote_asset)
-            object base_balance = self.c_get_balance(base_asset)
-
-        order_candidate = OrderCandidate(
-            trading_pair=trading_pair_str,
-            is_maker=True,
-            order_type=OrderType.LIMIT,
-            order_side=TradeType.BUY,
-            amount=amount,
-            price=price,
-            from_total_balances=True
-        )
-
-        adjusted_order_candidate = self._budget_checker.populate_collateral_entries(order_candidate)
-
-        # Quote currency used, including fees.
-        paid_amount = adjusted_order_candidate.order_collateral.amount
-        # Base currency acquired, including fees.
-        acquired_amount = adjusted_order_candidate.potential_returns.amount
-
-        # It's not possible to fulfill the order, the possible acquired amount is less than requested
-        if paid_amount > quote_balance:
-            self.logger().warning(f"Not enough {quote_asset} balance to fill limit buy order on {trading_pair_str}. "
-                                  f"{paid_amount:.8g} {quote_asset} needed vs. "
-                                  f"{quote_balance:.8g} {quote_asset} available.")
-
-            self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
-            self.c_trigger_event(self.MARKET_ORDER_CANCELED_EVENT_TAG,
-                                 OrderCancelledEvent(self._current_timestamp,
-                                                     order_id)
-                                 )
-            return
-
-        # The order was successfully executed
-        self.c_set_balance(quote_asset,
-                           quote_balance - paid_amount)
-        self.c_set_balance(base_asset,
-                           base_balance + acquired_amount)
-
-        # add fee
-        fees = build_trade_fee(
-            exchange=self.name,
-            is_maker=True,
-            base_currency="",
-            quote_currency="",
-            order_type=OrderType.LIMIT,
-            order_side=TradeType.BUY,
-            amount=Decimal("0"),
-            price=Decimal("0"),
-        )
-
-        # Emit the trade and order completed events.
-        self.c_trigger_event(
-            self.ORDER_FILLED_EVENT_TAG,
-            OrderFilledEvent(
-                self._current_timestamp,
-                order_id,
-                trading_pair_str,
-                TradeType.BUY,
-                OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
-                fees,
-                exchange_trade_id=str(int(self._time() * 1e6))
-            ))
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+            object best_bid = s_float_nan
+            object best_ask = s_float_nan
+        try:
+            best_bid = order_book.c_get_price(False)
+        except EnvironmentError:
+            pass
+        try:
+            best_ask = order_book.c_get_price(True)
+        except EnvironmentError:
+            pass
+        return best_bid, best_ask
 
-        self.c_trigger_event(
-            self.BUY_ORDER_COMPLETED_EVENT_TAG,
-            BuyOrderCompletedEvent(
-                self._current_timestamp,
-                order_id,
-                base_asset,
-                quote_asset,
-                acquired_amount,
-                paid_amount,
-                OrderType.LIMIT
-            ))
-        self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+    def _order_book_top(self, trading_pair: str) -> Tuple[float, float]:
+        return self.c_get_order_book_top(trading_pair)
 
-    cdef c_process_limit_ask_order(self,
-                                   LimitOrders *limit_orders_map_ptr,
-                                   LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+    cdef c_settle_limit_order_fill(self, object order, object amount, dict balances, list events):
         cdef:
-            const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
-            str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
-            str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
-            str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
-            str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
-            object amount = <object> cpp_limit_order_ptr.getQuantity()
-            object price = <object> cpp_limit_order_ptr.getPrice()
-            object quote_balance = self.c_get_balance(quote_asset)
-            object base_balance = self.c_get_balance(base_asset)
+            str trading_pair_str = order.trading_pair
+            str order_id = order.client_order_id
+            str base_asset = order.base_asset
+            str quote_asset = order.quote_asset
+            bint is_buy = order.is_buy
+            object trade_type = TradeType.BUY if is_buy else TradeType.SELL
+            str spent_asset = quote_asset if is_buy else base_asset
+            str acquired_asset = base_asset if is_buy else quote_asset
+
+        for asset in (spent_asset, acquired_asset):
+            if asset not in balances:
+                balances[asset] = self.c_get_balance(asset)
 
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
-            # Market orders are not maker orders
             is_maker=True,
             order_type=OrderType.LIMIT,
-            order_side=TradeType.SELL,
+            order_side=trade_type,
             amount=amount,
-            price=price,
+            price=order.price,
             from_total_balances=True
         )
 
         adjusted_order_candidate = self._budget_checker.populate_collateral_entries(order_candidate)
 
-        # Base currency used, including fees.
-        sold_amount = adjusted_order_candidate.order_collateral.amount
-        # Quote currency acquired, including fees.
+        # Quote currency used for buys, base currency used for sells, including fees.
+        spent_amount = adjusted_order_candidate.order_collateral.amount
+        # Base currency acquired for buys, quote currency acquired for sells, including fees.
         acquired_amount = adjusted_order_candidate.potential_returns.amount
 
-        # It's not possible to fulfill the order, the possible sold amount is less than requested
-        if sold_amount > base_balance:
-            self.logger().warning(f"Not enough {base_asset} balance to fill limit sell order on {trading_pair_str}. "
-                                  f"{sold_amount:.8g} {base_asset} needed vs. "
-                                  f"{base_balance:.8g} {base_asset} available.")
-            self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
-            self.c_trigger_event(self.MARKET_ORDER_CANCELED_EVENT_TAG,
-                                 OrderCancelledEvent(self._current_timestamp,
-                                                     order_id)
-                                 )
+        # It's not possible to fulfill the order, the available balance is less than required
+        if spent_amount > balances[spent_asset]:
+            self.logger().warning(f"Not enough {spent_asset} balance to fill limit {trade_type.name.lower()} order on "
+                                  f"{trading_pair_str}. "
+                                  f"{spent_amount:.8g} {spent_asset} needed vs. "
+                                  f"{balances[spent_asset]:.8g} {spent_asset} available.")
+            self._matching_engine.remove_order(order_id)
+            events.append((self.MARKET_ORDER_CANCELED_EVENT_TAG,
+                           OrderCancelledEvent(self._current_timestamp, order_id)))
             return
 
-        # The order was successfully executed
-        self.c_set_balance(quote_asset,
-                           quote_balance + acquired_amount)
-        self.c_set_balance(base_asset,
-                           base_balance - sold_amount)
+        # The fill was successfully executed
+        balances[spent_asset] -= spent_amount
+        balances[acquired_asset] += acquired_amount
+        if is_buy:
+            self._matching_engine.apply_fill(order, amount, acquired_amount, spent_amount)
+        else:
+            self._matching_engine.apply_fill(order, amount, spent_amount, acquired_amount)
 
         # add fee
         fees = build_trade_fee(
@@ -782,228 +654,130 @@ cdef class PaperTradeExchange(ExchangeBase):
             base_currency="",
             quote_currency="",
             order_type=OrderType.LIMIT,
-            order_side=TradeType.SELL,
+            order_side=trade_type,
             amount=Decimal("0"),
             price=Decimal("0"),
         )
 
-        # Emit the trade and order completed events.
-        self.c_trigger_event(
+        events.append((
             self.ORDER_FILLED_EVENT_TAG,
             OrderFilledEvent(
                 self._current_timestamp,
                 order_id,
                 trading_pair_str,
-                TradeType.SELL,
+                trade_type,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                order.price,
+                amount,
                 fees,
                 exchange_trade_id=str(int(self._time() * 1e6))
-            ))
-
-        self.c_trigger_event(
-            self.SELL_ORDER_COMPLETED_EVENT_TAG,
-            SellOrderCompletedEvent(
-                self._current_timestamp,
-                order_id,
-                base_asset,
-                quote_asset,
-                sold_amount,
-                acquired_amount,
-                OrderType.LIMIT
-            ))
-        self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
-
-    cdef c_process_limit_order(self,
-                               bint is_buy,
-                               LimitOrders *limit_orders_map_ptr,
-                               LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it):
-        try:
-            if is_buy:
-                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
-            else:
-                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
-        except Exception as e:
-            self.logger().error(f"Error processing limit order.", exc_info=True)
-
-    cdef c_process_crossed_limit_orders_for_trading_pair(self,
-                                                         bint is_buy,
-                                                         LimitOrders *limit_orders_map_ptr,
-                                                         LimitOrdersIterator *map_it_ptr):
+            )))
+
+        if order.is_done:
+            completed_event_class = BuyOrderCompletedEvent if is_buy else SellOrderCompletedEvent
+            events.append((
+                self.BUY_ORDER_COMPLETED_EVENT_TAG if is_buy else self.SELL_ORDER_COMPLETED_EVENT_TAG,
+                completed_event_class(
+                    self._current_timestamp,
+                    order_id,
+                    base_asset,
+                    quote_asset,
+                    order.base_amount_traded,
+                    order.quote_amount_traded,
+                    OrderType.LIMIT
+                )))
+
+    cdef c_settle_limit_order_fills(self, list fills):
         """
-        Trigger limit orders when the opposite side of the order book has crossed the limit order's price.
-        This implies someone was ready to fill the limit order, if that limit order was on the market.
+        Applies a batch of limit order fills. The balances are updated once per asset after all the fills have been
+        settled, and then the fill, completion and cancellation events are emitted in the order of the fills.
 
-        :param is_buy: are the limit orders on the bid side?
-        :param limit_orders_map_ptr: pointer to the limit orders map
-        :param map_it_ptr: limit orders map iterator, which implies the trading pair being processed
+        :param fills: list of (order, fill amount) tuples
         """
         cdef:
-            str trading_pair = deref(deref(map_it_ptr)).first.decode("utf8")
-            object opposite_order_book_price = self.c_get_price(trading_pair, is_buy)
-            SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
-            SingleTradingPairLimitOrdersIterator orders_it = orders_collection_ptr.begin()
-            SingleTradingPairLimitOrdersRIterator orders_rit = orders_collection_ptr.rbegin()
-            vector[SingleTradingPairLimitOrdersIterator] process_order_its
-            const CPPLimitOrder *cpp_limit_order_ptr = NULL
-
-        if is_buy:
-            while orders_rit != orders_collection_ptr.rend():
-                cpp_limit_order_ptr = address(deref(orders_rit))
-                if opposite_order_book_price > <object>cpp_limit_order_ptr.getPrice():
-                    break
-                process_order_its.push_back(getIteratorFromReverseIterator(
-                    <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
-                inc(orders_rit)
-        else:
-            while orders_it != orders_collection_ptr.end():
-                cpp_limit_order_ptr = address(deref(orders_it))
-                if opposite_order_book_price < <object>cpp_limit_order_ptr.getPrice():
-                    break
-                process_order_its.push_back(orders_it)
-                inc(orders_it)
-
-        for orders_it in process_order_its:
-            self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
+            dict balances = {}
+            list events = []
+
+        for order, amount in fills:
+            # The order could have been cancelled by a previous fill in the batch
+            if self._matching_engine.get_order(order.client_order_id) is not order:
+                continue
+            try:
+                self.c_settle_limit_order_fill(order, amount, balances, events)
+            except Exception:
+                self.logger().error("Error processing limit order.", exc_info=True)
+
+        for asset, balance in balances.items():
+            self.c_set_balance(asset, balance)
+        for event_tag, event in events:
+            self.c_trigger_event(event_tag, event)
 
     cdef c_process_crossed_limit_orders(self):
+        """
+        Trigger limit orders when the opposite side of the order book has crossed the limit order's price.
+        This implies someone was ready to fill the limit order, if that limit order was on the market.
+        Only the trading pairs with new orders or with a different best bid or ask since the last tick are checked.
+        """
         cdef:
-            LimitOrders *limit_orders_ptr = address(self._bid_limit_orders)
-            LimitOrdersIterator map_it = limit_orders_ptr.begin()
-
-        while map_it != limit_orders_ptr.end():
-            self.c_process_crossed_limit_orders_for_trading_pair(True, limit_orders_ptr, address(map_it))
-            if map_it != limit_orders_ptr.end():
-                inc(map_it)
+            list fills = []
 
-        limit_orders_ptr = address(self._ask_limit_orders)
-        map_it = limit_orders_ptr.begin()
-
-        while map_it != limit_orders_ptr.end():
-            self.c_process_crossed_limit_orders_for_trading_pair(False, limit_orders_ptr, address(map_it))
-            if map_it != limit_orders_ptr.end():
-                inc(map_it)
+        if len(self._matching_engine) == 0:
+            return
+        for trading_pair in self._matching_engine.trading_pairs_to_check(self._order_book_top):
+            crossed_orders = self._matching_engine.crossed_orders(trading_pair,
+                                                                  self.c_get_price(trading_pair, False),
+                                                                  self.c_get_price(trading_pair, True))
+            fills.extend((order, order.remaining_quantity) for order in crossed_orders)
+        if len(fills) > 0:
+            self.c_settle_limit_order_fills(fills)
 
     # <editor-fold desc="Event listener functions">
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event):
         """
-        Trigger limit orders when incoming market orders have crossed the limit order's price.
+        Trigger limit orders when incoming market orders have crossed the limit order's price. Orders at the trade
+        price are partially filled with the trade amount left after the amount ahead of them in the queue.
 
         :param order_book_trade_event: trade event from order book
         """
         cdef:
-            string cpp_trading_pair = order_book_trade_event.trading_pair.encode("utf8")
             bint is_maker_buy = order_book_trade_event.type is TradeType.SELL
-            object trade_price = order_book_trade_event.price
-            object trade_quantity = order_book_trade_event.amount
-            LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
-                                                 if is_maker_buy
-                                                 else address(self._ask_limit_orders))
-            LimitOrdersIterator map_it = limit_orders_map_ptr.find(cpp_trading_pair)
-            SingleTradingPairLimitOrders *orders_collection_ptr = NULL
-            SingleTradingPairLimitOrdersIterator orders_it
-            SingleTradingPairLimitOrdersRIterator orders_rit
-            vector[SingleTradingPairLimitOrdersIterator] process_order_its
-            const CPPLimitOrder *cpp_limit_order_ptr = NULL
-
-        if map_it == limit_orders_map_ptr.end():
-            return
-
-        orders_collection_ptr = address(deref(map_it).second)
-        if is_maker_buy:
-            orders_rit = orders_collection_ptr.rbegin()
-            while orders_rit != orders_collection_ptr.rend():
-                cpp_limit_order_ptr = address(deref(orders_rit))
-                if <object>cpp_limit_order_ptr.getPrice() <= trade_price:
-                    break
-                process_order_its.push_back(getIteratorFromReverseIterator(
-                    <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
-                inc(orders_rit)
-        else:
-            orders_it = orders_collection_ptr.begin()
-            while orders_it != orders_collection_ptr.end():
-                cpp_limit_order_ptr = address(deref(orders_it))
-                if <object>cpp_limit_order_ptr.getPrice() >= trade_price:
-                    break
-                process_order_its.push_back(orders_it)
-                inc(orders_it)
+            list fills
 
-        for orders_it in process_order_its:
-            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
+        fills = self._matching_engine.trade_fills(order_book_trade_event.trading_pair,
+                                                  is_maker_buy,
+                                                  Decimal(str(order_book_trade_event.price)),
+                                                  Decimal(str(order_book_trade_event.amount)))
+        if len(fills) > 0:
+            self.c_settle_limit_order_fills(fills)
 
     # </editor-fold>
 
     cdef object c_get_available_balance(self, str currency):
-        return self.available_balances.get(currency.upper(), s_decimal_0)
+        currency = currency.upper()
+        if currency not in self._account_balances:
+            return s_decimal_0
+        return self._account_balances[currency] - self._matching_engine.on_hold_balances.get(currency, s_decimal_0)
 
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         cdef:
-            LimitOrders *limit_orders_map_ptr
             list cancellation_results = []
-        limit_orders_map_ptr = address(self._bid_limit_orders)
-        for trading_pair_str in self._trading_pairs.keys():
-            results = self.c_cancel_order_from_orders_map(limit_orders_map_ptr, trading_pair_str, cancel_all=True)
-            cancellation_results.extend(results)
-
-        limit_orders_map_ptr = address(self._ask_limit_orders)
-        for trading_pair_str in self._trading_pairs.keys():
-            results = self.c_cancel_order_from_orders_map(limit_orders_map_ptr, trading_pair_str, cancel_all=True)
-            cancellation_results.extend(results)
+        for order in self._matching_engine.orders():
+            if self.c_cancel_limit_order(order.client_order_id):
+                cancellation_results.append(CancellationResult(order.client_order_id, True))
         return cancellation_results
 
-    cdef object c_cancel_order_from_orders_map(self,
-                                               LimitOrders *orders_map,
-                                               str trading_pair_str,
-                                               bint cancel_all=False,
-                                               str client_order_id=None):
-        cdef:
-            string cpp_trading_pair = trading_pair_str.encode("utf8")
-            LimitOrdersIterator map_it = orders_map.find(cpp_trading_pair)
-            SingleTradingPairLimitOrders *limit_orders_collection_ptr = NULL
-            SingleTradingPairLimitOrdersIterator orders_it
-            vector[SingleTradingPairLimitOrdersIterator] process_order_its
-            const CPPLimitOrder *limit_order_ptr = NULL
-            str limit_order_cid
-            list cancellation_results = []
-        try:
-            if map_it == orders_map.end():
-                return []
-
-            limit_orders_collection_ptr = address(deref(map_it).second)
-            orders_it = limit_orders_collection_ptr.begin()
-            while orders_it != limit_orders_collection_ptr.end():
-                limit_order_ptr = address(deref(orders_it))
-                limit_order_cid = limit_order_ptr.getClientOrderID().decode("utf8")
-                if (not cancel_all and limit_order_cid == client_order_id) or cancel_all:
-                    process_order_its.push_back(orders_it)
-                inc(orders_it)
-
-            for orders_it in process_order_its:
-                limit_order_ptr = address(deref(orders_it))
-                limit_order_cid = limit_order_ptr.getClientOrderID().decode("utf8")
-                delete_success = self.c_delete_limit_order(orders_map, address(map_it), orders_it)
-                cancellation_results.append(CancellationResult(limit_order_cid,
-                                                               delete_success))
-                self.c_trigger_event(self.MARKET_ORDER_CANCELED_EVENT_TAG,
-                                     OrderCancelledEvent(self._current_timestamp,
-                                                         limit_order_cid)
-                                     )
-            return cancellation_results
-        except Exception as err:
-            self.logger().error(f"Error canceling order.", exc_info=True)
+    cdef bint c_cancel_limit_order(self, str client_order_id):
+        if self._matching_engine.remove_order(client_order_id) is None:
+            return False
+        self.c_trigger_event(self.MARKET_ORDER_CANCELED_EVENT_TAG,
+                             OrderCancelledEvent(self._current_timestamp, client_order_id))
+        return True
 
     cdef c_cancel(self, str trading_pair_str, str client_order_id):
         cdef:
-            string cpp_trading_pair = trading_pair_str.encode("utf8")
-            string cpp_client_order_id = client_order_id.encode("utf8")
-            str trade_type = client_order_id.split("://")[0]
-            bint is_maker_buy = trade_type.upper() == "BUY"
-            LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
-                                                 if is_maker_buy
-                                                 else address(self._ask_limit_orders))
-        self.c_cancel_order_from_orders_map(limit_orders_map_ptr, trading_pair_str, False, client_order_id)
+            object order = self._matching_engine.get_order(client_order_id)
+        if order is not None and order.trading_pair == trading_pair_str:
+            self.c_cancel_limit_order(client_order_id)
 
     cdef object c_get_fee(self,
                           str base_asset,
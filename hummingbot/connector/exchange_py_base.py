@@ -45,6 +45,8 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    ORDER_BOOK_INIT_MAX_CONCURRENCY = 10
+    ORDER_BOOK_COALESCE_DIFFS = True
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -76,7 +78,9 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            max_concurrent_initializations=self.ORDER_BOOK_INIT_MAX_CONCURRENCY,
+            coalesce_diffs=self.ORDER_BOOK_COALESCE_DIFFS))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
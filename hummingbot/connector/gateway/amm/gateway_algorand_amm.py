@@ -11,7 +11,6 @@ from hummingbot.core.data_type.in_flight_order import OrderState, OrderUpdate
 from hummingbot.core.data_type.trade_fee import TokenAmount
 from hummingbot.core.event.events import TradeType
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
-from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.utils.tracking_nonce import NonceCreator
 from hummingbot.logger import HummingbotLogger
@@ -205,7 +204,6 @@ class GatewayAlgorandAMM(GatewayEVMAMM):
                 )
                 await self._order_tracker.process_order_not_found(tracked_order.client_order_id)
 
-    @async_ttl_cache(ttl=5, maxsize=10)
     async def get_quote_price(
             self,
             trading_pair: str,
@@ -228,9 +226,7 @@ class GatewayAlgorandAMM(GatewayEVMAMM):
 
         # Pull the price from gateway.
         try:
-            resp: Dict[str, Any] = await self._get_gateway_instance().get_price(
-                self.chain, self.network, self.connector_name, base, quote, amount, side
-            )
+            resp: Dict[str, Any] = await self._get_price_response(trading_pair, side, amount)
             return self.parse_price_response(base, quote, amount, side, price_response=resp, process_exception=False)
         except asyncio.CancelledError:
             raise
@@ -14,6 +14,7 @@ from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.gateway.gateway_in_flight_order import GatewayInFlightOrder
 from hummingbot.connector.gateway.gateway_price_shim import GatewayPriceShim
+from hummingbot.connector.gateway.gateway_quote_cache import GatewayQuoteCache, GatewayQuoteCacheKey
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.in_flight_order import OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
@@ -29,7 +30,6 @@ from hummingbot.core.event.events import (
 from hummingbot.core.gateway import check_transaction_exceptions
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.logger import HummingbotLogger
@@ -408,7 +408,47 @@ class GatewayEVMAMM(ConnectorBase):
             return Decimal(str(price))
         return None
 
-    @async_ttl_cache(ttl=5, maxsize=10)
+    async def _get_price_response(self, trading_pair: str, side: TradeType, amount: Decimal) -> Dict[str, Any]:
+        """
+        Gets the Gateway price response of the amount, through the shared quote cache.
+
+        :param trading_pair: The market trading pair
+        :param side: The trade side
+        :param amount: The amount required (in base token unit)
+        """
+        base, quote = trading_pair.split("-")
+        quote_cache: GatewayQuoteCache = GatewayQuoteCache.get_instance()
+        key: GatewayQuoteCacheKey = quote_cache.create_key(
+            self.chain, self.network, self.connector_name, trading_pair, side, amount
+        )
+        return await quote_cache.get_price(
+            key,
+            lambda: self._get_gateway_instance().get_price(
+                self.chain, self.network, self.connector_name, base, quote, key.amount, side
+            )
+        )
+
+    async def prefetch_quote_prices(self, trading_pair: str, is_buy: bool, amounts: List[Decimal]):
+        """
+        Requests the quotes of several amounts concurrently, so the following quote price queries for those amounts are
+        served from the quote cache.
+
+        :param trading_pair: The market trading pair
+        :param is_buy: True for an intention to buy, False for an intention to sell
+        :param amounts: The amounts required (in base token unit)
+        """
+        side: TradeType = TradeType.BUY if is_buy else TradeType.SELL
+        results = await safe_gather(
+            *[self._get_price_response(trading_pair, side, amount) for amount in amounts],
+            return_exceptions=True
+        )
+        for amount, result in zip(amounts, results):
+            if isinstance(result, Exception):
+                self.logger().network(
+                    f"Error prefetching quote price for {trading_pair} {side} order for {amount} amount.",
+                    exc_info=result
+                )
+
     async def get_quote_price(
             self,
             trading_pair: str,
@@ -442,9 +482,7 @@ class GatewayEVMAMM(ConnectorBase):
             if test_price is not None:
                 # Grab the gas price for test net.
                 try:
-                    resp: Dict[str, Any] = await self._get_gateway_instance().get_price(
-                        self.chain, self.network, self.connector_name, base, quote, amount, side
-                    )
+                    resp: Dict[str, Any] = await self._get_price_response(trading_pair, side, amount)
                     gas_price_token: str = resp["gasPriceToken"]
                     gas_cost: Decimal = Decimal(resp["gasCost"])
                     self.network_transaction_fee = TokenAmount(gas_price_token, gas_cost)
@@ -456,9 +494,7 @@ class GatewayEVMAMM(ConnectorBase):
 
         # Pull the price from gateway.
         try:
-            resp: Dict[str, Any] = await self._get_gateway_instance().get_price(
-                self.chain, self.network, self.connector_name, base, quote, amount, side
-            )
+            resp: Dict[str, Any] = await self._get_price_response(trading_pair, side, amount)
             return self.parse_price_response(base, quote, amount, side, price_response=resp)
         except asyncio.CancelledError:
             raise
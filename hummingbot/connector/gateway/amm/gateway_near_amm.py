@@ -10,7 +10,6 @@ from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.in_flight_order import OrderState, OrderUpdate
 from hummingbot.core.data_type.trade_fee import TokenAmount
-from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
@@ -163,7 +162,6 @@ class GatewayNearAMM(GatewayEVMAMM):
         """
         pass
 
-    @async_ttl_cache(ttl=5, maxsize=10)
     async def get_quote_price(
             self,
             trading_pair: str,
@@ -197,9 +195,7 @@ class GatewayNearAMM(GatewayEVMAMM):
             if test_price is not None:
                 # Grab the gas price for test net.
                 try:
-                    resp: Dict[str, Any] = await self._get_gateway_instance().get_price(
-                        self.chain, self.network, self.connector_name, base, quote, amount, side
-                    )
+                    resp: Dict[str, Any] = await self._get_price_response(trading_pair, side, amount)
                     gas_price_token: str = resp["gasPriceToken"]
                     gas_cost: Decimal = Decimal(resp["gasCost"])
                     self.network_transaction_fee = TokenAmount(gas_price_token, gas_cost)
@@ -211,9 +207,7 @@ class GatewayNearAMM(GatewayEVMAMM):
 
         # Pull the price from gateway.
         try:
-            resp: Dict[str, Any] = await self._get_gateway_instance().get_price(
-                self.chain, self.network, self.connector_name, base, quote, amount, side
-            )
+            resp: Dict[str, Any] = await self._get_price_response(trading_pair, side, amount)
             return self.parse_price_response(base, quote, amount, side, price_response=resp, process_exception=False)
         except asyncio.CancelledError:
             raise
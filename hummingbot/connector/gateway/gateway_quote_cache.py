@@ -0,0 +1,149 @@
+import asyncio
+import time
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, Tuple
+
+from hummingbot.core.data_type.common import TradeType
+
+
+class GatewayQuoteCacheKey(NamedTuple):
+    chain: str
+    network: str
+    connector_name: str
+    trading_pair: str
+    side: TradeType
+    amount: Decimal
+
+
+class GatewayQuoteCache:
+    """
+    Shared cache of the AMM price quotes returned by Gateway.
+
+    AMM prices only change when a new block is produced, so a quote is reused for the block time of its chain. The
+    quotes are keyed by chain, network, connector, trading pair, side and amount bucket: the amounts are rounded to
+    `amount_significant_digits` significant digits, and the quote of a bucket is requested for its rounded amount.
+    Concurrent requests for the same key share a single in flight Gateway call, and failed calls are not cached.
+    """
+    _shared_instance: Optional["GatewayQuoteCache"] = None
+
+    DEFAULT_BLOCK_TIME = 5.0
+    BLOCK_TIMES: Dict[str, float] = {
+        "ethereum": 12.0,
+        "polygon": 2.0,
+        "avalanche": 2.0,
+        "binance-smart-chain": 3.0,
+        "cronos": 6.0,
+        "harmony": 2.0,
+        "near": 1.0,
+        "algorand": 4.0,
+    }
+    AMOUNT_SIGNIFICANT_DIGITS = 8
+    MAX_ENTRIES = 1000
+
+    def __init__(self,
+                 amount_significant_digits: int = AMOUNT_SIGNIFICANT_DIGITS,
+                 max_entries: int = MAX_ENTRIES,
+                 time_func: Callable[[], float] = time.monotonic):
+        self._amount_significant_digits = amount_significant_digits
+        self._max_entries = max_entries
+        self._time_func = time_func
+        self._block_times: Dict[str, float] = dict(self.BLOCK_TIMES)
+        # key -> (expiry time, Gateway response)
+        self._entries: Dict[GatewayQuoteCacheKey, Tuple[float, Dict[str, Any]]] = {}
+        self._in_flight: Dict[GatewayQuoteCacheKey, asyncio.Task] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    @classmethod
+    def get_instance(cls) -> "GatewayQuoteCache":
+        if cls._shared_instance is None:
+            cls._shared_instance = GatewayQuoteCache()
+        return cls._shared_instance
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "entries": len(self._entries),
+            "in_flight": len(self._in_flight),
+        }
+
+    def block_time(self, chain: str) -> float:
+        return self._block_times.get(chain, self.DEFAULT_BLOCK_TIME)
+
+    def set_block_time(self, chain: str, block_time: float):
+        if block_time <= 0:
+            raise ValueError("The block time must be positive.")
+        self._block_times[chain] = block_time
+
+    def amount_bucket(self, amount: Decimal) -> Decimal:
+        """
+        :return: the amount rounded to the significant digits of the cache
+        """
+        if not amount.is_finite() or amount == 0:
+            return amount
+        exponent = amount.adjusted() - self._amount_significant_digits + 1
+        bucket = amount.quantize(Decimal(1).scaleb(exponent)).normalize()
+        # Keep the integer amounts out of the scientific notation
+        return bucket.quantize(Decimal(1)) if bucket.as_tuple().exponent > 0 else bucket
+
+    def create_key(self,
+                   chain: str,
+                   network: str,
+                   connector_name: str,
+                   trading_pair: str,
+                   side: TradeType,
+                   amount: Decimal) -> GatewayQuoteCacheKey:
+        return GatewayQuoteCacheKey(chain, network, connector_name, trading_pair, side, self.amount_bucket(amount))
+
+    def clear(self):
+        self._entries.clear()
+
+    async def get_price(self,
+                        key: GatewayQuoteCacheKey,
+                        fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Returns the cached quote of the key, or requests it with `fetch` if there is no valid quote. The response is
+        shared with the other callers and must not be modified.
+
+        :param key: the quote key, created with `create_key`
+        :param fetch: function requesting the quote of the key's amount to Gateway
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > self._time_func():
+            self._hits += 1
+            return entry[1]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            self._misses += 1
+            task = asyncio.ensure_future(self._fetch(key, fetch))
+            # The exception is retrieved by the waiting callers, unless all of them got cancelled
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._in_flight[key] = task
+        else:
+            self._coalesced += 1
+        # A caller being cancelled must not cancel the request the other callers are waiting for
+        return await asyncio.shield(task)
+
+    async def _fetch(self,
+                     key: GatewayQuoteCacheKey,
+                     fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        try:
+            response = await fetch()
+            self._store(key, response)
+            return response
+        finally:
+            self._in_flight.pop(key, None)
+
+    def _store(self, key: GatewayQuoteCacheKey, response: Dict[str, Any]):
+        now = self._time_func()
+        self._entries.pop(key, None)
+        self._entries[key] = (now + self.block_time(key.chain), response)
+        if len(self._entries) > self._max_entries:
+            self._entries = {k: entry for k, entry in self._entries.items() if entry[0] > now}
+            while len(self._entries) > self._max_entries:
+                del self._entries[next(iter(self._entries))]
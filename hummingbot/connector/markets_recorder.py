@@ -1,18 +1,18 @@
 import asyncio
 import logging
 import os.path
+import queue
 import threading
 import time
 from decimal import Decimal
-from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-import pandas as pd
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
-from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap
+from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap, MarketsRecorderConfigMap
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.trade_fills_csv_sink import TradeFillsCsvSink
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
@@ -44,9 +44,13 @@ from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
 
+# A database write, executed in a transaction. It can return a function to be called once the transaction is committed.
+WriteFunction = Callable[[Session], Optional[Callable[[], None]]]
+
 
 class MarketsRecorder:
     _logger = None
+    WRITE_BEHIND_MAX_ATTEMPTS = 3
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
@@ -63,7 +67,8 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 markets_recorder_config: Optional[MarketsRecorderConfigMap] = None):
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -74,6 +79,33 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+
+        # Write-behind mode: records are queued and written in batches by a background thread
+        self._write_behind_enabled: bool = (markets_recorder_config is not None
+                                            and markets_recorder_config.write_behind_enabled)
+        self._write_behind_flush_interval: float = (markets_recorder_config.write_behind_flush_interval
+                                                    if markets_recorder_config is not None else 1.0)
+        self._write_behind_batch_size: int = (markets_recorder_config.write_behind_batch_size
+                                              if markets_recorder_config is not None else 100)
+        self._pending_writes: "queue.Queue[WriteFunction]" = queue.Queue()
+        self._pending_writes_lock: threading.Lock = threading.Lock()
+        # Records that failed to be written, retried in the next flush before the records queued after them
+        self._failed_writes: List[WriteFunction] = []
+        self._failed_write_attempts: Dict[WriteFunction, int] = {}
+        self._write_behind_wakeup: threading.Event = threading.Event()
+        self._write_behind_stopped: threading.Event = threading.Event()
+        self._write_behind_thread: Optional[threading.Thread] = None
+
+        # Trades CSV files, kept open while the recorder runs
+        self._trades_csv_max_file_size: Optional[int] = (
+            markets_recorder_config.trades_csv_max_file_size_mb * 1024 * 1024
+            if markets_recorder_config is not None and markets_recorder_config.trades_csv_max_file_size_mb > 0
+            else None)
+        self._trades_csv_rotate_daily: bool = (markets_recorder_config is not None
+                                               and markets_recorder_config.trades_csv_rotate_daily)
+        self._csv_sinks: Dict[str, TradeFillsCsvSink] = {}
+        self._csv_sinks_lock: threading.Lock = threading.Lock()
+
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -165,12 +197,22 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_behind_enabled(self) -> bool:
+        return self._write_behind_enabled
+
+    @property
+    def pending_writes_count(self) -> int:
+        return self._pending_writes.qsize() + len(self._failed_writes)
+
     def start(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_config.market_data_collection_enabled:
             self._start_market_data_recording()
+        if self._write_behind_enabled:
+            self._start_write_behind_thread()
 
     def stop(self):
         for market in self._markets:
@@ -178,10 +220,115 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        self._stop_write_behind_thread()
+        # Durable flush: nothing queued is lost when the recorder stops, the failed records are retried until they
+        # run out of attempts
+        for _ in range(self.WRITE_BEHIND_MAX_ATTEMPTS):
+            self.flush_pending_writes()
+            if self.pending_writes_count == 0:
+                break
+        self._close_csv_sinks()
+
+    def flush_pending_writes(self):
+        """
+        Writes all the queued records to the database, in transactions of at most the configured batch size.
+        It is safe to call from any thread, and it is called before reading orders or trades to provide
+        read-your-writes consistency in write-behind mode.
+        When a batch fails its records are written one by one, so a bad record does not drop the others. The records
+        that still fail are retried in the next flush ahead of the newer records, up to WRITE_BEHIND_MAX_ATTEMPTS times.
+        """
+        with self._pending_writes_lock:
+            writes: List[WriteFunction] = self._failed_writes
+            self._failed_writes = []
+            # Only the records queued before the flush started are written
+            for _ in range(self._pending_writes.qsize()):
+                try:
+                    writes.append(self._pending_writes.get_nowait())
+                except queue.Empty:
+                    break
+            failed_writes: List[WriteFunction] = []
+            for batch_start in range(0, len(writes), self._write_behind_batch_size):
+                batch: List[WriteFunction] = writes[batch_start:batch_start + self._write_behind_batch_size]
+                try:
+                    self._write_batch(batch)
+                    continue
+                except Exception:
+                    self.logger().error(f"Unexpected error writing {len(batch)} queued records to the database.",
+                                        exc_info=True)
+                if len(batch) == 1:
+                    failed_writes.extend(batch)
+                    continue
+                # Writing the records one by one keeps a bad record from dropping the others
+                for write_function in batch:
+                    try:
+                        self._write_batch([write_function])
+                    except Exception:
+                        self.logger().error("Unexpected error writing a queued record to the database.",
+                                            exc_info=True)
+                        failed_writes.append(write_function)
+            for write_function in failed_writes:
+                self._retry_failed_write(write_function)
+
+    def _write_batch(self, batch: List[WriteFunction]):
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                post_commit_functions = [write_function(session) for write_function in batch]
+        for post_commit_function in post_commit_functions:
+            if post_commit_function is not None:
+                post_commit_function()
+        if len(self._failed_write_attempts) > 0:
+            for write_function in batch:
+                self._failed_write_attempts.pop(write_function, None)
+
+    def _retry_failed_write(self, write_function: WriteFunction):
+        attempts = self._failed_write_attempts.pop(write_function, 0) + 1
+        if attempts < self.WRITE_BEHIND_MAX_ATTEMPTS:
+            self._failed_write_attempts[write_function] = attempts
+            self._failed_writes.append(write_function)
+        else:
+            self.logger().error(f"A queued record could not be written to the database after {attempts} attempts. "
+                                f"The record is discarded.")
+
+    def _start_write_behind_thread(self):
+        if self._write_behind_thread is not None and self._write_behind_thread.is_alive():
+            return
+        self._write_behind_stopped.clear()
+        self._write_behind_thread = threading.Thread(target=self._write_behind_loop,
+                                                     name="MarketsRecorderWriteBehind",
+                                                     daemon=True)
+        self._write_behind_thread.start()
+
+    def _stop_write_behind_thread(self):
+        if self._write_behind_thread is not None:
+            self._write_behind_stopped.set()
+            self._write_behind_wakeup.set()
+            self._write_behind_thread.join()
+            self._write_behind_thread = None
+
+    def _write_behind_loop(self):
+        while not self._write_behind_stopped.is_set():
+            self._write_behind_wakeup.wait(timeout=self._write_behind_flush_interval)
+            self._write_behind_wakeup.clear()
+            self.flush_pending_writes()
+            self._flush_csv_sinks()
+
+    def _record(self, write_function: WriteFunction):
+        """
+        Executes a database write. In write-behind mode the write is queued to be executed later in a batch, otherwise
+        it is executed immediately in its own transaction.
+        """
+        if self._write_behind_enabled:
+            self._pending_writes.put(write_function)
+            if self._pending_writes.qsize() >= self._write_behind_batch_size:
+                self._write_behind_wakeup.set()
+        else:
+            self._write_batch([write_function])
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
+        if self._write_behind_enabled:
+            self.flush_pending_writes()
         with self._sql_manager.get_new_session() as session:
             filters = [Order.config_file_path == config_file_path,
                        Order.market == market.display_name]
@@ -197,6 +344,8 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        if self._write_behind_enabled:
+            self.flush_pending_writes()
         with self._sql_manager.get_new_session() as session:
             query: Query = (session
                             .query(TradeFill)
@@ -207,18 +356,27 @@ class MarketsRecorder:
             else:
                 return query.limit(number_of_rows).all()
 
-    def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
+    def save_market_states(self,
+                           config_file_path: str,
+                           market: ConnectorBase,
+                           session: Session,
+                           tracking_states: Optional[Dict[str, Any]] = None):
+        """
+        :param tracking_states: the market tracking states to save. When not specified the current tracking states of
+            the market are used (write-behind mode captures them when the event happens instead)
+        """
         market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
         timestamp: int = self.db_timestamp
+        tracking_states = market.tracking_states if tracking_states is None else tracking_states
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = tracking_states
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
                                         market=market.display_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=tracking_states)
             session.add(market_states)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
@@ -250,32 +408,35 @@ class MarketsRecorder:
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
+        tracking_states: Optional[Dict[str, Any]] = market.tracking_states if self._write_behind_enabled else None
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+
+        def write_order(session: Session):
+            order_record: Order = Order(id=evt.order_id,
+                                        config_file_path=self._config_file_path,
+                                        strategy=self._strategy_name,
+                                        market=market.display_name,
+                                        symbol=evt.trading_pair,
+                                        base_asset=base_asset,
+                                        quote_asset=quote_asset,
+                                        creation_timestamp=timestamp,
+                                        order_type=evt.type.name,
+                                        amount=Decimal(evt.amount),
+                                        leverage=evt.leverage if evt.leverage else 1,
+                                        price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                        position=evt.position if evt.position else PositionAction.NIL.value,
+                                        last_status=event_type.name,
+                                        last_update_timestamp=timestamp,
+                                        exchange_order_id=evt.exchange_order_id)
+            order_status: OrderStatus = OrderStatus(order=order_record,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            session.add(order_record)
+            session.add(order_status)
+            self.save_market_states(self._config_file_path, market, session=session, tracking_states=tracking_states)
+
+        self._record(write_order)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -289,47 +450,51 @@ class MarketsRecorder:
         timestamp: int = int(evt.timestamp * 1e3) if evt.timestamp is not None else self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
-                self.append_to_csv(trade_fill_record)
+        tracking_states: Optional[Dict[str, Any]] = market.tracking_states if self._write_behind_enabled else None
+
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market.display_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+
+        def write_fill(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+
+            # Order status and trade fill record should be added even if the order record is not found, because it's
+            # possible for fill event to come in before the order created event for market orders.
+            order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+
+            trade_fill_record: TradeFill = TradeFill(
+                config_file_path=self.config_file_path,
+                strategy=self.strategy_name,
+                market=market.display_name,
+                symbol=evt.trading_pair,
+                base_asset=base_asset,
+                quote_asset=quote_asset,
+                timestamp=timestamp,
+                order_id=order_id,
+                trade_type=evt.trade_type.name,
+                order_type=evt.order_type.name,
+                price=evt.price,
+                amount=evt.amount,
+                leverage=evt.leverage if evt.leverage else 1,
+                trade_fee=evt.trade_fee.to_json(),
+                exchange_trade_id=evt.exchange_trade_id,
+                position=evt.position if evt.position else PositionAction.NIL.value,
+            )
+            session.add(order_status)
+            session.add(trade_fill_record)
+            self.save_market_states(self._config_file_path, market, session=session, tracking_states=tracking_states)
+            # The trade is added to the CSV file only once the transaction is committed, a failed write can be retried
+            csv_path, field_names, field_data = self._trade_fill_csv_row(trade_fill_record)
+            return lambda: self._csv_sink(csv_path, field_names).write_row(field_data)
+
+        self._record(write_fill)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -341,26 +506,27 @@ class MarketsRecorder:
 
         timestamp: float = evt.timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
-
-    @staticmethod
-    def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
+        def write_funding_payment(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                        config_file_path=self.config_file_path,
+                                                                        market=market.display_name,
+                                                                        rate=evt.funding_rate,
+                                                                        symbol=evt.trading_pair,
+                                                                        amount=float(evt.amount))
+                session.add(funding_payment_record)
+
+        self._record(write_funding_payment)
 
     def append_to_csv(self, trade: TradeFill):
+        csv_path, field_names, field_data = self._trade_fill_csv_row(trade)
+        self._csv_sink(csv_path, field_names).write_row(field_data)
+
+    @staticmethod
+    def _trade_fill_csv_row(trade: TradeFill) -> Tuple[str, Tuple[str, ...], Tuple[Any, ...]]:
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
         csv_path = os.path.join(data_path(), csv_filename)
 
@@ -369,19 +535,41 @@ class MarketsRecorder:
 
         # adding extra field "age"
         # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
-        age = pd.Timestamp(int((trade.timestamp * 1e-3) - (trade.order.creation_timestamp * 1e-3)), unit='s').strftime(
-            '%H:%M:%S') if (trade.order is not None and "//" not in trade.order_id) else "n/a"
+        age = time.strftime(
+            "%H:%M:%S",
+            time.gmtime(int((trade.timestamp * 1e-3) - (trade.order.creation_timestamp * 1e-3)))
+        ) if (trade.order is not None and "//" not in trade.order_id) else "n/a"
         field_names += ("age",)
         field_data += (age,)
 
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
-
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+        return csv_path, field_names, field_data
+
+    def _csv_sink(self, csv_path: str, header: Tuple[str, ...]) -> TradeFillsCsvSink:
+        with self._csv_sinks_lock:
+            sink: Optional[TradeFillsCsvSink] = self._csv_sinks.get(csv_path)
+            if sink is None or sink.header != header:
+                if sink is not None:
+                    sink.close()
+                # In write-behind mode the background thread flushes the files after each batch. Otherwise each row
+                # is flushed as soon as it is written.
+                sink = TradeFillsCsvSink(file_path=csv_path,
+                                         header=header,
+                                         max_file_size=self._trades_csv_max_file_size,
+                                         rotate_daily=self._trades_csv_rotate_daily,
+                                         flush_interval=self._write_behind_flush_interval if self._write_behind_enabled else 0)
+                self._csv_sinks[csv_path] = sink
+            return sink
+
+    def _flush_csv_sinks(self):
+        with self._csv_sinks_lock:
+            for sink in self._csv_sinks.values():
+                sink.flush()
+
+    def _close_csv_sinks(self):
+        with self._csv_sinks_lock:
+            for sink in self._csv_sinks.values():
+                sink.close()
+            self._csv_sinks.clear()
 
     def _update_order_status(self,
                              event_tag: int,
@@ -398,19 +586,24 @@ class MarketsRecorder:
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
+        tracking_states: Optional[Dict[str, Any]] = market.tracking_states if self._write_behind_enabled else None
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+        def write_order_status(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
 
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+                self.save_market_states(self._config_file_path,
+                                        market,
+                                        session=session,
+                                        tracking_states=tracking_states)
+
+        self._record(write_order_status)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -445,16 +638,21 @@ class MarketsRecorder:
             return
 
         timestamp: int = self.db_timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        tracking_states: Optional[Dict[str, Any]] = connector.tracking_states if self._write_behind_enabled else None
+
+        def write_range_position_update(session: Session):
+            rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                                 timestamp=timestamp,
+                                                                 tx_hash=evt.exchange_order_id,
+                                                                 token_id=evt.token_id,
+                                                                 trade_fee=evt.trade_fee.to_json())
+            session.add(rp_update)
+            self.save_market_states(self._config_file_path,
+                                    connector,
+                                    session=session,
+                                    tracking_states=tracking_states)
+
+        self._record(write_range_position_update)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -464,17 +662,23 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        tracking_states: Optional[Dict[str, Any]] = connector.tracking_states if self._write_behind_enabled else None
+
+        def write_range_position_fees(session: Session):
+            rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                             strategy=self._strategy_name,
+                                                                             token_id=evt.token_id,
+                                                                             token_0=evt.token_0,
+                                                                             token_1=evt.token_1,
+                                                                             claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                             claimed_fee_1=Decimal(evt.claimed_fee_1))
+            session.add(rp_fees)
+            self.save_market_states(self._config_file_path,
+                                    connector,
+                                    session=session,
+                                    tracking_states=tracking_states)
+
+        self._record(write_range_position_fees)
 
     @staticmethod
     async def _sleep(delay):
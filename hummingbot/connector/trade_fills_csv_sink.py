@@ -0,0 +1,121 @@
+import csv
+import os.path
+import threading
+import time
+from datetime import datetime, timezone
+from shutil import move
+from typing import IO, Any, Optional, Sequence, Tuple
+
+OLD_FILE_TIMESTAMP_FORMAT = "%Y%m%d-%H%M%S"
+
+
+class TradeFillsCsvSink:
+    """
+    Appends trade fill rows to a CSV file, keeping the file open between writes.
+    The header of an existing file is validated only once, when the file is opened. If it does not match the
+    expected header the file is moved aside and a new one is started. Rows are buffered and flushed to disk at most
+    every `flush_interval` seconds (and when the sink is closed).
+    The file is rotated (moved aside with a timestamp suffix) when it grows over `max_file_size` bytes, or when the
+    UTC day changes if `rotate_daily` is enabled. The file size is only checked when the buffer is flushed.
+    """
+
+    def __init__(self,
+                 file_path: str,
+                 header: Sequence[str],
+                 max_file_size: Optional[int] = None,
+                 rotate_daily: bool = False,
+                 flush_interval: float = 1.0):
+        """
+        :param file_path: path of the CSV file
+        :param header: the column names, written as the first row of the file
+        :param max_file_size: size in bytes after which the file is rotated. None disables size based rotation
+        :param rotate_daily: if True the file is rotated when the UTC day changes
+        :param flush_interval: maximum time in seconds rows are kept in the write buffer
+        """
+        self._file_path: str = file_path
+        self._header: Tuple[str, ...] = tuple(header)
+        self._max_file_size: Optional[int] = max_file_size
+        self._rotate_daily: bool = rotate_daily
+        self._flush_interval: float = flush_interval
+        self._file: Optional[IO] = None
+        self._writer: Optional[Any] = None
+        self._file_day: Optional[int] = None
+        self._last_flush_time: float = 0
+        self._size_limit_reached: bool = False
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    @property
+    def header(self) -> Tuple[str, ...]:
+        return self._header
+
+    def write_row(self, row: Sequence[Any]):
+        with self._lock:
+            now = time.time()
+            if self._file is not None and self._should_rotate(now):
+                self._close_file()
+                self._move_aside()
+            if self._file is None:
+                self._open_file(now)
+            self._writer.writerow(row)
+            if now - self._last_flush_time >= self._flush_interval:
+                self._flush_file(now)
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._flush_file(time.time())
+
+    def close(self):
+        with self._lock:
+            self._close_file()
+
+    def _open_file(self, now: float):
+        if os.path.exists(self._file_path) and not self._file_matches_header():
+            self._move_aside()
+        write_header = not os.path.exists(self._file_path) or os.path.getsize(self._file_path) == 0
+        self._file = open(self._file_path, mode="a", newline="")
+        self._writer = csv.writer(self._file)
+        if write_header:
+            self._writer.writerow(self._header)
+        self._file_day = self._day(now)
+        self._last_flush_time = now
+
+    def _flush_file(self, now: float):
+        self._file.flush()
+        self._last_flush_time = now
+        if self._max_file_size is not None:
+            self._size_limit_reached = os.fstat(self._file.fileno()).st_size >= self._max_file_size
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+            self._size_limit_reached = False
+
+    def _file_matches_header(self) -> bool:
+        with open(self._file_path, mode="r", newline="") as file:
+            first_row = next(csv.reader(file), None)
+        return first_row is None or tuple(first_row) == self._header
+
+    def _should_rotate(self, now: float) -> bool:
+        if self._rotate_daily and self._day(now) != self._file_day:
+            return True
+        return self._size_limit_reached
+
+    def _move_aside(self):
+        suffix = datetime.now(tz=timezone.utc).strftime(OLD_FILE_TIMESTAMP_FORMAT)
+        old_file_path = self._file_path[:-4] + "_old_" + suffix + ".csv"
+        index = 1
+        while os.path.exists(old_file_path):
+            old_file_path = self._file_path[:-4] + "_old_" + suffix + f"_{index}.csv"
+            index += 1
+        move(self._file_path, old_file_path)
+
+    @staticmethod
+    def _day(timestamp: float) -> int:
+        return int(timestamp // (60 * 60 * 24))
@@ -2,10 +2,10 @@ import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
-from decimal import Decimal
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.task_log_ledger import TaskLogLedger
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
@@ -16,6 +16,7 @@ class AsyncRequestContextBase(ABC):
     """
     An async context class ('async with' syntax) that checks for rate limit and waits for the capacity to be freed.
     It uses an async lock to prevent multiple instances of this class from accessing the `acquire()` function.
+    When there is no capacity, the context sleeps until the task logs blocking it expire instead of polling.
     """
 
     _last_max_cap_warning_ts: float = 0.0
@@ -28,7 +29,7 @@ class AsyncRequestContextBase(ABC):
         return arc_logger
 
     def __init__(self,
-                 task_logs: List[TaskLog],
+                 task_logs: TaskLogLedger,
                  rate_limit: RateLimit,
                  related_limits: List[Tuple[RateLimit, int]],
                  lock: asyncio.Lock,
@@ -37,13 +38,13 @@ class AsyncRequestContextBase(ABC):
                  ):
         """
         Asynchronous context associated with each API request.
-        :param task_logs: Shared task logs associated with this API request
+        :param task_logs: Shared task logs ledger associated with this API request
         :param rate_limit: The RateLimit associated with this API Request
         :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
-        :param retry_interval: Time between each limit check
+        :param retry_interval: Time between each limit check when the waiting time can not be calculated
         """
-        self._task_logs: List[TaskLog] = task_logs
+        self._task_logs: TaskLogLedger = task_logs
         self._rate_limit: RateLimit = rate_limit
         self._related_limits: List[Tuple[RateLimit, int]] = related_limits
         self._lock: asyncio.Lock = lock
@@ -55,17 +56,18 @@ class AsyncRequestContextBase(ABC):
         Remove task logs that have passed rate limit periods
         :return:
         """
-        now: Decimal = Decimal(str(time.time()))
-        for task in self._task_logs:
-            task_limit: RateLimit = task.rate_limit
-            elapsed: Decimal = now - Decimal(str(task.timestamp))
-            if elapsed > Decimal(str(task_limit.time_interval * (1 + self._safety_margin_pct))):
-                self._task_logs.remove(task)
+        self._task_logs.flush(now=self._time(), safety_margin_pct=self._safety_margin_pct)
 
     @abstractmethod
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    def time_until_capacity(self) -> Optional[float]:
+        """
+        Returns the time to wait until there is capacity for the task, or None if it can not be determined
+        """
+        return None
+
     async def acquire(self):
         while True:
             async with self._lock:
@@ -73,9 +75,10 @@ class AsyncRequestContextBase(ABC):
 
                 if self.within_capacity():
                     break
-            await asyncio.sleep(self._retry_interval)
+                wait_time = self.time_until_capacity()
+            await asyncio.sleep(self._retry_interval if not wait_time else wait_time)
         async with self._lock:
-            now = time.time()
+            now = self._time()
             # Each related limit is represented as it own individual TaskLog
 
             # Log the acquired rate limit into the tasks log
@@ -87,6 +90,9 @@ class AsyncRequestContextBase(ABC):
             for limit, weight in self._related_limits:
                 self._task_logs.append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
 
+    def _time(self) -> float:
+        return time.time()
+
     async def __aenter__(self):
         await self.acquire()
 
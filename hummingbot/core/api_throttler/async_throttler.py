@@ -1,6 +1,4 @@
-import time
-from decimal import Decimal
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import (
     MAX_CAPACITY_REACHED_WARNING_INTERVAL,
@@ -23,14 +21,10 @@ class AsyncRequestContext(AsyncRequestContextBase):
         :return: True if it is within capacity to add a new task
         """
         if self._rate_limit is not None:
-            list_of_limits: List[Tuple[RateLimit, int]] = [(self._rate_limit,
-                                                            self._rate_limit.weight)] + self._related_limits
             now: float = self._time()
-            for rate_limit, weight in list_of_limits:
-                capacity_used: int = sum([task.weight
-                                          for task in self._task_logs
-                                          if rate_limit.limit_id == task.rate_limit.limit_id and
-                                          Decimal(str(now)) - Decimal(str(task.timestamp)) - Decimal(str(task.rate_limit.time_interval * self._safety_margin_pct)) <= task.rate_limit.time_interval])
+            for rate_limit, weight in self._limits_with_weights():
+                capacity_used: int = self._task_logs.capacity_used(
+                    rate_limit=rate_limit, now=now, safety_margin_pct=self._safety_margin_pct)
 
                 if capacity_used + weight > rate_limit.limit:
                     if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
@@ -43,8 +37,25 @@ class AsyncRequestContext(AsyncRequestContextBase):
                     return False
         return True
 
-    def _time(self):
-        return time.time()
+    def time_until_capacity(self) -> Optional[float]:
+        """
+        Calculates the time until all the rate limits associated with the task have enough capacity for it, based on
+        when the logged tasks blocking it expire.
+        :return: the time to wait in seconds, or None if the task can never fit in one of the limits
+        """
+        wait_time = 0
+        if self._rate_limit is not None:
+            now: float = self._time()
+            for rate_limit, weight in self._limits_with_weights():
+                limit_wait_time = self._task_logs.time_until_capacity(
+                    rate_limit=rate_limit, weight=weight, now=now, safety_margin_pct=self._safety_margin_pct)
+                if limit_wait_time is None:
+                    return None
+                wait_time = max(wait_time, limit_wait_time)
+        return wait_time
+
+    def _limits_with_weights(self) -> List[Tuple[RateLimit, int]]:
+        return [(self._rate_limit, self._rate_limit.weight)] + self._related_limits
 
 
 class AsyncThrottler(AsyncThrottlerBase):
@@ -7,7 +7,8 @@ from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.task_log_ledger import TaskLogLedger
 from hummingbot.logger.logger import HummingbotLogger
 
 
@@ -45,14 +46,14 @@ class AsyncThrottlerBase(ABC):
 
         self.set_rate_limits(rate_limits)
 
-        # List of TaskLog used to determine the API requests within a set time window.
-        self._task_logs: List[TaskLog] = []
+        # Ledger of TaskLog (grouped by limit id) used to determine the API requests within a set time window.
+        self._task_logs: TaskLogLedger = TaskLogLedger()
 
         # Throttler Parameters
         self._retry_interval: float = retry_interval
         self._safety_margin_pct: float = safety_margin_pct
 
-        # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
+        # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs ledger
         self._lock = asyncio.Lock()
 
     def set_rate_limits(self, rate_limits: List[RateLimit]):
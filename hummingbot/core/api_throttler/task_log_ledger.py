@@ -0,0 +1,138 @@
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Optional
+
+from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+
+# Precision (in decimal places) used when comparing elapsed times, to avoid float representation errors with epoch
+# timestamps (e.g. 1640000000.2 - 1640000000.0 = 0.2000000476837158)
+ELAPSED_TIME_PRECISION = 6
+ELAPSED_TIME_RESOLUTION = 10 ** -ELAPSED_TIME_PRECISION
+
+
+class _LimitTaskLogs:
+    """
+    FIFO queue of the task logs of a single rate limit, ordered by timestamp.
+    Stores the cumulative weight logged next to each entry, so the weight in the window is a subtraction and the
+    position where enough capacity gets freed is found with a binary search.
+    Expired entries are dropped by moving the head index, and the underlying lists are compacted once the head has
+    moved past half of them.
+    """
+
+    def __init__(self):
+        self.task_logs: List[TaskLog] = []
+        self.cumulative_weights: List[int] = []
+        self.head: int = 0
+        self.expired_weight: int = 0
+
+    def __len__(self) -> int:
+        return len(self.task_logs) - self.head
+
+    def __iter__(self) -> Iterator[TaskLog]:
+        for index in range(self.head, len(self.task_logs)):
+            yield self.task_logs[index]
+
+    @property
+    def used_capacity(self) -> int:
+        if len(self) == 0:
+            return 0
+        return self.cumulative_weights[-1] - self.expired_weight
+
+    def append(self, task_log: TaskLog):
+        total_weight = self.cumulative_weights[-1] if self.cumulative_weights else self.expired_weight
+        self.task_logs.append(task_log)
+        self.cumulative_weights.append(total_weight + task_log.weight)
+
+    def flush(self, now: float, safety_margin_pct: float):
+        task_logs = self.task_logs
+        head = self.head
+        while head < len(task_logs):
+            task_log = task_logs[head]
+            window = task_log.rate_limit.time_interval * (1 + safety_margin_pct)
+            if round(now - task_log.timestamp, ELAPSED_TIME_PRECISION) <= window:
+                break
+            self.expired_weight = self.cumulative_weights[head]
+            head += 1
+        self.head = head
+        if head > 0 and head * 2 >= len(task_logs):
+            self._compact()
+
+    def time_until_capacity(self, capacity_to_free: int, now: float, safety_margin_pct: float) -> float:
+        index = bisect_left(self.cumulative_weights, self.expired_weight + capacity_to_free, lo=self.head)
+        task_log = self.task_logs[min(index, len(self.task_logs) - 1)]
+        window = task_log.rate_limit.time_interval * (1 + safety_margin_pct)
+        wait_time = round(task_log.timestamp + window - now, ELAPSED_TIME_PRECISION)
+        # The task log is removed only once the elapsed time is strictly greater than the window
+        return max(0.0, wait_time) + ELAPSED_TIME_RESOLUTION
+
+    def _compact(self):
+        del self.task_logs[:self.head]
+        del self.cumulative_weights[:self.head]
+        self.head = 0
+
+
+class TaskLogLedger:
+    """
+    Keeps the task logs of a throttler grouped by rate limit id.
+    Each rate limit has its own FIFO queue of task logs with running weight totals. Expired task logs are only ever
+    removed from the head of each queue, so checking the capacity used by a rate limit costs O(1) amortized, and the
+    time until a task fits costs O(log n), regardless of the number of tasks logged.
+    """
+
+    def __init__(self):
+        self._logs: Dict[str, _LimitTaskLogs] = {}
+
+    def __len__(self) -> int:
+        return sum(len(logs) for logs in self._logs.values())
+
+    def __iter__(self) -> Iterator[TaskLog]:
+        for logs in self._logs.values():
+            yield from logs
+
+    def append(self, task_log: TaskLog):
+        limit_id = task_log.rate_limit.limit_id
+        logs = self._logs.get(limit_id)
+        if logs is None:
+            logs = _LimitTaskLogs()
+            self._logs[limit_id] = logs
+        logs.append(task_log)
+
+    def clear(self):
+        self._logs.clear()
+
+    def flush(self, now: float, safety_margin_pct: float):
+        """
+        Removes the task logs that have passed their rate limit periods (including the safety margin)
+        """
+        for logs in self._logs.values():
+            logs.flush(now=now, safety_margin_pct=safety_margin_pct)
+
+    def capacity_used(self, rate_limit: RateLimit, now: float, safety_margin_pct: float) -> int:
+        """
+        Returns the weight used by the rate limit in its current time window
+        """
+        logs = self._logs.get(rate_limit.limit_id)
+        if logs is None:
+            return 0
+        logs.flush(now=now, safety_margin_pct=safety_margin_pct)
+        return logs.used_capacity
+
+    def time_until_capacity(self,
+                            rate_limit: RateLimit,
+                            weight: int,
+                            now: float,
+                            safety_margin_pct: float) -> Optional[float]:
+        """
+        Calculates how long it takes until the rate limit has enough capacity to accept a new task with the specified
+        weight, assuming no other task is logged in the meantime.
+        :return: the number of seconds to wait (0 if there is capacity already), or None if the weight can never fit
+        """
+        if weight > rate_limit.limit:
+            return None
+        logs = self._logs.get(rate_limit.limit_id)
+        if logs is None:
+            return 0
+        logs.flush(now=now, safety_margin_pct=safety_margin_pct)
+        capacity_to_free = logs.used_capacity + weight - rate_limit.limit
+        if capacity_to_free <= 0:
+            return 0
+        return logs.time_until_capacity(capacity_to_free=capacity_to_free, now=now, safety_margin_pct=safety_margin_pct)
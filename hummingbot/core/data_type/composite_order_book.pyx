@@ -28,6 +28,7 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self.c_invalidate_depth_index()
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -71,6 +72,7 @@ cdef class CompositeOrderBook(OrderBook):
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        self.c_invalidate_depth_index()
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -175,6 +177,17 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
+    cdef c_rebuild_depth_index(self, bint is_buy):
+        # The depth queries see the composite entries, the original entries minus the traded amounts
+        if is_buy:
+            self._ask_depth.clear()
+            for order_book_row in self.ask_entries():
+                self.c_append_depth_level(True, order_book_row.price, order_book_row.amount)
+        else:
+            self._bid_depth.clear()
+            for order_book_row in self.bid_entries():
+                self.c_append_depth_level(False, order_book_row.price, order_book_row.amount)
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
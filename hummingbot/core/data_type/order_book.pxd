@@ -9,6 +9,14 @@ from .order_book_query_result cimport OrderBookQueryResult
 cimport numpy as np
 
 
+cdef struct DepthLevel:
+    double price
+    double amount
+    # The cumulative base and quote volumes from the top of the book to the level included
+    double base_volume
+    double quote_volume
+
+
 cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _bid_book
     cdef set[OrderBookEntry] _ask_book
@@ -20,16 +28,27 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef vector[DepthLevel] _bid_depth
+    cdef vector[DepthLevel] _ask_depth
+    cdef bint _bid_depth_valid
+    cdef bint _ask_depth_valid
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_notify_top_of_book_change(self, double previous_best_bid, double previous_best_ask, int64_t update_id)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array)
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=*)
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array)
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=*)
+    cdef c_invalidate_depth_index(self)
+    cdef c_rebuild_depth_index(self, bint is_buy)
+    cdef c_append_depth_level(self, bint is_buy, double price, double amount)
+    cdef vector[DepthLevel] *c_get_depth_index(self, bint is_buy)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
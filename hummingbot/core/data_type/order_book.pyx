@@ -21,13 +21,14 @@ from cython.operator cimport(
     postincrement as inc,
 )
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
+    OrderBookTopOfBookChangedEvent,
     OrderBookTradeEvent
 )
 
@@ -35,10 +36,86 @@ cimport numpy as np
 
 ob_logger = None
 NaN = float("nan")
+cdef int64_t TOP_OF_BOOK_CHANGED_EVENT_TAG = OrderBookEvent.TopOfBookChanged.value
+
+
+cdef inline bint c_price_changed(double old_price, double new_price):
+    # An empty side of the book (NaN price) staying empty is not a change
+    return not (old_price == new_price or (old_price != old_price and new_price != new_price))
+
+
+cdef int64_t c_numpy_rows_to_entries(np.ndarray[np.float64_t, ndim=2] rows, vector[OrderBookEntry] *entries):
+    """
+    Adds the [price, amount, update_id] rows to the entries vector and returns the highest update id found
+    """
+    cdef:
+        Py_ssize_t index
+        Py_ssize_t rows_count = rows.shape[0]
+        int64_t row_update_id
+        int64_t last_update_id = 0
+
+    entries.reserve(rows_count)
+    for index in range(rows_count):
+        row_update_id = <int64_t>rows[index, 2]
+        entries.push_back(OrderBookEntry(rows[index, 0], rows[index, 1], row_update_id))
+        if row_update_id > last_update_id:
+            last_update_id = row_update_id
+    return last_update_id
+
+
+cdef inline size_t c_first_level_reaching(vector[DepthLevel] *depth, double volume, bint is_quote_volume):
+    """
+    Binary search of the first level whose cumulative base (or quote) volume reaches the volume. Returns the number of
+    levels if the whole side doesn't.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = deref(depth).size()
+        size_t middle
+        double level_volume
+    while low < high:
+        middle = (low + high) >> 1
+        level_volume = deref(depth)[middle].quote_volume if is_quote_volume else deref(depth)[middle].base_volume
+        if level_volume >= volume:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+cdef inline size_t c_levels_within_price(vector[DepthLevel] *depth, bint is_buy, double price):
+    """
+    Binary search of the number of levels from the top of the book priced at or better than the price
+    """
+    cdef:
+        size_t low = 0
+        size_t high = deref(depth).size()
+        size_t middle
+        double level_price
+        bint is_beyond_price
+    while low < high:
+        middle = (low + high) >> 1
+        level_price = deref(depth)[middle].price
+        is_beyond_price = level_price > price if is_buy else level_price < price
+        if is_beyond_price:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+cdef inline double c_volume_before(vector[DepthLevel] *depth, size_t index, bint is_quote_volume):
+    """
+    The cumulative base (or quote) volume of the levels before the index
+    """
+    if index == 0:
+        return 0
+    return deref(depth)[index - 1].quote_volume if is_quote_volume else deref(depth)[index - 1].base_volume
 
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG = OrderBookEvent.TopOfBookChanged.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -66,6 +143,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -96,6 +175,8 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self.c_invalidate_depth_index()
+        self.c_notify_top_of_book_change(previous_best_bid, previous_best_ask, update_id)
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -105,6 +186,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator ask_iterator
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
@@ -136,6 +219,16 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_invalidate_depth_index()
+        self.c_notify_top_of_book_change(previous_best_bid, previous_best_ask, update_id)
+
+    cdef c_notify_top_of_book_change(self, double previous_best_bid, double previous_best_ask, int64_t update_id):
+        # The event is only built when someone listens to it, since diffs are applied at a high rate
+        if self._events.find(TOP_OF_BOOK_CHANGED_EVENT_TAG) == self._events.end():
+            return
+        if c_price_changed(previous_best_bid, self._best_bid) or c_price_changed(previous_best_ask, self._best_ask):
+            self.c_trigger_event(TOP_OF_BOOK_CHANGED_EVENT_TAG,
+                                 OrderBookTopOfBookChangedEvent(update_id, self._best_bid, self._best_ask))
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -209,16 +302,18 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        If no update_id is provided the highest update id in the arrays is used.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        self.c_apply_numpy_diffs(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array):
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -226,26 +321,23 @@ cdef class OrderBook(PubSub):
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
+            int64_t last_update_id = c_numpy_rows_to_entries(bids_array, &cpp_bids)
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+        last_update_id = max(last_update_id, c_numpy_rows_to_entries(asks_array, &cpp_asks))
+        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
 
-    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        If no update_id is provided the highest update id in the arrays is used.
         """
-        self.c_apply_numpy_snapshot(bids_array, asks_array)
+        self.c_apply_numpy_snapshot(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array):
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -253,15 +345,28 @@ cdef class OrderBook(PubSub):
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
+            int64_t last_update_id = c_numpy_rows_to_entries(bids_array, &cpp_bids)
+
+        last_update_id = max(last_update_id, c_numpy_rows_to_entries(asks_array, &cpp_asks))
+        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        """
+        Applies a snapshot message, using the message arrays directly if it is a NumpyOrderBookMessage
+        """
+        if isinstance(message, NumpyOrderBookMessage):
+            self.c_apply_numpy_snapshot(message.bids_array, message.asks_array, message.update_id)
+        else:
+            self.apply_snapshot(message.bids, message.asks, message.update_id)
+
+    def apply_diff_message(self, message: OrderBookMessage):
+        """
+        Applies a diff message, using the message arrays directly if it is a NumpyOrderBookMessage
+        """
+        if isinstance(message, NumpyOrderBookMessage):
+            self.c_apply_numpy_diffs(message.bids_array, message.asks_array, message.update_id)
+        else:
+            self.apply_diffs(message.bids, message.asks, message.update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
@@ -319,144 +424,137 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
-    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+    cdef c_invalidate_depth_index(self):
+        self._bid_depth_valid = False
+        self._ask_depth_valid = False
+
+    cdef c_rebuild_depth_index(self, bint is_buy):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+            self._ask_depth.clear()
+            self._ask_depth.reserve(self._ask_book.size())
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                self.c_append_depth_level(True, entry.getPrice(), entry.getAmount())
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+            self._bid_depth.clear()
+            self._bid_depth.reserve(self._bid_book.size())
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                self.c_append_depth_level(False, entry.getPrice(), entry.getAmount())
+                inc(bid_it)
+
+    cdef c_append_depth_level(self, bint is_buy, double price, double amount):
+        cdef:
+            vector[DepthLevel] *depth = ref(self._ask_depth) if is_buy else ref(self._bid_depth)
+            DepthLevel level
+            size_t depth_size = deref(depth).size()
+
+        level.price = price
+        level.amount = amount
+        level.base_volume = c_volume_before(depth, depth_size, False) + amount
+        level.quote_volume = c_volume_before(depth, depth_size, True) + amount * price
+        deref(depth).push_back(level)
+
+    cdef vector[DepthLevel] *c_get_depth_index(self, bint is_buy):
+        """
+        Returns the levels of the side of the book a buy (asks) or sell (bids) order takes, from the top of the book,
+        with their cumulative volumes. The index is rebuilt on the first query after the book changes.
+        """
+        if is_buy:
+            if not self._ask_depth_valid:
+                self.c_rebuild_depth_index(True)
+                self._ask_depth_valid = True
+            return ref(self._ask_depth)
+        if not self._bid_depth_valid:
+            self.c_rebuild_depth_index(False)
+            self._bid_depth_valid = True
+        return ref(self._bid_depth)
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            vector[DepthLevel] *depth = self.c_get_depth_index(is_buy)
+            size_t index = c_first_level_reaching(depth, volume, False)
+            double cumulative_volume = c_volume_before(depth, index, False)
+            double result_price = NaN
+
+        if index < deref(depth).size():
+            cumulative_volume = deref(depth)[index].base_volume
+            result_price = deref(depth)[index].price
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
-            double total_cost = 0
-            double total_volume = 0
+            vector[DepthLevel] *depth = self.c_get_depth_index(is_buy)
+            size_t index = c_first_level_reaching(depth, volume, False)
+            DepthLevel level
+            double total_cost
+            double total_volume = c_volume_before(depth, index, False)
+            double incremental_amount
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+
+        if index < deref(depth).size():
+            level = deref(depth)[index]
+            total_cost = level.quote_volume - level.amount * level.price
+            total_volume = level.base_volume - level.amount
+            incremental_amount = volume - total_volume
+            total_cost += incremental_amount * level.price
+            total_volume += incremental_amount
+            result_vwap = total_cost / total_volume
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
-            double cumulative_volume = 0
+            vector[DepthLevel] *depth = self.c_get_depth_index(is_buy)
+            size_t index = c_first_level_reaching(depth, quote_volume, True)
+            double cumulative_volume = c_volume_before(depth, index, True)
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+        if index < deref(depth).size():
+            cumulative_volume = deref(depth)[index].quote_volume
+            result_price = deref(depth)[index].price
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
-            double cumulative_volume = 0
-            double cumulative_base_amount = 0
-            double row_amount = 0
+            vector[DepthLevel] *depth = self.c_get_depth_index(is_buy)
+            size_t index = c_first_level_reaching(depth, base_amount, False)
+            double cumulative_volume = c_volume_before(depth, index, True)
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+        if index < deref(depth).size():
+            cumulative_volume += (base_amount - c_volume_before(depth, index, False)) * deref(depth)[index].price
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
+            vector[DepthLevel] *depth = self.c_get_depth_index(is_buy)
+            size_t levels_count = c_levels_within_price(depth, is_buy, price)
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+        if levels_count > 0:
+            result_price = deref(depth)[levels_count - 1].price
 
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+        return OrderBookQueryResult(price, NaN, result_price, c_volume_before(depth, levels_count, False))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
+            vector[DepthLevel] *depth = self.c_get_depth_index(is_buy)
+            size_t levels_count = c_levels_within_price(depth, is_buy, price)
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+        if levels_count > 0:
+            result_price = deref(depth)[levels_count - 1].price
 
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+        return OrderBookQueryResult(price, NaN, result_price, c_volume_before(depth, levels_count, True))
 
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
@@ -476,6 +574,24 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    def get_prices_for_volumes(self, is_buy: bool, volumes: List[float]) -> List[OrderBookQueryResult]:
+        """
+        Answers several price for volume queries against the same depth index
+        """
+        return [self.c_get_price_for_volume(is_buy, volume) for volume in volumes]
+
+    def get_vwaps_for_volumes(self, is_buy: bool, volumes: List[float]) -> List[OrderBookQueryResult]:
+        """
+        Answers several VWAP for volume queries against the same depth index
+        """
+        return [self.c_get_vwap_for_volume(is_buy, volume) for volume in volumes]
+
+    def get_quote_volumes_for_base_amounts(self, is_buy: bool, base_amounts: List[float]) -> List[OrderBookQueryResult]:
+        """
+        Answers several quote volume for base amount queries against the same depth index
+        """
+        return [self.c_get_quote_volume_for_base_amount(is_buy, base_amount) for base_amount in base_amounts]
+
     @classmethod
     def snapshot_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
         pass
@@ -487,6 +603,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_message(diff)
@@ -3,6 +3,8 @@ from enum import Enum
 from functools import total_ordering
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
@@ -95,3 +97,62 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             )
         )
         return eq
+
+
+class NumpyOrderBookMessage(OrderBookMessage):
+    """
+    Order book message that keeps its bids and asks as contiguous float64 arrays with the columns
+    [price, amount, update_id]. The exchange payload is parsed only once, when the message is created, and the arrays
+    can be applied directly to an order book with `apply_numpy_diffs` / `apply_numpy_snapshot`.
+    Exchange data sources opt in by creating this message type instead of `OrderBookMessage` for snapshots and diffs.
+    """
+
+    def __new__(
+        cls,
+        message_type: OrderBookMessageType,
+        content: Dict[str, any],
+        timestamp: Optional[float] = None,
+        *args,
+        **kwargs,
+    ):
+        content = dict(content)
+        if message_type in [OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT]:
+            update_id = content["update_id"]
+            content["bids"] = cls.rows_to_array(content.get("bids", []), update_id)
+            content["asks"] = cls.rows_to_array(content.get("asks", []), update_id)
+        return super(NumpyOrderBookMessage, cls).__new__(cls, message_type, content, timestamp, *args, **kwargs)
+
+    @staticmethod
+    def rows_to_array(rows, update_id: int) -> np.ndarray:
+        """
+        Converts the price levels received from the exchange ([price, amount, ...] entries, with numbers or numeric
+        strings) to a float64 array with the columns [price, amount, update_id]
+        """
+        array = np.empty((len(rows), 3), dtype=np.float64)
+        if len(rows) > 0:
+            try:
+                levels = np.asarray(rows, dtype=np.float64)
+            except ValueError:
+                # Entries with a different number of fields (or non numeric extra fields)
+                levels = np.asarray([(row[0], row[1]) for row in rows], dtype=np.float64)
+            array[:, :2] = levels[:, :2]
+        array[:, 2] = update_id
+        return array
+
+    @property
+    def bids_array(self) -> np.ndarray:
+        return self.content["bids"]
+
+    @property
+    def asks_array(self) -> np.ndarray:
+        return self.content["asks"]
+
+    @property
+    def asks(self) -> List[OrderBookRow]:
+        update_id = self.update_id
+        return [OrderBookRow(price, amount, update_id) for price, amount, _ in self.content["asks"].tolist()]
+
+    @property
+    def bids(self) -> List[OrderBookRow]:
+        update_id = self.update_id
+        return [OrderBookRow(price, amount, update_id) for price, amount, _ in self.content["bids"].tolist()]
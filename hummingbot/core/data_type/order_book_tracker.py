@@ -5,14 +5,16 @@ from collections import defaultdict, deque
 from enum import Enum
 from typing import Deque, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -21,6 +23,46 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+class OrderBookTrackingStats:
+    """
+    Counters of the diff messages processed for a single trading pair, used to detect when an order book is falling
+    behind the exchange stream.
+    """
+
+    def __init__(self):
+        self.queue_depth: int = 0
+        self.max_queue_depth: int = 0
+        self.diff_messages_processed: int = 0
+        self.diff_updates_applied: int = 0
+        self.last_apply_latency: float = 0
+        self.total_apply_latency: float = 0
+
+    @property
+    def coalescing_ratio(self) -> float:
+        """
+        Average number of diff messages merged into each update applied to the order book (1 means no coalescing)
+        """
+        if self.diff_updates_applied == 0:
+            return 1.0
+        return self.diff_messages_processed / self.diff_updates_applied
+
+    @property
+    def average_apply_latency(self) -> float:
+        if self.diff_updates_applied == 0:
+            return 0.0
+        return self.total_apply_latency / self.diff_updates_applied
+
+    def record_queue_depth(self, queue_depth: int):
+        self.queue_depth = queue_depth
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+
+    def record_diff_update(self, messages_count: int, apply_latency: float):
+        self.diff_messages_processed += messages_count
+        self.diff_updates_applied += 1
+        self.last_apply_latency = apply_latency
+        self.total_apply_latency += apply_latency
+
+
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
     _obt_logger: Optional[HummingbotLogger] = None
@@ -31,11 +73,30 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 max_concurrent_initializations: Optional[int] = None,
+                 coalesce_diffs: bool = False):
+        """
+        :param data_source: the data source used to fetch snapshots and listen to the exchange streams
+        :param trading_pairs: the trading pairs to track
+        :param domain: the exchange domain, if any
+        :param max_concurrent_initializations: when set, the initial snapshots are requested concurrently with at most
+            this number of requests in flight. The pace is then given by the rate limits enforced by the data source
+            throttler instead of a fixed delay between trading pairs. When None the snapshots are requested one by one.
+        :param coalesce_diffs: when True all the diff messages pending in a trading pair queue are drained at once and
+            merged (the last update of each price level wins), so they are applied to the order book as a single diff
+        """
         self._domain: Optional[str] = domain
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
+        self._max_concurrent_initializations: Optional[int] = max_concurrent_initializations
+        self._coalesce_diffs: bool = coalesce_diffs
+        self._tracking_stats: Dict[str, OrderBookTrackingStats] = defaultdict(OrderBookTrackingStats)
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_ready_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -68,6 +129,23 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        """
+        Indicates if the order book for the trading pair has been initialized and is being tracked, regardless of the
+        initialization state of the rest of the order books.
+        """
+        return trading_pair in self._order_book_ready_events and self._order_book_ready_events[trading_pair].is_set()
+
+    async def wait_order_book_ready(self, trading_pair: str):
+        await self._order_book_ready_events[trading_pair].wait()
+
+    @property
+    def tracking_stats(self) -> Dict[str, OrderBookTrackingStats]:
+        """
+        Diff processing counters (queue depth, coalescing ratio and apply latency) for each tracked trading pair
+        """
+        return self._tracking_stats
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -138,6 +216,8 @@ class OrderBookTracker:
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        for ready_event in self._order_book_ready_events.values():
+            ready_event.clear()
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
@@ -176,15 +256,56 @@ class OrderBookTracker:
         """
         Initialize order books
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+        if self._max_concurrent_initializations is None:
+            for index, trading_pair in enumerate(self._trading_pairs):
+                order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+                self._start_tracking_order_book(trading_pair=trading_pair, order_book=order_book)
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{index + 1}/{len(self._trading_pairs)} completed.")
+                await self._sleep(delay=1)
+        else:
+            await self._init_order_books_concurrently()
         self._order_books_initialized.set()
 
+    async def _init_order_books_concurrently(self):
+        """
+        Requests the initial snapshots for all trading pairs concurrently, bounded by the configured maximum number of
+        requests in flight. Each order book starts being tracked as soon as its snapshot arrives.
+        Rate limiting is delegated to the throttler used by the data source REST requests.
+        """
+        semaphore = asyncio.Semaphore(max(1, self._max_concurrent_initializations))
+        completed: int = 0
+
+        async def _init_single_order_book(trading_pair: str):
+            nonlocal completed
+            while True:
+                try:
+                    async with semaphore:
+                        order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+                    break
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().network(
+                        f"Unexpected error initializing order book for {trading_pair}.",
+                        exc_info=True,
+                        app_warning_msg=f"Unexpected error initializing order book for {trading_pair}. "
+                                        f"Retrying after 5 seconds."
+                    )
+                    await self._sleep(delay=5.0)
+            self._start_tracking_order_book(trading_pair=trading_pair, order_book=order_book)
+            completed += 1
+            self.logger().info(f"Initialized order book for {trading_pair}. "
+                               f"{completed}/{len(self._trading_pairs)} completed.")
+
+        await safe_gather(*[_init_single_order_book(trading_pair) for trading_pair in self._trading_pairs])
+
+    def _start_tracking_order_book(self, trading_pair: str, order_book: OrderBook):
+        self._order_books[trading_pair] = order_book
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_book_ready_events[trading_pair].set()
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -258,6 +379,7 @@ class OrderBookTracker:
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
+        stats: OrderBookTrackingStats = self._tracking_stats[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
 
@@ -270,16 +392,27 @@ class OrderBookTracker:
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
+                stats.record_queue_depth(message_queue.qsize())
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    diff_messages = [message]
+                    pending_snapshot: Optional[OrderBookMessage] = None
+                    if self._coalesce_diffs and len(saved_messages) == 0:
+                        pending_snapshot = self._drain_diff_messages(message_queue, diff_messages)
+
+                    self._apply_diff_messages(order_book, diff_messages, stats)
+                    past_diffs_window.extend(diff_messages)
+                    diff_messages_accepted += len(diff_messages)
+
+                    if pending_snapshot is not None:
+                        order_book.restore_from_snapshot_and_diffs(pending_snapshot, list(past_diffs_window))
 
                     # Output some statistics periodically.
                     now: float = time.time()
                     if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
+                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair} "
+                                            f"(coalescing ratio: {stats.coalescing_ratio:.2f}, "
+                                            f"max queue depth: {stats.max_queue_depth}).")
                         diff_messages_accepted = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
@@ -295,6 +428,40 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    @staticmethod
+    def _drain_diff_messages(message_queue: asyncio.Queue,
+                             diff_messages: List[OrderBookMessage]) -> Optional[OrderBookMessage]:
+        """
+        Moves the diff messages already pending in the queue to diff_messages, without waiting.
+        Draining stops at the first snapshot message, that is returned to be applied after the drained diffs.
+        """
+        while not message_queue.empty():
+            message = message_queue.get_nowait()
+            if message.type is OrderBookMessageType.SNAPSHOT:
+                return message
+            if message.type is OrderBookMessageType.DIFF:
+                diff_messages.append(message)
+        return None
+
+    @staticmethod
+    def _apply_diff_messages(order_book: OrderBook,
+                             diff_messages: List[OrderBookMessage],
+                             stats: OrderBookTrackingStats):
+        start = time.perf_counter()
+        if len(diff_messages) == 1:
+            order_book.apply_diff_message(diff_messages[0])
+        elif all(isinstance(message, NumpyOrderBookMessage) for message in diff_messages):
+            order_book.apply_numpy_diffs(
+                coalesce_numpy_levels([message.bids_array for message in diff_messages]),
+                coalesce_numpy_levels([message.asks_array for message in diff_messages]),
+                diff_messages[-1].update_id)
+        else:
+            order_book.apply_diffs(
+                coalesce_levels([message.bids for message in diff_messages]),
+                coalesce_levels([message.asks for message in diff_messages]),
+                diff_messages[-1].update_id)
+        stats.record_diff_update(messages_count=len(diff_messages), apply_latency=time.perf_counter() - start)
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -342,3 +509,26 @@ class OrderBookTracker:
     @staticmethod
     async def _sleep(delay: float):
         await asyncio.sleep(delay=delay)
+
+
+def coalesce_levels(levels_by_message: List[List[OrderBookRow]]) -> List[OrderBookRow]:
+    """
+    Merges the price levels of consecutive diffs. When a price is updated more than once the last update wins.
+    """
+    merged_levels: Dict[float, OrderBookRow] = {}
+    for levels in levels_by_message:
+        for level in levels:
+            merged_levels[level.price] = level
+    return list(merged_levels.values())
+
+
+def coalesce_numpy_levels(levels_by_message: List[np.ndarray]) -> np.ndarray:
+    """
+    Merges the [price, amount, update_id] arrays of consecutive diffs. When a price is updated more than once the
+    last update wins.
+    """
+    levels = np.concatenate(levels_by_message)
+    # np.unique returns the first occurrence of each price, so the search is done over the reversed levels
+    reversed_levels = levels[::-1]
+    _, last_update_indexes = np.unique(reversed_levels[:, 0], return_index=True)
+    return np.ascontiguousarray(reversed_levels[last_update_indexes])
@@ -37,6 +37,7 @@ class MarketEvent(Enum):
 
 class OrderBookEvent(int, Enum):
     TradeEvent = 901
+    TopOfBookChanged = 902
 
 
 class OrderBookDataSourceEvent(int, Enum):
@@ -151,6 +152,12 @@ class OrderBookTradeEvent(NamedTuple):
     is_taker: bool = True  # CEXs deliver trade events from the taker's perspective
 
 
+class OrderBookTopOfBookChangedEvent(NamedTuple):
+    update_id: int
+    best_bid: float
+    best_ask: float
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
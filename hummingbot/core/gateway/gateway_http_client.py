@@ -1,6 +1,7 @@
 import logging
 import re
 import ssl
+import time
 from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
@@ -11,6 +12,7 @@ from hummingbot.client.config.security import Security
 from hummingbot.core.data_type.common import OrderType, PositionSide
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.event.events import TradeType
+from hummingbot.core.gateway.gateway_http_transport import GatewayLatencyHistogram, GatewayRouteClass, get_route_class
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -41,10 +43,14 @@ class GatewayError(Enum):
 class GatewayHttpClient:
     """
     An HTTP client for making requests to the gateway API.
+
+    The requests placing and canceling orders and the polling requests (prices, balances, status) use separate
+    connection pools, so the order placement doesn't wait for a connection used by polling. The connections are kept
+    open between requests, and the latency of each route is recorded in a histogram.
     """
 
     _ghc_logger: Optional[HummingbotLogger] = None
-    _shared_client: Optional[aiohttp.ClientSession] = None
+    _shared_clients: Dict[GatewayRouteClass, aiohttp.ClientSession] = {}
     _base_url: str
 
     __instance = None
@@ -62,8 +68,11 @@ class GatewayHttpClient:
         api_host = client_config_map.gateway.gateway_api_host
         api_port = client_config_map.gateway.gateway_api_port
         if GatewayHttpClient.__instance is None:
-            self._base_url = f"https://{api_host}:{api_port}"
+            # The connections through a Unix domain socket are not encrypted, the host only sets the Host header
+            scheme = "https" if client_config_map.gateway.gateway_api_unix_socket is None else "http"
+            self._base_url = f"{scheme}://{api_host}:{api_port}"
         self._client_config_map = client_config_map
+        self._latency_histograms: Dict[str, GatewayLatencyHistogram] = {}
         GatewayHttpClient.__instance = self
 
     @classmethod
@@ -73,19 +82,42 @@ class GatewayHttpClient:
         return cls._ghc_logger
 
     @classmethod
-    def _http_client(cls, client_config_map: "ClientConfigAdapter", re_init: bool = False) -> aiohttp.ClientSession:
+    def _http_client(
+            cls,
+            client_config_map: "ClientConfigAdapter",
+            re_init: bool = False,
+            route_class: GatewayRouteClass = GatewayRouteClass.POLLING,
+    ) -> aiohttp.ClientSession:
         """
-        :returns Shared client session instance
+        :returns Shared client session instance of the route class
         """
-        if cls._shared_client is None or re_init:
-            cert_path = client_config_map.certs_path
-            ssl_ctx = ssl.create_default_context(cafile=f"{cert_path}/ca_cert.pem")
-            ssl_ctx.load_cert_chain(certfile=f"{cert_path}/client_cert.pem",
-                                    keyfile=f"{cert_path}/client_key.pem",
-                                    password=Security.secrets_manager.password.get_secret_value())
-            conn = aiohttp.TCPConnector(ssl_context=ssl_ctx)
-            cls._shared_client = aiohttp.ClientSession(connector=conn)
-        return cls._shared_client
+        if route_class not in cls._shared_clients or re_init:
+            cls._shared_clients[route_class] = aiohttp.ClientSession(
+                connector=cls._create_connector(client_config_map, route_class)
+            )
+        return cls._shared_clients[route_class]
+
+    @staticmethod
+    def _create_connector(client_config_map: "ClientConfigAdapter",
+                          route_class: GatewayRouteClass) -> aiohttp.BaseConnector:
+        gateway_config = client_config_map.gateway
+        if route_class == GatewayRouteClass.TRADING:
+            limit = gateway_config.gateway_trading_connections_limit
+        else:
+            limit = gateway_config.gateway_polling_connections_limit
+        keepalive_timeout = gateway_config.gateway_keepalive_timeout
+        if gateway_config.gateway_api_unix_socket is not None:
+            return aiohttp.UnixConnector(path=gateway_config.gateway_api_unix_socket,
+                                         limit=limit,
+                                         keepalive_timeout=keepalive_timeout)
+        cert_path = client_config_map.certs_path
+        ssl_ctx = ssl.create_default_context(cafile=f"{cert_path}/ca_cert.pem")
+        ssl_ctx.load_cert_chain(certfile=f"{cert_path}/client_cert.pem",
+                                keyfile=f"{cert_path}/client_key.pem",
+                                password=Security.secrets_manager.password.get_secret_value())
+        return aiohttp.TCPConnector(ssl_context=ssl_ctx,
+                                    limit=limit,
+                                    keepalive_timeout=keepalive_timeout)
 
     @classmethod
     def reload_certs(cls, client_config_map: "ClientConfigAdapter"):
@@ -93,7 +125,22 @@ class GatewayHttpClient:
         Re-initializes the aiohttp.ClientSession. This should be called whenever there is any updates to the
         Certificates used to secure a HTTPS connection to the Gateway service.
         """
-        cls._http_client(client_config_map, re_init=True)
+        for route_class in GatewayRouteClass:
+            cls._http_client(client_config_map, re_init=True, route_class=route_class)
+
+    @property
+    def latency_histograms(self) -> Dict[str, GatewayLatencyHistogram]:
+        """
+        The request latency histograms, by route (e.g. "POST amm/trade")
+        """
+        return self._latency_histograms
+
+    def _record_latency(self, method: str, path_url: str, latency_seconds: float):
+        route = f"{method.upper()} {path_url}"
+        histogram = self._latency_histograms.get(route)
+        if histogram is None:
+            histogram = self._latency_histograms[route] = GatewayLatencyHistogram()
+        histogram.record(latency_seconds)
 
     @property
     def base_url(self) -> str:
@@ -171,9 +218,10 @@ class GatewayHttpClient:
         :returns A response in json format.
         """
         url = f"{self.base_url}/{path_url}"
-        client = self._http_client(self._client_config_map)
+        client = self._http_client(self._client_config_map, route_class=get_route_class(method, path_url))
 
         parsed_response = {}
+        start_time = time.perf_counter()
         try:
             if method == "get":
                 if len(params) > 0:
@@ -216,6 +264,8 @@ class GatewayHttpClient:
                         app_warning_msg=f"Call to {url} failed. See logs for more details."
                     )
                 raise e
+        finally:
+            self._record_latency(method, path_url, time.perf_counter() - start_time)
 
         return parsed_response
 
@@ -0,0 +1,108 @@
+import bisect
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+
+
+class GatewayRouteClass(Enum):
+    """
+    The classes of Gateway routes, each one sent through its own connection pool so the order placement and
+    cancellation requests don't wait for the connections used by price, balance and status polling.
+    """
+    TRADING = "trading"
+    POLLING = "polling"
+
+
+# The (method, path) of the routes that place, cancel or sign orders and transactions
+TRADING_ROUTES = {
+    ("post", "amm/trade"),
+    ("post", "amm/perp/open"),
+    ("post", "amm/perp/close"),
+    ("post", "amm/liquidity/add"),
+    ("post", "amm/liquidity/remove"),
+    ("post", "amm/liquidity/collect_fees"),
+    ("post", "evm/approve"),
+    ("post", "evm/cancel"),
+    ("post", "evm/nextNonce"),
+    ("get", "wallet/sign"),
+    ("post", "clob/orders"),
+    ("delete", "clob/orders"),
+    ("post", "clob/batchOrders"),
+    ("post", "clob/perp/orders"),
+    ("delete", "clob/perp/orders"),
+    ("post", "clob/perp/batchOrders"),
+}
+
+
+def get_route_class(method: str, path_url: str) -> GatewayRouteClass:
+    if (method.lower(), path_url) in TRADING_ROUTES:
+        return GatewayRouteClass.TRADING
+    return GatewayRouteClass.POLLING
+
+
+class GatewayLatencyHistogram:
+    """
+    Counts the request latencies of a Gateway route in fixed buckets, so percentiles can be estimated without keeping
+    the individual latencies.
+    """
+    # The upper bounds of the buckets, in milliseconds. The last bucket counts the latencies above the last bound.
+    BUCKET_BOUNDS_MS: Tuple[float, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self, bucket_bounds_ms: Tuple[float, ...] = BUCKET_BOUNDS_MS):
+        self._bucket_bounds_ms = bucket_bounds_ms
+        self._counts: List[int] = [0] * (len(bucket_bounds_ms) + 1)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+
+    @property
+    def bucket_bounds_ms(self) -> Tuple[float, ...]:
+        return self._bucket_bounds_ms
+
+    @property
+    def counts(self) -> List[int]:
+        return self._counts
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean_ms(self) -> float:
+        return self._total_ms / self._count if self._count > 0 else 0.0
+
+    @property
+    def max_ms(self) -> float:
+        return self._max_ms
+
+    def record(self, latency_seconds: float):
+        latency_ms = latency_seconds * 1e3
+        self._counts[bisect.bisect_left(self._bucket_bounds_ms, latency_ms)] += 1
+        self._count += 1
+        self._total_ms += latency_ms
+        self._max_ms = max(self._max_ms, latency_ms)
+
+    def percentile_ms(self, percentile: float) -> Optional[float]:
+        """
+        :param percentile: the percentile, between 0 and 100
+        :return: the upper bound of the bucket containing the percentile (the max latency for the last bucket), or
+        None if no latency was recorded
+        """
+        if self._count == 0:
+            return None
+        rank = percentile / 100 * self._count
+        cumulative_count = 0
+        for bound, count in zip(self._bucket_bounds_ms, self._counts):
+            cumulative_count += count
+            if cumulative_count >= rank and cumulative_count > 0:
+                return min(bound, self._max_ms)
+        return self._max_ms
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self._count,
+            "mean_ms": self.mean_ms,
+            "p50_ms": self.percentile_ms(50),
+            "p90_ms": self.percentile_ms(90),
+            "p99_ms": self.percentile_ms(99),
+            "max_ms": self._max_ms,
+        }
@@ -39,8 +39,15 @@ cdef class PubSub:
        make sense to do the GC every time.
     2. c_remove_listener():
        Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+    3. c_get_listeners():
+       Every time. The function takes O(n) already.
+    4. c_trigger_event():
+       Only when a dead listener is found while dispatching the event.
+
+    Events are dispatched to a snapshot of the listeners of the event tag: an immutable tuple of the listener weak
+    references, built on the first event after the listeners of the tag change and discarded by any change. Listeners
+    are allowed to add and remove listeners while the event is dispatched, which only discards the snapshot being
+    iterated. Triggering an event therefore neither copies nor scans the listeners registry when they don't change.
     """
 
     ADD_LISTENER_GC_PROBABILITY = 0.005
@@ -52,8 +59,13 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
+    def __cinit__(self):
+        # Set in __cinit__ since not all the subclasses call PubSub.__init__()
+        self._listeners_snapshots = {}
+
     def __init__(self):
         self._events = Events()
+        self._listeners_snapshots = {}
 
     def add_listener(self, event_tag: Enum, listener: EventListener):
         self.c_add_listener(event_tag.value, listener)
@@ -79,10 +91,12 @@ cdef class PubSub:
             PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
         if it != self._events.end():
             listeners_ptr = address(deref(it).second)
-            deref(listeners_ptr).insert(listener_wrapper)
+            if deref(listeners_ptr).insert(listener_wrapper).second:
+                self._listeners_snapshots.pop(event_tag, None)
         else:
             new_listeners.insert(listener_wrapper)
             self._events.insert(EventsPair(event_tag, new_listeners))
+            self._listeners_snapshots.pop(event_tag, None)
 
         if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
             self.c_remove_dead_listeners(event_tag)
@@ -100,6 +114,7 @@ cdef class PubSub:
         lit = deref(listeners_ptr).find(listener_wrapper)
         if lit != deref(listeners_ptr).end():
             deref(listeners_ptr).erase(lit)
+            self._listeners_snapshots.pop(event_tag, None)
         self.c_remove_dead_listeners(event_tag)
 
     cdef c_remove_dead_listeners(self, int64_t event_tag):
@@ -118,10 +133,13 @@ cdef class PubSub:
             if <object>(PyWeakref_GetObject(listener_weakref)) is None:
                 lit_to_remove.push_back(lit)
             inc(lit)
-        for lit in lit_to_remove:
-            deref(listeners_ptr).erase(lit)
+        if lit_to_remove.size() > 0:
+            for lit in lit_to_remove:
+                deref(listeners_ptr).erase(lit)
+            self._listeners_snapshots.pop(event_tag, None)
         if deref(listeners_ptr).size() < 1:
             self._events.erase(it)
+            self._listeners_snapshots.pop(event_tag, None)
 
     cdef c_get_listeners(self, int64_t event_tag):
         self.c_remove_dead_listeners(event_tag)
@@ -143,23 +161,32 @@ cdef class PubSub:
             retval.append(typed_listener)
         return retval
 
-    cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
+    cdef tuple c_get_listeners_snapshot(self, int64_t event_tag):
+        cdef:
+            tuple snapshot = self._listeners_snapshots.get(event_tag)
+            EventsIterator it
+        if snapshot is None:
+            it = self._events.find(event_tag)
+            if it == self._events.end():
+                return ()
+            snapshot = tuple([<object>pyref.get() for pyref in deref(it).second])
+            self._listeners_snapshots[event_tag] = snapshot
+        return snapshot
 
+    cdef c_trigger_event(self, int64_t event_tag, object arg):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            tuple listeners = self.c_get_listeners_snapshot(event_tag)
+            object listener
             EventListener typed_listener
-        if it == self._events.end():
-            return
-
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+            bint dead_listener_found = False
+
+        # The snapshot is immutable, so listeners can call c_add_listener() and c_remove_listener() while it's iterated
+        for listener_weakref in listeners:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                dead_listener_found = True
+                continue
+            typed_listener = listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
@@ -167,3 +194,6 @@ cdef class PubSub:
                 self.c_log_exception(event_tag, arg)
             finally:
                 typed_listener.c_set_event_info(0, None)
+
+        if dead_listener_found:
+            self.c_remove_dead_listeners(event_tag)
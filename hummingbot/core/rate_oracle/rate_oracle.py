@@ -13,7 +13,7 @@ from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGecko
 from hummingbot.core.rate_oracle.sources.gate_io_rate_source import GateIoRateSource
 from hummingbot.core.rate_oracle.sources.kucoin_rate_source import KucoinRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateGraph, find_rate
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
@@ -30,7 +30,8 @@ class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    The find_rate is then used on these prices to find a rate on a given pair. The stored prices are also indexed in a
+    RateGraph, so that rates for the stored prices are found without scanning all of them.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
@@ -47,10 +48,22 @@ class RateOracle(NetworkBase):
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, source: Optional[RateSourceBase] = None, quote_token: Optional[str] = None):
+    def __init__(self,
+                 source: Optional[RateSourceBase] = None,
+                 quote_token: Optional[str] = None,
+                 max_hops: int = 1):
+        """
+        :param source: the source of the prices
+        :param quote_token: the token in which prices are requested to the source
+        :param max_hops: maximum number of intermediate conversions used to find a rate for a stored pair. Rates that
+            need more than one intermediate conversion are searched as the shortest path between the pair tokens
+        """
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
-        self._prices: Dict[str, Decimal] = {}
+        # Increased on every prices update, the rate graph is rebuilt when it changes
+        self._prices_version: int = 0
+        self._stored_prices: Dict[str, Decimal] = {}
+        self._rate_graph: RateGraph = RateGraph(max_hops=max_hops)
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
@@ -93,12 +106,31 @@ class RateOracle(NetworkBase):
             self._quote_token = new_token
             self._prices = {}
 
+    @property
+    def max_hops(self) -> int:
+        return self._rate_graph.max_hops
+
+    @max_hops.setter
+    def max_hops(self, value: int):
+        self._rate_graph.max_hops = value
+
     @property
     def prices(self) -> Dict[str, Decimal]:
         """
         Actual prices retrieved from URL
         """
-        return self._prices.copy()
+        return self._stored_prices.copy()
+
+    @property
+    def _prices(self) -> Dict[str, Decimal]:
+        # The stored prices can be updated in place through the returned dictionary
+        self._prices_version += 1
+        return self._stored_prices
+
+    @_prices.setter
+    def _prices(self, prices: Dict[str, Decimal]):
+        self._stored_prices = prices
+        self._prices_version += 1
 
     async def start_network(self):
         await self.stop_network()
@@ -153,7 +185,9 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        if not self._rate_graph.is_synced_with(self._prices_version):
+            self._rate_graph.update(self._stored_prices, self._prices_version)
+        return self._rate_graph.find_rate(pair)
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
@@ -164,7 +198,7 @@ class RateOracle(NetworkBase):
 
         :return A conversion rate
         """
-        if self._prices:
+        if self._stored_prices:
             rate = self.get_pair_rate(pair)
         else:
             rate = await self.rate_async(pair)
@@ -185,7 +219,8 @@ class RateOracle(NetworkBase):
         while True:
             try:
                 self._prices = await self._source.get_prices(quote_token=self._quote_token)
-                if self._prices:
+                self._rate_graph.update(self._stored_prices, self._prices_version)
+                if self._stored_prices:
                     self._ready_event.set()
             except asyncio.CancelledError:
                 raise
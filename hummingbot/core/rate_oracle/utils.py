@@ -1,5 +1,7 @@
+import itertools
+from collections import defaultdict
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, List, Optional
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.gateway.utils import unwrap_token_symbol
@@ -35,3 +37,135 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
         common_denom_pair = combine_to_hb_trading_pair(base=quote, quote=link_quote)
         if common_denom_pair in prices:
             return proxy_price / prices[common_denom_pair]
+
+
+class RateGraph:
+    '''
+    Token graph built from a dictionary of prices, used to find exchange rates without scanning all the prices.
+    Each price "BASE-QUOTE" is stored as an edge from BASE to QUOTE (and indexed by QUOTE for the inverse rate).
+    The graph is updated incrementally with `update`, and every update that changes a price starts a new generation.
+    Rates found are memoized until the generation changes.
+    Direct, inverse and one-hop rates are resolved in the same way (and order) as `find_rate`. When `max_hops` is
+    greater than 1, rates that can not be found with one hop are searched with a shortest path (in number of hops)
+    over the graph.
+    '''
+
+    def __init__(self, max_hops: int = 1):
+        self._max_hops: int = max_hops
+        self._source_prices_version: Optional[int] = None
+        self._known_prices: Dict[str, Decimal] = {}
+        self._quotes_by_base: Dict[str, Dict[str, Decimal]] = defaultdict(dict)
+        self._bases_by_quote: Dict[str, Dict[str, Decimal]] = defaultdict(dict)
+        self._generation: int = 0
+        self._rates_cache: Dict[str, Optional[Decimal]] = {}
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def max_hops(self) -> int:
+        return self._max_hops
+
+    @max_hops.setter
+    def max_hops(self, value: int):
+        if value != self._max_hops:
+            self._max_hops = value
+            self._rates_cache.clear()
+
+    def is_synced_with(self, prices_version: int) -> bool:
+        '''
+        Checks if the graph was last updated with the given version of the prices. The owner of the prices increases
+        the version every time it updates them, in place or not.
+        '''
+        return prices_version == self._source_prices_version
+
+    def update(self, prices: Dict[str, Decimal], prices_version: Optional[int] = None):
+        '''
+        Updates the graph edges with the new prices, removing the pairs that are no longer present.
+        :param prices: The dictionary of trading pairs and their prices
+        :param prices_version: The version of the prices, see `is_synced_with`
+        '''
+        changed = False
+        for pair, price in prices.items():
+            if pair not in self._known_prices or self._known_prices[pair] != price:
+                try:
+                    base, quote = split_hb_trading_pair(trading_pair=pair)
+                except ValueError:
+                    continue
+                self._quotes_by_base[base][quote] = price
+                self._bases_by_quote[quote][base] = price
+                changed = True
+        for pair in self._known_prices.keys() - prices.keys():
+            base, quote = split_hb_trading_pair(trading_pair=pair)
+            self._quotes_by_base[base].pop(quote, None)
+            self._bases_by_quote[quote].pop(base, None)
+            changed = True
+
+        self._source_prices_version = prices_version
+        self._known_prices = {pair: price for pair, price in prices.items() if pair.count("-") == 1}
+        if changed:
+            self._generation += 1
+            self._rates_cache.clear()
+
+    def find_rate(self, pair: str) -> Optional[Decimal]:
+        '''
+        Finds the exchange rate for a trading pair
+        :param pair: The trading pair
+        :return: the rate, or None if no rate can be found
+        '''
+        if pair in self._rates_cache:
+            return self._rates_cache[pair]
+        rate = self._find_rate(pair)
+        self._rates_cache[pair] = rate
+        return rate
+
+    def _find_rate(self, pair: str) -> Optional[Decimal]:
+        if pair in self._known_prices:
+            return self._known_prices[pair]
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        base = unwrap_token_symbol(base)
+        quote = unwrap_token_symbol(quote)
+        if base == quote:
+            return Decimal("1")
+        base_quotes = self._quotes_by_base.get(base, {})
+        if quote in base_quotes:
+            return base_quotes[quote]
+        quote_quotes = self._quotes_by_base.get(quote, {})
+        if base in quote_quotes:
+            return Decimal("1") / quote_quotes[base]
+        for link_quote, proxy_price in base_quotes.items():
+            link_quotes = self._quotes_by_base.get(link_quote, {})
+            if quote in link_quotes:
+                return proxy_price * link_quotes[quote]
+            if link_quote in quote_quotes:
+                return proxy_price / quote_quotes[link_quote]
+        if self._max_hops > 1:
+            return self._find_shortest_path_rate(base=base, quote=quote)
+        return None
+
+    def _find_shortest_path_rate(self, base: str, quote: str) -> Optional[Decimal]:
+        '''
+        Breadth first search of the quote token, following prices in both directions, up to max_hops edges.
+        '''
+        rates: Dict[str, Decimal] = {base: Decimal("1")}
+        frontier: List[str] = [base]
+        for _ in range(self._max_hops):
+            next_frontier: List[str] = []
+            for token in frontier:
+                token_rate = rates[token]
+                neighbours = itertools.chain(
+                    ((next_token, price) for next_token, price in self._quotes_by_base.get(token, {}).items()),
+                    ((next_token, Decimal("1") / price) for next_token, price in self._bases_by_quote.get(token, {}).items()
+                     if price != 0))
+                for next_token, price in neighbours:
+                    if next_token in rates:
+                        continue
+                    rates[next_token] = token_rate * price
+                    if next_token == quote:
+                        return rates[next_token]
+                    next_frontier.append(next_token)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return None
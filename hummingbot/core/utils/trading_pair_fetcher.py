@@ -1,17 +1,34 @@
+import asyncio
+import json
 import logging
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+import os
+import time
+from os.path import join
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
+from hummingbot import data_path
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting
 from hummingbot.logger import HummingbotLogger
 
-from .async_utils import safe_ensure_future
+from .async_utils import safe_ensure_future, safe_gather
 
 
 class TradingPairFetcher:
+    """
+    Fetches the trading pairs of all the connectors, used for the trading pair autocompletion and validation.
+
+    The trading pairs of each connector are cached on disk. On start the cached pairs are available straight away, and
+    only the connectors whose cache entry is missing or older than `CACHE_TTL` are fetched again in the background,
+    at most `MAX_CONCURRENT_FETCHES` at a time.
+    """
     _sf_shared_instance: "TradingPairFetcher" = None
     _tpf_logger: Optional[HummingbotLogger] = None
 
+    CACHE_FILE_NAME = "trading_pairs_cache.json"
+    CACHE_TTL = 60 * 60 * 24  # seconds
+    MAX_CONCURRENT_FETCHES = 8
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._tpf_logger is None:
@@ -30,44 +47,131 @@ class TradingPairFetcher:
         self.trading_pairs: Dict[str, Any] = {}
         self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
 
-    def _fetch_pairs_from_connector_setting(
+    async def _fetch_pairs_from_connector_setting(
             self,
             connector_setting: ConnectorSetting,
-            connector_name: Optional[str] = None):
-        connector_name = connector_name or connector_setting.name
-        connector = connector_setting.non_trading_connector_instance_with_default_configuration()
-        safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
+            connector_names: List[str],
+            fetch_semaphore: asyncio.Semaphore) -> Optional[List[str]]:
+        async with fetch_semaphore:
+            # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
+            # data source module for them.
+            try:
+                connector = connector_setting.non_trading_connector_instance_with_default_configuration()
+            except ModuleNotFoundError:
+                return None
+            except Exception:
+                self.logger().exception(f"An error occurred when fetching trading pairs for {connector_setting.name}."
+                                        "Please check the logs")
+                return None
+            pairs = await self.call_fetch_pairs(connector.all_trading_pairs(), connector_names[0])
+        for connector_name in connector_names[1:]:
+            self.trading_pairs[connector_name] = self.trading_pairs[connector_names[0]]
+        return pairs
 
     async def fetch_all(self, client_config_map: ClientConfigAdapter):
         connector_settings = self._all_connector_settings()
+        # Paper trade connectors share the trading pairs of the connector they are based on
+        connectors_by_source: Dict[str, Tuple[ConnectorSetting, List[str]]] = {}
         for conn_setting in connector_settings.values():
-            # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
-            # data source module for them.
             try:
                 if conn_setting.base_name().endswith("paper_trade"):
-                    self._fetch_pairs_from_connector_setting(
-                        connector_setting=connector_settings[conn_setting.parent_name],
-                        connector_name=conn_setting.name
-                    )
+                    source_setting = connector_settings[conn_setting.parent_name]
                 else:
-                    self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
-            except ModuleNotFoundError:
-                continue
+                    source_setting = conn_setting
             except Exception:
                 self.logger().exception(f"An error occurred when fetching trading pairs for {conn_setting.name}."
                                         "Please check the logs")
+                continue
+            _, connector_names = connectors_by_source.setdefault(source_setting.name, (source_setting, []))
+            if conn_setting.name == source_setting.name:
+                connector_names.insert(0, conn_setting.name)
+            else:
+                connector_names.append(conn_setting.name)
+
+        cache = self._read_cache()
+        now = time.time()
+        sources_to_fetch = []
+        for source_name, (_, connector_names) in connectors_by_source.items():
+            cache_entry = cache.get(source_name)
+            if cache_entry is not None:
+                for connector_name in connector_names:
+                    self.trading_pairs[connector_name] = cache_entry["trading_pairs"]
+            if cache_entry is None or now - cache_entry["timestamp"] > self.CACHE_TTL:
+                sources_to_fetch.append(source_name)
 
         self.ready = True
 
-    async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
+        fetch_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+        fetched_pairs = await safe_gather(*[
+            self._fetch_pairs_from_connector_setting(*connectors_by_source[source_name], fetch_semaphore)
+            for source_name in sources_to_fetch
+        ])
+        fetch_time = time.time()
+        for source_name, pairs in zip(sources_to_fetch, fetched_pairs):
+            if pairs is not None:
+                cache[source_name] = {"timestamp": fetch_time, "trading_pairs": pairs}
+        if any(pairs is not None for pairs in fetched_pairs):
+            self._write_cache(cache)
+
+    async def call_fetch_pairs(
+            self,
+            fetch_fn: Callable[[], Awaitable[List[str]]],
+            exchange_name: str) -> Optional[List[str]]:
         try:
             pairs = await fetch_fn
-            self.trading_pairs[exchange_name] = pairs
         except Exception:
-            self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
-                                f"Trading pairs autocompletion won't work.", exc_info=True)
-            # In case of error just assign empty list, this is st. the bot won't stop working
-            self.trading_pairs[exchange_name] = []
+            if exchange_name in self.trading_pairs:
+                self.logger().warning(f"Connector {exchange_name} failed to retrieve its trading pairs. "
+                                      f"The cached trading pairs will be used for autocompletion.", exc_info=True)
+            else:
+                self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
+                                    f"Trading pairs autocompletion won't work.", exc_info=True)
+                # In case of error just assign empty list, this is st. the bot won't stop working
+                self.trading_pairs[exchange_name] = []
+            return None
+        if len(pairs) == 0:
+            # Some connectors return no trading pairs instead of raising when they fail to get them, e.g. the Gateway
+            # connectors when Gateway is not running. The result is not cached, and the cached pairs are kept.
+            if exchange_name in self.trading_pairs:
+                self.logger().warning(f"Connector {exchange_name} returned no trading pairs. "
+                                      f"The cached trading pairs will be used for autocompletion.")
+            else:
+                self.trading_pairs[exchange_name] = []
+            return None
+        self.trading_pairs[exchange_name] = pairs
+        return pairs
+
+    def _read_cache(self) -> Dict[str, Dict[str, Any]]:
+        cache_path = self._cache_path()
+        if not os.path.exists(cache_path):
+            return {}
+        try:
+            with open(cache_path) as cache_file:
+                cache = json.load(cache_file)
+            return {
+                connector_name: entry for connector_name, entry in cache.items()
+                if isinstance(entry, dict)
+                and isinstance(entry.get("timestamp"), (int, float))
+                and isinstance(entry.get("trading_pairs"), list)
+            }
+        except Exception:
+            self.logger().warning(f"Could not read the trading pairs cache {cache_path}. "
+                                  f"The trading pairs of all the connectors will be fetched.", exc_info=True)
+            return {}
+
+    def _write_cache(self, cache: Dict[str, Dict[str, Any]]):
+        cache_path = self._cache_path()
+        temp_path = f"{cache_path}.tmp"
+        try:
+            with open(temp_path, "w") as cache_file:
+                json.dump(cache, cache_file)
+            os.replace(temp_path, cache_path)
+        except Exception:
+            self.logger().warning(f"Could not write the trading pairs cache {cache_path}.", exc_info=True)
+
+    def _cache_path(self) -> str:
+        # Method created to enabling patching in unit tests
+        return join(data_path(), self.CACHE_FILE_NAME)
 
     def _all_connector_settings(self) -> Dict[str, ConnectorSetting]:
         # Method created to enabling patching in unit tests
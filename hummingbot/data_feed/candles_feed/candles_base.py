@@ -1,6 +1,5 @@
 import asyncio
-from collections import deque
-from typing import Optional
+from typing import Optional, Tuple
 
 import pandas as pd
 from bidict import bidict
@@ -11,12 +10,15 @@ from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.data_feed.candles_feed.incremental_indicators import IncrementalIndicator
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a CandlesStore (NumPy columns in a ring
+    layout with the interface of a double-ended queue) to store candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
     """
@@ -45,7 +47,8 @@ class CandlesBase(NetworkBase):
         super().__init__()
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesStore(columns=self.columns, maxlen=max_records)
+        self._candles_df_cache: Optional[Tuple[int, pd.DataFrame]] = None
         self._listen_candles_task: Optional[asyncio.Task] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
@@ -113,8 +116,30 @@ class CandlesBase(NetworkBase):
     def candles_df(self) -> pd.DataFrame:
         """
         This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        The DataFrame is built only when the candles change. A copy is returned, so changes made by the caller do not
+        modify the cached DataFrame.
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        if self._candles_df_cache is None or self._candles_df_cache[0] != self._candles.version:
+            self._candles_df_cache = (self._candles.version, self._build_candles_df())
+        return self._candles_df_cache[1].copy()
+
+    def _build_candles_df(self) -> pd.DataFrame:
+        return pd.DataFrame(self._candles.to_numpy(), columns=self.columns)
+
+    def add_indicator(self, name: str, indicator: IncrementalIndicator):
+        """
+        Registers an incremental indicator (EMA, RSI, MACD, Bollinger bands...) calculated over the candles. The
+        indicator is updated with each new candle instead of being calculated again over all the candles.
+        :param name: the name used to get the indicator value
+        :param indicator: the indicator instance
+        """
+        self._candles.add_indicator(name, indicator)
+
+    def get_indicator_value(self, name: str):
+        """
+        Returns the current value of a registered indicator (NaN while there are not enough candles)
+        """
+        return self._candles.get_indicator(name).value
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
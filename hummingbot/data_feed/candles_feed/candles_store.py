@@ -0,0 +1,152 @@
+from typing import Dict, Iterable, Iterator, List, Sequence
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.incremental_indicators import IncrementalIndicator
+
+
+class CandlesStore:
+    """
+    Fixed capacity store of candles, kept in a preallocated float64 array (one column per candle field) in a ring
+    layout. It supports the deque operations used by the candles feeds (append, pop, extendleft, indexing), with the
+    same semantics as a deque with maxlen.
+    Every change increments `version`, so views built from the store can be cached until the candles change.
+    The registered incremental indicators are updated with each candle appended to the right, and reverted when the
+    last candle is popped (which is how the feeds update the candle still open). Adding candles to the left
+    (historical candles) recalculates the indicators over all the candles.
+    """
+
+    def __init__(self, columns: Sequence[str], maxlen: int):
+        self._columns: List[str] = list(columns)
+        self._maxlen: int = maxlen
+        self._values: np.ndarray = np.zeros((maxlen, len(self._columns)), dtype=np.float64)
+        self._start: int = 0
+        self._size: int = 0
+        self._version: int = 0
+        self._indicators: Dict[str, IncrementalIndicator] = {}
+        self._indicators_outdated: bool = False
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def columns(self) -> List[str]:
+        return self._columns
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self._values[self._position(index)].copy()
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for index in range(self._size):
+            yield self[index]
+
+    def append(self, candle: Sequence):
+        row = np.asarray(candle, dtype=np.float64)
+        if self._size == self._maxlen:
+            self._values[self._start] = row
+            self._start = (self._start + 1) % self._maxlen
+        else:
+            self._values[(self._start + self._size) % self._maxlen] = row
+            self._size += 1
+        self._version += 1
+        self._update_indicators(row)
+
+    def pop(self) -> np.ndarray:
+        if self._size == 0:
+            raise IndexError("pop from an empty CandlesStore")
+        candle = self[-1]
+        self._size -= 1
+        self._version += 1
+        self._revert_indicators()
+        return candle
+
+    def appendleft(self, candle: Sequence):
+        row = np.asarray(candle, dtype=np.float64)
+        self._start = (self._start - 1) % self._maxlen
+        self._values[self._start] = row
+        if self._size < self._maxlen:
+            self._size += 1
+        self._version += 1
+        self._indicators_outdated = True
+
+    def extendleft(self, candles: Iterable[Sequence]):
+        for candle in candles:
+            self.appendleft(candle)
+
+    def clear(self):
+        self._start = 0
+        self._size = 0
+        self._version += 1
+        for indicator in self._indicators.values():
+            indicator.reset()
+        self._indicators_outdated = False
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Returns a copy of the candles, ordered from the oldest to the newest, as a 2D array
+        """
+        end = self._start + self._size
+        if end <= self._maxlen:
+            return self._values[self._start:end].copy()
+        return np.concatenate((self._values[self._start:], self._values[:end - self._maxlen]))
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Returns a copy of the values of one of the columns, ordered from the oldest candle to the newest
+        """
+        return self.to_numpy()[:, self._columns.index(name)]
+
+    def add_indicator(self, name: str, indicator: IncrementalIndicator):
+        """
+        Registers an indicator that is kept up to date with the candles of the store
+        """
+        self._indicators[name] = indicator
+        self._recalculate_indicator(indicator)
+
+    def remove_indicator(self, name: str):
+        self._indicators.pop(name, None)
+
+    def get_indicator(self, name: str) -> IncrementalIndicator:
+        if self._indicators_outdated:
+            for indicator in self._indicators.values():
+                self._recalculate_indicator(indicator)
+            self._indicators_outdated = False
+        return self._indicators[name]
+
+    def _position(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("CandlesStore index out of range")
+        return (self._start + index) % self._maxlen
+
+    def _update_indicators(self, row: np.ndarray):
+        if self._indicators_outdated:
+            return
+        for indicator in self._indicators.values():
+            indicator.update(row[self._columns.index(indicator.column)])
+
+    def _revert_indicators(self):
+        if self._indicators_outdated:
+            return
+        for indicator in self._indicators.values():
+            if indicator.can_revert:
+                indicator.revert()
+            else:
+                self._indicators_outdated = True
+
+    def _recalculate_indicator(self, indicator: IncrementalIndicator):
+        indicator.reset()
+        for value in self.column(indicator.column).tolist():
+            indicator.update(value)
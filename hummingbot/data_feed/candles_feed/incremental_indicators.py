@@ -0,0 +1,221 @@
+import math
+from collections import deque
+from typing import Any, Deque, Optional, Tuple
+
+
+class IncrementalIndicator:
+    """
+    Base class for indicators updated one candle at a time.
+    Each update keeps the state previous to it, so the last update can be reverted once. That is how an update of the
+    last (still open) candle is handled: the previous value of the candle is reverted and the new one is applied.
+    The value is NaN until the indicator has received enough candles.
+    """
+
+    def __init__(self, length: int, column: str = "close"):
+        if length < 1:
+            raise ValueError("The indicator length must be greater than 0.")
+        self._length: int = length
+        self._column: str = column
+        self._count: int = 0
+        self._previous_state: Optional[Any] = None
+        self.reset()
+
+    @property
+    def column(self) -> str:
+        return self._column
+
+    @property
+    def length(self) -> int:
+        return self._length
+
+    @property
+    def is_ready(self) -> bool:
+        return self._count >= self._length
+
+    @property
+    def can_revert(self) -> bool:
+        return self._previous_state is not None
+
+    @property
+    def value(self):
+        raise NotImplementedError
+
+    def reset(self):
+        self._count = 0
+        self._previous_state = None
+        self._reset_state()
+
+    def update(self, value: float):
+        self._previous_state = (self._count, self._get_state())
+        self._count += 1
+        self._update_state(value)
+
+    def revert(self):
+        """
+        Reverts the last update. Only one update can be reverted.
+        """
+        if self._previous_state is None:
+            raise ValueError("There is no update to revert.")
+        count, state = self._previous_state
+        self._count = count
+        self._set_state(state)
+        self._previous_state = None
+
+    def _reset_state(self):
+        raise NotImplementedError
+
+    def _get_state(self) -> Any:
+        raise NotImplementedError
+
+    def _set_state(self, state: Any):
+        raise NotImplementedError
+
+    def _update_state(self, value: float):
+        raise NotImplementedError
+
+
+class EMAIndicator(IncrementalIndicator):
+    """
+    Exponential moving average with smoothing factor 2 / (length + 1), seeded with the first value
+    """
+
+    def _reset_state(self):
+        self._ema: float = math.nan
+
+    def _get_state(self) -> float:
+        return self._ema
+
+    def _set_state(self, state: float):
+        self._ema = state
+
+    def _update_state(self, value: float):
+        if self._count == 1:
+            self._ema = value
+        else:
+            self._ema += (value - self._ema) * 2 / (self._length + 1)
+
+    @property
+    def value(self) -> float:
+        return self._ema if self.is_ready else math.nan
+
+
+class RSIIndicator(IncrementalIndicator):
+    """
+    Relative strength index, with the average gains and losses smoothed with Wilder's method (factor 1 / length)
+    """
+
+    def _reset_state(self):
+        self._last_value: float = math.nan
+        self._average_gain: float = 0.0
+        self._average_loss: float = 0.0
+
+    def _get_state(self) -> Tuple[float, float, float]:
+        return self._last_value, self._average_gain, self._average_loss
+
+    def _set_state(self, state: Tuple[float, float, float]):
+        self._last_value, self._average_gain, self._average_loss = state
+
+    def _update_state(self, value: float):
+        if self._count > 1:
+            change = value - self._last_value
+            self._average_gain += (max(change, 0.0) - self._average_gain) / self._length
+            self._average_loss += (max(-change, 0.0) - self._average_loss) / self._length
+        self._last_value = value
+
+    @property
+    def is_ready(self) -> bool:
+        # The first candle has no change
+        return self._count > self._length
+
+    @property
+    def value(self) -> float:
+        if not self.is_ready:
+            return math.nan
+        if self._average_loss == 0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + self._average_gain / self._average_loss)
+
+
+class MACDIndicator(IncrementalIndicator):
+    """
+    Moving average convergence divergence. The value is the tuple (macd, signal, histogram)
+    """
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9, column: str = "close"):
+        if fast >= slow:
+            raise ValueError("The MACD fast length must be lower than the slow length.")
+        self._fast_ema = EMAIndicator(length=fast, column=column)
+        self._slow_ema = EMAIndicator(length=slow, column=column)
+        self._signal_ema = EMAIndicator(length=signal, column=column)
+        super().__init__(length=slow + signal - 1, column=column)
+
+    def _reset_state(self):
+        for ema in (self._fast_ema, self._slow_ema, self._signal_ema):
+            ema.reset()
+
+    def _get_state(self) -> Tuple:
+        return tuple((ema._count, ema._get_state()) for ema in (self._fast_ema, self._slow_ema, self._signal_ema))
+
+    def _set_state(self, state: Tuple):
+        for ema, (count, ema_state) in zip((self._fast_ema, self._slow_ema, self._signal_ema), state):
+            ema._count = count
+            ema._set_state(ema_state)
+
+    def _update_state(self, value: float):
+        self._fast_ema.update(value)
+        self._slow_ema.update(value)
+        if self._slow_ema.is_ready:
+            self._signal_ema.update(self._fast_ema.value - self._slow_ema.value)
+
+    @property
+    def value(self) -> Tuple[float, float, float]:
+        if not self.is_ready:
+            return math.nan, math.nan, math.nan
+        macd = self._fast_ema.value - self._slow_ema.value
+        signal = self._signal_ema.value
+        return macd, signal, macd - signal
+
+
+class BollingerBandsIndicator(IncrementalIndicator):
+    """
+    Bollinger bands over a rolling window of `length` candles, using the population standard deviation.
+    The value is the tuple (lower band, middle band, upper band)
+    """
+
+    def __init__(self, length: int = 20, std_multiplier: float = 2.0, column: str = "close"):
+        self._std_multiplier: float = std_multiplier
+        super().__init__(length=length, column=column)
+
+    def _reset_state(self):
+        self._window: Deque[float] = deque()
+        self._sum: float = 0.0
+        self._sum_of_squares: float = 0.0
+        self._evicted_value: Optional[float] = None
+
+    def _get_state(self) -> Tuple[float, float, Optional[float]]:
+        return self._sum, self._sum_of_squares, self._evicted_value
+
+    def _set_state(self, state: Tuple[float, float, Optional[float]]):
+        # The reverted update added a value to the window and maybe evicted the oldest one
+        self._window.pop()
+        if self._evicted_value is not None:
+            self._window.appendleft(self._evicted_value)
+        self._sum, self._sum_of_squares, self._evicted_value = state
+
+    def _update_state(self, value: float):
+        self._evicted_value = None
+        if len(self._window) == self._length:
+            self._evicted_value = self._window.popleft()
+            self._sum -= self._evicted_value
+            self._sum_of_squares -= self._evicted_value * self._evicted_value
+        self._window.append(value)
+        self._sum += value
+        self._sum_of_squares += value * value
+
+    @property
+    def value(self) -> Tuple[float, float, float]:
+        if not self.is_ready:
+            return math.nan, math.nan, math.nan
+        mean = self._sum / self._length
+        std = math.sqrt(max(0.0, self._sum_of_squares / self._length - mean * mean))
+        return mean - self._std_multiplier * std, mean, mean + self._std_multiplier * std
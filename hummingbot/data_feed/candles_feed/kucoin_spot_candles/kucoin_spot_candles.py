@@ -61,9 +61,8 @@ class KucoinSpotCandles(CandlesBase):
     def intervals(self):
         return CONSTANTS.INTERVALS
 
-    @property
-    def candles_df(self) -> pd.DataFrame:
-        df = pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+    def _build_candles_df(self) -> pd.DataFrame:
+        df = super()._build_candles_df()
         df["timestamp"] = df["timestamp"] * 1000
         return df.sort_values(by="timestamp", ascending=True)
 
@@ -0,0 +1,256 @@
+import json
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import JSON, BigInteger, Column, Index, Integer, Text, cast, func, literal_column
+from sqlalchemy.orm import Query, Session
+
+from hummingbot.core.data_type.common import PositionAction, TradeType
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee
+from hummingbot.model import HummingbotBase
+from hummingbot.model.decimal_type_decorator import SqliteDecimalText
+from hummingbot.model.trade_fill import TradeFill
+
+s_decimal_0 = Decimal("0")
+# The SQLite row id of the trade fills follows their insertion order, unlike their (exchange) timestamps
+TRADE_FILL_ROW_ID = literal_column('"TradeFill".rowid', Integer)
+
+SummaryKey = Tuple[str, str, str]
+
+
+class TradeFillSummary(HummingbotBase):
+    """
+    Aggregation of the trade fills of a strategy config since a start timestamp, for one market, trading pair and
+    trade side. The summaries are updated incrementally: each update aggregates only the trade fills inserted after the
+    last fill already summarized, with one grouped query. The fills are tracked by row id rather than by timestamp, so
+    fills recorded late or with the same timestamp as the last summarized one are not missed.
+    """
+    __tablename__ = "TradeFillSummary"
+    __table_args__ = (Index("tfs_config_start_timestamp_index",
+                            "config_file_path", "start_timestamp"),
+                      )
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    start_timestamp = Column(BigInteger, nullable=False)
+    market = Column(Text, nullable=False)
+    symbol = Column(Text, nullable=False)
+    trade_type = Column(Text, nullable=False)
+    num_trades = Column(Integer, nullable=False)
+    num_nil_position_trades = Column(Integer, nullable=False)
+    base_volume = Column(SqliteDecimalText(), nullable=False)
+    quote_volume = Column(SqliteDecimalText(), nullable=False)
+    # Fees calculated as a percentage of the traded quote volume
+    percent_fees_in_quote = Column(SqliteDecimalText(), nullable=False)
+    # Part of the percent fees deducted from the returns of the trades
+    deducted_fees_in_quote = Column(SqliteDecimalText(), nullable=False)
+    # Flat fee amounts by token, serialized as strings
+    flat_fees = Column(JSON, nullable=False)
+    first_timestamp = Column(BigInteger, nullable=False)
+    first_price = Column(SqliteDecimalText(), nullable=False)
+    last_timestamp = Column(BigInteger, nullable=False)
+    last_price = Column(SqliteDecimalText(), nullable=False)
+    last_trade_fill_row_id = Column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"TradeFillSummary(config_file_path='{self.config_file_path}', " \
+               f"start_timestamp={self.start_timestamp}, market='{self.market}', symbol='{self.symbol}', " \
+               f"trade_type='{self.trade_type}', num_trades={self.num_trades}, " \
+               f"num_nil_position_trades={self.num_nil_position_trades}, base_volume={self.base_volume}, " \
+               f"quote_volume={self.quote_volume}, percent_fees_in_quote={self.percent_fees_in_quote}, " \
+               f"deducted_fees_in_quote={self.deducted_fees_in_quote}, flat_fees={self.flat_fees}, " \
+               f"first_timestamp={self.first_timestamp}, first_price={self.first_price}, " \
+               f"last_timestamp={self.last_timestamp}, last_price={self.last_price}, " \
+               f"last_trade_fill_row_id={self.last_trade_fill_row_id})"
+
+    @property
+    def is_buy(self) -> bool:
+        return self.trade_type.upper() == TradeType.BUY.name
+
+    @staticmethod
+    def are_derivatives(summaries: List["TradeFillSummary"]) -> bool:
+        """
+        Returns True if all the trades of one of the sides have a position action, as the trades of derivatives do
+        """
+        return any(summary.num_trades > 0 and summary.num_nil_position_trades == 0 for summary in summaries)
+
+    @classmethod
+    def get_summaries(cls,
+                      sql_session: Session,
+                      config_file_path: str,
+                      start_timestamp: int,
+                      persist: bool = True) -> List["TradeFillSummary"]:
+        """
+        Returns the summaries of the trade fills of the config since the start timestamp (in milliseconds).
+        :param sql_session: the database session
+        :param config_file_path: the strategy config file, matched as the trade fills are matched by the export and
+        history commands
+        :param start_timestamp: the start timestamp in milliseconds
+        :param persist: if True, the summaries stored for the config and start timestamp are updated with the new trade
+        fills and committed. Otherwise, the trade fills are aggregated without storing the result (for one-off start
+        timestamps)
+        """
+        if not persist:
+            return list(cls.aggregate_trade_fills(sql_session, config_file_path, start_timestamp).values())
+
+        stored: List[TradeFillSummary] = cls._stored_summaries_query(sql_session, config_file_path,
+                                                                     start_timestamp).all()
+        last_row_id: Optional[int] = max((summary.last_trade_fill_row_id for summary in stored), default=None)
+        new_summaries = cls.aggregate_trade_fills(sql_session, config_file_path, start_timestamp, last_row_id)
+        if len(new_summaries) > 0:
+            summaries_by_key: Dict[SummaryKey, TradeFillSummary] = {summary.key: summary for summary in stored}
+            for key, new_summary in new_summaries.items():
+                summary = summaries_by_key.get(key)
+                if summary is None:
+                    sql_session.add(new_summary)
+                else:
+                    summary.merge(new_summary)
+            sql_session.commit()
+            # The commit expires the loaded summaries, they are queried again to be usable once the session is closed
+            stored = cls._stored_summaries_query(sql_session, config_file_path, start_timestamp).all()
+        return stored
+
+    @classmethod
+    def aggregate_trade_fills(cls,
+                              sql_session: Session,
+                              config_file_path: str,
+                              start_timestamp: int,
+                              after_row_id: Optional[int] = None) -> Dict[SummaryKey, "TradeFillSummary"]:
+        """
+        Aggregates the trade fills of the config since the start timestamp (and inserted after the trade fill with row
+        id `after_row_id` if specified) into new (not persisted) summaries, by market, trading pair and trade side.
+        The amounts are summed by the database for each price, and the quote volumes are calculated from them with
+        Decimal arithmetic. The fees are calculated once per distinct fee of each group, since trade fills with the
+        same percent fee or the same flat fees are grouped together.
+        """
+        filters = cls._trade_fill_filters(config_file_path, start_timestamp, after_row_id)
+        trade_fee = cast(TradeFill.trade_fee, Text)
+        query: Query = (sql_session
+                        .query(TradeFill.market,
+                               TradeFill.symbol,
+                               TradeFill.trade_type,
+                               TradeFill.position,
+                               trade_fee,
+                               TradeFill.price,
+                               func.count(),
+                               func.sum(TradeFill.amount),
+                               func.min(TradeFill.timestamp),
+                               func.max(TradeFill.timestamp),
+                               func.max(TRADE_FILL_ROW_ID))
+                        .filter(*filters)
+                        .group_by(TradeFill.market,
+                                  TradeFill.symbol,
+                                  TradeFill.trade_type,
+                                  TradeFill.position,
+                                  trade_fee,
+                                  TradeFill.price))
+
+        summaries: Dict[SummaryKey, TradeFillSummary] = {}
+        for (market, symbol, trade_type, position, fee_json, price, count, base_volume,
+             first_timestamp, last_timestamp, last_row_id) in query:
+            key = (market, symbol, trade_type)
+            summary = summaries.get(key)
+            if summary is None:
+                summary = cls(config_file_path=config_file_path,
+                              start_timestamp=start_timestamp,
+                              market=market,
+                              symbol=symbol,
+                              trade_type=trade_type,
+                              num_trades=0,
+                              num_nil_position_trades=0,
+                              base_volume=s_decimal_0,
+                              quote_volume=s_decimal_0,
+                              percent_fees_in_quote=s_decimal_0,
+                              deducted_fees_in_quote=s_decimal_0,
+                              flat_fees={},
+                              first_timestamp=first_timestamp,
+                              last_timestamp=last_timestamp,
+                              last_trade_fill_row_id=last_row_id)
+                summaries[key] = summary
+            group_base_volume = Decimal(str(base_volume))
+            group_quote_volume = group_base_volume * Decimal(str(price))
+            summary.num_trades += count
+            # Trade fills without position are not considered spot trades, as in PerformanceMetrics
+            if position == PositionAction.NIL.value:
+                summary.num_nil_position_trades += count
+            summary.base_volume += group_base_volume
+            summary.quote_volume += group_quote_volume
+            summary.first_timestamp = min(summary.first_timestamp, first_timestamp)
+            summary.last_timestamp = max(summary.last_timestamp, last_timestamp)
+            summary.last_trade_fill_row_id = max(summary.last_trade_fill_row_id, last_row_id)
+            summary._add_fees(json.loads(fee_json) if isinstance(fee_json, str) else fee_json,
+                              count,
+                              group_quote_volume)
+
+        for summary in summaries.values():
+            summary.first_price = cls._trade_fill_price(sql_session, filters, summary, summary.first_timestamp)
+            summary.last_price = cls._trade_fill_price(sql_session, filters, summary, summary.last_timestamp)
+        return summaries
+
+    @property
+    def key(self) -> SummaryKey:
+        return self.market, self.symbol, self.trade_type
+
+    def merge(self, newer: "TradeFillSummary"):
+        """
+        Adds the aggregation of newer trade fills (of the same market, trading pair and side) to this summary
+        """
+        self.num_trades += newer.num_trades
+        self.num_nil_position_trades += newer.num_nil_position_trades
+        self.base_volume += newer.base_volume
+        self.quote_volume += newer.quote_volume
+        self.percent_fees_in_quote += newer.percent_fees_in_quote
+        self.deducted_fees_in_quote += newer.deducted_fees_in_quote
+        flat_fees = dict(self.flat_fees)
+        for token, amount in newer.flat_fees.items():
+            flat_fees[token] = str(Decimal(flat_fees.get(token, "0")) + Decimal(amount))
+        # The JSON column is reassigned (not modified in place) for the change to be detected
+        self.flat_fees = flat_fees
+        # Trade fills recorded late can be older than the ones already summarized
+        if newer.first_timestamp < self.first_timestamp:
+            self.first_timestamp = newer.first_timestamp
+            self.first_price = newer.first_price
+        if newer.last_timestamp >= self.last_timestamp:
+            self.last_timestamp = newer.last_timestamp
+            self.last_price = newer.last_price
+        self.last_trade_fill_row_id = max(self.last_trade_fill_row_id, newer.last_trade_fill_row_id)
+
+    def _add_fees(self, trade_fee: Dict, trades_count: int, quote_volume: Decimal):
+        if trade_fee.get("percent") is not None:
+            fee_amount = quote_volume * Decimal(str(trade_fee["percent"]))
+            self.percent_fees_in_quote += fee_amount
+            if trade_fee.get("fee_type") == DeductedFromReturnsTradeFee.type_descriptor_for_json():
+                self.deducted_fees_in_quote += fee_amount
+        for flat_fee in trade_fee.get("flat_fees", []):
+            token = flat_fee["token"]
+            amount = Decimal(flat_fee["amount"]) * trades_count
+            self.flat_fees[token] = str(Decimal(self.flat_fees.get(token, "0")) + amount)
+
+    @classmethod
+    def _stored_summaries_query(cls, sql_session: Session, config_file_path: str, start_timestamp: int) -> Query:
+        return (sql_session
+                .query(cls)
+                .filter(cls.config_file_path == config_file_path,
+                        cls.start_timestamp == start_timestamp)
+                .order_by(cls.id))
+
+    @staticmethod
+    def _trade_fill_filters(config_file_path: str, start_timestamp: int, after_row_id: Optional[int]) -> List:
+        filters = [TradeFill.timestamp >= start_timestamp,
+                   TradeFill.config_file_path.like(f"%{config_file_path}%")]
+        if after_row_id is not None:
+            filters.append(TRADE_FILL_ROW_ID > after_row_id)
+        return filters
+
+    @staticmethod
+    def _trade_fill_price(sql_session: Session, filters: List, summary: "TradeFillSummary", timestamp: int) -> Decimal:
+        price = (sql_session
+                 .query(TradeFill.price)
+                 .filter(*filters,
+                         TradeFill.market == summary.market,
+                         TradeFill.symbol == summary.symbol,
+                         TradeFill.trade_type == summary.trade_type,
+                         TradeFill.timestamp == timestamp)
+                 .limit(1)
+                 .scalar())
+        return Decimal(str(price))
@@ -26,6 +26,18 @@ class InternalEventMessage(PubSubMessage):
     data: Optional[dict] = {}
 
 
+class InternalEventBatchMessage(PubSubMessage):
+    timestamp: Optional[int] = -1
+    type: Optional[str] = 'batch'
+    events: Optional[List[dict]] = []
+
+
+class HealthMessage(PubSubMessage):
+    ts: Optional[int] = -1
+    health: Optional[bool] = False
+    events_queue: Optional[dict] = {}
+
+
 class LogMessage(PubSubMessage):
     timestamp: float = 0.0
     msg: str = ''
@@ -6,10 +6,11 @@ import logging
 import threading
 import time
 from collections import deque
-from dataclasses import asdict, is_dataclass
+from copy import deepcopy
+from dataclasses import asdict, fields, is_dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, FrozenSet, List, Optional, Tuple
 
 from hummingbot import get_logging_conf
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -37,8 +38,10 @@ from hummingbot.remote_iface.messages import (
     CommandShortcutMessage,
     ConfigCommandMessage,
     ExternalEventMessage,
+    HealthMessage,
     HistoryCommandMessage,
     ImportCommandMessage,
+    InternalEventBatchMessage,
     InternalEventMessage,
     LogMessage,
     NotifyMessage,
@@ -353,6 +356,27 @@ class MQTTCommands:
 
 
 class MQTTMarketEventForwarder:
+    EVENT_TYPES: Dict[int, str] = {
+        events.MarketEvent.BuyOrderCreated.value: "BuyOrderCreated",
+        events.MarketEvent.BuyOrderCompleted.value: "BuyOrderCompleted",
+        events.MarketEvent.SellOrderCreated.value: "SellOrderCreated",
+        events.MarketEvent.SellOrderCompleted.value: "SellOrderCompleted",
+        events.MarketEvent.OrderFilled.value: "OrderFilled",
+        events.MarketEvent.OrderCancelled.value: "OrderCancelled",
+        events.MarketEvent.OrderExpired.value: "OrderExpired",
+        events.MarketEvent.OrderFailure.value: "OrderFailure",
+        events.MarketEvent.FundingPaymentCompleted.value: "FundingPaymentCompleted",
+        events.MarketEvent.RangePositionLiquidityAdded.value: "RangePositionLiquidityAdded",
+        events.MarketEvent.RangePositionLiquidityRemoved.value: "RangePositionLiquidityRemoved",
+        events.MarketEvent.RangePositionUpdate.value: "RangePositionUpdate",
+        events.MarketEvent.RangePositionUpdateFailure.value: "RangePositionUpdateFailure",
+        events.MarketEvent.RangePositionFeeCollected.value: "RangePositionFeeCollected",
+        events.MarketEvent.RangePositionClosed.value: "RangePositionClosed",
+    }
+    STR_FIELDS: FrozenSet[str] = frozenset(['type', 'order_type', 'trade_type'])
+    # Every fill is reported, the other events of an order replace the queued event of the same type when merged
+    UNMERGEABLE_EVENT_TYPES: FrozenSet[str] = frozenset(['OrderFilled'])
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global mqtts_logger
@@ -378,6 +402,20 @@ class MQTTMarketEventForwarder:
         )
         self._topic = f'{topic_prefix}{TopicSpecs.INTERNAL_EVENTS}'
 
+        mqtt_bridge = self._hb_app.client_config_map.mqtt_bridge
+        self._batching: bool = mqtt_bridge.mqtt_events_batching
+        self._batch_interval: float = mqtt_bridge.mqtt_events_batch_interval
+        self._batch_size: int = mqtt_bridge.mqtt_events_batch_size
+        self._max_queue_size: int = mqtt_bridge.mqtt_events_queue_size
+        # Queued events as [merge key, timestamp, type, data] lists, so merged events are updated in place
+        self._queue: Deque[List[Any]] = deque()
+        self._queued_by_key: Dict[Tuple[str, str], List[Any]] = {}
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._dropped_events: int = 0
+        self._merged_events: int = 0
+        self._sent_batches: int = 0
+        self._serializers: Dict[type, Optional[Callable[[Any], Dict[str, Any]]]] = {}
+
         self._mqtt_fowarder: SourceInfoEventForwarder = \
             SourceInfoEventForwarder(self._send_mqtt_event)
         self._market_event_pairs: List[Tuple[int, EventListener]] = [
@@ -399,10 +437,22 @@ class MQTTMarketEventForwarder:
         ]
 
         self.event_fw_pub = self._node.create_publisher(
-            topic=self._topic, msg_type=InternalEventMessage
+            topic=self._topic,
+            msg_type=InternalEventBatchMessage if self._batching else InternalEventMessage
         )
         self._start_event_listeners()
 
+    @property
+    def queue_metrics(self) -> Dict[str, Any]:
+        return {
+            'batching': self._batching,
+            'queue_size': len(self._queue),
+            'max_queue_size': self._max_queue_size,
+            'dropped_events': self._dropped_events,
+            'merged_events': self._merged_events,
+            'sent_batches': self._sent_batches,
+        }
+
     def _send_mqtt_event(self, event_tag: int, pubsub: PubSub, event):
         if threading.current_thread() != threading.main_thread():  # pragma: no cover
             self._ev_loop.call_soon_threadsafe(
@@ -412,35 +462,19 @@ class MQTTMarketEventForwarder:
                 event
             )
             return
-        try:
-            event_types = {
-                events.MarketEvent.BuyOrderCreated.value: "BuyOrderCreated",
-                events.MarketEvent.BuyOrderCompleted.value: "BuyOrderCompleted",
-                events.MarketEvent.SellOrderCreated.value: "SellOrderCreated",
-                events.MarketEvent.SellOrderCompleted.value: "SellOrderCompleted",
-                events.MarketEvent.OrderFilled.value: "OrderFilled",
-                events.MarketEvent.OrderCancelled.value: "OrderCancelled",
-                events.MarketEvent.OrderExpired.value: "OrderExpired",
-                events.MarketEvent.OrderFailure.value: "OrderFailure",
-                events.MarketEvent.FundingPaymentCompleted.value: "FundingPaymentCompleted",
-                events.MarketEvent.RangePositionLiquidityAdded.value: "RangePositionLiquidityAdded",
-                events.MarketEvent.RangePositionLiquidityRemoved.value: "RangePositionLiquidityRemoved",
-                events.MarketEvent.RangePositionUpdate.value: "RangePositionUpdate",
-                events.MarketEvent.RangePositionUpdateFailure.value: "RangePositionUpdateFailure",
-                events.MarketEvent.RangePositionFeeCollected.value: "RangePositionFeeCollected",
-                events.MarketEvent.RangePositionClosed.value: "RangePositionClosed",
-            }
-            event_type = event_types[event_tag]
-        except KeyError:
-            event_type = "Unknown"
+        event_type = self.EVENT_TYPES.get(event_tag, "Unknown")
+
+        event_class = type(event)
+        if event_class in self._serializers:
+            serializer = self._serializers[event_class]
+        else:
+            serializer = self._serializers[event_class] = self._create_event_serializer(event_class)
 
-        if is_dataclass(event):
-            event_data = asdict(event)
-        elif isinstance(event, tuple) and hasattr(event, '_fields'):
-            event_data = event._asdict()
+        if serializer is not None:
+            event_data = serializer(event)
         else:
             try:
-                event_data = dict(event)
+                event_data = self._make_event_payload(dict(event))
             except (TypeError, ValueError):
                 event_data = {}
 
@@ -449,15 +483,54 @@ class MQTTMarketEventForwarder:
         except KeyError:
             timestamp = datetime.now().timestamp()
 
-        event_data = self._make_event_payload(event_data)
-
-        self.event_fw_pub.publish(
-            InternalEventMessage(
-                timestamp=int(timestamp),
-                type=event_type,
-                data=event_data
+        if self._batching:
+            self._enqueue_event(int(timestamp), event_type, event_data)
+        else:
+            self.event_fw_pub.publish(
+                InternalEventMessage(
+                    timestamp=int(timestamp),
+                    type=event_type,
+                    data=event_data
+                )
             )
-        )
+
+    def _create_event_serializer(self, event_class: type) -> Optional[Callable[[Any], Dict[str, Any]]]:
+        """
+        Creates the function converting the events of a dataclass or named tuple class into a payload, with the field
+        names resolved once per class. The payload is the same as converting the event with `asdict` or `_asdict`
+        followed by `_make_event_payload`, without walking the whole event.
+        """
+        if is_dataclass(event_class):
+            field_names = tuple(field.name for field in fields(event_class))
+            nested_dataclasses_as_dict = True
+        elif issubclass(event_class, tuple) and hasattr(event_class, '_fields'):
+            field_names = tuple(event_class._fields)
+            nested_dataclasses_as_dict = False
+        else:
+            return None
+        str_fields = self.STR_FIELDS.intersection(field_names)
+        convert_value = self._make_event_value_payload
+
+        def serialize(event) -> Dict[str, Any]:
+            event_data = {}
+            for name in field_names:
+                value = getattr(event, name)
+                event_data[name] = str(value) if name in str_fields else convert_value(value,
+                                                                                       nested_dataclasses_as_dict)
+            return event_data
+
+        return serialize
+
+    def _make_event_value_payload(self, value: Any, nested_dataclasses_as_dict: bool) -> Any:
+        if isinstance(value, Decimal):
+            return float(value)
+        elif nested_dataclasses_as_dict and is_dataclass(value) and not isinstance(value, type):
+            return self._make_event_payload(asdict(value))
+        elif isinstance(value, (DeductedFromReturnsTradeFee, AddedToCostTradeFee)):
+            return self._make_event_payload(value.to_json())
+        elif isinstance(value, dict):
+            return self._make_event_payload(deepcopy(value))
+        return value
 
     def _make_event_payload(self, event_data):
         if 'type' in event_data:
@@ -480,6 +553,70 @@ class MQTTMarketEventForwarder:
                 self._make_event_payload(event_data[key])
         return event_data
 
+    def _enqueue_event(self, timestamp: int, event_type: str, event_data: Dict[str, Any]):
+        """
+        Queues an event for the next batch message. When the queue is full, the event replaces the queued event of the
+        same type for the same order if there is one, otherwise the oldest queued event is dropped.
+        """
+        order_id = event_data.get('order_id')
+        key = (event_type, order_id) if order_id is not None and event_type not in self.UNMERGEABLE_EVENT_TYPES \
+            else None
+        if len(self._queue) >= self._max_queue_size:
+            queued = self._queued_by_key.get(key) if key is not None else None
+            if queued is not None:
+                queued[1] = timestamp
+                queued[3] = event_data
+                self._merged_events += 1
+                return
+            self._forget_queued(self._queue.popleft())
+            self._dropped_events += 1
+        entry = [key, timestamp, event_type, event_data]
+        self._queue.append(entry)
+        if key is not None:
+            self._queued_by_key[key] = entry
+
+        if len(self._queue) >= self._batch_size:
+            self._schedule_flush(0)
+        elif self._flush_handle is None:
+            self._schedule_flush(self._batch_interval)
+
+    def _forget_queued(self, entry: List[Any]):
+        key = entry[0]
+        if key is not None and self._queued_by_key.get(key) is entry:
+            del self._queued_by_key[key]
+
+    def _schedule_flush(self, delay: float):
+        if self._flush_handle is not None:
+            if delay > 0:
+                return
+            self._flush_handle.cancel()
+        if delay > 0:
+            self._flush_handle = self._ev_loop.call_later(delay, self._flush_events)
+        else:
+            self._flush_handle = self._ev_loop.call_soon(self._flush_events)
+
+    def _flush_events(self):
+        """
+        Publishes the queued events in batch messages of up to the batch size
+        """
+        self._flush_handle = None
+        while len(self._queue) > 0:
+            batch = []
+            while len(self._queue) > 0 and len(batch) < self._batch_size:
+                entry = self._queue.popleft()
+                self._forget_queued(entry)
+                batch.append({'timestamp': entry[1], 'type': entry[2], 'data': entry[3]})
+            try:
+                self.event_fw_pub.publish(
+                    InternalEventBatchMessage(
+                        timestamp=int(time.time()),
+                        events=batch
+                    )
+                )
+                self._sent_batches += 1
+            except Exception:
+                self.logger().error("Error publishing the MQTT events batch.", exc_info=True)
+
     def _start_event_listeners(self):
         for market in self._markets:
             for event_pair in self._market_event_pairs:
@@ -492,6 +629,9 @@ class MQTTMarketEventForwarder:
         for market in self._markets:
             for event_pair in self._market_event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush_events()
 
 
 class MQTTNotifier(NotifierBase):
@@ -596,6 +736,7 @@ class MQTTGateway(Node):
         self._commands: MQTTCommands = None
         self._logh: MQTTLogHandler = None
         self._external_events: MQTTExternalEvents = None
+        self._health_pub = None
         self._hb_app: "HummingbotApplication" = hb_app
         self._ev_loop = self._hb_app.ev_loop
         self._params = self._create_mqtt_params_from_conf()
@@ -608,6 +749,7 @@ class MQTTGateway(Node):
             instance_id=self._hb_app.instance_id
         )
         _hb_topic = f'{self._topic_prefix}{TopicSpecs.HEARTBEATS}'
+        self._health_topic = _hb_topic
 
         super().__init__(
             node_name=self.NODE_NAME.replace('$instance_id', hb_app.instance_id),
@@ -706,6 +848,23 @@ class MQTTGateway(Node):
         if self._status_updates is not None:
             self._status_updates.add_msg_to_queue(*args, **kwargs)
 
+    def _init_health_updates(self):
+        self._health_pub = self.create_publisher(topic=self._health_topic, msg_type=HealthMessage)
+
+    def _publish_health(self):
+        """
+        Publishes the gateway health on the heartbeats topic, with the queue metrics of the market events forwarder
+        """
+        if self._health_pub is None:
+            return
+        self._health_pub.publish(
+            HealthMessage(
+                ts=int(time.time()),
+                health=self._health,
+                events_queue=self._market_events.queue_metrics if self._market_events is not None else {}
+            )
+        )
+
     def _init_commands(self):
         if self._hb_app.client_config_map.mqtt_bridge.mqtt_commands:
             self._commands = MQTTCommands(self._hb_app, self)
@@ -793,6 +952,7 @@ class MQTTGateway(Node):
                 if not self._initial_connection_succeeded:
                     self._initial_connection_succeeded = True
                     self._hb_app.logger().debug('Monitoring MQTT Gateway health for disconnections.')
+                self._publish_health()
 
                 await asyncio.sleep(self._INTERVAL_HEALTH_CHECK)
             elif self._initial_connection_succeeded and not self._stop_event_async.is_set():
@@ -839,6 +999,7 @@ class MQTTGateway(Node):
         self._init_status_updates()
         self._init_commands()
         self._init_external_events()
+        self._init_health_updates()
 
         if with_health:
             self._start_health_monitoring_loop()
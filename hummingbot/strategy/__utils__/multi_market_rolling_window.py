@@ -0,0 +1,120 @@
+from collections import deque
+from typing import Deque, Dict, Hashable, List, Sequence, Tuple
+
+import numpy as np
+
+
+class MultiMarketRollingWindow:
+    """
+    Rolling window of the prices of many markets sampled together, e.g. the mid prices of the markets of a strategy
+    sampled on every tick.
+
+    The window keeps the last `interval * period` prices of each market in a shared array. The max and min of the last
+    `interval` prices of each market are maintained with monotonic deques, so adding a sample is O(1) amortized. The
+    volatility of a market is the mean of the relative ranges, (max - min) / min, of its last `period` complete
+    intervals ending at the latest sample, computed for all the markets at once. NaN prices, e.g. of the markets
+    without order book, are left out of the max and the min.
+    """
+
+    def __init__(self, markets: Sequence[Hashable], interval: int, period: int):
+        if interval <= 0 or period <= 0:
+            raise ValueError("The interval and the period must be positive.")
+        self._markets: List[Hashable] = list(markets)
+        self._market_indexes: Dict[Hashable, int] = {market: i for i, market in enumerate(self._markets)}
+        self._interval = interval
+        self._period = period
+        self._capacity = interval * period
+        self._prices = np.full((len(self._markets), self._capacity), np.nan)
+        # The relative range of the interval ending at each sample, NaN while the interval is not complete
+        self._ranges = np.full((len(self._markets), self._capacity), np.nan)
+        # (sample index, price) of the candidates to the max and the min of the last interval of each market
+        self._max_deques: List[Deque[Tuple[int, float]]] = [deque() for _ in self._markets]
+        self._min_deques: List[Deque[Tuple[int, float]]] = [deque() for _ in self._markets]
+        self._window_max = np.full(len(self._markets), np.nan)
+        self._window_min = np.full(len(self._markets), np.nan)
+        self._sample_count = 0
+
+    @property
+    def markets(self) -> List[Hashable]:
+        return self._markets
+
+    @property
+    def interval(self) -> int:
+        return self._interval
+
+    @property
+    def period(self) -> int:
+        return self._period
+
+    @property
+    def sample_count(self) -> int:
+        return self._sample_count
+
+    def add_samples(self, prices: Sequence[float]):
+        """
+        :param prices: the price of each market, in the order of `markets`
+        """
+        if len(prices) != len(self._markets):
+            raise ValueError(f"Expected {len(self._markets)} prices, got {len(prices)}.")
+        index = self._sample_count
+        expired_index = index - self._interval
+        float_prices = [float(price) for price in prices]
+        for i, price in enumerate(float_prices):
+            max_deque = self._max_deques[i]
+            min_deque = self._min_deques[i]
+            if max_deque and max_deque[0][0] <= expired_index:
+                max_deque.popleft()
+            if min_deque and min_deque[0][0] <= expired_index:
+                min_deque.popleft()
+            if not np.isnan(price):
+                while max_deque and max_deque[-1][1] <= price:
+                    max_deque.pop()
+                max_deque.append((index, price))
+                while min_deque and min_deque[-1][1] >= price:
+                    min_deque.pop()
+                min_deque.append((index, price))
+            self._window_max[i] = max_deque[0][1] if max_deque else np.nan
+            self._window_min[i] = min_deque[0][1] if min_deque else np.nan
+
+        slot = index % self._capacity
+        self._prices[:, slot] = float_prices
+        if index >= self._interval - 1:
+            self._ranges[:, slot] = self._relative_ranges()
+        else:
+            self._ranges[:, slot] = np.nan
+        self._sample_count += 1
+
+    def get_prices(self, market: Hashable) -> np.ndarray:
+        """
+        :return: the prices of the market in the window, from the oldest to the latest
+        """
+        prices = self._prices[self._market_indexes[market]]
+        if self._sample_count <= self._capacity:
+            return prices[:self._sample_count].copy()
+        slot = self._sample_count % self._capacity
+        return np.concatenate((prices[slot:], prices[:slot]))
+
+    def volatilities(self) -> np.ndarray:
+        """
+        :return: the volatility of each market, in the order of `markets`. Until an interval is complete, the relative
+        range of all the prices is used. NaN if there are less than 2 samples.
+        """
+        if self._sample_count < 2:
+            return np.full(len(self._markets), np.nan)
+        if self._sample_count < self._interval:
+            return self._relative_ranges()
+        # The ranges of the intervals ending at the latest sample are the ones in the slots of the same phase
+        phase = (self._sample_count - 1) % self._interval
+        ranges = self._ranges[:, phase::self._interval]
+        valid = ~np.isnan(ranges)
+        counts = valid.sum(axis=1)
+        sums = np.where(valid, ranges, 0.0).sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(counts > 0, sums / counts, np.nan)
+
+    def volatility(self, market: Hashable) -> float:
+        return float(self.volatilities()[self._market_indexes[market]])
+
+    def _relative_ranges(self) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (self._window_max - self._window_min) / self._window_min
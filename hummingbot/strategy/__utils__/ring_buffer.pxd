@@ -8,13 +8,21 @@ cdef class RingBuffer:
         int64_t _delimiter
         int64_t _length
         bint _is_full
+        double _shift
+        double _shifted_sum
+        double _shifted_sum_of_squares
+        double _sum_of_squared_diffs
 
     cdef void c_add_value(self, float val)
     cdef void c_increment_delimiter(self)
     cdef double c_get_last_value(self)
     cdef bint c_is_full(self)
     cdef bint c_is_empty(self)
+    cdef int64_t c_size(self)
     cdef double c_mean_value(self)
     cdef double c_variance(self)
     cdef double c_std_dev(self)
+    cdef double c_sum_of_squared_diffs(self)
+    cdef void c_reset_accumulators(self)
+    cdef void c_recompute_accumulators(self)
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self)
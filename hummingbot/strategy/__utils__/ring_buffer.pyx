@@ -1,11 +1,19 @@
 import numpy as np
 import logging
+from libc.math cimport sqrt
 cimport numpy as np
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length circular buffer of doubles.
+    The mean, variance and sum of squared differences between consecutive values are kept as running accumulators,
+    updated when a value is added or overwritten, so reading them does not allocate nor iterate the buffer. The sums
+    are shifted by a reference value close to the data to avoid losing precision, and they are recalculated from the
+    buffer content every time the buffer wraps around, so rounding errors do not accumulate.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -18,13 +26,37 @@ cdef class RingBuffer:
         self._buffer = np.zeros(length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_accumulators()
 
     def __dealloc__(self):
         self._buffer = None
 
     cdef void c_add_value(self, float val):
-        self._buffer[self._delimiter] = val
+        cdef:
+            double value = val
+            double old_value
+            double shifted_value
+
+        if self.c_is_empty():
+            self._shift = value
+        elif self._length > 1:
+            self._sum_of_squared_diffs += (value - self.c_get_last_value()) ** 2
+        if self._is_full:
+            # The oldest value is overwritten
+            old_value = self._buffer[self._delimiter]
+            shifted_value = old_value - self._shift
+            self._shifted_sum -= shifted_value
+            self._shifted_sum_of_squares -= shifted_value * shifted_value
+            if self._length > 1:
+                self._sum_of_squared_diffs -= (self._buffer[(self._delimiter + 1) % self._length] - old_value) ** 2
+        shifted_value = value - self._shift
+        self._shifted_sum += shifted_value
+        self._shifted_sum_of_squares += shifted_value * shifted_value
+
+        self._buffer[self._delimiter] = value
         self.c_increment_delimiter()
+        if self._is_full and self._delimiter == 0:
+            self.c_recompute_accumulators()
 
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
@@ -42,32 +74,68 @@ cdef class RingBuffer:
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
     cdef double c_mean_value(self):
-        result = np.nan
-        if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
-        return result
+        if not self._is_full:
+            return np.nan
+        return self._shift + self._shifted_sum / self._length
 
     cdef double c_variance(self):
-        result = np.nan
-        if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
-        return result
+        cdef double shifted_mean
+        if not self._is_full:
+            return np.nan
+        shifted_mean = self._shifted_sum / self._length
+        return max(0.0, self._shifted_sum_of_squares / self._length - shifted_mean * shifted_mean)
 
     cdef double c_std_dev(self):
-        result = np.nan
-        if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
-        return result
+        if not self._is_full:
+            return np.nan
+        return sqrt(self.c_variance())
+
+    cdef double c_sum_of_squared_diffs(self):
+        return self._sum_of_squared_diffs
+
+    cdef void c_reset_accumulators(self):
+        self._shift = 0
+        self._shifted_sum = 0
+        self._shifted_sum_of_squares = 0
+        self._sum_of_squared_diffs = 0
+
+    cdef void c_recompute_accumulators(self):
+        cdef:
+            int64_t size = self.c_size()
+            int64_t start = self._delimiter if self._is_full else 0
+            int64_t i
+            double value
+            double previous_value
+            double shifted_value
+            double total = 0
+
+        self.c_reset_accumulators()
+        if size == 0:
+            return
+        for i in range(size):
+            total += self._buffer[(start + i) % self._length]
+        self._shift = total / size
+        previous_value = self._buffer[start]
+        for i in range(size):
+            value = self._buffer[(start + i) % self._length]
+            shifted_value = value - self._shift
+            self._shifted_sum += shifted_value
+            self._shifted_sum_of_squares += shifted_value * shifted_value
+            self._sum_of_squared_diffs += (value - previous_value) ** 2
+            previous_value = value
 
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+        cdef np.ndarray[np.int64_t, ndim=1] indexes
 
         if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
+            indexes = np.arange(0, stop=self._delimiter, dtype=np.int64)
         else:
             indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
+                                dtype=np.int64) % self._length
         return np.asarray(self._buffer)[indexes]
 
     def __init__(self, length):
@@ -75,6 +143,7 @@ cdef class RingBuffer:
         self._buffer = np.zeros(length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_accumulators()
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -89,6 +158,10 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -101,6 +174,13 @@ cdef class RingBuffer:
     def variance(self):
         return self.c_variance()
 
+    @property
+    def sum_of_squared_diffs(self) -> float:
+        """
+        Sum of the squared differences between consecutive values in the buffer
+        """
+        return self.c_sum_of_squared_diffs()
+
     @property
     def length(self) -> int:
         return self._length
@@ -113,6 +193,7 @@ cdef class RingBuffer:
         self._buffer = np.zeros(value, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_accumulators()
 
         for val in data[-value:]:
             self.add_value(val)
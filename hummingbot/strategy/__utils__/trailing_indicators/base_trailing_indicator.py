@@ -51,7 +51,7 @@ class BaseTrailingIndicator(ABC):
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        buffer_len = len(self._sampling_buffer.get_as_numpy_array())
+        buffer_len = self._sampling_buffer.size
         is_changed = self._samples_length != buffer_len
         self._samples_length = buffer_len
         return is_changed
@@ -12,17 +12,29 @@ cdef class TradingIntensityIndicator:
     cdef:
         double _alpha
         double _kappa
+        str _fit_method
         dict _trade_samples
-        list _current_trade_sample
+        list _sample_timestamps_heap
+        dict _amounts_by_price_level
+        dict _trades_count_by_price_level
+        list _trade_timestamps
+        list _trade_prices
+        list _trade_amounts
+        object _quote_timestamps
+        object _quote_prices
+        int64_t _quotes_start
+        int64_t _quotes_end
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
         int _sampling_length
         int _samples_length
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_quote(self, double timestamp, double price)
+    cdef c_add_trade_sample(self, double sample_timestamp, object price_levels, object amounts)
+    cdef c_remove_oldest_trade_sample(self)
     cdef c_estimate_intensity(self)
 
 cdef class TradesForwarder(EventListener):
@@ -1,6 +1,8 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
+import heapq
+import math
 import warnings
 from decimal import Decimal
 from typing import Tuple
@@ -17,6 +19,10 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+FIT_METHOD_LOG_LINEAR = "log_linear"
+FIT_METHOD_DOGBOX = "dogbox"
+QUOTES_INITIAL_CAPACITY = 64
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -26,19 +32,45 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
-
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    """
+    Estimates the parameters of the trading intensity function lambda(d) = alpha * exp(-kappa * d), where d is the
+    distance between the price of a trade and the mid price quoted before it.
+
+    Mid price quotes are kept in arrays ordered by timestamp, so each trade is matched to its quote with a binary
+    search. The amount traded at each price level is kept in a histogram that is updated as trade samples enter and
+    leave the sampling window, so the fit does not need to consolidate all the samples again.
+    By default the fit is a closed form linear regression of log(lambda) over the price levels. The slower non linear
+    least squares fit (`scipy.optimize.curve_fit` with the dogbox method) can be selected with fit_method="dogbox".
+    """
+
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 fit_method: str = FIT_METHOD_LOG_LINEAR):
+        if fit_method not in (FIT_METHOD_LOG_LINEAR, FIT_METHOD_DOGBOX):
+            raise ValueError(f"Invalid fit method {fit_method}. "
+                             f"Valid methods are {FIT_METHOD_LOG_LINEAR} and {FIT_METHOD_DOGBOX}.")
         self._alpha = 0
         self._kappa = 0
+        self._fit_method = fit_method
         self._trade_samples = {}
-        self._current_trade_sample = []
+        self._sample_timestamps_heap = []
+        self._amounts_by_price_level = {}
+        self._trades_count_by_price_level = {}
+        self._trade_timestamps = []
+        self._trade_prices = []
+        self._trade_amounts = []
+        self._quote_timestamps = np.empty(QUOTES_INITIAL_CAPACITY, dtype=np.float64)
+        self._quote_prices = np.empty(QUOTES_INITIAL_CAPACITY, dtype=np.float64)
+        self._quotes_start = 0
+        self._quotes_end = 0
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
         self._order_book.c_add_listener(OrderBookEvent.TradeEvent, self._trades_forwarder)
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -46,14 +78,18 @@ cdef class TradingIntensityIndicator:
     def current_value(self) -> Tuple[float, float]:
         return self._alpha, self._kappa
 
+    @property
+    def fit_method(self) -> str:
+        return self._fit_method
+
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return len(self._trade_samples) == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != len(self._trade_samples)
+        self._samples_length = len(self._trade_samples)
         return is_changed
 
     @property
@@ -67,12 +103,17 @@ cdef class TradingIntensityIndicator:
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        return [{"timestamp": timestamp, "price": price}
+                for timestamp, price in zip(self._quote_timestamps[self._quotes_start:self._quotes_end][::-1].tolist(),
+                                            self._quote_prices[self._quotes_start:self._quotes_end][::-1].tolist())]
 
     @last_quotes.setter
     def last_quotes(self, value):
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        self._quotes_start = 0
+        self._quotes_end = 0
+        for quote in reversed(value):
+            self.c_add_quote(quote["timestamp"], quote["price"])
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
@@ -80,38 +121,35 @@ cdef class TradingIntensityIndicator:
 
     cdef c_calculate(self, timestamp):
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
-
-        latest_processed_quote_idx = None
-        for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
-
-        # THere are no trades left to process
-        self._current_trade_sample = []
-        # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
-
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
-
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+        self.c_add_quote(timestamp, price)
+
+        if len(self._trade_timestamps) > 0:
+            quote_timestamps = self._quote_timestamps[self._quotes_start:self._quotes_end]
+            quote_prices = self._quote_prices[self._quotes_start:self._quotes_end]
+            # Each trade is matched with the latest quote before it
+            quote_indexes = np.searchsorted(quote_timestamps,
+                                            np.asarray(self._trade_timestamps, dtype=np.float64),
+                                            side="left") - 1
+            matched = quote_indexes >= 0
+            if np.any(matched):
+                quote_indexes = quote_indexes[matched]
+                price_levels = np.abs(np.asarray(self._trade_prices, dtype=np.float64)[matched]
+                                      - quote_prices[quote_indexes])
+                amounts = np.asarray(self._trade_amounts, dtype=np.float64)[matched]
+                sample_timestamps = quote_timestamps[quote_indexes] + 1
+                for sample_timestamp in np.unique(sample_timestamps).tolist():
+                    in_sample = sample_timestamps == sample_timestamp
+                    self.c_add_trade_sample(sample_timestamp, price_levels[in_sample], amounts[in_sample])
+                # Store quotes that happened after the latest trade + one before
+                self._quotes_start += int(quote_indexes.max())
+
+            # There are no trades left to process
+            self._trade_timestamps.clear()
+            self._trade_prices.clear()
+            self._trade_amounts.clear()
+
+        while len(self._trade_samples) > self._sampling_length:
+            self.c_remove_oldest_trade_sample()
 
         if self.is_sampling_buffer_full:
             self.c_estimate_intensity()
@@ -121,35 +159,91 @@ cdef class TradingIntensityIndicator:
         self.c_register_trade(trade)
 
     cdef c_register_trade(self, object trade):
-        self._current_trade_sample.append(trade)
+        self._trade_timestamps.append(trade.timestamp)
+        self._trade_prices.append(trade.price)
+        self._trade_amounts.append(trade.amount)
+
+    cdef c_add_quote(self, double timestamp, double price):
+        cdef int64_t quotes_count
+
+        if self._quotes_end == len(self._quote_timestamps):
+            # Move the quotes still in use to the beginning of the arrays, growing them if they are more than half full
+            quotes_count = self._quotes_end - self._quotes_start
+            capacity = len(self._quote_timestamps) * 2 if quotes_count * 2 > len(self._quote_timestamps) else len(
+                self._quote_timestamps)
+            quote_timestamps = np.empty(capacity, dtype=np.float64)
+            quote_prices = np.empty(capacity, dtype=np.float64)
+            quote_timestamps[:quotes_count] = self._quote_timestamps[self._quotes_start:self._quotes_end]
+            quote_prices[:quotes_count] = self._quote_prices[self._quotes_start:self._quotes_end]
+            self._quote_timestamps = quote_timestamps
+            self._quote_prices = quote_prices
+            self._quotes_start = 0
+            self._quotes_end = quotes_count
+        self._quote_timestamps[self._quotes_end] = timestamp
+        self._quote_prices[self._quotes_end] = price
+        self._quotes_end += 1
+
+    cdef c_add_trade_sample(self, double sample_timestamp, object price_levels, object amounts):
+        price_levels = price_levels.tolist()
+        amounts = amounts.tolist()
+        if sample_timestamp not in self._trade_samples:
+            self._trade_samples[sample_timestamp] = []
+            heapq.heappush(self._sample_timestamps_heap, sample_timestamp)
+        self._trade_samples[sample_timestamp].append((price_levels, amounts))
+
+        for price_level, amount in zip(price_levels, amounts):
+            self._amounts_by_price_level[price_level] = self._amounts_by_price_level.get(price_level, 0) + amount
+            self._trades_count_by_price_level[price_level] = self._trades_count_by_price_level.get(price_level, 0) + 1
+
+    cdef c_remove_oldest_trade_sample(self):
+        sample_timestamp = heapq.heappop(self._sample_timestamps_heap)
+        for price_levels, amounts in self._trade_samples.pop(sample_timestamp):
+            for price_level, amount in zip(price_levels, amounts):
+                trades_count = self._trades_count_by_price_level[price_level] - 1
+                if trades_count == 0:
+                    del self._trades_count_by_price_level[price_level]
+                    del self._amounts_by_price_level[price_level]
+                else:
+                    self._trades_count_by_price_level[price_level] = trades_count
+                    self._amounts_by_price_level[price_level] -= amount
 
     cdef c_estimate_intensity(self):
-        cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
-
+        levels_count = len(self._amounts_by_price_level)
+        price_levels = np.fromiter(self._amounts_by_price_level.keys(), dtype=np.float64, count=levels_count)
+        lambdas = np.fromiter(self._amounts_by_price_level.values(), dtype=np.float64, count=levels_count)
+
+        if self._fit_method == FIT_METHOD_DOGBOX:
+            self._estimate_intensity_with_curve_fit(price_levels, lambdas)
+        else:
+            self._estimate_intensity_with_log_linear_regression(price_levels, lambdas)
+
+    def _estimate_intensity_with_log_linear_regression(self, price_levels: np.ndarray, lambdas: np.ndarray):
+        # log(lambda) = log(alpha) - kappa * price_level, fitted with ordinary least squares
+        positive = lambdas > 0
+        price_levels = price_levels[positive]
+        log_lambdas = np.log(lambdas[positive])
+        if price_levels.size < 2:
+            return
+
+        price_levels_mean = price_levels.mean()
+        log_lambdas_mean = log_lambdas.mean()
+        price_levels_deviation = price_levels - price_levels_mean
+        squared_deviations_sum = np.dot(price_levels_deviation, price_levels_deviation)
+        if squared_deviations_sum == 0:
+            return
+        slope = np.dot(price_levels_deviation, log_lambdas - log_lambdas_mean) / squared_deviations_sum
+
+        # Same bounds as the non linear fit: kappa can not be negative
+        kappa = max(0.0, -slope)
+        intercept = log_lambdas_mean + kappa * price_levels_mean
+        self._kappa = Decimal(str(kappa))
+        self._alpha = Decimal(str(math.exp(intercept)))
+
+    def _estimate_intensity_with_curve_fit(self, price_levels: np.ndarray, lambdas: np.ndarray):
+        descending_order = np.argsort(price_levels)[::-1]
+        price_levels = price_levels[descending_order]
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        lambdas_adj = np.where(lambdas[descending_order] == 0, 10**-10, lambdas[descending_order])
 
         # Fit the probability density function; reuse previously calculated parameters as initial values
         try:
@@ -463,7 +463,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         active_orders = self.active_orders
         no_sells = len([o for o in active_orders if not o.is_buy and o.client_order_id and
                         not self._hanging_orders_tracker.is_order_id_in_hanging_orders(o.client_order_id)])
-        active_orders.sort(key=lambda x: x.price, reverse=True)
+        active_orders = sorted(active_orders, key=lambda x: x.price, reverse=True)
         columns = ["Level", "Type", "Price", "Spread", "Amount (Orig)", "Amount (Adj)", "Age"]
         data = []
         lvl_buy, lvl_sell = 0, 0
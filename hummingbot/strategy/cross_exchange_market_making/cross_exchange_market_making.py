@@ -1,10 +1,11 @@
 import logging
+import time
 from collections import defaultdict, deque
 from decimal import Decimal
 from enum import Enum
 from functools import lru_cache
 from math import ceil, floor
-from typing import Dict, List, Tuple, cast
+from typing import Dict, List, Optional, Tuple, cast
 
 import pandas as pd
 from bidict import bidict
@@ -25,7 +26,7 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
 )
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making_config_map_pydantic import (
     CrossExchangeMarketMakingConfigMap,
     PassiveOrderRefreshMode,
@@ -70,6 +71,12 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
     SHADOW_MAKER_ORDER_KEEP_ALIVE_DURATION = 60.0 * 15
     CANCEL_EXPIRY_DURATION = 60.0
 
+    # Gateway quotes older than this are not used to hedge the maker fills right away
+    HEDGE_QUOTE_MAX_AGE = 5.0
+    HEDGE_LATENCY_SAMPLE_SIZE = 100
+    # Receive times of maker fills not hedged after this many seconds are dropped, they are not used for the latencies
+    FILL_RECEIVED_TIME_MAX_AGE = 60.0 * 15
+
     @classmethod
     def logger(cls):
         global s_logger
@@ -118,6 +125,12 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
         self._last_taker_buy_price = None
         self._last_taker_sell_price = None
+        # Holds the last Gateway taker quotes, (market pair, is buy) -> (amount, price, timestamp)
+        self._hedge_quotes = {}
+
+        # Holds the times the maker fills were received, until they are hedged, and the recent fill to hedge latencies
+        self._fill_received_times = {}
+        self._fill_to_hedge_latencies = deque(maxlen=self.HEDGE_LATENCY_SAMPLE_SIZE)
 
         self._main_task = None
         self._gateway_quotes_task = None
@@ -237,6 +250,19 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
     def logging_options(self, logging_options: Tuple):
         self._logging_options = logging_options
 
+    @property
+    def fill_to_hedge_latency_stats(self) -> Dict[str, float]:
+        """
+        Returns the count, mean and max, in seconds, of the recent latencies between receiving a maker fill and
+        placing the taker order hedging it.
+        """
+        latencies = self._fill_to_hedge_latencies
+        return {
+            "count": len(latencies),
+            "mean": sum(latencies) / len(latencies) if len(latencies) > 0 else s_float_nan,
+            "max": max(latencies) if len(latencies) > 0 else s_float_nan,
+        }
+
     @property
     def market_info_to_active_orders(self) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
         return self._sb_order_tracker.market_pair_to_active_orders
@@ -354,6 +380,11 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
             warning_lines.extend(self.balance_warning([market_pair.maker, market_pair.taker]))
 
+        latency_stats = self.fill_to_hedge_latency_stats
+        if latency_stats["count"] > 0:
+            lines.extend(["", f"  Fill to hedge latency: mean {latency_stats['mean'] * 1e3:.1f} ms, "
+                              f"max {latency_stats['max'] * 1e3:.1f} ms ({latency_stats['count']} recent hedges)"])
+
         if len(warning_lines) > 0:
             lines.extend(["", "  *** WARNINGS ***"] + warning_lines)
 
@@ -439,9 +470,11 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                         limit_order.client_order_id in self._maker_to_taker_order_ids.keys():
                     market_pair_to_active_orders[market_pair].append(limit_order)
 
-            # Process each market pair independently.
-            for market_pair in self._market_pairs.values():
-                await self.process_market_pair(timestamp, market_pair, market_pair_to_active_orders[market_pair])
+            # Process each market pair independently and concurrently, s.t. a slow pair doesn't delay the others.
+            await safe_gather(*[
+                self.process_market_pair(timestamp, market_pair, market_pair_to_active_orders[market_pair])
+                for market_pair in self._market_pairs.values()
+            ])
 
             # log conversion rates every 5 minutes
             if self._last_conv_rates_logged + (60. * 5) < timestamp:
@@ -461,12 +494,14 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                     order_amount
                 )
                 self._last_taker_buy_price = order_price
+                self.set_hedge_quote(market_pair, True, order_amount, order_price)
                 order_price = await market_pair.taker.market.get_order_price(
                     market_pair.taker.trading_pair,
                     False,
                     order_amount
                 )
                 self._last_taker_sell_price = order_price
+                self.set_hedge_quote(market_pair, False, order_amount, order_price)
 
     def ready_for_new_trades(self) -> bool:
         """
@@ -574,54 +609,66 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         # See if it's profitable to place a limit order on maker market.
         await self.check_and_create_new_orders(market_pair, has_active_bid, has_active_ask)
 
-    async def hedge_filled_maker_order(self,
-                                       maker_order_id: str,
-                                       order_filled_event: OrderFilledEvent):
+    def record_maker_order_fill(self, order_filled_event: OrderFilledEvent) -> Optional[MakerTakerMarketPair]:
         """
-        If a limit order previously made to the maker side has been filled, hedge it on the taker side.
+        If a limit order previously made to the maker side has been filled, store the fill to hedge it on the taker
+        side.
         :param order_filled_event: event object
+        :return: the market pair of the maker order, or None if the fill is not to be hedged
         """
         order_id = order_filled_event.order_id
         market_pair = self._market_pair_tracker.get_market_pair_from_order_id(order_id)
 
         # Make sure to only hedge limit orders.
-        if market_pair is not None and order_id not in self._taker_to_maker_order_ids.keys():
-            limit_order_record = self._sb_order_tracker.get_shadow_limit_order(order_id)
-            order_fill_record = (limit_order_record, order_filled_event)
-
-            # Store the limit order fill event in a map, s.t. it can be processed in check_and_hedge_orders()
-            # later.
-            if order_filled_event.trade_type is TradeType.BUY:
-                if market_pair not in self._order_fill_buy_events:
-                    self._order_fill_buy_events[market_pair] = [order_fill_record]
-                else:
-                    self._order_fill_buy_events[market_pair].append(order_fill_record)
+        if market_pair is None or order_id in self._taker_to_maker_order_ids.keys():
+            return None
 
-                if LogOption.MAKER_ORDER_FILLED in self.logging_options:
-                    self.log_with_clock(
-                        logging.INFO,
-                        f"({market_pair.maker.trading_pair}) Maker buy order of "
-                        f"{order_filled_event.amount} {market_pair.maker.base_asset} filled."
-                    )
+        limit_order_record = self._sb_order_tracker.get_shadow_limit_order(order_id)
+        order_fill_record = (limit_order_record, order_filled_event)
 
+        # Store the limit order fill event in a map, s.t. it can be processed in hedge_orders()
+        if order_filled_event.trade_type is TradeType.BUY:
+            if market_pair not in self._order_fill_buy_events:
+                self._order_fill_buy_events[market_pair] = [order_fill_record]
             else:
-                if market_pair not in self._order_fill_sell_events:
-                    self._order_fill_sell_events[market_pair] = [order_fill_record]
-                else:
-                    self._order_fill_sell_events[market_pair].append(order_fill_record)
+                self._order_fill_buy_events[market_pair].append(order_fill_record)
 
-                if LogOption.MAKER_ORDER_FILLED in self.logging_options:
-                    self.log_with_clock(
-                        logging.INFO,
-                        f"({market_pair.maker.trading_pair}) Maker sell order of "
-                        f"{order_filled_event.amount} {market_pair.maker.base_asset} filled."
-                    )
+            if LogOption.MAKER_ORDER_FILLED in self.logging_options:
+                self.log_with_clock(
+                    logging.INFO,
+                    f"({market_pair.maker.trading_pair}) Maker buy order of "
+                    f"{order_filled_event.amount} {market_pair.maker.base_asset} filled."
+                )
 
-            # Call check_and_hedge_orders() to emit the orders on the taker side.
-            try:
-                await self.check_and_hedge_orders(maker_order_id, market_pair)
-            except Exception:
-                self.log_with_clock(logging.ERROR, "Unexpected error.", exc_info=True)
+        else:
+            if market_pair not in self._order_fill_sell_events:
+                self._order_fill_sell_events[market_pair] = [order_fill_record]
+            else:
+                self._order_fill_sell_events[market_pair].append(order_fill_record)
+
+            if LogOption.MAKER_ORDER_FILLED in self.logging_options:
+                self.log_with_clock(
+                    logging.INFO,
+                    f"({market_pair.maker.trading_pair}) Maker sell order of "
+                    f"{order_filled_event.amount} {market_pair.maker.base_asset} filled."
+                )
+        return market_pair
+
+    def hedge_filled_maker_order(self, maker_order_id: str, market_pair: MakerTakerMarketPair):
+        """
+        Hedge the stored maker fills right away from the taker order book, or from the last Gateway quote. If a taker
+        price is missing, the hedge is retried in a task that quotes the taker prices first.
+        """
+        try:
+            hedged = self.hedge_orders(maker_order_id, market_pair)
+        except Exception:
+            self.log_with_clock(logging.ERROR, "Unexpected error.", exc_info=True)
+            return
+        if not hedged:
+            self.hedge_tasks_cleanup()
+            self._hedge_maker_order_tasks += [safe_ensure_future(
+                self.check_and_hedge_orders(maker_order_id, market_pair)
+            )]
 
     def hedge_tasks_cleanup(self):
         hedge_maker_order_tasks = []
@@ -656,11 +703,12 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                 # Values have to be unique in a bidict
 
                 self._maker_to_hedging_trades[maker_order_id] += [exchange_trade_id]
+                fill_received_time = time.perf_counter()
 
-                self.hedge_tasks_cleanup()
-                self._hedge_maker_order_task = safe_ensure_future(
-                    self.hedge_filled_maker_order(maker_order_id, order_filled_event)
-                )
+                market_pair = self.record_maker_order_fill(order_filled_event)
+                if market_pair is not None:
+                    self.record_fill_received_time(exchange_trade_id, fill_received_time)
+                    self.hedge_filled_maker_order(maker_order_id, market_pair)
 
     def did_cancel_order(self, order_canceled_event: OrderCancelledEvent):
         if order_canceled_event.order_id in self._taker_to_maker_order_ids.keys():
@@ -847,10 +895,75 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                                      maker_order_id: str,
                                      market_pair: MakerTakerMarketPair):
         """
+        Quote the taker prices of the un-hedged limit order fill events if the taker market is a Gateway market, then
+        emit orders to hedge them.
+
+        :param market_pair: cross exchange market pair
+        """
+        if self.is_gateway_market(market_pair.taker):
+            await self.update_hedge_quotes(market_pair)
+        if not self.hedge_orders(maker_order_id, market_pair):
+            self.logger().warning("Gateway: failed to obtain order price. No hedging order will be submitted.")
+
+    async def update_hedge_quotes(self, market_pair: MakerTakerMarketPair):
+        """
+        Quote the taker prices of the un-hedged limit order fill events on the Gateway taker market.
+
+        :param market_pair: cross exchange market pair
+        """
+        _, _, _, _, _, base_rate, _, _, _ = self.get_conversion_rates(market_pair)
+        unhedged_fill_records = [
+            (TradeType.BUY, self.get_unhedged_buy_records(market_pair)),
+            (TradeType.SELL, self.get_unhedged_sell_records(market_pair)),
+        ]
+        for trade_type, fill_records in unhedged_fill_records:
+            fill_quantity = sum([fill_event.amount for _, fill_event in fill_records])
+            if fill_quantity > 0:
+                # Maker buys are hedged with taker sells, and maker sells with taker buys
+                is_taker_buy = trade_type is TradeType.SELL
+                taker_amount = fill_quantity / base_rate
+                taker_price = await market_pair.taker.market.get_order_price(
+                    market_pair.taker.trading_pair,
+                    is_taker_buy,
+                    taker_amount
+                )
+                self.set_hedge_quote(market_pair, is_taker_buy, taker_amount, taker_price)
+
+    def set_hedge_quote(self,
+                        market_pair: MakerTakerMarketPair,
+                        is_buy: bool,
+                        amount: Decimal,
+                        price: Optional[Decimal]):
+        if price is not None and not price.is_nan():
+            self._hedge_quotes[(market_pair, is_buy)] = (amount, price, self.current_timestamp)
+
+    def get_hedge_price(self, market_pair: MakerTakerMarketPair, is_buy: bool, amount: Decimal) -> Optional[Decimal]:
+        """
+        Returns the taker price to hedge an amount without waiting: the price for the amount in the taker order book,
+        or the last Gateway quote if it is recent and for at least the amount.
+
+        :param market_pair: cross exchange market pair
+        :param is_buy: whether the taker order is a buy
+        :param amount: the amount of the taker order, in taker base asset
+        :return: the taker price, or None if no quote is available
+        """
+        if not self.is_gateway_market(market_pair.taker):
+            return market_pair.taker.market.get_price_for_volume(market_pair.taker.trading_pair, is_buy, amount).result_price
+        quote = self._hedge_quotes.get((market_pair, is_buy))
+        if quote is None:
+            return None
+        quote_amount, quote_price, quote_timestamp = quote
+        if amount > quote_amount or not self.current_timestamp - quote_timestamp <= self.HEDGE_QUOTE_MAX_AGE:
+            return None
+        return quote_price
+
+    def hedge_orders(self, maker_order_id: str, market_pair: MakerTakerMarketPair) -> bool:
+        """
         Look into the stored and un-hedged limit order fill events, and emit orders to hedge them, depending on
         availability of funds on the taker market.
 
         :param market_pair: cross exchange market pair
+        :return: False if no taker price was available to hedge some fill events, True otherwise
         """
 
         buy_fill_records = self.get_unhedged_buy_records(market_pair)
@@ -883,20 +996,13 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                               sum([r.amount for _, r in buy_fill_records]))
 
             self.check_multiple_buy_orders(buy_fill_records)
+            order_price = self.get_hedge_price(market_pair, False, quantized_hedge_amount)
+            if order_price is None:
+                return False
             if self.is_gateway_market(market_pair.taker):
-                order_price = await market_pair.taker.market.get_order_price(
-                    taker_trading_pair,
-                    False,
-                    quantized_hedge_amount)
-                if order_price is None:
-                    self.logger().warning("Gateway: failed to obtain order price. No hedging order will be submitted.")
-                    return
                 taker_top = order_price
             else:
                 taker_top = taker_market.get_price(taker_trading_pair, False)
-                order_price = taker_market.get_price_for_volume(
-                    taker_trading_pair, False, quantized_hedge_amount
-                ).result_price
 
             self.log_with_clock(logging.INFO, f"Calculated by HB order_price: {order_price}")
             order_price *= taker_slippage_adjustment_factor
@@ -934,21 +1040,9 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             # Taker buy
             taker_slippage_adjustment_factor = Decimal("1") + self.slippage_buffer
 
-            if self.is_gateway_market(market_pair.taker):
-                taker_price = await market_pair.taker.market.get_order_price(
-                    taker_trading_pair,
-                    True,
-                    sell_fill_quantity / base_rate
-                )
-                if taker_price is None:
-                    self.logger().warning("Gateway: failed to obtain order price. No hedging order will be submitted.")
-                    return
-            else:
-                taker_price = taker_market.get_price_for_volume(
-                    taker_trading_pair,
-                    True,
-                    sell_fill_quantity / base_rate
-                ).result_price
+            taker_price = self.get_hedge_price(market_pair, True, sell_fill_quantity / base_rate)
+            if taker_price is None:
+                return False
 
             hedged_order_quantity = min(
                 sell_fill_quantity / base_rate,
@@ -964,20 +1058,13 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                               sum([r.amount for _, r in sell_fill_records]))
 
             self.check_multiple_sell_orders(sell_fill_records)
+            order_price = self.get_hedge_price(market_pair, True, quantized_hedge_amount)
+            if order_price is None:
+                return False
             if self.is_gateway_market(market_pair.taker):
-                order_price = await market_pair.taker.market.get_order_price(
-                    taker_trading_pair,
-                    True,
-                    quantized_hedge_amount)
-                if order_price is None:
-                    self.logger().warning("Gateway: failed to obtain order price. No hedging order will be submitted.")
-                    return
                 taker_top = order_price
             else:
                 taker_top = taker_market.get_price(taker_trading_pair, True)
-                order_price = taker_market.get_price_for_volume(
-                    taker_trading_pair, True, quantized_hedge_amount
-                ).result_price
 
             self.log_with_clock(logging.INFO, f"Calculated by HB order_price: {order_price}")
             order_price *= taker_slippage_adjustment_factor
@@ -1746,6 +1833,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             self._taker_to_maker_order_ids[order_id] = maker_order_id
             self._maker_to_taker_order_ids[maker_order_id] += [order_id]
             self.set_ongoing_hedging(fill_records, order_id)
+            self.record_fill_to_hedge_latency(fill_records)
         return order_id
 
     def cancel_maker_order(self, market_pair: MakerTakerMarketPair, order_id: str):
@@ -1815,6 +1903,26 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                     return True
         return False
 
+    def record_fill_received_time(self, exchange_trade_id: str, fill_received_time: float):
+        """
+        Stores the time a maker fill was received, to measure its fill to hedge latency once it is hedged. The fills
+        that are never hedged on their own (e.g. too small for the taker market) are dropped once older than
+        FILL_RECEIVED_TIME_MAX_AGE, s.t. the stored times do not grow for the life of the bot.
+        """
+        while len(self._fill_received_times) > 0:
+            oldest_trade_id, oldest_received_time = next(iter(self._fill_received_times.items()))
+            if fill_received_time - oldest_received_time <= self.FILL_RECEIVED_TIME_MAX_AGE:
+                break
+            del self._fill_received_times[oldest_trade_id]
+        self._fill_received_times[exchange_trade_id] = fill_received_time
+
+    def record_fill_to_hedge_latency(self, fill_records: List[OrderFilledEvent]):
+        now = time.perf_counter()
+        for _, fill_event in fill_records:
+            fill_received_time = self._fill_received_times.pop(fill_event.exchange_trade_id, None)
+            if fill_received_time is not None:
+                self._fill_to_hedge_latencies.append(now - fill_received_time)
+
     def set_ongoing_hedging(self, fill_records: List[OrderFilledEvent], order_id: str):
         maker_exchange_trade_ids = tuple(r.exchange_trade_id for _, r in fill_records)
         self._ongoing_hedging[maker_exchange_trade_ids] = order_id
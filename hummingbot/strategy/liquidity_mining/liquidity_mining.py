@@ -1,7 +1,6 @@
 import asyncio
 import logging
 from decimal import Decimal
-from statistics import mean
 from typing import Dict, List, Set, Union
 
 import numpy as np
@@ -15,6 +14,7 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.estimate_fee import build_trade_fee
 from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy.__utils__.multi_market_rolling_window import MultiMarketRollingWindow
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.pure_market_making.inventory_skew_calculator import (
     calculate_bid_ask_ratios_from_base_asset_ratio,
@@ -85,7 +85,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
         self._token_balances = {}
         self._sell_budgets = {}
         self._buy_budgets = {}
-        self._mid_prices = {market: [] for market in market_infos}
+        self._mid_prices = MultiMarketRollingWindow(list(market_infos), volatility_interval, avg_volatility_period)
         self._volatility = {market: s_decimal_nan for market in self._market_infos}
         self._last_vol_reported = 0.
         self._hb_app_notification = hb_app_notification
@@ -561,30 +561,20 @@ class LiquidityMiningStrategy(StrategyPyBase):
         """
         Query asset markets for mid price
         """
-        for market in self._market_infos:
-            mid_price = self._market_infos[market].get_mid_price()
-            self._mid_prices[market].append(mid_price)
-            # To avoid memory leak, we store only the last part of the list needed for volatility calculation
-            max_len = self._volatility_interval * self._avg_volatility_period
-            self._mid_prices[market] = self._mid_prices[market][-1 * max_len:]
+        # The markets with trading paused are not sampled
+        self._mid_prices.add_samples([
+            self._market_infos[market].get_mid_price() if market in self._market_infos else s_decimal_nan
+            for market in self._mid_prices.markets
+        ])
 
     def update_volatility(self):
         """
         Update volatility data from the market
         """
-        self._volatility = {market: s_decimal_nan for market in self._market_infos}
-        for market, mid_prices in self._mid_prices.items():
-            last_index = len(mid_prices) - 1
-            atr = []
-            first_index = last_index - (self._volatility_interval * self._avg_volatility_period)
-            first_index = max(first_index, 0)
-            for i in range(last_index, first_index, self._volatility_interval * -1):
-                prices = mid_prices[i - self._volatility_interval + 1: i + 1]
-                if not prices:
-                    break
-                atr.append((max(prices) - min(prices)) / min(prices))
-            if atr:
-                self._volatility[market] = mean(atr)
+        self._volatility = {
+            market: s_decimal_nan if np.isnan(vol) else Decimal(str(vol))
+            for market, vol in zip(self._mid_prices.markets, self._mid_prices.volatilities())
+        }
         if self._last_vol_reported < self.current_timestamp - self._volatility_interval:
             for market, vol in self._volatility.items():
                 if not vol.is_nan():
@@ -0,0 +1,74 @@
+import asyncio
+import time
+from typing import Any, Callable, Optional, Set
+
+
+class OrderBookChangeDebouncer:
+    """
+    Coalesces order book change notifications into callbacks separated by at least `min_interval` seconds.
+    The first change after a quiet period is delivered on the next event loop iteration, so the changes applied in the
+    same iteration produce a single callback. The changes notified before the interval elapses are accumulated and
+    delivered together once it does.
+    """
+
+    def __init__(self,
+                 callback: Callable[[Set[Any]], None],
+                 min_interval: float = 0.0,
+                 time_func: Callable[[], float] = time.monotonic):
+        """
+        :param callback: function called with the set of order books changed since the previous call
+        :param min_interval: minimum time in seconds between two callbacks
+        :param time_func: clock used to measure the interval
+        """
+        self._callback = callback
+        self._time_func = time_func
+        self._min_interval: float = 0.0
+        self.min_interval = min_interval
+        self._pending: Set[Any] = set()
+        self._scheduled_call: Optional[asyncio.Handle] = None
+        self._last_callback_time: float = float("-inf")
+
+    @property
+    def min_interval(self) -> float:
+        return self._min_interval
+
+    @min_interval.setter
+    def min_interval(self, value: float):
+        if value < 0:
+            raise ValueError("The minimum interval between order book change callbacks can't be negative.")
+        self._min_interval = value
+
+    @property
+    def pending_order_books(self) -> Set[Any]:
+        return self._pending
+
+    @property
+    def is_scheduled(self) -> bool:
+        return self._scheduled_call is not None
+
+    def notify(self, order_book: Any):
+        self._pending.add(order_book)
+        if self._scheduled_call is not None:
+            return
+        loop = asyncio.get_event_loop()
+        delay = self._last_callback_time + self._min_interval - self._time_func()
+        if delay > 0:
+            self._scheduled_call = loop.call_later(delay, self._deliver)
+        else:
+            self._scheduled_call = loop.call_soon(self._deliver)
+
+    def cancel(self):
+        """
+        Discards the pending changes and the scheduled callback
+        """
+        if self._scheduled_call is not None:
+            self._scheduled_call.cancel()
+            self._scheduled_call = None
+        self._pending = set()
+
+    def _deliver(self):
+        self._scheduled_call = None
+        order_books, self._pending = self._pending, set()
+        self._last_callback_time = self._time_func()
+        if len(order_books) > 0:
+            self._callback(order_books)
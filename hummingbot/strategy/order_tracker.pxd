@@ -14,6 +14,14 @@ cdef class OrderTracker(TimeIterator):
         object _shadow_gc_requests
         object _in_flight_cancels
         object _in_flight_pending_created
+        bint _exclude_in_flight_cancels
+        bint _active_order_views_dirty
+        double _active_order_views_valid_from
+        double _active_order_views_valid_until
+        list _active_limit_orders_view
+        list _active_bids_view
+        list _active_asks_view
+        dict _market_pair_to_active_orders_view
 
     cdef dict c_get_limit_orders(self)
     cdef dict c_get_market_orders(self)
@@ -33,3 +41,4 @@ cdef class OrderTracker(TimeIterator):
     cdef c_check_and_cleanup_shadow_records(self)
     cdef c_add_create_order_pending(self, str order_id)
     cdef c_remove_create_order_pending(self, str order_id)
+    cdef c_update_active_order_views(self)
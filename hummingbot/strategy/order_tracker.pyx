@@ -36,16 +36,25 @@ cdef class OrderTracker(TimeIterator):
         self._shadow_gc_requests = deque()
         self._in_flight_pending_created = set()
         self._in_flight_cancels = OrderedDict()
+        # The active order views exclude the orders being canceled. They are rebuilt when the tracked orders or the
+        # cancels change, or when a cancel expires, and shared by all the reads in between.
+        self._exclude_in_flight_cancels = True
+        self._active_order_views_dirty = True
+        self._active_order_views_valid_from = NaN
+        self._active_order_views_valid_until = NaN
+        self._active_limit_orders_view = []
+        self._active_bids_view = []
+        self._active_asks_view = []
+        self._market_pair_to_active_orders_view = {}
 
     @property
     def active_limit_orders(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
-        limit_orders = []
-        for market_pair, orders_map in self._tracked_limit_orders.items():
-            for limit_order in orders_map.values():
-                if self.c_has_in_flight_cancel(limit_order.client_order_id):
-                    continue
-                limit_orders.append((market_pair.market, limit_order))
-        return limit_orders
+        """
+        The tracked limit orders without an in flight cancel. The list is shared until the active orders change, and
+        must not be modified.
+        """
+        self.c_update_active_order_views()
+        return self._active_limit_orders_view
 
     @property
     def shadow_limit_orders(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
@@ -59,24 +68,18 @@ cdef class OrderTracker(TimeIterator):
 
     @property
     def market_pair_to_active_orders(self) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
-        market_pair_to_orders = {}
-        market_pairs = self._tracked_limit_orders.keys()
-        for market_pair in market_pairs:
-            limit_orders = []
-            for limit_order in self._tracked_limit_orders[market_pair].values():
-                if self.c_has_in_flight_cancel(limit_order.client_order_id):
-                    continue
-                limit_orders.append(limit_order)
-            market_pair_to_orders[market_pair] = limit_orders
-        return market_pair_to_orders
+        self.c_update_active_order_views()
+        return self._market_pair_to_active_orders_view
 
     @property
     def active_bids(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
-        return [(market, limit_order) for market, limit_order in self.active_limit_orders if limit_order.is_buy]
+        self.c_update_active_order_views()
+        return self._active_bids_view
 
     @property
     def active_asks(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
-        return [(market, limit_order) for market, limit_order in self.active_limit_orders if not limit_order.is_buy]
+        self.c_update_active_order_views()
+        return self._active_asks_view
 
     @property
     def tracked_limit_orders(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
@@ -174,6 +177,8 @@ cdef class OrderTracker(TimeIterator):
 
         # Track the cancel.
         self._in_flight_cancels[order_id] = self._current_timestamp
+        if order_id in self._order_id_to_market_pair:
+            self._active_order_views_dirty = True
         return True
 
     def check_and_track_cancel(self, order_id: str) -> bool:
@@ -232,6 +237,7 @@ cdef class OrderTracker(TimeIterator):
         self._shadow_tracked_limit_orders[market_pair][order_id] = limit_order
         self._order_id_to_market_pair[order_id] = market_pair
         self._shadow_order_id_to_market_pair[order_id] = market_pair
+        self._active_order_views_dirty = True
 
     def start_tracking_limit_order(self, market_pair: MarketTradingPairTuple, order_id: str, is_buy: bool, price: Decimal,
                                    quantity: Decimal):
@@ -242,6 +248,7 @@ cdef class OrderTracker(TimeIterator):
             del self._tracked_limit_orders[market_pair][order_id]
             if len(self._tracked_limit_orders[market_pair]) < 1:
                 del self._tracked_limit_orders[market_pair]
+            self._active_order_views_dirty = True
             self._shadow_gc_requests.append((
                 self._current_timestamp + self.SHADOW_MAKER_ORDER_KEEP_ALIVE_DURATION,
                 market_pair,
@@ -312,3 +319,47 @@ cdef class OrderTracker(TimeIterator):
 
     def remove_create_order_pending(self, order_id: str):
         self.c_remove_create_order_pending(order_id)
+
+    cdef c_update_active_order_views(self):
+        """
+        Rebuilds the active order views if the tracked orders or the in flight cancels changed since they were built, if
+        the in flight cancel of an excluded order has expired, or if the current time is before the views were built.
+        """
+        cdef:
+            double current_timestamp = self._current_timestamp
+            double valid_until = float("inf")
+            double cancel_expiry
+            list limit_orders = []
+            list bids = []
+            list asks = []
+            dict market_pair_to_orders = {}
+            list market_pair_orders
+            LimitOrder limit_order
+
+        if (not self._active_order_views_dirty and
+                self._active_order_views_valid_from <= current_timestamp < self._active_order_views_valid_until):
+            return
+
+        for market_pair, orders_map in self._tracked_limit_orders.items():
+            market = market_pair.market
+            market_pair_orders = []
+            for limit_order in orders_map.values():
+                if self._exclude_in_flight_cancels and self.c_has_in_flight_cancel(limit_order.client_order_id):
+                    cancel_expiry = self._in_flight_cancels[limit_order.client_order_id] + self.CANCEL_EXPIRY_DURATION
+                    valid_until = min(valid_until, cancel_expiry)
+                    continue
+                market_pair_orders.append(limit_order)
+                limit_orders.append((market, limit_order))
+                if limit_order.is_buy:
+                    bids.append((market, limit_order))
+                else:
+                    asks.append((market, limit_order))
+            market_pair_to_orders[market_pair] = market_pair_orders
+
+        self._active_limit_orders_view = limit_orders
+        self._active_bids_view = bids
+        self._active_asks_view = asks
+        self._market_pair_to_active_orders_view = market_pair_to_orders
+        self._active_order_views_dirty = False
+        self._active_order_views_valid_from = current_timestamp
+        self._active_order_views_valid_until = valid_until
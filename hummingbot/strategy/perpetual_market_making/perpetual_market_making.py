@@ -337,7 +337,7 @@ class PerpetualMarketMakingStrategy(StrategyPyBase):
         price = self.get_price()
         active_orders = self.active_orders
         no_sells = len([o for o in active_orders if not o.is_buy])
-        active_orders.sort(key=lambda x: x.price, reverse=True)
+        active_orders = sorted(active_orders, key=lambda x: x.price, reverse=True)
         columns = ["Level", "Type", "Price", "Spread", "Amount (Orig)", "Amount (Adj)", "Age"]
         data = []
         lvl_buy, lvl_sell = 0, 0
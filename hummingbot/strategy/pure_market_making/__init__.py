@@ -2,7 +2,11 @@
 
 from .pure_market_making import PureMarketMakingStrategy
 from .inventory_cost_price_delegate import InventoryCostPriceDelegate
+from .multi_market_budget import MultiMarketBudget
+from .multi_market_pure_market_making import MultiMarketPureMarketMakingStrategy
 __all__ = [
     PureMarketMakingStrategy,
     InventoryCostPriceDelegate,
+    MultiMarketBudget,
+    MultiMarketPureMarketMakingStrategy,
 ]
@@ -0,0 +1,58 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict
+
+s_decimal_zero = Decimal(0)
+
+
+class MultiMarketBudget:
+    """
+    Shared budget accounting for market making strategies quoting several trading pairs on the same connector.
+    The connector available balances are only updated once the exchange reports the new orders, so the strategies
+    ticking in the same cycle would otherwise size their orders against the same balance. Each strategy reserves the
+    amounts of the orders it creates, and those amounts are excluded from the balance the other trading pairs can use
+    until the next cycle starts.
+    """
+
+    def __init__(self):
+        # asset -> trading pair -> amount reserved in the current cycle
+        self._reservations: Dict[str, Dict[str, Decimal]] = defaultdict(dict)
+
+    @property
+    def reservations(self) -> Dict[str, Dict[str, Decimal]]:
+        return self._reservations
+
+    def start_cycle(self):
+        """
+        Clears the reservations, to be called before the strategies tick. By then the connector balances reflect the
+        orders created in the previous cycle.
+        """
+        self._reservations.clear()
+
+    def reserved(self, asset: str, excluded_trading_pair: str = None) -> Decimal:
+        """
+        :param asset: the asset reserved
+        :param excluded_trading_pair: a trading pair whose reservation is not counted
+        :return: the amount of the asset reserved in the current cycle
+        """
+        return sum((amount for trading_pair, amount in self._reservations.get(asset, {}).items()
+                    if trading_pair != excluded_trading_pair),
+                   s_decimal_zero)
+
+    def available(self, trading_pair: str, asset: str, balance: Decimal) -> Decimal:
+        """
+        :param trading_pair: the trading pair the balance is used for
+        :param asset: the asset of the balance
+        :param balance: the balance available for the trading pair according to the connector
+        :return: the balance minus the amounts reserved by the other trading pairs in the current cycle
+        """
+        return max(balance - self.reserved(asset, excluded_trading_pair=trading_pair), s_decimal_zero)
+
+    def reserve(self, trading_pair: str, asset: str, amount: Decimal):
+        """
+        Records the amount of the asset used by the orders created for the trading pair in the current cycle, and not
+        deducted yet from the connector available balance
+        """
+        if amount > s_decimal_zero:
+            reservations = self._reservations[asset]
+            reservations[trading_pair] = reservations.get(trading_pair, s_decimal_zero) + amount
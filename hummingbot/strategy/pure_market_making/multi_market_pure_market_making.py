@@ -0,0 +1,86 @@
+import logging
+from typing import Any, Dict, List, Optional
+
+from hummingbot.core.clock import Clock
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy.strategy_py_base import StrategyPyBase
+
+from .multi_market_budget import MultiMarketBudget
+from .pure_market_making import PureMarketMakingStrategy
+
+mmpmm_logger = None
+
+
+class MultiMarketPureMarketMakingStrategy(StrategyPyBase):
+    """
+    Runs the pure market making proposal pipeline for several trading pairs of the same connector in one strategy.
+    Each trading pair is quoted by its own PureMarketMakingStrategy (with its own configuration), ticked by this
+    strategy instead of the clock, so all the trading pairs share the connector, its order book trackers and rate
+    limits. The strategies share a MultiMarketBudget, so that the orders created for one trading pair reduce the balance
+    available to the others in the same tick.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global mmpmm_logger
+        if mmpmm_logger is None:
+            mmpmm_logger = logging.getLogger(__name__)
+        return mmpmm_logger
+
+    def init_params(self,
+                    strategies: Dict[str, PureMarketMakingStrategy],
+                    budget: MultiMarketBudget,
+                    market_overrides: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        :param strategies: the market making strategy of each trading pair, created with the shared budget
+        :param budget: the budget shared by the strategies
+        :param market_overrides: the config values overridden for each trading pair
+        """
+        self._strategies = strategies
+        self._budget = budget
+        self._market_overrides = market_overrides or {}
+        self.add_markets(list({strategy.market_info.market for strategy in strategies.values()}))
+
+    @property
+    def strategies(self) -> Dict[str, PureMarketMakingStrategy]:
+        return self._strategies
+
+    @property
+    def budget(self) -> MultiMarketBudget:
+        return self._budget
+
+    def strategies_using_config(self, key: str) -> List[PureMarketMakingStrategy]:
+        """
+        :return: the strategies of the trading pairs that use the strategy config value of the key, i.e. the ones
+        without a market override for it
+        """
+        return [strategy for trading_pair, strategy in self._strategies.items()
+                if key not in self._market_overrides.get(trading_pair, {})]
+
+    @property
+    def active_orders(self) -> List[LimitOrder]:
+        return [order for strategy in self._strategies.values() for order in strategy.active_orders]
+
+    def start(self, clock: Clock, timestamp: float):
+        for strategy in self._strategies.values():
+            strategy.start(clock)
+
+    def stop(self, clock: Clock):
+        for strategy in self._strategies.values():
+            strategy.stop(clock)
+
+    def tick(self, timestamp: float):
+        self._budget.start_cycle()
+        for trading_pair, strategy in self._strategies.items():
+            try:
+                strategy.tick(timestamp)
+            except Exception:
+                # One failing trading pair shouldn't stop the others from being quoted
+                self.logger().error(f"Unexpected error running the market making of {trading_pair}.", exc_info=True)
+
+    def format_status(self) -> str:
+        lines = []
+        for trading_pair, strategy in self._strategies.items():
+            lines.extend(["", f"  {trading_pair}:"] + ["  " + line for line in strategy.format_status().split("\n")])
+        return "\n".join(lines)
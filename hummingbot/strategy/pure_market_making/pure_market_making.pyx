@@ -27,6 +27,7 @@ from .inventory_skew_calculator cimport c_calculate_bid_ask_ratios_from_base_ass
 from .inventory_skew_calculator import calculate_total_order_size
 from .pure_market_making_order_tracker import PureMarketMakingOrderTracker
 from .moving_price_band import MovingPriceBand
+from .multi_market_budget import MultiMarketBudget
 
 
 NaN = float("nan")
@@ -85,7 +86,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     bid_order_level_spreads: List[Decimal] = None,
                     ask_order_level_spreads: List[Decimal] = None,
                     should_wait_order_cancel_confirmation: bool = True,
-                    moving_price_band: Optional[MovingPriceBand] = None
+                    moving_price_band: Optional[MovingPriceBand] = None,
+                    budget: Optional[MultiMarketBudget] = None
                     ):
         if order_override is None:
             order_override = {}
@@ -144,6 +146,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._last_own_trade_price = Decimal('nan')
         self._should_wait_order_cancel_confirmation = should_wait_order_cancel_confirmation
         self._moving_price_band = moving_price_band
+        self._budget = budget
         self.c_add_markets([market_info.market])
 
     def all_markets_ready(self):
@@ -410,6 +413,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     def moving_price_band(self) -> MovingPriceBand:
         return self._moving_price_band
 
+    @property
+    def budget(self) -> Optional[MultiMarketBudget]:
+        return self._budget
+
     def get_price(self) -> Decimal:
         price_provider = self._asset_price_delegate or self._market_info
         if self._price_type is PriceType.LastOwnTrade:
@@ -577,7 +584,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         active_orders = self.active_orders
         no_sells = len([o for o in active_orders if not o.is_buy and o.client_order_id and
                         not self._hanging_orders_tracker.is_order_id_in_hanging_orders(o.client_order_id)])
-        active_orders.sort(key=lambda x: x.price, reverse=True)
+        active_orders = sorted(active_orders, key=lambda x: x.price, reverse=True)
         columns = ["Level", "Type", "Price", "Spread", "Amount (Orig)", "Amount (Adj)", "Age"]
         data = []
         lvl_buy, lvl_sell = 0, 0
@@ -934,6 +941,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             object adjusted_amount
 
         base_balance, quote_balance = self.adjusted_available_balance_for_orders_budget_constrain()
+        if self._budget is not None:
+            base_balance = self._budget.available(self.trading_pair, self.base_asset, base_balance)
+            quote_balance = self._budget.available(self.trading_pair, self.quote_asset, quote_balance)
 
         for buy in proposal.buys:
             buy_fee = market.c_get_fee(self.base_asset, self.quote_asset, OrderType.LIMIT, TradeType.BUY,
@@ -1245,11 +1255,15 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
     cdef c_execute_orders_proposal(self, object proposal):
         cdef:
+            ExchangeBase market = self._market_info.market
             double expiration_seconds = NaN
             str bid_order_id, ask_order_id
             bint orders_created = False
         # Number of pair of orders to track for hanging orders
         number_of_pairs = min((len(proposal.buys), len(proposal.sells))) if self._hanging_orders_enabled else 0
+        if self._budget is not None:
+            base_balance_before = market.c_get_available_balance(self.base_asset)
+            quote_balance_before = market.c_get_available_balance(self.quote_asset)
 
         if len(proposal.buys) > 0:
             if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
@@ -1298,6 +1312,19 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                         self._hanging_orders_tracker.current_created_pairs_of_orders[idx].sell_order = order
         if orders_created:
             self.set_timers()
+            if self._budget is not None:
+                # Only the amounts not yet deducted from the connector balances are reserved, some connectors (e.g.
+                # paper trade) update the available balances as soon as the orders are created
+                self._budget.reserve(
+                    self.trading_pair,
+                    self.quote_asset,
+                    sum([buy.size * buy.price for buy in proposal.buys], s_decimal_zero)
+                    - (quote_balance_before - market.c_get_available_balance(self.quote_asset)))
+                self._budget.reserve(
+                    self.trading_pair,
+                    self.base_asset,
+                    sum([sell.size for sell in proposal.sells], s_decimal_zero)
+                    - (base_balance_before - market.c_get_available_balance(self.base_asset)))
 
     cdef set_timers(self):
         cdef double next_cycle = self._current_timestamp + self._order_refresh_time
@@ -27,6 +27,14 @@ def validate_exchange_trading_pair(value: str) -> Optional[str]:
     return validate_market_trading_pair(exchange, value)
 
 
+def validate_additional_markets(value: str) -> Optional[str]:
+    exchange = pure_market_making_config_map.get("exchange").value
+    for trading_pair in value.split(","):
+        error = validate_market_trading_pair(exchange, trading_pair.strip())
+        if error is not None:
+            return error
+
+
 def order_amount_prompt() -> str:
     trading_pair = pure_market_making_config_map["market"].value
     base_asset, quote_asset = trading_pair.split("-")
@@ -385,6 +393,19 @@ pure_market_making_config_map = {
                   required_if=lambda: False,
                   default=None,
                   type_str="json"),
+    "additional_markets":
+        ConfigVar(key="additional_markets",
+                  prompt=None,
+                  required_if=lambda: False,
+                  default=None,
+                  type_str="str",
+                  validator=validate_additional_markets),
+    "market_overrides":
+        ConfigVar(key="market_overrides",
+                  prompt=None,
+                  required_if=lambda: False,
+                  default=None,
+                  type_str="json"),
     "should_wait_order_cancel_confirmation":
         ConfigVar(key="should_wait_order_cancel_confirmation",
                   prompt="Should the strategy wait to receive a confirmation for orders cancelation "
@@ -1,13 +1,19 @@
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+from hummingbot.client.config.config_helpers import parse_cvar_value
 from hummingbot.client.hummingbot_application import HummingbotApplication
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.strategy.api_asset_price_delegate import APIAssetPriceDelegate
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate import OrderBookAssetPriceDelegate
-from hummingbot.strategy.pure_market_making import InventoryCostPriceDelegate, PureMarketMakingStrategy
+from hummingbot.strategy.pure_market_making import (
+    InventoryCostPriceDelegate,
+    MultiMarketBudget,
+    MultiMarketPureMarketMakingStrategy,
+    PureMarketMakingStrategy,
+)
 from hummingbot.strategy.pure_market_making.moving_price_band import MovingPriceBand
 from hummingbot.strategy.pure_market_making.pure_market_making_config_map import pure_market_making_config_map as c_map
 
@@ -20,55 +26,62 @@ def start(self):
         string_list = list(string.split(","))
         return [Decimal(v) / divisor for v in string_list]
 
-    try:
-        order_amount = c_map.get("order_amount").value
-        order_refresh_time = c_map.get("order_refresh_time").value
-        max_order_age = c_map.get("max_order_age").value
-        bid_spread = c_map.get("bid_spread").value / Decimal('100')
-        ask_spread = c_map.get("ask_spread").value / Decimal('100')
-        minimum_spread = c_map.get("minimum_spread").value / Decimal('100')
-        price_ceiling = c_map.get("price_ceiling").value
-        price_floor = c_map.get("price_floor").value
-        ping_pong_enabled = c_map.get("ping_pong_enabled").value
-        order_levels = c_map.get("order_levels").value
-        order_level_amount = c_map.get("order_level_amount").value
-        order_level_spread = c_map.get("order_level_spread").value / Decimal('100')
-        exchange = c_map.get("exchange").value.lower()
-        raw_trading_pair = c_map.get("market").value
-        inventory_skew_enabled = c_map.get("inventory_skew_enabled").value
-        inventory_target_base_pct = 0 if c_map.get("inventory_target_base_pct").value is None else \
-            c_map.get("inventory_target_base_pct").value / Decimal('100')
-        inventory_range_multiplier = c_map.get("inventory_range_multiplier").value
-        filled_order_delay = c_map.get("filled_order_delay").value
-        hanging_orders_enabled = c_map.get("hanging_orders_enabled").value
-        hanging_orders_cancel_pct = c_map.get("hanging_orders_cancel_pct").value / Decimal('100')
-        order_optimization_enabled = c_map.get("order_optimization_enabled").value
-        ask_order_optimization_depth = c_map.get("ask_order_optimization_depth").value
-        bid_order_optimization_depth = c_map.get("bid_order_optimization_depth").value
-        add_transaction_costs_to_orders = c_map.get("add_transaction_costs").value
-        price_source = c_map.get("price_source").value
-        price_type = c_map.get("price_type").value
-        price_source_exchange = c_map.get("price_source_exchange").value
-        price_source_market = c_map.get("price_source_market").value
-        price_source_custom_api = c_map.get("price_source_custom_api").value
-        custom_api_update_interval = c_map.get("custom_api_update_interval").value
-        order_refresh_tolerance_pct = c_map.get("order_refresh_tolerance_pct").value / Decimal('100')
-        order_override = c_map.get("order_override").value
-        split_order_levels_enabled = c_map.get("split_order_levels_enabled").value
+    def create_strategy(market_info: MarketTradingPairTuple,
+                        overrides: Dict[str, Any],
+                        budget: Optional[MultiMarketBudget]) -> PureMarketMakingStrategy:
+        def value(key: str) -> Any:
+            '''the config value of the trading pair, its override if there is one'''
+            if key in overrides:
+                return parse_cvar_value(c_map.get(key), overrides[key])
+            return c_map.get(key).value
+
+        trading_pair = market_info.trading_pair
+        order_amount = value("order_amount")
+        order_refresh_time = value("order_refresh_time")
+        max_order_age = value("max_order_age")
+        bid_spread = value("bid_spread") / Decimal('100')
+        ask_spread = value("ask_spread") / Decimal('100')
+        minimum_spread = value("minimum_spread") / Decimal('100')
+        price_ceiling = value("price_ceiling")
+        price_floor = value("price_floor")
+        ping_pong_enabled = value("ping_pong_enabled")
+        order_levels = value("order_levels")
+        order_level_amount = value("order_level_amount")
+        order_level_spread = value("order_level_spread") / Decimal('100')
+        inventory_skew_enabled = value("inventory_skew_enabled")
+        inventory_target_base_pct = 0 if value("inventory_target_base_pct") is None else \
+            value("inventory_target_base_pct") / Decimal('100')
+        inventory_range_multiplier = value("inventory_range_multiplier")
+        filled_order_delay = value("filled_order_delay")
+        hanging_orders_enabled = value("hanging_orders_enabled")
+        hanging_orders_cancel_pct = value("hanging_orders_cancel_pct") / Decimal('100')
+        order_optimization_enabled = value("order_optimization_enabled")
+        ask_order_optimization_depth = value("ask_order_optimization_depth")
+        bid_order_optimization_depth = value("bid_order_optimization_depth")
+        add_transaction_costs_to_orders = value("add_transaction_costs")
+        price_source = value("price_source")
+        price_type = value("price_type")
+        price_source_exchange = value("price_source_exchange")
+        price_source_market = value("price_source_market")
+        price_source_custom_api = value("price_source_custom_api")
+        custom_api_update_interval = value("custom_api_update_interval")
+        order_refresh_tolerance_pct = value("order_refresh_tolerance_pct") / Decimal('100')
+        order_override = value("order_override")
+        split_order_levels_enabled = value("split_order_levels_enabled")
         moving_price_band = MovingPriceBand(
-            enabled=c_map.get("moving_price_band_enabled").value,
-            price_floor_pct=c_map.get("price_floor_pct").value,
-            price_ceiling_pct=c_map.get("price_ceiling_pct").value,
-            price_band_refresh_time=c_map.get("price_band_refresh_time").value
+            enabled=value("moving_price_band_enabled"),
+            price_floor_pct=value("price_floor_pct"),
+            price_ceiling_pct=value("price_ceiling_pct"),
+            price_band_refresh_time=value("price_band_refresh_time")
         )
         bid_order_level_spreads = convert_decimal_string_to_list(
-            c_map.get("bid_order_level_spreads").value)
+            value("bid_order_level_spreads"))
         ask_order_level_spreads = convert_decimal_string_to_list(
-            c_map.get("ask_order_level_spreads").value)
+            value("ask_order_level_spreads"))
         bid_order_level_amounts = convert_decimal_string_to_list(
-            c_map.get("bid_order_level_amounts").value)
+            value("bid_order_level_amounts"))
         ask_order_level_amounts = convert_decimal_string_to_list(
-            c_map.get("ask_order_level_amounts").value)
+            value("ask_order_level_amounts"))
         if split_order_levels_enabled:
             buy_list = [['buy', spread, amount] for spread, amount in zip(bid_order_level_spreads, bid_order_level_amounts)]
             sell_list = [['sell', spread, amount] for spread, amount in zip(ask_order_level_spreads, ask_order_level_amounts)]
@@ -76,18 +89,17 @@ def start(self):
             order_override = {
                 f'split_level_{i}': order for i, order in enumerate(both_list)
             }
-        trading_pair: str = raw_trading_pair
-        maker_assets: Tuple[str, str] = self._initialize_market_assets(exchange, [trading_pair])[0]
-        market_names: List[Tuple[str, List[str]]] = [(exchange, [trading_pair])]
-        self._initialize_markets(market_names)
-        maker_data = [self.markets[exchange], trading_pair] + list(maker_assets)
-        self.market_trading_pair_tuples = [MarketTradingPairTuple(*maker_data)]
 
         asset_price_delegate = None
         if price_source == "external_market":
             asset_trading_pair: str = price_source_market
-            ext_market = create_paper_trade_market(price_source_exchange, self.client_config_map, [asset_trading_pair])
-            self.markets[price_source_exchange]: ExchangeBase = ext_market
+            ext_market = external_markets.get(price_source_exchange)
+            if ext_market is None:
+                ext_market = create_paper_trade_market(price_source_exchange,
+                                                       self.client_config_map,
+                                                       external_trading_pairs[price_source_exchange])
+                external_markets[price_source_exchange] = ext_market
+                self.markets[price_source_exchange]: ExchangeBase = ext_market
             asset_price_delegate = OrderBookAssetPriceDelegate(ext_market, asset_trading_pair)
         elif price_source == "custom_api":
             asset_price_delegate = APIAssetPriceDelegate(self.markets[exchange], price_source_custom_api,
@@ -96,14 +108,14 @@ def start(self):
         if price_type == "inventory_cost":
             db = HummingbotApplication.main_application().trade_fill_db
             inventory_cost_price_delegate = InventoryCostPriceDelegate(db, trading_pair)
-        take_if_crossed = c_map.get("take_if_crossed").value
+        take_if_crossed = value("take_if_crossed")
 
-        should_wait_order_cancel_confirmation = c_map.get("should_wait_order_cancel_confirmation")
+        should_wait_order_cancel_confirmation = value("should_wait_order_cancel_confirmation")
 
         strategy_logging_options = PureMarketMakingStrategy.OPTION_LOG_ALL
-        self.strategy = PureMarketMakingStrategy()
-        self.strategy.init_params(
-            market_info=MarketTradingPairTuple(*maker_data),
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(
+            market_info=market_info,
             bid_spread=bid_spread,
             ask_spread=ask_spread,
             order_levels=order_levels,
@@ -138,8 +150,56 @@ def start(self):
             bid_order_level_spreads=bid_order_level_spreads,
             ask_order_level_spreads=ask_order_level_spreads,
             should_wait_order_cancel_confirmation=should_wait_order_cancel_confirmation,
-            moving_price_band=moving_price_band
+            moving_price_band=moving_price_band,
+            budget=budget
         )
+        return strategy
+
+    try:
+        exchange = c_map.get("exchange").value.lower()
+        raw_trading_pair = c_map.get("market").value
+        additional_markets = c_map.get("additional_markets").value
+        market_overrides = c_map.get("market_overrides").value or {}
+        trading_pairs: List[str] = [raw_trading_pair]
+        if additional_markets is not None:
+            for trading_pair in additional_markets.split(","):
+                trading_pair = trading_pair.strip()
+                if len(trading_pair) > 0 and trading_pair not in trading_pairs:
+                    trading_pairs.append(trading_pair)
+
+        # The external price source markets of all the trading pairs, to create one paper trade market per exchange
+        external_trading_pairs: Dict[str, List[str]] = {}
+        external_markets: Dict[str, ExchangeBase] = {}
+        for trading_pair in trading_pairs:
+            overrides = market_overrides.get(trading_pair, {})
+            if overrides.get("price_source", c_map.get("price_source").value) == "external_market":
+                price_source_exchange = overrides.get("price_source_exchange", c_map.get("price_source_exchange").value)
+                price_source_market = overrides.get("price_source_market", c_map.get("price_source_market").value)
+                external_trading_pairs.setdefault(price_source_exchange, [])
+                if price_source_market not in external_trading_pairs[price_source_exchange]:
+                    external_trading_pairs[price_source_exchange].append(price_source_market)
+
+        maker_assets: List[Tuple[str, str]] = self._initialize_market_assets(exchange, trading_pairs)
+        market_names: List[Tuple[str, List[str]]] = [(exchange, trading_pairs)]
+        self._initialize_markets(market_names)
+        self.market_trading_pair_tuples = [
+            MarketTradingPairTuple(self.markets[exchange], trading_pair, *assets)
+            for trading_pair, assets in zip(trading_pairs, maker_assets)
+        ]
+
+        if len(trading_pairs) == 1:
+            self.strategy = create_strategy(self.market_trading_pair_tuples[0], market_overrides.get(raw_trading_pair, {}),
+                                            budget=None)
+        else:
+            budget = MultiMarketBudget()
+            strategies = {
+                market_info.trading_pair: create_strategy(market_info,
+                                                          market_overrides.get(market_info.trading_pair, {}),
+                                                          budget)
+                for market_info in self.market_trading_pair_tuples
+            }
+            self.strategy = MultiMarketPureMarketMakingStrategy()
+            self.strategy.init_params(strategies=strategies, budget=budget, market_overrides=market_overrides)
     except Exception as e:
         self.notify(str(e))
         self.logger().error("Unknown error during initialization.", exc_info=True)
@@ -27,6 +27,9 @@ cdef class StrategyBase(TimeIterator):
         EventListener _sb_range_position_closed_listener
         bint _sb_delegate_lock
         public OrderTracker _sb_order_tracker
+        dict _sb_order_book_subscriptions
+        object _sb_order_book_change_forwarder
+        object _sb_order_book_change_debouncer
 
     cdef c_add_markets(self, list markets)
     cdef c_remove_markets(self, list markets)
@@ -47,6 +50,7 @@ cdef class StrategyBase(TimeIterator):
     cdef c_did_fail_lp_update(self, object fail_lp_update_event)
     cdef c_did_collect_fee(self, object collect_fee_event)
     cdef c_did_close_position(self, object closed_event)
+    cdef c_did_change_order_books(self, set order_books)
 
     cdef c_did_fail_order_tracker(self, object order_failed_event)
     cdef c_did_cancel_order_tracker(self, object order_cancelled_event)
@@ -2,13 +2,17 @@ from decimal import Decimal
 import logging
 import pandas as pd
 from typing import (
-    List)
+    List,
+    Set)
 
 from hummingbot.core.clock cimport Clock
-from hummingbot.core.event.events import MarketEvent, AccountEvent
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent, AccountEvent, OrderBookEvent
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.order_book_change_debouncer import OrderBookChangeDebouncer
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.connector.connector_base cimport ConnectorBase
 from hummingbot.core.data_type.trade import Trade
@@ -163,6 +167,10 @@ cdef class StrategyBase(TimeIterator):
 
         self._sb_order_tracker = OrderTracker()
 
+        self._sb_order_book_subscriptions = {}
+        self._sb_order_book_change_forwarder = SourceInfoEventForwarder(self._process_order_book_change_event)
+        self._sb_order_book_change_debouncer = OrderBookChangeDebouncer(self._deliver_order_book_changes)
+
     def init_params(self, *args, **kwargs):
         """
         Assigns strategy parameters, this function must be called directly after init.
@@ -179,6 +187,51 @@ cdef class StrategyBase(TimeIterator):
     def order_tracker(self) -> OrderTracker:
         return self._sb_order_tracker
 
+    @property
+    def order_book_change_min_interval(self) -> float:
+        """
+        Minimum time in seconds between two calls to `c_did_change_order_books`
+        """
+        return self._sb_order_book_change_debouncer.min_interval
+
+    @order_book_change_min_interval.setter
+    def order_book_change_min_interval(self, value: float):
+        self._sb_order_book_change_debouncer.min_interval = value
+
+    def subscribe_to_order_book_changes(self, order_book: OrderBook, top_of_book: bool = True, trades: bool = False):
+        """
+        Makes the strategy react to the changes of an order book in between clock ticks. The changes are debounced:
+        `c_did_change_order_books` is called with the order books changed since the previous call, at most once every
+        `order_book_change_min_interval` seconds.
+        :param order_book: the order book to follow
+        :param top_of_book: True to be notified when the best bid or the best ask change
+        :param trades: True to be notified of the trades of the order book
+        """
+        self.unsubscribe_from_order_book_changes(order_book)
+        event_tags = []
+        if top_of_book:
+            event_tags.append(OrderBookEvent.TopOfBookChanged)
+        if trades:
+            event_tags.append(OrderBookEvent.TradeEvent)
+        for event_tag in event_tags:
+            order_book.add_listener(event_tag, self._sb_order_book_change_forwarder)
+        self._sb_order_book_subscriptions[order_book] = event_tags
+
+    def unsubscribe_from_order_book_changes(self, order_book: OrderBook):
+        for event_tag in self._sb_order_book_subscriptions.pop(order_book, []):
+            order_book.remove_listener(event_tag, self._sb_order_book_change_forwarder)
+
+    def _process_order_book_change_event(self, event_tag: int, order_book: OrderBook, event: object):
+        self._sb_order_book_change_debouncer.notify(order_book)
+
+    def _deliver_order_book_changes(self, order_books: Set[OrderBook]):
+        if self._clock is None:
+            return
+        try:
+            self.c_did_change_order_books(order_books)
+        except Exception:
+            self.logger().error("Unexpected error processing order book changes.", exc_info=True)
+
     def format_status(self):
         raise NotImplementedError
 
@@ -309,6 +362,9 @@ cdef class StrategyBase(TimeIterator):
         TimeIterator.c_stop(self, clock)
         self._sb_order_tracker.c_stop(clock)
         self.c_remove_markets(list(self._sb_markets))
+        for order_book in list(self._sb_order_book_subscriptions):
+            self.unsubscribe_from_order_book_changes(order_book)
+        self._sb_order_book_change_debouncer.cancel()
 
     cdef c_add_markets(self, list markets):
         cdef:
@@ -450,6 +506,13 @@ cdef class StrategyBase(TimeIterator):
 
     cdef c_did_close_position(self, object closed_event):
         pass
+
+    cdef c_did_change_order_books(self, set order_books):
+        """
+        Called with the order books (subscribed with `subscribe_to_order_book_changes`) that changed since the
+        previous call. Strategies can react here to the market moves instead of waiting for the next tick.
+        """
+        pass
     # ----------------------------------------------------------------------------------------------------------
     # </editor-fold>
 
@@ -1,5 +1,8 @@
+from typing import Set
+
 from hummingbot.strategy.strategy_base cimport StrategyBase
 from hummingbot.core.clock import Clock
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.event.events import (
     BuyOrderCreatedEvent,
@@ -147,3 +150,9 @@ cdef class StrategyPyBase(StrategyBase):
 
     def did_close_position(self, closed_position_event: RangePositionClosedEvent):
         pass
+
+    cdef c_did_change_order_books(self, set order_books):
+        self.did_change_order_books(order_books)
+
+    def did_change_order_books(self, order_books: Set[OrderBook]):
+        pass
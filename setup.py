@@ -38,7 +38,8 @@ def main():
         "hummingbot": [
             "core/cpp/*",
             "VERSION",
-            "templates/*TEMPLATE.yml"
+            "templates/*TEMPLATE.yml",
+            "connector/connector_manifest.json",
         ],
     }
     install_requires = [
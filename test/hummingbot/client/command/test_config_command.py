@@ -100,6 +100,12 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ market_data_collection_enabled  | True                 |\n"
                            "    | ∟ market_data_collection_interval | 60                   |\n"
                            "    | ∟ market_data_collection_depth    | 20                   |\n"
+                           "    | markets_recorder                  |                      |\n"
+                           "    | ∟ write_behind_enabled            | False                |\n"
+                           "    | ∟ write_behind_flush_interval     | 1.0                  |\n"
+                           "    | ∟ write_behind_batch_size         | 100                  |\n"
+                           "    | ∟ trades_csv_max_file_size_mb     | 0                    |\n"
+                           "    | ∟ trades_csv_rotate_daily         | False                |\n"
                            "    +-----------------------------------+----------------------+")
 
         self.assertEqual(df_str_expected, captures[1])
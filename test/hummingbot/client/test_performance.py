@@ -13,6 +13,7 @@ from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
 from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_summary import TradeFillSummary
 
 trading_pair = "HBOT-USDT"
 base, quote = trading_pair.split("-")
@@ -171,6 +172,60 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("799"), metrics.trade_pnl)
         print(metrics)
 
+    def test_performance_metrics_from_summaries_match_metrics_from_trades(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices["BNB-USDT"] = Decimal("300")
+        rate_oracle._prices[trading_pair] = Decimal("115")
+        RateOracle._shared_instance = rate_oracle
+
+        def trade_fill(order_id: str, trade_type: str, price: int, amount: int, trade_fee) -> TradeFill:
+            return TradeFill(
+                config_file_path="some-strategy.yml",
+                strategy="pure_market_making",
+                market="binance",
+                symbol=trading_pair,
+                base_asset=base,
+                quote_asset=quote,
+                timestamp=int(time.time()),
+                order_id=order_id,
+                trade_type=trade_type,
+                order_type="LIMIT",
+                price=price,
+                amount=amount,
+                trade_fee=trade_fee.to_json(),
+                exchange_trade_id=order_id,
+                position=PositionAction.NIL.value,
+            )
+
+        trades = [
+            trade_fill("someId0", "BUY", 100, 10, AddedToCostTradeFee(percent=Decimal("0.01"))),
+            trade_fill("someId1", "SELL", 120, 15, DeductedFromReturnsTradeFee(percent=Decimal("0.02"))),
+            trade_fill("someId2", "BUY", 110, 5, AddedToCostTradeFee(flat_fees=[TokenAmount("BNB", Decimal("0.1"))])),
+        ]
+        summaries = [
+            TradeFillSummary(trade_type="BUY", num_trades=2, num_nil_position_trades=2,
+                             base_volume=Decimal("15"), quote_volume=Decimal("1550"),
+                             percent_fees_in_quote=Decimal("10"), deducted_fees_in_quote=Decimal("0"),
+                             flat_fees={"BNB": "0.1"}, first_timestamp=1, first_price=Decimal("100"),
+                             last_timestamp=3, last_price=Decimal("110")),
+            TradeFillSummary(trade_type="SELL", num_trades=1, num_nil_position_trades=1,
+                             base_volume=Decimal("15"), quote_volume=Decimal("1800"),
+                             percent_fees_in_quote=Decimal("36"), deducted_fees_in_quote=Decimal("36"),
+                             flat_fees={}, first_timestamp=2, first_price=Decimal("120"),
+                             last_timestamp=2, last_price=Decimal("120")),
+        ]
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+
+        from_trades = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades, cur_bals))
+        from_summaries = self.async_run_with_timeout(
+            PerformanceMetrics.create_from_summaries(trading_pair, summaries, cur_bals))
+
+        for attribute in ("num_buys", "num_sells", "b_vol_base", "s_vol_base", "b_vol_quote", "s_vol_quote",
+                          "avg_b_price", "avg_s_price", "start_price", "cur_price", "hold_value", "cur_value",
+                          "trade_pnl", "fee_in_quote", "total_pnl", "return_pct"):
+            self.assertEqual(getattr(from_trades, attribute), getattr(from_summaries, attribute), attribute)
+        self.assertEqual(dict(from_trades.fees), dict(from_summaries.fees))
+
     @patch('hummingbot.client.performance.PerformanceMetrics._is_trade_fill')
     def test_performance_metrics_for_derivatives(self, is_trade_fill_mock):
         rate_oracle = RateOracle()
@@ -1,10 +1,11 @@
+import json
 import unittest
 from unittest.mock import MagicMock, patch
 
 from pydantic import SecretStr
 
-from hummingbot.client.settings import ConnectorSetting, ConnectorType
-from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
+from hummingbot.client.settings import CONNECTOR_MANIFEST_PATH, AllConnectorSettings, ConnectorSetting, ConnectorType
+from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap, BinanceUSConfigMap
 from hummingbot.connector.gateway.clob_spot.data_sources.injective.injective_api_data_source import (
     InjectiveAPIDataSource,
 )
@@ -150,3 +151,62 @@ class SettingsTest(unittest.TestCase):
 
         self.assertIsInstance(api_data_source, InjectiveAPIDataSource)
         self.assertEqual(expected_params_without_api_data_source, params)
+
+
+class AllConnectorSettingsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.all_connector_settings = AllConnectorSettings.all_connector_settings
+        self.connectors_with_unloaded_config_keys = AllConnectorSettings.connectors_with_unloaded_config_keys
+
+    def tearDown(self) -> None:
+        AllConnectorSettings.all_connector_settings = self.all_connector_settings
+        AllConnectorSettings.connectors_with_unloaded_config_keys = self.connectors_with_unloaded_config_keys
+        super().tearDown()
+
+    def test_connector_manifest_is_up_to_date(self):
+        with open(CONNECTOR_MANIFEST_PATH) as manifest_file:
+            manifest = json.load(manifest_file)
+
+        self.assertEqual(
+            AllConnectorSettings.create_connector_manifest(),
+            manifest,
+            "The connector manifest is outdated, run bin/create_connector_manifest.py to update it."
+        )
+
+    def test_connector_settings_from_manifest_match_connector_modules(self):
+        manifest_settings = dict(AllConnectorSettings.create_connector_settings())
+        module_settings = dict(AllConnectorSettings.create_connector_settings(use_manifest=False))
+
+        self.assertEqual(module_settings.keys(), manifest_settings.keys())
+        for name, module_setting in module_settings.items():
+            self.assertEqual(module_setting._replace(config_keys=None), manifest_settings[name]._replace(config_keys=None))
+
+    def test_config_keys_loaded_on_first_use(self):
+        connector_settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertIsNone(connector_settings["binance"].config_keys)
+        self.assertIn("binance", AllConnectorSettings.connectors_with_unloaded_config_keys)
+
+        self.assertIsInstance(AllConnectorSettings.get_connector_config_keys("binance"), BinanceConfigMap)
+        self.assertIsInstance(AllConnectorSettings.get_connector_settings()["binance"].config_keys, BinanceConfigMap)
+        self.assertNotIn("binance", AllConnectorSettings.connectors_with_unloaded_config_keys)
+        self.assertIn("binance_us", AllConnectorSettings.connectors_with_unloaded_config_keys)
+
+        self.assertIsInstance(AllConnectorSettings.get_connector_config_keys("binance_us"), BinanceUSConfigMap)
+
+    def test_paper_trade_config_keys_loaded_from_base_connector(self):
+        AllConnectorSettings.create_connector_settings()
+        AllConnectorSettings.initialize_paper_trade_settings(["binance"])
+
+        self.assertIn("binance_paper_trade", AllConnectorSettings.connectors_with_unloaded_config_keys)
+        self.assertIsInstance(AllConnectorSettings.get_connector_config_keys("binance_paper_trade"), BinanceConfigMap)
+
+    def test_paper_trade_config_keys_loaded_from_sub_domain_connector(self):
+        AllConnectorSettings.create_connector_settings()
+        AllConnectorSettings.initialize_paper_trade_settings(["binance_us"])
+
+        self.assertIn("binance_us_paper_trade", AllConnectorSettings.connectors_with_unloaded_config_keys)
+        self.assertIsInstance(AllConnectorSettings.get_connector_config_keys("binance_us_paper_trade"),
+                              BinanceUSConfigMap)
+        self.assertNotIn("binance_us", AllConnectorSettings.connectors_with_unloaded_config_keys)
@@ -0,0 +1,79 @@
+import importlib
+import json
+import logging
+import subprocess
+import sys
+import time
+import unittest
+from os.path import join, realpath
+from unittest.mock import patch
+
+from hummingbot.client.settings import AllConnectorSettings
+
+ITERATIONS = 5
+COLD_START_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+from hummingbot.client.settings import AllConnectorSettings
+AllConnectorSettings.create_connector_settings(use_manifest={use_manifest})
+elapsed = time.perf_counter() - start
+utils_modules = [name for name in sys.modules if name.startswith("hummingbot.connector.") and name.endswith("_utils")]
+print(json.dumps({{"elapsed": elapsed, "utils_modules": len(utils_modules)}}))
+"""
+
+
+class ConnectorSettingsStartupPerformanceTests(unittest.TestCase):
+    """
+    Benchmark of the creation of the connector settings at startup, reading the connector manifest or importing the
+    connector modules.
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.all_connector_settings = AllConnectorSettings.all_connector_settings
+        self.connectors_with_unloaded_config_keys = AllConnectorSettings.connectors_with_unloaded_config_keys
+
+    def tearDown(self) -> None:
+        AllConnectorSettings.all_connector_settings = self.all_connector_settings
+        AllConnectorSettings.connectors_with_unloaded_config_keys = self.connectors_with_unloaded_config_keys
+        super().tearDown()
+
+    @staticmethod
+    def _cold_start(use_manifest: bool) -> dict:
+        output = subprocess.check_output(
+            [sys.executable, "-c", COLD_START_SCRIPT.format(use_manifest=use_manifest)],
+            cwd=realpath(join(__file__, "../../../../")),
+        )
+        return json.loads(output.decode().splitlines()[-1])
+
+    def _time_create_connector_settings(self, use_manifest: bool) -> float:
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            AllConnectorSettings.create_connector_settings(use_manifest=use_manifest)
+        return (time.perf_counter() - start) / ITERATIONS
+
+    def test_create_connector_settings_from_manifest_imports_no_connector_module(self):
+        with patch("importlib.import_module", wraps=importlib.import_module) as import_module_mock:
+            manifest_elapsed = self._time_create_connector_settings(use_manifest=True)
+
+        imported_modules = [call.args[0] for call in import_module_mock.call_args_list]
+        self.assertEqual([], [module for module in imported_modules if module.startswith("hummingbot.connector.")])
+
+        # The connector modules are already imported by the previous calls, so this only measures the settings creation
+        modules_elapsed = self._time_create_connector_settings(use_manifest=False)
+        logging.getLogger(__name__).info(
+            f"Connector settings created in {manifest_elapsed * 1e3:.2f} ms from the manifest, "
+            f"{modules_elapsed * 1e3:.2f} ms from the imported connector modules")
+
+    def test_cold_start_from_manifest_imports_fewer_connector_modules(self):
+        manifest_start = self._cold_start(use_manifest=True)
+        modules_start = self._cold_start(use_manifest=False)
+
+        logging.getLogger(__name__).info(
+            f"Cold start in {manifest_start['elapsed']:.2f} s importing {manifest_start['utils_modules']} connector "
+            f"utils modules from the manifest, {modules_start['elapsed']:.2f} s importing "
+            f"{modules_start['utils_modules']} without it")
+        self.assertLess(manifest_start["utils_modules"], modules_start["utils_modules"])
@@ -0,0 +1,116 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.connector.exchange.paper_trade.matching_engine import PaperTradeMatchingEngine, PaperTradeOrder
+
+
+class PaperTradeMatchingEngineTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.engine = PaperTradeMatchingEngine()
+
+    def order(self, order_id: str, is_buy: bool, price: str, quantity: str, queue_ahead: str = "0",
+              trading_pair: str = trading_pair) -> PaperTradeOrder:
+        base, quote = trading_pair.split("-")
+        order = PaperTradeOrder(order_id, trading_pair, is_buy, base, quote, Decimal(price), Decimal(quantity),
+                                1640000000000000, Decimal(queue_ahead))
+        self.engine.add_order(order)
+        return order
+
+    def test_orders_listed_best_priced_first(self):
+        self.order("B1", True, "99", "1")
+        self.order("B2", True, "100", "1")
+        self.order("B3", True, "99", "1")
+        self.order("A1", False, "102", "1")
+        self.order("A2", False, "101", "1")
+
+        self.assertEqual(["B2", "B1", "B3", "A2", "A1"], [o.client_order_id for o in self.engine.orders()])
+
+    def test_on_hold_balances_follow_orders(self):
+        self.order("B1", True, "100", "2")
+        self.order("A1", False, "101", "3")
+
+        self.assertEqual(Decimal("200"), self.engine.on_hold_balances["HBOT"])
+        self.assertEqual(Decimal("3"), self.engine.on_hold_balances["COINALPHA"])
+
+        self.engine.remove_order("B1")
+
+        self.assertEqual(Decimal("0"), self.engine.on_hold_balances["HBOT"])
+        self.assertIsNone(self.engine.remove_order("B1"))
+        self.assertEqual(1, len(self.engine))
+
+    def test_partial_fill_updates_order_and_on_hold_balance(self):
+        order = self.order("B1", True, "100", "2")
+
+        self.engine.apply_fill(order, Decimal("0.5"), Decimal("0.5"), Decimal("50"))
+
+        self.assertEqual(Decimal("1.5"), order.remaining_quantity)
+        self.assertEqual(Decimal("150"), self.engine.on_hold_balances["HBOT"])
+        self.assertIs(order, self.engine.get_order("B1"))
+
+        self.engine.apply_fill(order, Decimal("1.5"), Decimal("1.5"), Decimal("150"))
+
+        self.assertTrue(order.is_done)
+        self.assertEqual(Decimal("2"), order.base_amount_traded)
+        self.assertEqual(Decimal("200"), order.quote_amount_traded)
+        self.assertIsNone(self.engine.get_order("B1"))
+        self.assertEqual(Decimal("0"), self.engine.on_hold_balances["HBOT"])
+
+    def test_crossed_orders(self):
+        self.order("B1", True, "100", "1")
+        self.order("B2", True, "99", "1")
+        self.order("A1", False, "101", "1")
+        self.order("A2", False, "102", "1")
+
+        crossed = self.engine.crossed_orders(self.trading_pair, best_bid=Decimal("101.5"), best_ask=Decimal("100"))
+
+        self.assertEqual(["B1", "A1"], [o.client_order_id for o in crossed])
+        self.assertEqual([], self.engine.crossed_orders(self.trading_pair, Decimal("NaN"), Decimal("NaN")))
+
+    def test_only_pairs_with_new_orders_or_changed_top_are_checked(self):
+        self.order("B1", True, "100", "1")
+        self.order("B2", True, "100", "1", trading_pair="ETH-HBOT")
+        tops = {self.trading_pair: (100.5, 101.0), "ETH-HBOT": (100.5, 101.0)}
+
+        self.assertEqual({self.trading_pair, "ETH-HBOT"}, set(self.engine.trading_pairs_to_check(tops.get)))
+        self.assertEqual([], self.engine.trading_pairs_to_check(tops.get))
+
+        tops["ETH-HBOT"] = (100.5, 100.9)
+        self.assertEqual(["ETH-HBOT"], self.engine.trading_pairs_to_check(tops.get))
+
+        self.order("B3", True, "99", "1")
+        self.assertEqual([self.trading_pair], self.engine.trading_pairs_to_check(tops.get))
+
+    def test_trade_through_price_fills_orders_completely(self):
+        self.order("B1", True, "100", "2")
+        self.order("B2", True, "99", "1")
+
+        fills = self.engine.trade_fills(self.trading_pair, True, Decimal("98"), Decimal("0.1"))
+
+        self.assertEqual([("B1", Decimal("2")), ("B2", Decimal("1"))],
+                         [(order.client_order_id, amount) for order, amount in fills])
+
+    def test_trade_at_price_fills_after_queue_ahead(self):
+        first = self.order("A1", False, "101", "2", queue_ahead="3")
+        second = self.order("A2", False, "101", "1", queue_ahead="4")
+
+        fills = self.engine.trade_fills(self.trading_pair, False, Decimal("101"), Decimal("2"))
+
+        self.assertEqual([], fills)
+        self.assertEqual(Decimal("1"), first.queue_ahead)
+        self.assertEqual(Decimal("2"), second.queue_ahead)
+
+        fills = self.engine.trade_fills(self.trading_pair, False, Decimal("101"), Decimal("2.5"))
+
+        self.assertEqual([("A1", Decimal("1.5"))], [(order.client_order_id, amount) for order, amount in fills])
+        self.assertEqual(Decimal("0"), first.queue_ahead)
+        self.assertEqual(Decimal("0"), second.queue_ahead)
+
+    def test_trade_at_price_ignored_without_queue_position_fills(self):
+        self.engine = PaperTradeMatchingEngine(queue_position_fills=False)
+        self.order("A1", False, "101", "2")
+
+        self.assertEqual([], self.engine.trade_fills(self.trading_pair, False, Decimal("101"), Decimal("5")))
+        self.assertEqual([], self.engine.trade_fills("ETH-HBOT", False, Decimal("101"), Decimal("5")))
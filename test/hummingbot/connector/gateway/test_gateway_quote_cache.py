@@ -0,0 +1,117 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Any, Awaitable, Dict, List
+
+from hummingbot.connector.gateway.gateway_quote_cache import GatewayQuoteCache, GatewayQuoteCacheKey
+from hummingbot.core.data_type.common import TradeType
+
+
+class GatewayQuoteCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.now = 1000.0
+        self.cache = GatewayQuoteCache(time_func=lambda: self.now)
+        self.requested_amounts: List[Decimal] = []
+
+    def tearDown(self) -> None:
+        self.ev_loop.close()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def create_key(self, amount: Decimal, side: TradeType = TradeType.BUY) -> GatewayQuoteCacheKey:
+        return self.cache.create_key("ethereum", "mainnet", "uniswap", "WETH-DAI", side, amount)
+
+    def fetch(self, key: GatewayQuoteCacheKey, delay: float = 0):
+        async def request() -> Dict[str, Any]:
+            self.requested_amounts.append(key.amount)
+            await asyncio.sleep(delay)
+            return {"price": str(key.amount)}
+        return request
+
+    def test_quote_reused_within_block_time(self):
+        key = self.create_key(Decimal("10"))
+
+        first = self.async_run_with_timeout(self.cache.get_price(key, self.fetch(key)))
+        self.now += self.cache.block_time("ethereum") - 1
+        second = self.async_run_with_timeout(self.cache.get_price(key, self.fetch(key)))
+
+        self.assertIs(first, second)
+        self.assertEqual([Decimal("10")], self.requested_amounts)
+
+        self.now += 1
+        self.async_run_with_timeout(self.cache.get_price(key, self.fetch(key)))
+
+        self.assertEqual([Decimal("10"), Decimal("10")], self.requested_amounts)
+        self.assertEqual(1, self.cache.metrics["hits"])
+        self.assertEqual(2, self.cache.metrics["misses"])
+
+    def test_keys_differ_by_side_and_amount_bucket(self):
+        self.assertEqual(self.create_key(Decimal("1000")), self.create_key(Decimal("1000.0000001")))
+        self.assertNotEqual(self.create_key(Decimal("1000")), self.create_key(Decimal("1000.001")))
+        self.assertNotEqual(self.create_key(Decimal("1000")), self.create_key(Decimal("1000"), TradeType.SELL))
+        self.assertEqual(Decimal("0.12345679"), self.cache.amount_bucket(Decimal("0.123456789")))
+
+    def test_concurrent_requests_coalesced(self):
+        key = self.create_key(Decimal("10"))
+
+        responses = self.async_run_with_timeout(asyncio.gather(
+            *[self.cache.get_price(key, self.fetch(key, delay=0.01)) for _ in range(5)]
+        ))
+
+        self.assertEqual([Decimal("10")], self.requested_amounts)
+        self.assertTrue(all(response is responses[0] for response in responses))
+        self.assertEqual(4, self.cache.metrics["coalesced"])
+        self.assertEqual(0, self.cache.metrics["in_flight"])
+
+    def test_failed_request_not_cached(self):
+        key = self.create_key(Decimal("10"))
+
+        async def failing_request():
+            raise IOError("Gateway not available")
+
+        with self.assertRaises(IOError):
+            self.async_run_with_timeout(self.cache.get_price(key, failing_request))
+
+        response = self.async_run_with_timeout(self.cache.get_price(key, self.fetch(key)))
+
+        self.assertEqual({"price": "10"}, response)
+        self.assertEqual(0, self.cache.metrics["hits"])
+
+    def test_cancelled_caller_does_not_cancel_shared_request(self):
+        key = self.create_key(Decimal("10"))
+
+        async def cancel_one_caller():
+            cancelled = asyncio.ensure_future(self.cache.get_price(key, self.fetch(key, delay=0.01)))
+            waiting = asyncio.ensure_future(self.cache.get_price(key, self.fetch(key, delay=0.01)))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            return await waiting
+
+        response = self.async_run_with_timeout(cancel_one_caller())
+
+        self.assertEqual({"price": "10"}, response)
+        self.assertEqual([Decimal("10")], self.requested_amounts)
+
+    def test_entries_bounded(self):
+        cache = GatewayQuoteCache(max_entries=2, time_func=lambda: self.now)
+        keys = [self.create_key(Decimal(i + 1)) for i in range(3)]
+
+        for key in keys:
+            self.async_run_with_timeout(cache.get_price(key, self.fetch(key)))
+
+        self.assertEqual(2, cache.metrics["entries"])
+        self.async_run_with_timeout(cache.get_price(keys[0], self.fetch(keys[0])))
+        self.assertEqual(4, len(self.requested_amounts))
+
+    def test_block_time_must_be_positive(self):
+        self.cache.set_block_time("ethereum", 6)
+
+        self.assertEqual(6, self.cache.block_time("ethereum"))
+        self.assertEqual(GatewayQuoteCache.DEFAULT_BLOCK_TIME, self.cache.block_time("unknown"))
+        with self.assertRaises(ValueError):
+            self.cache.set_block_time("ethereum", 0)
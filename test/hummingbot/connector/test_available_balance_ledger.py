@@ -0,0 +1,89 @@
+import unittest
+from decimal import Decimal
+from typing import Dict
+from unittest.mock import MagicMock
+
+from hummingbot.connector.available_balance_ledger import AvailableBalanceLedger
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import OrderFilledEvent
+
+
+class AvailableBalanceLedgerTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.calculator = MagicMock(side_effect=self.locked_balances)
+        self.ledger = AvailableBalanceLedger(locked_balances_calculator=self.calculator)
+
+    @staticmethod
+    def locked_balances(orders: Dict) -> Dict[str, Decimal]:
+        return {"HBOT": Decimal(len(orders))} if orders is not None else {}
+
+    @staticmethod
+    def fill_event(timestamp: float, trade_type: TradeType, price: str, amount: str) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=timestamp,
+            order_id="OID1",
+            trading_pair="COINALPHA-HBOT",
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=Decimal(price),
+            amount=Decimal(amount),
+            trade_fee=AddedToCostTradeFee(),
+        )
+
+    def test_snapshot_locked_balance_calculated_once_per_snapshot(self):
+        snapshot = {"OID1": MagicMock()}
+
+        self.assertEqual(Decimal("1"), self.ledger.snapshot_locked_balance("HBOT", snapshot))
+        self.assertEqual(Decimal("0"), self.ledger.snapshot_locked_balance("COINALPHA", snapshot))
+        self.assertEqual(1, self.calculator.call_count)
+
+        new_snapshot = {"OID1": MagicMock(), "OID2": MagicMock()}
+        self.assertEqual(Decimal("2"), self.ledger.snapshot_locked_balance("HBOT", new_snapshot))
+        self.assertEqual(2, self.calculator.call_count)
+
+    def test_in_flight_locked_balance_recalculated_after_order_changes(self):
+        orders = {"OID1": MagicMock()}
+
+        self.assertEqual(Decimal("1"), self.ledger.in_flight_locked_balance("HBOT", orders))
+        self.assertEqual(Decimal("1"), self.ledger.in_flight_locked_balance("HBOT", orders))
+        self.assertEqual(1, self.calculator.call_count)
+
+        orders["OID2"] = MagicMock()
+        self.assertEqual(Decimal("2"), self.ledger.in_flight_locked_balance("HBOT", orders))
+        self.assertEqual(2, self.calculator.call_count)
+
+        self.ledger.mark_orders_changed()
+        self.ledger.in_flight_locked_balance("HBOT", orders)
+        self.assertEqual(3, self.calculator.call_count)
+
+    def test_fills_update_filled_balances(self):
+        self.ledger.record_fill(self.fill_event(1640000001, TradeType.BUY, "100", "2"))
+        self.ledger.record_fill(self.fill_event(1640000002, TradeType.SELL, "110", "0.5"))
+
+        self.assertEqual(Decimal("1.5"), self.ledger.filled_balance("COINALPHA"))
+        self.assertEqual(Decimal("-145"), self.ledger.filled_balance("HBOT"))
+        self.assertEqual(Decimal("1.5"), self.ledger.filled_balance_since_snapshot("COINALPHA", 0))
+        self.assertEqual(Decimal("0"), self.ledger.filled_balance("OTHER"))
+
+    def test_filled_balances_since_snapshot_rebuilt_when_snapshot_timestamp_changes(self):
+        self.ledger.filled_balance_since_snapshot("COINALPHA", 1640000000)
+        self.ledger.record_fill(self.fill_event(1630000000, TradeType.BUY, "100", "1"))
+        self.ledger.record_fill(self.fill_event(1640000001, TradeType.BUY, "100", "2"))
+        self.ledger.record_fill(self.fill_event(1640000005, TradeType.SELL, "110", "0.5"))
+
+        self.assertEqual(Decimal("1.5"), self.ledger.filled_balance_since_snapshot("COINALPHA", 1640000000))
+        self.assertEqual(Decimal("-0.5"), self.ledger.filled_balance_since_snapshot("COINALPHA", 1640000002))
+        self.assertEqual(Decimal("55"), self.ledger.filled_balance_since_snapshot("HBOT", 1640000002))
+        self.assertEqual(Decimal("2.5"), self.ledger.filled_balance("COINALPHA"))
+
+    def test_fill_invalidates_in_flight_locked_balances(self):
+        orders = {"OID1": MagicMock()}
+        self.ledger.in_flight_locked_balance("HBOT", orders)
+
+        self.ledger.record_fill(self.fill_event(1640000001, TradeType.BUY, "100", "2"))
+        self.ledger.in_flight_locked_balance("HBOT", orders)
+
+        self.assertEqual(2, self.calculator.call_count)
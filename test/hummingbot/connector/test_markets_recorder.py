@@ -8,7 +8,11 @@ from unittest.mock import patch
 import numpy as np
 from sqlalchemy import create_engine
 
-from hummingbot.client.config.client_config_map import ClientConfigMap, MarketDataCollectionConfigMap
+from hummingbot.client.config.client_config_map import (
+    ClientConfigMap,
+    MarketDataCollectionConfigMap,
+    MarketsRecorderConfigMap,
+)
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
@@ -67,6 +71,39 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def remove_listener(self, event_tag, listener):
+        pass
+
+    def _create_write_behind_recorder(self, batch_size: int = 100) -> MarketsRecorder:
+        return MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            markets_recorder_config=MarketsRecorderConfigMap(
+                write_behind_enabled=True,
+                write_behind_flush_interval=60,
+                write_behind_batch_size=batch_size,
+            ),
+        )
+
+    def _create_order_event(self, order_id: str) -> BuyOrderCreatedEvent:
+        return BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id=order_id,
+            creation_timestamp=1640001112.223,
+            exchange_order_id=f"E{order_id}",
+        )
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -356,3 +393,169 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(market_data[0].best_ask, Decimal("101"))
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
+
+    def test_write_behind_mode_queues_records_until_read(self):
+        recorder = self._create_write_behind_recorder()
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._create_order_event("OID1"))
+
+        self.assertTrue(recorder.write_behind_enabled)
+        self.assertEqual(1, recorder.pending_writes_count)
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, len(session.query(Order).all()))
+
+        orders = recorder.get_orders_for_config_and_market(self.config_file_path, self)
+
+        self.assertEqual(0, recorder.pending_writes_count)
+        self.assertEqual(1, len(orders))
+        self.assertEqual("OID1", orders[0].id)
+
+    def test_write_behind_mode_writes_fill_after_order_in_same_batch(self):
+        recorder = self._create_write_behind_recorder()
+        create_event = self._create_order_event("OID1")
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=Decimal(1010),
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+        trades = recorder.get_trades_for_config(self.config_file_path)
+
+        self.assertEqual(1, len(trades))
+        with self.manager.get_new_session() as session:
+            order = session.query(Order).one()
+            self.assertEqual(MarketEvent.OrderFilled.name, order.last_status)
+            self.assertEqual(2, len(order.status))
+
+    def test_write_behind_mode_flushes_in_batches(self):
+        recorder = self._create_write_behind_recorder(batch_size=2)
+
+        for i in range(5):
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._create_order_event(f"OID{i}"))
+
+        with patch.object(self.manager, "get_new_session", wraps=self.manager.get_new_session) as session_mock:
+            recorder.flush_pending_writes()
+            self.assertEqual(3, session_mock.call_count)
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(5, len(session.query(Order).all()))
+
+    def test_write_behind_mode_flushes_pending_records_on_stop(self):
+        recorder = self._create_write_behind_recorder()
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._create_order_event("OID1"))
+        recorder.stop()
+
+        self.assertEqual(0, recorder.pending_writes_count)
+        with self.manager.get_new_session() as session:
+            self.assertEqual(1, len(session.query(Order).all()))
+
+    def test_write_behind_mode_failed_record_does_not_drop_batch(self):
+        recorder = self._create_write_behind_recorder()
+        failed_attempts = []
+
+        def failing_write(session):
+            failed_attempts.append(session)
+            raise ValueError("Invalid record")
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._create_order_event("OID1"))
+        recorder._record(failing_write)
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._create_order_event("OID2"))
+
+        with patch.object(recorder.logger(), "error") as error_log_mock:
+            recorder.flush_pending_writes()
+
+            # The batch fails, then the records are written one by one and the failed one is kept for the next flush
+            self.assertEqual(2, len(failed_attempts))
+            self.assertEqual(1, recorder.pending_writes_count)
+            with self.manager.get_new_session() as session:
+                self.assertEqual(["OID1", "OID2"], sorted(order.id for order in session.query(Order).all()))
+
+            recorder.flush_pending_writes()
+            self.assertEqual(1, recorder.pending_writes_count)
+
+            recorder.flush_pending_writes()
+            self.assertEqual(0, recorder.pending_writes_count)
+            self.assertEqual(recorder.WRITE_BEHIND_MAX_ATTEMPTS + 1, len(failed_attempts))
+            self.assertIn("The record is discarded.", error_log_mock.call_args[0][0])
+
+    def test_write_behind_mode_retries_failed_records_on_stop(self):
+        recorder = self._create_write_behind_recorder()
+        attempts = []
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._create_order_event("OID1"))
+        write_order = recorder._pending_writes.get_nowait()
+
+        def flaky_write(session):
+            attempts.append(session)
+            if len(attempts) < recorder.WRITE_BEHIND_MAX_ATTEMPTS:
+                raise ValueError("Database is locked")
+            write_order(session)
+
+        recorder._record(flaky_write)
+        recorder.stop()
+
+        self.assertEqual(0, recorder.pending_writes_count)
+        with self.manager.get_new_session() as session:
+            self.assertEqual(1, len(session.query(Order).all()))
+
+    def test_write_behind_mode_trade_added_to_csv_once_committed(self):
+        recorder = self._create_write_behind_recorder()
+        create_event = self._create_order_event("OID1")
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=Decimal(1010),
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+
+        def failing_write(session):
+            raise ValueError("Invalid record")
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+        recorder._record(failing_write)
+
+        with patch.object(recorder, "_csv_sink") as csv_sink_mock:
+            with patch.object(recorder.logger(), "error"):
+                trades = recorder.get_trades_for_config(self.config_file_path)
+
+        # The failed batch is rolled back and written again record by record, the trade is added to the CSV only once
+        self.assertEqual(1, len(trades))
+        csv_sink_mock.return_value.write_row.assert_called_once()
+        self.assertEqual("TradeId1", csv_sink_mock.return_value.write_row.call_args[0][0][
+            TradeFill.attribute_names_for_file_export().index("exchange_trade_id")])
+
+    def test_write_behind_mode_retries_failed_records_before_newer_ones(self):
+        recorder = self._create_write_behind_recorder()
+        attempts = []
+        written = []
+
+        def flaky_write(session):
+            attempts.append(session)
+            if len(attempts) == 1:
+                raise ValueError("Database is locked")
+            written.append("first")
+
+        recorder._record(flaky_write)
+        with patch.object(recorder.logger(), "error"):
+            recorder.flush_pending_writes()
+        recorder._record(lambda session: written.append("second"))
+        recorder.flush_pending_writes()
+
+        self.assertEqual(["first", "second"], written)
+        self.assertEqual(0, recorder.pending_writes_count)
@@ -0,0 +1,94 @@
+import csv
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from hummingbot.connector.trade_fills_csv_sink import TradeFillsCsvSink
+
+
+class TradeFillsCsvSinkTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "trades_test_config.csv")
+        self.header = ("exchange_trade_id", "price", "age")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def read_rows(self, file_path: str):
+        with open(file_path, newline="") as file:
+            return list(csv.reader(file))
+
+    def old_files(self):
+        return [file_name for file_name in os.listdir(self.temp_dir.name) if "_old_" in file_name]
+
+    def test_header_written_once_for_new_file(self):
+        sink = TradeFillsCsvSink(file_path=self.file_path, header=self.header, flush_interval=0)
+
+        sink.write_row(("T1", 100, "n/a"))
+        sink.write_row(("T2", 101, "00:00:01"))
+        sink.close()
+
+        self.assertEqual([list(self.header), ["T1", "100", "n/a"], ["T2", "101", "00:00:01"]],
+                         self.read_rows(self.file_path))
+
+    def test_appends_to_existing_file_with_matching_header(self):
+        sink = TradeFillsCsvSink(file_path=self.file_path, header=self.header)
+        sink.write_row(("T1", 100, "n/a"))
+        sink.close()
+
+        sink = TradeFillsCsvSink(file_path=self.file_path, header=self.header)
+        sink.write_row(("T2", 101, "n/a"))
+        sink.close()
+
+        self.assertEqual(3, len(self.read_rows(self.file_path)))
+        self.assertEqual(0, len(self.old_files()))
+
+    def test_existing_file_with_different_header_is_moved_aside(self):
+        with open(self.file_path, "w", newline="") as file:
+            csv.writer(file).writerows([("exchange_trade_id", "price"), ("T0", 99)])
+
+        sink = TradeFillsCsvSink(file_path=self.file_path, header=self.header)
+        sink.write_row(("T1", 100, "n/a"))
+        sink.close()
+
+        self.assertEqual([list(self.header), ["T1", "100", "n/a"]], self.read_rows(self.file_path))
+        self.assertEqual(1, len(self.old_files()))
+
+    def test_rows_are_buffered_until_flush(self):
+        sink = TradeFillsCsvSink(file_path=self.file_path, header=self.header, flush_interval=60)
+        sink.write_row(("T1", 100, "n/a"))
+
+        self.assertEqual(0, os.path.getsize(self.file_path))
+
+        sink.flush()
+
+        self.assertEqual(2, len(self.read_rows(self.file_path)))
+        sink.close()
+
+    def test_file_rotated_when_size_limit_reached(self):
+        sink = TradeFillsCsvSink(file_path=self.file_path, header=self.header, max_file_size=30, flush_interval=0)
+
+        sink.write_row(("T1", 100, "n/a"))
+        sink.write_row(("T2", 101, "n/a"))
+        sink.close()
+
+        self.assertEqual(1, len(self.old_files()))
+        self.assertEqual([list(self.header), ["T2", "101", "n/a"]], self.read_rows(self.file_path))
+
+    @patch("hummingbot.connector.trade_fills_csv_sink.time.time")
+    def test_file_rotated_when_day_changes(self, time_mock):
+        sink = TradeFillsCsvSink(file_path=self.file_path, header=self.header, rotate_daily=True)
+
+        time_mock.return_value = 1640995199
+        sink.write_row(("T1", 100, "n/a"))
+        time_mock.return_value = 1640995200
+        sink.write_row(("T2", 101, "n/a"))
+        sink.close()
+
+        self.assertEqual(1, len(self.old_files()))
+        self.assertEqual([list(self.header), ["T2", "101", "n/a"]], self.read_rows(self.file_path))
@@ -12,6 +12,7 @@ from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
 from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.task_log_ledger import TaskLogLedger
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
 TEST_PATH_URL = "/hummingbot"
@@ -108,10 +109,10 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
     def test_flush_only_elapsed_tasks_are_flushed(self):
         lock = asyncio.Lock()
         rate_limit = self.rate_limits[0]
-        self.throttler._task_logs = [
-            TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight),
-            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight)
-        ]
+        self.throttler._task_logs = TaskLogLedger()
+        self.throttler._task_logs.append(TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight))
+        self.throttler._task_logs.append(
+            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
 
         self.assertEqual(2, len(self.throttler._task_logs))
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
@@ -243,7 +244,7 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         ])
 
         # Scenario where one specific task was executed at 0 milliseconds
-        tasks_log = []
+        tasks_log = TaskLogLedger()
         tasks_log.append(TaskLog(timestamp=1640000000.0000, rate_limit=per_millisecond_limit, weight=1))
         tasks_log.append(TaskLog(timestamp=1640000000.0000, rate_limit=per_second_limit, weight=1))
 
@@ -278,3 +279,55 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         time_mock.return_value = 1640000000.2100
         result = context.within_capacity()
         self.assertTrue(result)
+
+    def test_time_until_capacity_is_zero_when_within_capacity(self):
+        rate_limit, related_limits = self.throttler.get_related_limits(limit_id=TEST_PATH_URL)
+        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+                                      rate_limit=rate_limit,
+                                      related_limits=related_limits,
+                                      lock=asyncio.Lock(),
+                                      safety_margin_pct=self.throttler._safety_margin_pct)
+        self.assertEqual(0, context.time_until_capacity())
+
+    @patch("hummingbot.core.api_throttler.async_throttler.AsyncRequestContext._time")
+    def test_time_until_capacity_waits_for_oldest_blocking_task(self, time_mock):
+        rate_limit = RateLimit(limit_id="limit", limit=2, time_interval=1)
+        task_logs = TaskLogLedger()
+        task_logs.append(TaskLog(timestamp=1640000000.0, rate_limit=rate_limit, weight=1))
+        task_logs.append(TaskLog(timestamp=1640000000.5, rate_limit=rate_limit, weight=1))
+        context = AsyncRequestContext(task_logs=task_logs,
+                                      rate_limit=rate_limit,
+                                      related_limits=[],
+                                      lock=asyncio.Lock(),
+                                      safety_margin_pct=0)
+
+        time_mock.return_value = 1640000000.6
+        wait_time = context.time_until_capacity()
+        self.assertAlmostEqual(0.4, wait_time, places=5)
+
+        time_mock.return_value += wait_time
+        self.assertTrue(context.within_capacity())
+
+    def test_time_until_capacity_is_none_when_weight_exceeds_limit(self):
+        pool_limit = RateLimit(limit_id="pool", limit=2, time_interval=1)
+        task_limit = RateLimit(limit_id="task", limit=10, time_interval=1)
+        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+                                      rate_limit=task_limit,
+                                      related_limits=[(pool_limit, 3)],
+                                      lock=asyncio.Lock(),
+                                      safety_margin_pct=0)
+        self.assertIsNone(context.time_until_capacity())
+
+    def test_acquire_sleeps_until_capacity_is_freed(self):
+        rate_limit = RateLimit(limit_id="limit", limit=1, time_interval=0.2)
+        self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=1))
+        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+                                      rate_limit=rate_limit,
+                                      related_limits=[],
+                                      lock=asyncio.Lock(),
+                                      safety_margin_pct=0,
+                                      retry_interval=10)
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(context.acquire(), 1.0))
+
+        self.assertEqual(1, len(self.throttler._task_logs))
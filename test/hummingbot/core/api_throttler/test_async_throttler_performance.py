@@ -0,0 +1,69 @@
+import asyncio
+import logging
+import time
+import unittest
+from decimal import Decimal
+from typing import List
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+
+POOL_ID = "POOL"
+TASK_ID = "/task"
+QUEUED_TASKS = 10000
+REPETITIONS = 3
+
+
+class AsyncThrottlerPerformanceTests(unittest.TestCase):
+    """
+    Micro-benchmark of the throttler acquire latency with a large number of tasks logged in the current window.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=POOL_ID, limit=QUEUED_TASKS * 4, time_interval=60),
+            RateLimit(limit_id=TASK_ID, limit=QUEUED_TASKS * 4, time_interval=60,
+                      linked_limits=[LinkedLimitWeightPair(POOL_ID)]),
+        ]
+
+    def _throttler_with_queued_tasks(self, queued_tasks: int) -> AsyncThrottler:
+        throttler = AsyncThrottler(rate_limits=self.rate_limits, limits_share_percentage=Decimal("100"))
+        pool_limit, _ = throttler.get_related_limits(POOL_ID)
+        task_limit, _ = throttler.get_related_limits(TASK_ID)
+        now = time.time()
+        for _ in range(queued_tasks):
+            throttler._task_logs.append(TaskLog(timestamp=now, rate_limit=task_limit, weight=1))
+            throttler._task_logs.append(TaskLog(timestamp=now, rate_limit=pool_limit, weight=1))
+        return throttler
+
+    async def _acquire_many(self, throttler: AsyncThrottler, count: int):
+        for _ in range(count):
+            async with throttler.execute_task(limit_id=TASK_ID):
+                pass
+
+    def _average_acquire_latency(self, queued_tasks: int, acquisitions: int) -> float:
+        # Best of a few runs, to leave out the runs slowed down by other processes
+        latencies = []
+        for _ in range(REPETITIONS):
+            throttler = self._throttler_with_queued_tasks(queued_tasks)
+            start = time.perf_counter()
+            self.ev_loop.run_until_complete(self._acquire_many(throttler, acquisitions))
+            latencies.append((time.perf_counter() - start) / acquisitions)
+            self.assertEqual((queued_tasks + acquisitions) * 2, len(throttler._task_logs))
+        return min(latencies)
+
+    def test_acquire_latency_with_queued_tasks(self):
+        acquisitions = 1000
+
+        reference_latency = self._average_acquire_latency(0, acquisitions)
+        average_latency = self._average_acquire_latency(QUEUED_TASKS, acquisitions)
+
+        logging.getLogger(__name__).info(
+            f"Average acquire latency with {QUEUED_TASKS} queued tasks: {average_latency * 1e6:.2f} us "
+            f"(without queued tasks: {reference_latency * 1e6:.2f} us)")
+        # The latency does not depend on the number of logged tasks. A full scan of the task logs is more than a
+        # hundred times slower than the reference at this size.
+        self.assertLess(average_latency, reference_latency * 10)
@@ -3,6 +3,9 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessageType
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTopOfBookChangedEvent
 import numpy as np
 
 
@@ -50,6 +53,108 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_apply_numpy_diffs_with_explicit_update_id(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1]], dtype=np.float64),
+                                        np.array([[2, 1, 1]], dtype=np.float64),
+                                        update_id=10)
+        self.assertEqual(10, order_book.snapshot_uid)
+
+        order_book.apply_numpy_diffs(np.array([[1.5, 1, 11]], dtype=np.float64),
+                                     np.empty((0, 3), dtype=np.float64),
+                                     update_id=12)
+        self.assertEqual(12, order_book.last_diff_uid)
+        self.assertEqual(1.5, order_book.get_price(False))
+
+    def test_apply_numpy_messages(self):
+        order_book = OrderBook()
+        snapshot = NumpyOrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 1,
+            "bids": [["10", "1"], ["9", "2"]],
+            "asks": [["11", "1"], ["12", "2"]],
+        }, timestamp=1)
+        diff = NumpyOrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 2,
+            "bids": [["10", "0"]],
+            "asks": [["10.5", "3"]],
+        }, timestamp=2)
+
+        order_book.apply_snapshot_message(snapshot)
+        order_book.apply_diff_message(diff)
+
+        bids, asks = order_book.snapshot
+        self.assertEqual([9., 2., 1.], bids.iloc[0].tolist())
+        self.assertEqual([10.5, 3., 2.], asks.iloc[0].tolist())
+        self.assertEqual(1, order_book.snapshot_uid)
+        self.assertEqual(2, order_book.last_diff_uid)
+
+    def test_top_of_book_changed_event(self):
+        order_book = OrderBook()
+        listener = EventLogger()
+        order_book.add_listener(OrderBookEvent.TopOfBookChanged, listener)
+
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1]], dtype=np.float64),
+                                        np.array([[2, 1, 1]], dtype=np.float64),
+                                        update_id=1)
+        # A change below the top of the book is not notified
+        order_book.apply_numpy_diffs(np.array([[0.5, 1, 2]], dtype=np.float64),
+                                     np.array([[3, 1, 2]], dtype=np.float64),
+                                     update_id=2)
+        order_book.apply_numpy_diffs(np.array([[1.5, 1, 3]], dtype=np.float64),
+                                     np.zeros((0, 3), dtype=np.float64),
+                                     update_id=3)
+
+        self.assertEqual([OrderBookTopOfBookChangedEvent(1, 1.0, 2.0), OrderBookTopOfBookChangedEvent(3, 1.5, 2.0)],
+                         listener.event_log)
+
+    def test_depth_queries(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[99, 1, 1], [98, 2, 1], [97, 3, 1]], dtype=np.float64),
+                                        np.array([[101, 1, 1], [102, 2, 1], [103, 3, 1]], dtype=np.float64),
+                                        update_id=1)
+
+        self.assertEqual(102, order_book.get_price_for_volume(True, 2).result_price)
+        self.assertEqual(98, order_book.get_price_for_volume(False, 3).result_price)
+        self.assertTrue(np.isnan(order_book.get_price_for_volume(True, 10).result_price))
+        self.assertEqual(6, order_book.get_price_for_volume(True, 10).result_volume)
+        self.assertAlmostEqual((101 + 102 * 1.5) / 2.5, order_book.get_vwap_for_volume(True, 2.5).result_price)
+        self.assertEqual(2.5, order_book.get_vwap_for_volume(True, 2.5).result_volume)
+        self.assertEqual(102, order_book.get_price_for_quote_volume(True, 200).result_price)
+        self.assertEqual(99 + 98 * 0.5, order_book.get_quote_volume_for_base_amount(False, 1.5).result_volume)
+        self.assertEqual(99 + 98 * 2 + 97 * 3, order_book.get_quote_volume_for_base_amount(False, 10).result_volume)
+        self.assertEqual(3, order_book.get_volume_for_price(True, 102.5).result_volume)
+        self.assertEqual(102, order_book.get_volume_for_price(True, 102.5).result_price)
+        self.assertEqual(99 + 98 * 2, order_book.get_quote_volume_for_price(False, 98).result_volume)
+        self.assertEqual(0, order_book.get_volume_for_price(False, 100).result_volume)
+
+        # The depth index is rebuilt after the book changes
+        order_book.apply_numpy_diffs(np.zeros((0, 3), dtype=np.float64),
+                                     np.array([[101, 0, 2], [100.5, 4, 2]], dtype=np.float64),
+                                     update_id=2)
+
+        self.assertEqual(100.5, order_book.get_price_for_volume(True, 2).result_price)
+        self.assertEqual(102, order_book.get_price_for_volume(True, 5).result_price)
+
+    def test_batch_depth_queries(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[99, 1, 1], [98, 2, 1]], dtype=np.float64),
+                                        np.array([[101, 1, 1], [102, 2, 1]], dtype=np.float64),
+                                        update_id=1)
+        volumes = [0.5, 1, 2, 3]
+
+        def results(query_results):
+            return [(query_result.result_price, query_result.result_volume) for query_result in query_results]
+
+        self.assertEqual(results([order_book.get_price_for_volume(True, volume) for volume in volumes]),
+                         results(order_book.get_prices_for_volumes(True, volumes)))
+        self.assertEqual(results([order_book.get_vwap_for_volume(False, volume) for volume in volumes]),
+                         results(order_book.get_vwaps_for_volumes(False, volumes)))
+        self.assertEqual([99 * 0.5, 99, 99 + 98, 99 + 98 * 2],
+                         [query_result.result_volume
+                          for query_result in order_book.get_quote_volumes_for_base_amounts(False, volumes)])
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -1,7 +1,9 @@
 import time
 import unittest
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, \
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage, \
     OrderBookMessageType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -248,3 +250,36 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertTrue(diff1 < snapshot2)  # based on id
         self.assertTrue(trade1 < snapshot1)  # based on timestamp
         self.assertTrue(diff2 < trade1)  # if same ts, ob messages < trade messages
+
+    def test_numpy_message_parses_levels_once_into_arrays(self):
+        msg = NumpyOrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "trading_pair": "COINALPHA-HBOT",
+                "update_id": 5,
+                "bids": [["10.5", "1.25"], ["10", "0"]],
+                "asks": [["11", "2", "extraField"]],
+            },
+            timestamp=time.time(),
+        )
+
+        self.assertEqual(np.float64, msg.bids_array.dtype)
+        self.assertTrue(msg.bids_array.flags["C_CONTIGUOUS"])
+        self.assertEqual([[10.5, 1.25, 5], [10, 0, 5]], msg.bids_array.tolist())
+        self.assertEqual([[11, 2, 5]], msg.asks_array.tolist())
+        self.assertIs(msg.bids_array, msg.bids_array)
+
+    def test_numpy_message_rows_compatible_with_order_book_message(self):
+        content = {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 5,
+            "bids": [["10.5", "1.25"]],
+            "asks": [],
+        }
+        msg = NumpyOrderBookMessage(OrderBookMessageType.SNAPSHOT, content, timestamp=time.time())
+        expected = OrderBookMessage(OrderBookMessageType.SNAPSHOT, content, timestamp=time.time())
+
+        self.assertEqual(expected.bids, msg.bids)
+        self.assertEqual([], msg.asks)
+        self.assertEqual((0, 3), msg.asks_array.shape)
+        self.assertEqual(["10.5", "1.25"], content["bids"][0])
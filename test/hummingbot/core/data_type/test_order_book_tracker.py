@@ -0,0 +1,191 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker, coalesce_levels, coalesce_numpy_levels
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pairs = ["COINALPHA-HBOT", "COINBETA-HBOT", "COINGAMMA-HBOT"]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_source = MagicMock()
+        self.data_source.get_new_order_book = AsyncMock(side_effect=lambda trading_pair: OrderBook())
+        self.tracker = OrderBookTracker(
+            data_source=self.data_source,
+            trading_pairs=self.trading_pairs,
+            max_concurrent_initializations=2)
+        self.tracker._sleep = AsyncMock()
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_concurrent_initialization_does_not_sleep_between_pairs(self):
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_books.keys()))
+        self.tracker._sleep.assert_not_called()
+
+    def test_concurrent_initialization_respects_max_concurrency(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_new_order_book(trading_pair: str):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return OrderBook()
+
+        self.data_source.get_new_order_book = get_new_order_book
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertEqual(2, max_in_flight)
+        self.assertTrue(self.tracker.ready)
+
+    def test_order_book_ready_per_trading_pair(self):
+        blocked_pair_event = asyncio.Event()
+
+        async def get_new_order_book(trading_pair: str):
+            if trading_pair == self.trading_pairs[-1]:
+                await blocked_pair_event.wait()
+            return OrderBook()
+
+        self.data_source.get_new_order_book = get_new_order_book
+
+        init_task = self.ev_loop.create_task(self.tracker._init_order_books())
+        self.async_run_with_timeout(self.tracker.wait_order_book_ready(self.trading_pairs[0]))
+
+        self.assertTrue(self.tracker.is_order_book_ready(self.trading_pairs[0]))
+        self.assertFalse(self.tracker.is_order_book_ready(self.trading_pairs[-1]))
+        self.assertFalse(self.tracker.ready)
+
+        blocked_pair_event.set()
+        self.async_run_with_timeout(init_task)
+
+        self.assertTrue(self.tracker.is_order_book_ready(self.trading_pairs[-1]))
+        self.assertTrue(self.tracker.ready)
+
+    def test_failed_snapshot_request_is_retried(self):
+        self.data_source.get_new_order_book = AsyncMock(side_effect=[Exception("Test error"),
+                                                                     OrderBook(),
+                                                                     OrderBook(),
+                                                                     OrderBook()])
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(4, self.data_source.get_new_order_book.call_count)
+        self.tracker._sleep.assert_called_once_with(delay=5.0)
+
+    def test_sequential_initialization_when_no_concurrency_configured(self):
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+        tracker._sleep = AsyncMock()
+
+        self.async_run_with_timeout(tracker._init_order_books())
+
+        self.assertTrue(tracker.ready)
+        self.assertEqual(len(self.trading_pairs), tracker._sleep.call_count)
+        tracker.stop()
+
+    def _diff_message(self, update_id: int, bids, asks, message_class=OrderBookMessage):
+        return message_class(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pairs[0],
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=update_id)
+
+    def _track_pending_messages(self, tracker: OrderBookTracker, messages):
+        trading_pair = self.trading_pairs[0]
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(10, 1, 1)], [OrderBookRow(11, 1, 1)], 1)
+        tracker._order_books[trading_pair] = order_book
+        tracker._tracking_message_queues[trading_pair] = asyncio.Queue()
+        for message in messages:
+            tracker._tracking_message_queues[trading_pair].put_nowait(message)
+
+        async def track_until_processed():
+            task = self.ev_loop.create_task(tracker._track_single_book(trading_pair))
+            while tracker._tracking_message_queues[trading_pair].qsize() > 0:
+                await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            task.cancel()
+
+        self.async_run_with_timeout(track_until_processed())
+        return order_book
+
+    def test_coalesce_levels_last_update_wins(self):
+        levels = coalesce_levels([
+            [OrderBookRow(10, 1, 2), OrderBookRow(9, 1, 2)],
+            [OrderBookRow(10, 0, 3)],
+        ])
+
+        self.assertEqual([OrderBookRow(10, 0, 3), OrderBookRow(9, 1, 2)], levels)
+
+    def test_coalesce_numpy_levels_last_update_wins(self):
+        levels = coalesce_numpy_levels([
+            np.array([[10, 1, 2], [9, 1, 2]], dtype=np.float64),
+            np.array([[10, 0, 3]], dtype=np.float64),
+        ])
+
+        self.assertEqual([[9, 1, 2], [10, 0, 3]], levels.tolist())
+
+    def test_pending_diffs_applied_as_single_update_when_coalescing(self):
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs, coalesce_diffs=True)
+        messages = [
+            self._diff_message(2, [["10", "0"], ["9.5", "2"]], [], message_class=NumpyOrderBookMessage),
+            self._diff_message(3, [["9.5", "3"]], [["10.5", "1"]], message_class=NumpyOrderBookMessage),
+            self._diff_message(4, [], [["10.5", "4"]], message_class=NumpyOrderBookMessage),
+        ]
+
+        order_book = self._track_pending_messages(tracker, messages)
+
+        stats = tracker.tracking_stats[self.trading_pairs[0]]
+        self.assertEqual(3, stats.diff_messages_processed)
+        self.assertEqual(1, stats.diff_updates_applied)
+        self.assertEqual(3, stats.coalescing_ratio)
+        self.assertEqual(2, stats.max_queue_depth)
+        self.assertEqual(9.5, order_book.get_price(False))
+        self.assertEqual(10.5, order_book.get_price(True))
+        self.assertEqual(4, order_book.last_diff_uid)
+        bids, asks = order_book.snapshot
+        self.assertEqual([9.5, 3., 3.], bids.iloc[0].tolist())
+        self.assertEqual([10.5, 4., 4.], asks.iloc[0].tolist())
+        self.assertEqual(3, len(tracker._past_diffs_windows[self.trading_pairs[0]]))
+
+    def test_pending_diffs_applied_one_by_one_without_coalescing(self):
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+        messages = [
+            self._diff_message(2, [["10", "0"], ["9.5", "2"]], []),
+            self._diff_message(3, [["9.5", "3"]], [["10.5", "1"]]),
+        ]
+
+        order_book = self._track_pending_messages(tracker, messages)
+
+        stats = tracker.tracking_stats[self.trading_pairs[0]]
+        self.assertEqual(2, stats.diff_messages_processed)
+        self.assertEqual(2, stats.diff_updates_applied)
+        self.assertEqual(1, stats.coalescing_ratio)
+        self.assertEqual(9.5, order_book.get_price(False))
+        self.assertEqual(3, order_book.last_diff_uid)
@@ -41,6 +41,7 @@ class GatewayHttpClientUnitTest(unittest.TestCase):
     async def test_ping_gateway(self):
         result: bool = await GatewayHttpClient.get_instance().ping_gateway()
         self.assertTrue(result)
+        self.assertGreater(GatewayHttpClient.get_instance().latency_histograms["GET "].count, 0)
 
     @async_test(loop=ev_loop)
     async def test_get_gateway_status(self):
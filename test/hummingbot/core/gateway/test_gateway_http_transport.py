@@ -0,0 +1,40 @@
+import unittest
+
+from hummingbot.core.gateway.gateway_http_transport import GatewayLatencyHistogram, GatewayRouteClass, get_route_class
+
+
+class GatewayHttpTransportTest(unittest.TestCase):
+    def test_get_route_class(self):
+        self.assertEqual(GatewayRouteClass.TRADING, get_route_class("post", "amm/trade"))
+        self.assertEqual(GatewayRouteClass.TRADING, get_route_class("DELETE", "clob/orders"))
+        self.assertEqual(GatewayRouteClass.POLLING, get_route_class("get", "clob/orders"))
+        self.assertEqual(GatewayRouteClass.POLLING, get_route_class("post", "amm/price"))
+        self.assertEqual(GatewayRouteClass.POLLING, get_route_class("get", ""))
+
+    def test_latency_histogram(self):
+        histogram = GatewayLatencyHistogram()
+
+        self.assertIsNone(histogram.percentile_ms(50))
+
+        for latency in [0.0005, 0.003, 0.003, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.3]:
+            histogram.record(latency)
+
+        self.assertEqual(10, histogram.count)
+        self.assertEqual(1, histogram.counts[0])
+        self.assertEqual(2, histogram.counts[2])
+        self.assertEqual(6, histogram.counts[4])
+        self.assertAlmostEqual(300, histogram.max_ms)
+        self.assertAlmostEqual(42.65, histogram.mean_ms)
+        self.assertEqual(5, histogram.percentile_ms(30))
+        self.assertEqual(25, histogram.percentile_ms(50))
+        self.assertEqual(25, histogram.percentile_ms(90))
+        self.assertAlmostEqual(300, histogram.percentile_ms(99))
+
+    def test_latency_histogram_above_last_bound(self):
+        histogram = GatewayLatencyHistogram(bucket_bounds_ms=(1, 10))
+
+        histogram.record(0.05)
+
+        self.assertEqual([0, 0, 1], histogram.counts)
+        self.assertAlmostEqual(50, histogram.percentile_ms(50))
+        self.assertEqual(1, histogram.to_dict()["count"])
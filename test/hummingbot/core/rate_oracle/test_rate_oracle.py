@@ -10,7 +10,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGeckoRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateGraph, find_rate
 
 
 class DummyRateSource(RateSourceBase):
@@ -101,3 +101,74 @@ class RateOracleTest(unittest.TestCase):
         config_map.global_token.global_token_name = "EUR"
 
         self.assertEqual(0, len(rate_oracle.prices))
+
+    def test_rate_graph_find_rate(self):
+        prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
+        graph = RateGraph()
+        graph.update(prices)
+
+        self.assertEqual(Decimal("100"), graph.find_rate("HBOT-USDT"))
+        self.assertIsNone(graph.find_rate("ZBOT-USDT"))
+        self.assertEqual(Decimal("0.01"), graph.find_rate("USDT-HBOT"))
+        self.assertEqual(Decimal("2"), graph.find_rate("HBOT-AAVE"))
+        self.assertEqual(Decimal("0.5"), graph.find_rate("AAVE-HBOT"))
+        self.assertEqual(Decimal("75"), graph.find_rate("HBOT-GBP"))
+
+    def test_rate_graph_update_is_incremental_and_resets_cached_rates(self):
+        prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50")}
+        graph = RateGraph()
+        graph.update(prices)
+        generation = graph.generation
+        self.assertEqual(Decimal("2"), graph.find_rate("HBOT-AAVE"))
+
+        graph.update(dict(prices))
+        self.assertEqual(generation, graph.generation)
+
+        graph.update({"HBOT-USDT": Decimal("200")})
+        self.assertEqual(generation + 1, graph.generation)
+        self.assertIsNone(graph.find_rate("HBOT-AAVE"))
+        self.assertEqual(Decimal("200"), graph.find_rate("HBOT-USDT"))
+
+    def test_rate_graph_multi_hop_rate(self):
+        prices = {"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75"), "GBP-JPY": Decimal("150")}
+        graph = RateGraph()
+        graph.update(prices)
+
+        self.assertIsNone(graph.find_rate("HBOT-JPY"))
+
+        graph.max_hops = 3
+
+        self.assertEqual(Decimal("11250"), graph.find_rate("HBOT-JPY"))
+        self.assertAlmostEqual(Decimal("1") / Decimal("11250"), graph.find_rate("JPY-HBOT"), places=20)
+        self.assertIsNone(graph.find_rate("HBOT-EUR"))
+
+    def test_get_pair_rate_uses_replaced_prices(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+        rate_oracle._prices = {"HBOT-USDT": Decimal("100")}
+        self.assertEqual(Decimal("100"), rate_oracle.get_pair_rate("HBOT-USDT"))
+
+        rate_oracle._prices = {"HBOT-USDT": Decimal("50")}
+        self.assertEqual(Decimal("50"), rate_oracle.get_pair_rate("HBOT-USDT"))
+
+    def test_get_pair_rate_uses_prices_updated_in_place(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+        rate_oracle._prices = {"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75")}
+        self.assertEqual(Decimal("75"), rate_oracle.get_pair_rate("HBOT-GBP"))
+
+        rate_oracle._prices["HBOT-USDT"] = Decimal("50")
+        self.assertEqual(Decimal("37.5"), rate_oracle.get_pair_rate("HBOT-GBP"))
+
+    def test_rate_graph_synced_with_prices_version(self):
+        graph = RateGraph()
+        self.assertFalse(graph.is_synced_with(1))
+
+        graph.update({"HBOT-USDT": Decimal("100")}, 1)
+        self.assertTrue(graph.is_synced_with(1))
+        self.assertFalse(graph.is_synced_with(2))
+
+    def test_get_pair_rate_multi_hop(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}), max_hops=3)
+        rate_oracle._prices = {"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75"), "GBP-JPY": Decimal("150")}
+
+        self.assertEqual(3, rate_oracle.max_hops)
+        self.assertEqual(Decimal("11250"), rate_oracle.get_pair_rate("HBOT-JPY"))
@@ -0,0 +1,43 @@
+import logging
+import time
+import unittest
+from test.mock.mock_events import MockEvent, MockEventType
+
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.pubsub import PubSub
+
+LISTENER_COUNTS = [1, 10, 100]
+EVENTS = 10000
+
+
+class CountingListener(EventListener):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def __call__(self, arg):
+        self.count += 1
+
+
+class PubSubPerformanceTests(unittest.TestCase):
+    """
+    Micro-benchmark of the events triggered per second by the number of listeners of the event.
+    """
+
+    def test_events_per_second_by_listener_count(self):
+        event = MockEvent(payload=1)
+        for listener_count in LISTENER_COUNTS:
+            pubsub = PubSub()
+            listeners = [CountingListener() for _ in range(listener_count)]
+            for listener in listeners:
+                pubsub.add_listener(MockEventType.EVENT_ZERO, listener)
+
+            start = time.perf_counter()
+            for _ in range(EVENTS):
+                pubsub.trigger_event(MockEventType.EVENT_ZERO, event)
+            elapsed = time.perf_counter() - start
+
+            logging.getLogger(__name__).info(
+                f"{EVENTS / elapsed:.0f} events per second with {listener_count} listeners "
+                f"({elapsed / (EVENTS * listener_count) * 1e9:.0f} ns per listener call)")
+            self.assertTrue(all(listener.count == EVENTS for listener in listeners))
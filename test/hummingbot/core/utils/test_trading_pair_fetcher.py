@@ -1,7 +1,10 @@
 import asyncio
 import json
+import time
 import unittest
 from decimal import Decimal
+from os.path import join
+from tempfile import TemporaryDirectory
 from typing import Any, Awaitable, Dict
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -31,6 +34,25 @@ class TestTradingPairFetcher(unittest.TestCase):
             else:
                 await asyncio.sleep(0)
 
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache_dir = TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.cache_path = join(self.cache_dir.name, TradingPairFetcher.CACHE_FILE_NAME)
+        cache_path_patch = patch(
+            "hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._cache_path",
+            return_value=self.cache_path)
+        cache_path_patch.start()
+        self.addCleanup(cache_path_patch.stop)
+
+    def write_cache(self, cache: Dict[str, Any]):
+        with open(self.cache_path, "w") as cache_file:
+            json.dump(cache, cache_file)
+
+    def read_cache(self) -> Dict[str, Any]:
+        with open(self.cache_path) as cache_file:
+            return json.load(cache_file)
+
     def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
         ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
         return ret
@@ -88,6 +110,157 @@ class TestTradingPairFetcher(unittest.TestCase):
         self.assertEqual(2, len(trading_pairs))
         self.assertEqual({"mockConnector": ["MOCK-HBOT"], "mock_paper_trade": ["MOCK-HBOT"]}, trading_pairs)
 
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_fetched_trading_pairs_saved_in_cache(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+            "mock_paper_trade": self.MockConnectorSetting(name="mock_paper_trade", parent_name="mock_exchange_1")
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        # The paper trade connector reuses the trading pairs of its parent connector
+        connector.all_trading_pairs.assert_awaited_once()
+        cache = self.read_cache()
+        self.assertEqual(["mock_exchange_1"], list(cache.keys()))
+        self.assertEqual(["MOCK-HBOT"], cache["mock_exchange_1"]["trading_pairs"])
+        self.assertAlmostEqual(time.time(), cache["mock_exchange_1"]["timestamp"], delta=10)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_fresh_cached_trading_pairs_not_fetched(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+            "mock_paper_trade": self.MockConnectorSetting(name="mock_paper_trade", parent_name="mock_exchange_1")
+        }
+        self.write_cache({"mock_exchange_1": {"timestamp": time.time(), "trading_pairs": ["CACHED-HBOT"]}})
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        connector.all_trading_pairs.assert_not_awaited()
+        self.assertTrue(trading_pair_fetcher.ready)
+        self.assertEqual(
+            {"mock_exchange_1": ["CACHED-HBOT"], "mock_paper_trade": ["CACHED-HBOT"]},
+            trading_pair_fetcher.trading_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_cached_trading_pairs_available_before_refresh(self, mock_connector_settings):
+        refresh_allowed = asyncio.Event()
+
+        async def all_trading_pairs():
+            await refresh_allowed.wait()
+            return ["MOCK-HBOT"]
+
+        connector = MagicMock()
+        connector.all_trading_pairs.side_effect = all_trading_pairs
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+        }
+        expired_timestamp = time.time() - TradingPairFetcher.CACHE_TTL - 1
+        self.write_cache({"mock_exchange_1": {"timestamp": expired_timestamp, "trading_pairs": ["CACHED-HBOT"]}})
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher))
+
+        self.assertEqual({"mock_exchange_1": ["CACHED-HBOT"]}, trading_pair_fetcher.trading_pairs)
+
+        refresh_allowed.set()
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        self.assertEqual({"mock_exchange_1": ["MOCK-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        self.assertEqual(["MOCK-HBOT"], self.read_cache()["mock_exchange_1"]["trading_pairs"])
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_cached_trading_pairs_kept_when_refresh_fails(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.side_effect = IOError("Network error")
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+        }
+        expired_timestamp = time.time() - TradingPairFetcher.CACHE_TTL - 1
+        self.write_cache({"mock_exchange_1": {"timestamp": expired_timestamp, "trading_pairs": ["CACHED-HBOT"]}})
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        self.assertEqual({"mock_exchange_1": ["CACHED-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        self.assertEqual(expired_timestamp, self.read_cache()["mock_exchange_1"]["timestamp"])
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_cached_trading_pairs_kept_when_refresh_returns_no_pairs(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = []
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+        }
+        expired_timestamp = time.time() - TradingPairFetcher.CACHE_TTL - 1
+        self.write_cache({"mock_exchange_1": {"timestamp": expired_timestamp, "trading_pairs": ["CACHED-HBOT"]}})
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        connector.all_trading_pairs.assert_called_once()
+        self.assertEqual({"mock_exchange_1": ["CACHED-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        self.assertEqual(
+            {"mock_exchange_1": {"timestamp": expired_timestamp, "trading_pairs": ["CACHED-HBOT"]}},
+            self.read_cache())
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_invalid_cache_ignored(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+        }
+        with open(self.cache_path, "w") as cache_file:
+            cache_file.write("{invalid json")
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        self.assertEqual({"mock_exchange_1": ["MOCK-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        self.assertEqual(["MOCK-HBOT"], self.read_cache()["mock_exchange_1"]["trading_pairs"])
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher.MAX_CONCURRENT_FETCHES", 2)
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_concurrent_fetches_bounded(self, mock_connector_settings):
+        running_fetches = 0
+        max_running_fetches = 0
+
+        async def all_trading_pairs():
+            nonlocal running_fetches, max_running_fetches
+            running_fetches += 1
+            max_running_fetches = max(max_running_fetches, running_fetches)
+            await asyncio.sleep(0.01)
+            running_fetches -= 1
+            return ["MOCK-HBOT"]
+
+        connector_settings = {}
+        for i in range(6):
+            connector = MagicMock()
+            connector.all_trading_pairs.side_effect = all_trading_pairs
+            connector_settings[f"mock_exchange_{i}"] = self.MockConnectorSetting(
+                name=f"mock_exchange_{i}", connector=connector)
+        mock_connector_settings.return_value = connector_settings
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        self.assertEqual(2, max_running_fetches)
+        self.assertEqual(6, len(trading_pair_fetcher.trading_pairs))
+
     @aioresponses()
     @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
     @patch("hummingbot.core.gateway.gateway_http_client.GatewayHttpClient.get_perp_markets")
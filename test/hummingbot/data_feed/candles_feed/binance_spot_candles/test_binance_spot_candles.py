@@ -9,6 +9,7 @@ from aioresponses import aioresponses
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles, constants as CONSTANTS
+from hummingbot.data_feed.candles_feed.incremental_indicators import EMAIndicator
 
 
 class TestBinanceSpotCandles(unittest.TestCase):
@@ -178,6 +179,34 @@ class TestBinanceSpotCandles(unittest.TestCase):
     def test_candles_empty(self):
         self.assertTrue(self.data_feed.candles_df.empty)
 
+    def test_candles_df_cached_until_candles_change(self):
+        self.data_feed._candles.append([1672981200000, "16823.24", "16823.63", "16792.12", "16810.18", "6230.44034",
+                                        "104737787.36", 162086, "3058.60695", "51418990.63"])
+        self.data_feed._build_candles_df = MagicMock(wraps=self.data_feed._build_candles_df)
+        candles_df = self.data_feed.candles_df
+        candles_df["new_column"] = 1
+        candles_df["close"] *= 2
+        candles_df.loc[0, "open"] = 0
+
+        self.assertNotIn("new_column", self.data_feed.candles_df.columns)
+        self.assertEqual(16810.18, self.data_feed.candles_df["close"].iloc[0])
+        self.assertEqual(16823.24, self.data_feed.candles_df["open"].iloc[0])
+        self.assertEqual(1, self.data_feed._build_candles_df.call_count)
+
+        self.data_feed._candles.pop()
+        self.data_feed._candles.append([1672981200000, "16823.24", "16830", "16792.12", "16829.5", "6300",
+                                        "104737787.36", 162100, "3058.60695", "51418990.63"])
+
+        self.assertEqual(16829.5, self.data_feed.candles_df["close"].iloc[-1])
+        self.assertEqual(2, self.data_feed._build_candles_df.call_count)
+
+    def test_incremental_indicator_updated_with_candles(self):
+        self.data_feed.add_indicator("ema", EMAIndicator(length=2))
+        for timestamp, close in [(1672981200000, 100), (1672984800000, 102)]:
+            self.data_feed._candles.append([timestamp, close, close, close, close, 1, 1, 1, 1, 1])
+
+        self.assertAlmostEqual(100 + 2 * 2 / 3, self.data_feed.get_indicator_value("ema"))
+
     @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_listen_for_subscriptions_subscribes_to_klines(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
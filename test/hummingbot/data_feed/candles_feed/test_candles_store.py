@@ -0,0 +1,88 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.data_feed.candles_feed.incremental_indicators import EMAIndicator
+
+COLUMNS = ["timestamp", "open", "high", "low", "close", "volume"]
+
+
+class CandlesStoreTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.store = CandlesStore(columns=COLUMNS, maxlen=3)
+
+    @staticmethod
+    def candle(timestamp: int, close: float):
+        return [timestamp, close, close, close, close, 1]
+
+    def test_append_keeps_the_latest_candles(self):
+        for timestamp in range(5):
+            self.store.append(self.candle(timestamp, 100 + timestamp))
+
+        self.assertEqual(3, len(self.store))
+        self.assertEqual([2, 3, 4], self.store.column("timestamp").tolist())
+        self.assertEqual(2, self.store[0][0])
+        self.assertEqual(4, self.store[-1][0])
+
+    def test_append_converts_string_values(self):
+        self.store.append([1, "100.5", "101", "99", "100", "10"])
+
+        self.assertEqual(np.float64, self.store.to_numpy().dtype)
+        self.assertEqual(100.5, self.store[-1][1])
+
+    def test_pop_and_append_replaces_last_candle(self):
+        self.store.append(self.candle(1, 100))
+        self.store.append(self.candle(2, 101))
+
+        popped = self.store.pop()
+        self.store.append(self.candle(2, 102))
+
+        self.assertEqual(101, popped[4])
+        self.assertEqual([100, 102], self.store.column("close").tolist())
+
+    def test_extendleft_adds_older_candles(self):
+        self.store.append(self.candle(3, 103))
+        self.store.extendleft([self.candle(2, 102), self.candle(1, 101)])
+
+        self.assertEqual([1, 2, 3], self.store.column("timestamp").tolist())
+        self.assertEqual(3, len(self.store))
+
+    def test_version_changes_with_each_modification(self):
+        versions = [self.store.version]
+        self.store.append(self.candle(1, 100))
+        versions.append(self.store.version)
+        self.store.pop()
+        versions.append(self.store.version)
+        self.store.clear()
+        versions.append(self.store.version)
+
+        self.assertEqual(len(versions), len(set(versions)))
+
+    def test_indicator_updated_with_new_and_updated_candles(self):
+        store = CandlesStore(columns=COLUMNS, maxlen=10)
+        store.add_indicator("ema", EMAIndicator(length=2))
+        for timestamp, close in enumerate([100, 102, 101]):
+            store.append(self.candle(timestamp, close))
+        # Update of the last candle
+        store.pop()
+        store.append(self.candle(2, 104))
+
+        expected = np.array([100, 102, 104], dtype=float)
+        expected_ema = expected[0]
+        for value in expected[1:]:
+            expected_ema += (value - expected_ema) * 2 / 3
+        self.assertAlmostEqual(expected_ema, store.get_indicator("ema").value, 10)
+
+    def test_indicator_recalculated_after_extendleft(self):
+        store = CandlesStore(columns=COLUMNS, maxlen=10)
+        store.add_indicator("ema", EMAIndicator(length=2))
+        store.append(self.candle(3, 104))
+        store.extendleft([self.candle(2, 102), self.candle(1, 100)])
+
+        reference = EMAIndicator(length=2)
+        for value in [100, 102, 104]:
+            reference.update(value)
+        self.assertAlmostEqual(reference.value, store.get_indicator("ema").value, 10)
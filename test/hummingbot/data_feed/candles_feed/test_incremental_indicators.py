@@ -0,0 +1,79 @@
+import math
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.incremental_indicators import (
+    BollingerBandsIndicator,
+    EMAIndicator,
+    MACDIndicator,
+    RSIIndicator,
+)
+
+
+class IncrementalIndicatorsTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        np.random.seed(3141592653)
+        self.closes = pd.Series(100 + np.cumsum(np.random.normal(0, 1, 200)))
+
+    @staticmethod
+    def feed(indicator, values):
+        for value in values:
+            indicator.update(value)
+        return indicator
+
+    def test_ema(self):
+        indicator = EMAIndicator(length=10)
+        self.assertTrue(math.isnan(self.feed(indicator, self.closes[:9]).value))
+
+        self.feed(indicator, self.closes[9:])
+
+        expected = self.closes.ewm(span=10, adjust=False).mean().iloc[-1]
+        self.assertAlmostEqual(expected, indicator.value, 8)
+
+    def test_rsi(self):
+        indicator = self.feed(RSIIndicator(length=14), self.closes)
+
+        changes = self.closes.diff().fillna(0)
+        average_gain = changes.clip(lower=0).ewm(alpha=1 / 14, adjust=False).mean().iloc[-1]
+        average_loss = (-changes).clip(lower=0).ewm(alpha=1 / 14, adjust=False).mean().iloc[-1]
+        expected = 100 - 100 / (1 + average_gain / average_loss)
+        self.assertAlmostEqual(expected, indicator.value, 8)
+
+    def test_macd(self):
+        indicator = self.feed(MACDIndicator(fast=12, slow=26, signal=9), self.closes)
+
+        macd_line = (self.closes.ewm(span=12, adjust=False).mean()
+                     - self.closes.ewm(span=26, adjust=False).mean())
+        signal = macd_line[25:].ewm(span=9, adjust=False).mean().iloc[-1]
+        macd, macd_signal, histogram = indicator.value
+        self.assertAlmostEqual(macd_line.iloc[-1], macd, 8)
+        self.assertAlmostEqual(signal, macd_signal, 8)
+        self.assertAlmostEqual(macd_line.iloc[-1] - signal, histogram, 8)
+
+    def test_bollinger_bands(self):
+        indicator = self.feed(BollingerBandsIndicator(length=20, std_multiplier=2), self.closes)
+
+        window = self.closes.iloc[-20:]
+        lower, middle, upper = indicator.value
+        self.assertAlmostEqual(window.mean(), middle, 8)
+        self.assertAlmostEqual(window.mean() + 2 * window.std(ddof=0), upper, 8)
+        self.assertAlmostEqual(window.mean() - 2 * window.std(ddof=0), lower, 8)
+
+    def test_revert_last_update(self):
+        for indicator in (EMAIndicator(length=5), RSIIndicator(length=5), MACDIndicator(fast=3, slow=6, signal=3),
+                          BollingerBandsIndicator(length=5)):
+            self.feed(indicator, self.closes[:50])
+            expected = indicator.value
+            indicator.update(1000)
+            indicator.revert()
+
+            self.assertEqual(expected, indicator.value)
+            self.assertFalse(indicator.can_revert)
+
+    def test_revert_without_update_raises_error(self):
+        with self.assertRaises(ValueError):
+            EMAIndicator(length=5).revert()
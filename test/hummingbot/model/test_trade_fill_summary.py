@@ -0,0 +1,168 @@
+from decimal import Decimal
+from unittest import TestCase
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from hummingbot.core.data_type.common import PositionAction
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.model import get_declarative_base
+from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_summary import TradeFillSummary
+
+
+class TradeFillSummaryTests(TestCase):
+    config_file_path = "test_config.yml"
+    market = "binance"
+    base = "COINALPHA"
+    quote = "HBOT"
+    trading_pair = f"{base}-{quote}"
+
+    def setUp(self) -> None:
+        super().setUp()
+        engine = create_engine("sqlite://")
+        get_declarative_base().metadata.create_all(engine)
+        self.session = sessionmaker(bind=engine)()
+        self.trades_count = 0
+
+    def tearDown(self) -> None:
+        self.session.close()
+        super().tearDown()
+
+    def add_trade(self, timestamp: int, trade_type: str, price: str, amount: str, trade_fee=None,
+                  position: str = PositionAction.NIL.value, config_file_path: str = config_file_path):
+        self.trades_count += 1
+        trade_fee = trade_fee or AddedToCostTradeFee(percent=Decimal("0.01"))
+        self.session.add(TradeFill(
+            config_file_path=config_file_path,
+            strategy="pure_market_making",
+            market=self.market,
+            symbol=self.trading_pair,
+            base_asset=self.base,
+            quote_asset=self.quote,
+            timestamp=timestamp,
+            order_id=f"OID{self.trades_count}",
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=Decimal(price),
+            amount=Decimal(amount),
+            leverage=1,
+            trade_fee=trade_fee.to_json(),
+            exchange_trade_id=f"EID{self.trades_count}",
+            position=position,
+        ))
+        self.session.commit()
+
+    def summaries_by_side(self, summaries):
+        return {summary.trade_type: summary for summary in summaries}
+
+    def test_aggregate_trade_fills_by_side(self):
+        self.add_trade(1000, "BUY", "10", "2")
+        self.add_trade(2000, "BUY", "12", "1", AddedToCostTradeFee(flat_fees=[TokenAmount("BNB", Decimal("0.5"))]))
+        self.add_trade(3000, "SELL", "11", "4", DeductedFromReturnsTradeFee(percent=Decimal("0.02")))
+        self.add_trade(4000, "BUY", "9", "1", AddedToCostTradeFee(flat_fees=[TokenAmount("BNB", Decimal("0.5"))]))
+        self.add_trade(5000, "BUY", "100", "1", config_file_path="other_config.yml")
+        self.add_trade(500, "BUY", "100", "1")
+
+        summaries = self.summaries_by_side(
+            TradeFillSummary.get_summaries(self.session, self.config_file_path, start_timestamp=1000, persist=False))
+
+        buys = summaries["BUY"]
+        self.assertEqual(3, buys.num_trades)
+        self.assertEqual(Decimal("4"), buys.base_volume)
+        self.assertEqual(Decimal("41"), buys.quote_volume)
+        self.assertEqual(Decimal("0.2"), buys.percent_fees_in_quote)
+        self.assertEqual(Decimal("0"), buys.deducted_fees_in_quote)
+        self.assertEqual({"BNB": "1.0"}, buys.flat_fees)
+        self.assertEqual((1000, Decimal("10")), (buys.first_timestamp, buys.first_price))
+        self.assertEqual((4000, Decimal("9")), (buys.last_timestamp, buys.last_price))
+
+        sells = summaries["SELL"]
+        self.assertEqual(1, sells.num_trades)
+        self.assertEqual(Decimal("44"), sells.quote_volume)
+        self.assertEqual(Decimal("0.88"), sells.percent_fees_in_quote)
+        self.assertEqual(Decimal("0.88"), sells.deducted_fees_in_quote)
+        self.assertFalse(TradeFillSummary.are_derivatives(summaries.values()))
+        self.assertEqual(0, self.session.query(TradeFillSummary).count())
+
+    def test_stored_summaries_only_aggregate_new_trade_fills(self):
+        self.add_trade(1000, "BUY", "10", "2")
+        self.add_trade(2000, "SELL", "11", "1")
+
+        summaries = TradeFillSummary.get_summaries(self.session, self.config_file_path, start_timestamp=1000)
+
+        self.assertEqual(2, len(summaries))
+        self.assertEqual(2, self.session.query(TradeFillSummary).count())
+
+        self.add_trade(3000, "BUY", "12", "1")
+        self.add_trade(4000, "BUY", "13", "1")
+
+        summaries = self.summaries_by_side(
+            TradeFillSummary.get_summaries(self.session, self.config_file_path, start_timestamp=1000))
+
+        self.assertEqual(2, self.session.query(TradeFillSummary).count())
+        buys = summaries["BUY"]
+        self.assertEqual(3, buys.num_trades)
+        self.assertEqual(Decimal("4"), buys.base_volume)
+        self.assertEqual(Decimal("45"), buys.quote_volume)
+        self.assertAlmostEqual(Decimal("0.45"), buys.percent_fees_in_quote, places=12)
+        self.assertEqual((4000, Decimal("13")), (buys.last_timestamp, buys.last_price))
+        self.assertEqual((1000, Decimal("10")), (buys.first_timestamp, buys.first_price))
+        self.assertEqual(1, summaries["SELL"].num_trades)
+
+    def test_are_derivatives_when_all_trades_of_a_side_have_positions(self):
+        self.add_trade(1000, "BUY", "10", "2", position=PositionAction.OPEN.value)
+        self.add_trade(2000, "SELL", "11", "2", position=PositionAction.CLOSE.value)
+
+        summaries = TradeFillSummary.get_summaries(self.session, self.config_file_path, start_timestamp=0)
+
+        self.assertTrue(TradeFillSummary.are_derivatives(summaries))
+        self.assertTrue(all(summary.num_nil_position_trades == 0 for summary in summaries))
+
+    def test_stored_summaries_aggregate_trade_fills_recorded_late(self):
+        self.add_trade(1000, "BUY", "10", "2")
+        self.add_trade(2000, "BUY", "11", "1")
+
+        TradeFillSummary.get_summaries(self.session, self.config_file_path, start_timestamp=1000)
+
+        # A fill with the same timestamp as the last summarized one, and a fill that arrived out of order
+        self.add_trade(2000, "BUY", "12", "1")
+        self.add_trade(1500, "BUY", "9", "1")
+        self.add_trade(500, "BUY", "100", "1")
+
+        buys = self.summaries_by_side(
+            TradeFillSummary.get_summaries(self.session, self.config_file_path, start_timestamp=1000))["BUY"]
+
+        self.assertEqual(4, buys.num_trades)
+        self.assertEqual(Decimal("5"), buys.base_volume)
+        self.assertEqual(Decimal("52"), buys.quote_volume)
+        self.assertEqual((1000, Decimal("10")), (buys.first_timestamp, buys.first_price))
+        self.assertEqual(2000, buys.last_timestamp)
+
+        aggregated = self.summaries_by_side(
+            TradeFillSummary.get_summaries(self.session, self.config_file_path, start_timestamp=1000, persist=False))
+        self.assertEqual(aggregated["BUY"].num_trades, buys.num_trades)
+        self.assertEqual(aggregated["BUY"].quote_volume, buys.quote_volume)
+
+    def test_quote_volume_calculated_with_decimals(self):
+        self.add_trade(1000, "BUY", "0.123457", "123456.789012")
+        self.add_trade(2000, "BUY", "0.123457", "0.000001")
+        self.add_trade(3000, "BUY", "98765.432101", "3.3")
+
+        buys = self.summaries_by_side(
+            TradeFillSummary.get_summaries(self.session, self.config_file_path, start_timestamp=0))["BUY"]
+
+        expected_quote_volume = (Decimal("0.123457") * Decimal("123456.789013")
+                                 + Decimal("98765.432101") * Decimal("3.3"))
+        self.assertEqual(expected_quote_volume, buys.quote_volume)
+
+    def test_are_derivatives_when_trades_have_no_position(self):
+        self.add_trade(1000, "BUY", "10", "2")
+        self.add_trade(2000, "SELL", "11", "2")
+        # Stored without position, e.g. by versions that didn't record it
+        self.session.query(TradeFill).update({TradeFill.position: None})
+        self.session.commit()
+
+        summaries = TradeFillSummary.get_summaries(self.session, self.config_file_path, start_timestamp=0)
+
+        self.assertTrue(TradeFillSummary.are_derivatives(summaries))
@@ -13,7 +13,15 @@ from hummingbot.client.hummingbot_application import HummingbotApplication
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
-from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketEvent, OrderExpiredEvent, SellOrderCreatedEvent
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderExpiredEvent,
+    OrderFilledEvent,
+    RangePositionFeeCollectedEvent,
+    SellOrderCreatedEvent,
+)
 from hummingbot.core.mock_api.mock_mqtt_server import FakeMQTTBroker
 from hummingbot.model.order import Order
 from hummingbot.model.trade_fill import TradeFill
@@ -953,6 +961,85 @@ class RemoteIfaceMQTTTests(TestCase):
         self.ev_loop.run_until_complete(self.wait_for_rcv(events_topic, evt_type, msg_key = 'type'))
         self.assertTrue(self.is_msg_received(events_topic, evt_type, msg_key = 'type'))
 
+    @patch("commlib.transports.mqtt.MQTTTransport")
+    def test_mqtt_event_batching(self,
+                                 mock_mqtt):
+        mqtt_bridge = self.client_config_map.mqtt_bridge
+        mqtt_bridge.mqtt_events_batching = True
+        self.addCleanup(setattr, mqtt_bridge, "mqtt_events_batching", False)
+        self.start_mqtt(mock_mqtt=mock_mqtt)
+
+        for i, is_buy in enumerate([True, False]):
+            order = LimitOrder(client_order_id=f"HBOT_{i}",
+                               trading_pair="HBOT-USDT",
+                               is_buy=is_buy,
+                               base_currency="HBOT",
+                               quote_currency="USDT",
+                               price=Decimal("100"),
+                               quantity=Decimal("1.5")
+                               )
+            self.emit_order_created_event(self.test_market, order)
+
+        events_topic = f"hbot/{self.instance_id}/events"
+
+        self.ev_loop.run_until_complete(self.wait_for_rcv(events_topic, "batch", msg_key = 'type'))
+        batch = self.fake_mqtt_broker.received_msgs[events_topic][-1]['events']
+        self.assertEqual(["BuyOrderCreated", "SellOrderCreated"], [event['type'] for event in batch])
+        self.assertEqual(["HBOT_0", "HBOT_1"], [event['data']['order_id'] for event in batch])
+        self.assertEqual(1, self.gateway._market_events.queue_metrics['sent_batches'])
+        self.assertEqual(0, self.gateway._market_events.queue_metrics['queue_size'])
+
+    @patch("commlib.transports.mqtt.MQTTTransport")
+    def test_mqtt_event_batching_full_queue(self,
+                                            mock_mqtt):
+        mqtt_bridge = self.client_config_map.mqtt_bridge
+        mqtt_bridge.mqtt_events_batching = True
+        mqtt_bridge.mqtt_events_queue_size = 2
+        self.addCleanup(setattr, mqtt_bridge, "mqtt_events_batching", False)
+        self.addCleanup(setattr, mqtt_bridge, "mqtt_events_queue_size", 10000)
+        self.start_mqtt(mock_mqtt=mock_mqtt)
+        market_events = self.gateway._market_events
+
+        market_events._enqueue_event(1, "OrderCancelled", {'order_id': 'OID1'})
+        market_events._enqueue_event(2, "OrderFilled", {'order_id': 'OID2'})
+        # The queue is full, the event is merged with the queued one of the same type and order
+        market_events._enqueue_event(3, "OrderCancelled", {'order_id': 'OID1', 'exchange_order_id': 'EOID1'})
+        # Fills are never merged, the oldest event is dropped instead
+        market_events._enqueue_event(4, "OrderFilled", {'order_id': 'OID2'})
+
+        self.assertEqual([[None, 2, "OrderFilled", {'order_id': 'OID2'}],
+                          [None, 4, "OrderFilled", {'order_id': 'OID2'}]],
+                         list(market_events._queue))
+        metrics = market_events.queue_metrics
+        self.assertEqual(2, metrics['queue_size'])
+        self.assertEqual(1, metrics['merged_events'])
+        self.assertEqual(1, metrics['dropped_events'])
+
+        self.gateway._publish_health()
+        hb_topic = f"hbot/{self.instance_id}/hb"
+        self.ev_loop.run_until_complete(self.wait_for_rcv(hb_topic, metrics, msg_key='events_queue'))
+
+    @patch("commlib.transports.mqtt.MQTTTransport")
+    def test_mqtt_event_serializers(self,
+                                    mock_mqtt):
+        self.start_mqtt(mock_mqtt=mock_mqtt)
+        from dataclasses import asdict
+        market_events = self.gateway._market_events
+        fee = AddedToCostTradeFee(percent=Decimal("0.01"), flat_fees=[TokenAmount("HBOT", Decimal("1"))])
+        test_events = [
+            BuyOrderCreatedEvent(1, OrderType.LIMIT, "HBOT-USDT", Decimal("1.5"), Decimal("100"), "OID1", 1),
+            RangePositionFeeCollectedEvent(1, "OID1", "EOID1", "HBOT-USDT", fee, 1),
+            OrderFilledEvent(1, "OID1", "HBOT-USDT", TradeType.BUY, OrderType.LIMIT, Decimal("100"), Decimal("1"),
+                             fee),
+        ]
+
+        for event in test_events:
+            serializer = market_events._create_event_serializer(type(event))
+            expected = market_events._make_event_payload(
+                event._asdict() if isinstance(event, tuple) else asdict(event))
+            self.assertEqual(expected, serializer(event))
+        self.assertIsNone(market_events._create_event_serializer(dict))
+
     @patch("commlib.transports.mqtt.MQTTTransport")
     def test_mqtt_subscribed_topics(self,
                                     mock_mqtt):
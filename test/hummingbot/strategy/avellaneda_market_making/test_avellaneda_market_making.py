@@ -27,7 +27,10 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
 )
 from hummingbot.strategy.__utils__.trailing_indicators.instant_volatility import InstantVolatilityIndicator
-from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import (
+    FIT_METHOD_DOGBOX,
+    TradingIntensityIndicator,
+)
 from hummingbot.strategy.avellaneda_market_making import AvellanedaMarketMakingStrategy
 from hummingbot.strategy.avellaneda_market_making.avellaneda_market_making_config_map_pydantic import (
     AvellanedaMarketMakingConfigMap,
@@ -131,7 +134,8 @@ class AvellanedaMarketMakingUnitTests(unittest.TestCase):
         self.trading_intensity_indicator: TradingIntensityIndicator = TradingIntensityIndicator(
             order_book=self.market_info.order_book,
             price_delegate=self.price_delegate,
-            sampling_length=20)
+            sampling_length=20,
+            fit_method=FIT_METHOD_DOGBOX)
 
         self.strategy.avg_vol = self.avg_vol_indicator
 
@@ -376,6 +376,59 @@ class HedgedMarketMakingUnitTest(unittest.TestCase):
         self.assertAlmostEqual(Decimal("3.0"), maker_fill.amount)
         self.assertAlmostEqual(Decimal("3.0"), taker_fill.amount)
 
+    @patch("hummingbot.client.settings.AllConnectorSettings.get_exchange_names")
+    @patch("hummingbot.client.settings.AllConnectorSettings.get_connector_settings")
+    def test_maker_fill_hedged_without_waiting_for_tick(self, get_connector_settings_mock, get_exchange_names_mock):
+        get_exchange_names_mock.return_value = set(self.get_mock_connector_settings().keys())
+        get_connector_settings_mock.return_value = self.get_mock_connector_settings()
+
+        self.clock.backtest_til(self.start_timestamp + 5)
+        if len(self.maker_order_created_logger.event_log) == 0:
+            self.async_run_with_timeout(self.maker_order_created_logger.wait_for(BuyOrderCreatedEvent))
+
+        bid_order: LimitOrder = self.strategy.active_maker_bids[0][1]
+        self.simulate_maker_market_trade(False, Decimal("10.0"), bid_order.price * Decimal("0.99"))
+
+        # The taker order is placed from the fill event, before the next tick
+        self.assertEqual(1, len(self.maker_order_fill_logger.event_log))
+        self.assertEqual(1, len(self.strategy._taker_to_maker_order_ids))
+        self.assertEqual(bid_order.client_order_id, list(self.strategy._taker_to_maker_order_ids.values())[0])
+        self.assertEqual(1, self.strategy.fill_to_hedge_latency_stats["count"])
+        self.assertGreaterEqual(self.strategy.fill_to_hedge_latency_stats["max"], 0)
+        self.assertEqual(0, len(self.strategy._fill_received_times))
+
+    def test_unhedged_fill_received_times_dropped_after_max_age(self):
+        max_age = self.strategy.FILL_RECEIVED_TIME_MAX_AGE
+        self.strategy.record_fill_received_time("trade_1", 0)
+        self.strategy.record_fill_received_time("trade_2", 10)
+        self.strategy.record_fill_received_time("trade_3", max_age)
+
+        self.assertEqual(["trade_1", "trade_2", "trade_3"], list(self.strategy._fill_received_times))
+
+        self.strategy.record_fill_received_time("trade_4", max_age + 5)
+
+        self.assertEqual(["trade_2", "trade_3", "trade_4"], list(self.strategy._fill_received_times))
+
+    @patch('hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making.'
+           'CrossExchangeMarketMakingStrategy.is_gateway_market')
+    def test_gateway_hedge_price_from_recent_quote(self, is_gateway_mock: unittest.mock.Mock):
+        is_gateway_mock.return_value = False
+        self.clock.backtest_til(self.start_timestamp + 1)
+        is_gateway_mock.return_value = True
+
+        self.strategy.set_hedge_quote(self.market_pair, True, Decimal("3"), Decimal("1.01"))
+
+        self.assertEqual(Decimal("1.01"), self.strategy.get_hedge_price(self.market_pair, True, Decimal("2")))
+        self.assertIsNone(self.strategy.get_hedge_price(self.market_pair, True, Decimal("4")))
+        self.assertIsNone(self.strategy.get_hedge_price(self.market_pair, False, Decimal("2")))
+
+        amount, price, timestamp = self.strategy._hedge_quotes[(self.market_pair, True)]
+        self.strategy._hedge_quotes[(self.market_pair, True)] = (
+            amount, price, timestamp - self.strategy.HEDGE_QUOTE_MAX_AGE - 1
+        )
+
+        self.assertIsNone(self.strategy.get_hedge_price(self.market_pair, True, Decimal("2")))
+
     def test_top_depth_tolerance(self):  # TODO
         self.clock.remove_iterator(self.strategy)
         self.clock.add_iterator(self.strategy_with_top_depth_tolerance)
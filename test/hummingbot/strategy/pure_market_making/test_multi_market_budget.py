@@ -0,0 +1,36 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.strategy.pure_market_making.multi_market_budget import MultiMarketBudget
+
+
+class MultiMarketBudgetTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.budget = MultiMarketBudget()
+
+    def test_reservations_of_other_trading_pairs_reduce_available_balance(self):
+        self.budget.reserve("ETH-USDT", "USDT", Decimal("300"))
+        self.budget.reserve("BTC-USDT", "USDT", Decimal("200"))
+        self.budget.reserve("BTC-USDT", "BTC", Decimal("1"))
+
+        self.assertEqual(Decimal("500"), self.budget.available("LTC-USDT", "USDT", Decimal("1000")))
+        self.assertEqual(Decimal("800"), self.budget.available("ETH-USDT", "USDT", Decimal("1000")))
+        self.assertEqual(Decimal("2"), self.budget.available("BTC-USDT", "BTC", Decimal("2")))
+        self.assertEqual(Decimal("0"), self.budget.available("LTC-USDT", "USDT", Decimal("100")))
+
+    def test_reservations_of_the_same_trading_pair_add_up(self):
+        self.budget.reserve("ETH-USDT", "USDT", Decimal("300"))
+        self.budget.reserve("ETH-USDT", "USDT", Decimal("100"))
+        self.budget.reserve("ETH-USDT", "USDT", Decimal("0"))
+
+        self.assertEqual(Decimal("400"), self.budget.reserved("USDT"))
+        self.assertEqual(Decimal("0"), self.budget.reserved("USDT", excluded_trading_pair="ETH-USDT"))
+
+    def test_new_cycle_clears_reservations(self):
+        self.budget.reserve("ETH-USDT", "USDT", Decimal("300"))
+
+        self.budget.start_cycle()
+
+        self.assertEqual(Decimal("1000"), self.budget.available("BTC-USDT", "USDT", Decimal("1000")))
+        self.assertEqual({}, self.budget.reservations)
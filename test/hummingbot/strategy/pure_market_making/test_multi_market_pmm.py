@@ -0,0 +1,93 @@
+import unittest
+from decimal import Decimal
+
+import pandas as pd
+
+from hummingbot.client.command.config_command import ConfigCommand
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making import (
+    MultiMarketBudget,
+    MultiMarketPureMarketMakingStrategy,
+    PureMarketMakingStrategy,
+)
+
+
+class MultiMarketPMMUnitTest(unittest.TestCase):
+    start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
+    end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
+    start_timestamp: float = start.timestamp()
+    end_timestamp: float = end.timestamp()
+    trading_pairs = ["HBOT-ETH", "COINALPHA-ETH"]
+    quote_asset = "ETH"
+
+    def setUp(self):
+        self.clock: Clock = Clock(ClockMode.BACKTEST, 1, self.start_timestamp, self.end_timestamp)
+        self.market: MockPaperExchange = MockPaperExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap())
+        )
+        for trading_pair in self.trading_pairs:
+            self.market.set_balanced_order_book(trading_pair,
+                                                mid_price=100,
+                                                min_price=1,
+                                                max_price=200,
+                                                price_step_size=1,
+                                                volume_step_size=10)
+            self.market.set_quantization_param(QuantizationParams(trading_pair, 6, 6, 6, 6))
+        self.market.set_balance("HBOT", 0)
+        self.market.set_balance("COINALPHA", 0)
+        self.clock.add_iterator(self.market)
+
+        self.budget = MultiMarketBudget()
+        self.strategies = {}
+        for trading_pair in self.trading_pairs:
+            base_asset, quote_asset = trading_pair.split("-")
+            strategy = PureMarketMakingStrategy()
+            strategy.init_params(
+                MarketTradingPairTuple(self.market, trading_pair, base_asset, quote_asset),
+                bid_spread=Decimal("0.01"),
+                ask_spread=Decimal("0.01"),
+                order_amount=Decimal("1"),
+                order_refresh_time=5.0,
+                filled_order_delay=5.0,
+                order_refresh_tolerance_pct=-1,
+                minimum_spread=-1,
+                budget=self.budget,
+            )
+            self.strategies[trading_pair] = strategy
+        self.multi_market_strategy = MultiMarketPureMarketMakingStrategy()
+        self.multi_market_strategy.init_params(strategies=self.strategies,
+                                               budget=self.budget,
+                                               market_overrides={"COINALPHA-ETH": {"bid_spread": "2"}})
+        self.clock.add_iterator(self.multi_market_strategy)
+
+    def test_shared_balance_split_across_trading_pairs(self):
+        # Enough for the buy order of one trading pair (1 at 99 ETH), and half of the other one
+        self.market.set_balance(self.quote_asset, Decimal("148.5"))
+
+        self.clock.backtest_til(self.start_timestamp + 1)
+
+        first_buys = self.strategies["HBOT-ETH"].active_buys
+        second_buys = self.strategies["COINALPHA-ETH"].active_buys
+        self.assertEqual(1, len(first_buys))
+        self.assertEqual(Decimal("1"), first_buys[0].quantity)
+        # The second trading pair only gets the balance not used by the first one
+        self.assertEqual(1, len(second_buys))
+        self.assertEqual(Decimal("0.5"), second_buys[0].quantity)
+        self.assertEqual(Decimal("0"), self.market.get_available_balance(self.quote_asset))
+
+    def test_config_updates_trading_pairs_without_override(self):
+        updated = ConfigCommand.update_running_multi_market_mm(self.multi_market_strategy, "bid_spread", Decimal("3"))
+
+        self.assertTrue(updated)
+        self.assertEqual(Decimal("0.03"), self.strategies["HBOT-ETH"].bid_spread)
+        self.assertEqual(Decimal("0.01"), self.strategies["COINALPHA-ETH"].bid_spread)
+
+        updated = ConfigCommand.update_running_multi_market_mm(self.multi_market_strategy, "order_amount", Decimal("2"))
+
+        self.assertTrue(updated)
+        self.assertTrue(all(strategy.order_amount == Decimal("2") for strategy in self.strategies.values()))
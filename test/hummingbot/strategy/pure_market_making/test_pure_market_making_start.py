@@ -59,7 +59,7 @@ class PureMarketMakingStartTest(unittest.TestCase):
         c_map.get("ask_order_level_amounts").value = None
 
     def _initialize_market_assets(self, market, trading_pairs):
-        return [("ETH", "USDT")]
+        return [tuple(trading_pair.split("-")) for trading_pair in trading_pairs]
 
     def _initialize_markets(self, market_names):
         pass
@@ -105,3 +105,22 @@ class PureMarketMakingStartTest(unittest.TestCase):
         self.assertEqual(self.strategy.order_override, {"split_level_0": ['buy', Decimal("1"), Decimal("1")],
                                                         "split_level_1": ['buy', Decimal("2"), Decimal("2")],
                                                         })
+
+    def test_multi_market_strategy_creation(self):
+        c_map.get("split_order_levels_enabled").value = False
+        c_map.get("additional_markets").value = "BTC-USDT, ETH-USDT,LTC-USDT"
+        c_map.get("market_overrides").value = {"BTC-USDT": {"bid_spread": 0.5, "order_levels": "1"}}
+
+        strategy_start.start(self)
+
+        self.assertEqual(["ETH-USDT", "BTC-USDT", "LTC-USDT"], list(self.strategy.strategies.keys()))
+        eth_strategy = self.strategy.strategies["ETH-USDT"]
+        btc_strategy = self.strategy.strategies["BTC-USDT"]
+        self.assertEqual(Decimal("0.01"), eth_strategy.bid_spread)
+        self.assertEqual(2, eth_strategy.order_levels)
+        self.assertEqual(Decimal("0.005"), btc_strategy.bid_spread)
+        self.assertEqual(Decimal("0.02"), btc_strategy.ask_spread)
+        self.assertEqual(1, btc_strategy.order_levels)
+        self.assertEqual("BTC", btc_strategy.base_asset)
+        self.assertTrue(all(strategy.budget is self.strategy.budget for strategy in self.strategy.strategies.values()))
+        self.assertIs(eth_strategy.asset_price_delegate.market, btc_strategy.asset_price_delegate.market)
@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+from typing import Awaitable
+
+from hummingbot.strategy.order_book_change_debouncer import OrderBookChangeDebouncer
+
+
+class OrderBookChangeDebouncerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.now = 1000.0
+        self.callbacks = []
+        self.debouncer = OrderBookChangeDebouncer(self.callbacks.append, min_interval=0.05, time_func=lambda: self.now)
+
+    def tearDown(self) -> None:
+        self.debouncer.cancel()
+        self.ev_loop.close()
+        super().tearDown()
+
+    def run_async(self, coroutine: Awaitable):
+        return self.ev_loop.run_until_complete(coroutine)
+
+    def test_changes_in_the_same_loop_iteration_are_delivered_together(self):
+        self.debouncer.notify("book_a")
+        self.debouncer.notify("book_b")
+        self.debouncer.notify("book_a")
+
+        self.assertTrue(self.debouncer.is_scheduled)
+        self.assertEqual([], self.callbacks)
+
+        self.run_async(asyncio.sleep(0))
+
+        self.assertEqual([{"book_a", "book_b"}], self.callbacks)
+        self.assertFalse(self.debouncer.is_scheduled)
+        self.assertEqual(set(), self.debouncer.pending_order_books)
+
+    def test_changes_before_min_interval_are_delayed(self):
+        self.debouncer.notify("book_a")
+        self.run_async(asyncio.sleep(0))
+
+        self.now += 0.01
+        self.debouncer.notify("book_b")
+        self.run_async(asyncio.sleep(0))
+
+        self.assertEqual([{"book_a"}], self.callbacks)
+        self.assertEqual({"book_b"}, self.debouncer.pending_order_books)
+
+        self.run_async(asyncio.sleep(0.06))
+
+        self.assertEqual([{"book_a"}, {"book_b"}], self.callbacks)
+
+    def test_cancel_discards_pending_changes(self):
+        self.debouncer.notify("book_a")
+        self.debouncer.cancel()
+        self.run_async(asyncio.sleep(0))
+
+        self.assertEqual([], self.callbacks)
+        self.assertFalse(self.debouncer.is_scheduled)
+
+    def test_negative_min_interval_not_allowed(self):
+        with self.assertRaises(ValueError):
+            self.debouncer.min_interval = -1
@@ -181,6 +181,55 @@ class OrderTrackerUnitTests(unittest.TestCase):
 
         self.assertTrue(len(self.order_tracker.active_asks) == len(self.limit_orders) / 2)
 
+    def test_active_order_views_reused_until_orders_change(self):
+        for order in self.limit_orders[:4]:
+            self.simulate_place_order(self.order_tracker, order, self.market_info)
+            self.simulate_order_created(self.order_tracker, order)
+
+        active_limit_orders = self.order_tracker.active_limit_orders
+        active_bids = self.order_tracker.active_bids
+        market_pair_to_active_orders = self.order_tracker.market_pair_to_active_orders
+
+        self.assertIs(active_limit_orders, self.order_tracker.active_limit_orders)
+        self.assertIs(active_bids, self.order_tracker.active_bids)
+        self.assertIs(market_pair_to_active_orders, self.order_tracker.market_pair_to_active_orders)
+
+        self.simulate_place_order(self.order_tracker, self.limit_orders[4], self.market_info)
+
+        self.assertIsNot(active_limit_orders, self.order_tracker.active_limit_orders)
+        self.assertEqual(4, len(active_limit_orders))
+        self.assertEqual(5, len(self.order_tracker.active_limit_orders))
+        self.assertEqual(3, len(self.order_tracker.active_bids))
+        self.assertEqual(2, len(self.order_tracker.active_asks))
+        self.assertEqual(5, len(self.order_tracker.market_pair_to_active_orders[self.market_info]))
+
+        self.simulate_stop_tracking_order(self.order_tracker, self.limit_orders[0], self.market_info)
+
+        self.assertEqual(4, len(self.order_tracker.active_limit_orders))
+        self.assertNotIn(self.limit_orders[0].client_order_id,
+                         [order.client_order_id for _, order in self.order_tracker.active_bids])
+
+    def test_active_order_views_reinstate_orders_with_expired_cancel(self):
+        for order in self.limit_orders[:2]:
+            self.simulate_place_order(self.order_tracker, order, self.market_info)
+            self.simulate_order_created(self.order_tracker, order)
+
+        order_to_cancel = self.limit_orders[0]
+        self.simulate_cancel_order(self.order_tracker, order_to_cancel)
+
+        self.assertEqual(1, len(self.order_tracker.active_limit_orders))
+        self.assertEqual(0, len(self.order_tracker.active_bids))
+        self.assertEqual([self.limit_orders[1].client_order_id],
+                         [order.client_order_id
+                          for order in self.order_tracker.market_pair_to_active_orders[self.market_info]])
+
+        # Simulate in-flight cancel has expired
+        self.clock.backtest_til(self.start_timestamp + OrderTracker.CANCEL_EXPIRY_DURATION + 1)
+
+        self.assertEqual(2, len(self.order_tracker.active_limit_orders))
+        self.assertEqual([order_to_cancel.client_order_id],
+                         [order.client_order_id for _, order in self.order_tracker.active_bids])
+
     def test_tracked_limit_orders(self):
         # Check initial output
         self.assertTrue(len(self.order_tracker.tracked_limit_orders) == 0)
@@ -0,0 +1,110 @@
+import logging
+import math
+import time
+import unittest
+from statistics import mean
+
+import numpy as np
+
+from hummingbot.strategy.__utils__.multi_market_rolling_window import MultiMarketRollingWindow
+
+
+class MultiMarketRollingWindowTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 3141592653
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+
+    @staticmethod
+    def expected_volatility(prices, interval: int, period: int) -> float:
+        prices = prices[-interval * period:]
+        if len(prices) < interval:
+            return (max(prices) - min(prices)) / min(prices)
+        ranges = []
+        for end in range(len(prices), interval - 1, -interval):
+            interval_prices = prices[end - interval:end]
+            ranges.append((max(interval_prices) - min(interval_prices)) / min(interval_prices))
+        return mean(ranges)
+
+    def test_volatility_of_complete_intervals(self):
+        interval, period = 5, 3
+        window = MultiMarketRollingWindow(["ETH-USDT", "BTC-USDT"], interval, period)
+        samples = np.random.uniform(90, 110, (40, 2))
+
+        for i, sample in enumerate(samples):
+            window.add_samples(list(sample))
+            if i + 1 < 2:
+                continue
+            volatilities = window.volatilities()
+            for market_index in range(2):
+                expected = self.expected_volatility(list(samples[:i + 1, market_index]), interval, period)
+                self.assertAlmostEqual(expected, volatilities[market_index], 12)
+
+    def test_volatility_before_first_complete_interval(self):
+        window = MultiMarketRollingWindow(["ETH-USDT"], 300, 10)
+
+        window.add_samples([100])
+        self.assertTrue(math.isnan(window.volatility("ETH-USDT")))
+
+        window.add_samples([105])
+        window.add_samples([110])
+        self.assertAlmostEqual(0.1, window.volatility("ETH-USDT"))
+
+    def test_nan_prices_left_out(self):
+        window = MultiMarketRollingWindow(["ETH-USDT"], 2, 2)
+
+        for price in [100, float("nan"), 110, 105]:
+            window.add_samples([price])
+
+        # Intervals [nan, 110] and [110, 105]
+        self.assertAlmostEqual(mean([0, 5 / 105]), window.volatility("ETH-USDT"))
+
+        window.add_samples([float("nan")])
+        window.add_samples([float("nan")])
+
+        # Intervals [110, 105] and [nan, nan]
+        self.assertAlmostEqual(5 / 105, window.volatility("ETH-USDT"))
+
+        window.add_samples([float("nan")])
+        window.add_samples([float("nan")])
+
+        self.assertTrue(math.isnan(window.volatility("ETH-USDT")))
+
+    def test_get_prices_in_window(self):
+        window = MultiMarketRollingWindow(["ETH-USDT", "BTC-USDT"], 2, 2)
+
+        for price in range(1, 4):
+            window.add_samples([price, price * 10])
+        self.assertEqual([1, 2, 3], list(window.get_prices("ETH-USDT")))
+
+        for price in range(4, 7):
+            window.add_samples([price, price * 10])
+        self.assertEqual([3, 4, 5, 6], list(window.get_prices("ETH-USDT")))
+        self.assertEqual([30, 40, 50, 60], list(window.get_prices("BTC-USDT")))
+        self.assertEqual(6, window.sample_count)
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            MultiMarketRollingWindow(["ETH-USDT"], 0, 10)
+        window = MultiMarketRollingWindow(["ETH-USDT"], 10, 10)
+        with self.assertRaises(ValueError):
+            window.add_samples([1, 2])
+
+    def test_sample_time_by_market_count(self):
+        """
+        Micro-benchmark of the time to add a sample and compute the volatilities of all the markets.
+        """
+        interval, period, ticks = 300, 10, 1000
+        for market_count in [10, 100, 500]:
+            window = MultiMarketRollingWindow(list(range(market_count)), interval, period)
+            samples = np.random.uniform(90, 110, (ticks, market_count)).tolist()
+
+            start = time.perf_counter()
+            for sample in samples:
+                window.add_samples(sample)
+                window.volatilities()
+            elapsed = time.perf_counter() - start
+
+            logging.getLogger(__name__).info(
+                f"{elapsed / ticks * 1e6:.0f} us per tick with {market_count} markets")
+            self.assertEqual(ticks, window.sample_count)
@@ -107,3 +107,28 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_running_statistics_match_buffer_content(self):
+        np.random.seed(3141592653)
+        samples = np.random.normal(100, 0.01, self.BUFFER_LENGTH * 3 + 7)
+
+        for sample in samples:
+            self.buffer.add_value(sample)
+            values = self.buffer.get_as_numpy_array()
+            self.assertEqual(values.size, self.buffer.size)
+            self.assertAlmostEqual(np.sum(np.square(np.diff(values))), self.buffer.sum_of_squared_diffs, 10)
+            if self.buffer.is_full:
+                self.assertAlmostEqual(np.mean(values), self.buffer.mean_value, 10)
+                self.assertAlmostEqual(np.var(values), self.buffer.variance, 10)
+                self.assertAlmostEqual(np.std(values), self.buffer.std_dev, 8)
+
+    def test_running_statistics_after_length_change(self):
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(i)
+
+        self.buffer.length = 5
+
+        self.assertEqual(5, self.buffer.size)
+        self.assertEqual(np.mean([25, 26, 27, 28, 29]), self.buffer.mean_value)
+        self.assertEqual(np.var([25, 26, 27, 28, 29]), self.buffer.variance)
+        self.assertEqual(4, self.buffer.sum_of_squared_diffs)
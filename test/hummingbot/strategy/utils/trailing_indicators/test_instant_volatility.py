@@ -20,3 +20,13 @@ class InstantVolatilityTest(unittest.TestCase):
             self.indicator.add_sample(sample)
 
         self.assertAlmostEqual(self.indicator.current_value, 14.068197250366211, 4)
+
+    def test_volatility_while_buffer_not_full(self):
+        samples = [100, 101, 99, 102]
+        self.indicator = InstantVolatilityIndicator(10, 1)
+
+        for sample in samples:
+            self.indicator.add_sample(sample)
+
+        expected = np.sqrt(np.sum(np.square(np.diff(samples))) / len(samples))
+        self.assertAlmostEqual(expected, self.indicator.current_value, 6)
@@ -13,7 +13,10 @@ from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import (
+    FIT_METHOD_DOGBOX,
+    TradingIntensityIndicator,
+)
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate import OrderBookAssetPriceDelegate
 
@@ -62,7 +65,8 @@ class TradingIntensityTest(unittest.TestCase):
         self.indicator = TradingIntensityIndicator(
             order_book=self.market_info.order_book,
             price_delegate=self.price_delegate,
-            sampling_length=self.BUFFER_LENGTH)
+            sampling_length=self.BUFFER_LENGTH,
+            fit_method=FIT_METHOD_DOGBOX)
 
     @staticmethod
     def make_order_books(original_price_mid, original_spread, original_amount, volatility, spread_stdev, amount_stdev, samples):
@@ -227,7 +231,7 @@ class TradingIntensityTest(unittest.TestCase):
         self.assertAlmostEqual(self.indicator.current_value[0], 1.0032422566402444, 4)
         self.assertAlmostEqual(self.indicator.current_value[1], 0.0001595577045670909, 4)
 
-    def test_calculate_trading_intensity_deterministic(self):
+    def _calculate_deterministic_trading_intensity(self, **kwargs):
         def curve_fn(t_, a_, b_):  # see curve fit in `TradingIntensityIndicator.c_estimate_intensity`
             return a_ * np.exp(-b_ * t_)
 
@@ -239,7 +243,7 @@ class TradingIntensityTest(unittest.TestCase):
 
         timestamp = self.start_timestamp
 
-        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1)
+        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, **kwargs)
         trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": last_price}]
 
         timestamp += 1
@@ -255,7 +259,60 @@ class TradingIntensityTest(unittest.TestCase):
             trading_intensity_indicator.register_trade(new_trade)
 
         trading_intensity_indicator.calculate(timestamp)
-        alpha, kappa = trading_intensity_indicator.current_value
+        return a, b, trading_intensity_indicator.current_value
+
+    def test_calculate_trading_intensity_deterministic(self):
+        a, b, (alpha, kappa) = self._calculate_deterministic_trading_intensity()
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def test_calculate_trading_intensity_deterministic_with_dogbox_fit(self):
+        a, b, (alpha, kappa) = self._calculate_deterministic_trading_intensity(fit_method=FIT_METHOD_DOGBOX)
+
+        self.assertAlmostEqual(a, alpha, 10)
+        self.assertAlmostEqual(b, kappa, 10)
+
+    def test_invalid_fit_method_raises_error(self):
+        with self.assertRaises(ValueError):
+            TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, fit_method="lm")
+
+    def test_trades_matched_with_latest_previous_quote(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 10)
+        indicator.last_quotes = [{"timestamp": 3, "price": 102},
+                                 {"timestamp": 2, "price": 101},
+                                 {"timestamp": 1, "price": 100}]
+
+        for timestamp, price in [(2, 99), (3, 104), (2.5, 100)]:
+            indicator.register_trade(OrderBookTradeEvent(trading_pair="COINALPHAHBOT",
+                                                         timestamp=timestamp,
+                                                         price=price,
+                                                         amount=1,
+                                                         type=TradeType.SELL))
+        indicator.calculate(4)
+
+        self.assertFalse(indicator.is_sampling_buffer_full)
+        self.assertTrue(indicator.is_sampling_buffer_changed)
+        # The quotes before the latest one matched with a trade are discarded
+        self.assertEqual([4, 3, 2], [quote["timestamp"] for quote in indicator.last_quotes])
+
+    def test_samples_out_of_the_sampling_window_are_discarded(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2)
+        timestamp = self.start_timestamp
+        indicator.last_quotes = [{"timestamp": timestamp, "price": 1}]
+
+        for price_level in [1, 2, 3]:
+            timestamp += 1
+            indicator.register_trade(OrderBookTradeEvent(trading_pair="COINALPHAHBOT",
+                                                         timestamp=timestamp,
+                                                         price=1 + price_level,
+                                                         amount=2 * np.exp(-0.1 * price_level),
+                                                         type=TradeType.SELL))
+            indicator.calculate(timestamp)
+            indicator.last_quotes = [{"timestamp": timestamp, "price": 1}] + indicator.last_quotes
+
+        alpha, kappa = indicator.current_value
+
+        self.assertTrue(indicator.is_sampling_buffer_full)
+        self.assertAlmostEqual(2, alpha, 10)
+        self.assertAlmostEqual(0.1, kappa, 10)